@@ -0,0 +1,112 @@
+"""
+Request and response payloads of the hot path benchmarks, in a small and a large size per endpoint family.
+"""
+
+from moloni.api.customers_client import CustomersInsertModel
+from moloni.api.invoices_client import InvoicesInsertModel
+from moloni.api.products_client import ProductsInsertModel
+
+SIZES = {"small": 5, "large": 500}
+
+
+def customer(i):
+    return {
+        "company_id": 5,
+        "vat": f"5{i:08d}",
+        "number": str(i),
+        "name": f"Customer {i}",
+        "language_id": 1,
+        "address": f"Rua {i}",
+        "zip_code": "1000-001",
+        "city": "Lisboa",
+        "country_id": 1,
+        "email": f"customer{i}@example.com",
+        "salesman_id": 0,
+        "maturity_date_id": 1,
+        "payment_method_id": 1,
+        "delivery_method_id": 1,
+    }
+
+
+def product(i, lines):
+    return {
+        "company_id": 5,
+        "category_id": 1,
+        "type": "1",
+        "name": f"Product {i}",
+        "reference": f"REF{i:05d}",
+        "ean": f"560{i:010d}",
+        "price": "9.99",
+        "unit_id": 1,
+        "has_stock": "1",
+        "stock": "100",
+        "taxes": [
+            {"tax_id": 1, "value": "23", "order": 1, "cumulative": "0"}
+            for _ in range(max(1, lines // 100))
+        ],
+        "warehouses": [
+            {"warehouse_id": w, "stock": "10"} for w in range(max(1, lines // 10))
+        ],
+    }
+
+
+def invoice(i, lines):
+    return {
+        "company_id": 5,
+        "date": "2024-01-31",
+        "expiration_date": "2024-02-29",
+        "document_set_id": 1,
+        "customer_id": i,
+        "our_reference": f"ORDER-{i}",
+        "status": "1",
+        "products": [
+            {
+                "product_id": line,
+                "name": f"Product {line}",
+                "summary": "",
+                "qty": "2",
+                "price": "9.99",
+                "discount": "0",
+                "order": line,
+                "taxes": [
+                    {"tax_id": 1, "value": "23", "order": 1, "cumulative": "0"},
+                    {"tax_id": 2, "value": "0.5", "order": 2, "cumulative": "1"},
+                ],
+            }
+            for line in range(lines)
+        ],
+        "associated_documents": [{"associated_id": 10, "value": "9.99"}],
+    }
+
+
+FAMILIES = {
+    "customers": {
+        "model": CustomersInsertModel,
+        "path": "/<version>/customers/insert/",
+        "record": lambda i, lines: customer(i),
+    },
+    "products": {
+        "model": ProductsInsertModel,
+        "path": "/<version>/products/insert/",
+        "record": product,
+    },
+    "invoices": {
+        "model": InvoicesInsertModel,
+        "path": "/<version>/invoices/insert/",
+        "record": invoice,
+    },
+}
+
+
+def request_data(family, size):
+    """
+    Insert request of one record, the large invoice has 500 product lines
+    """
+    return FAMILIES[family]["record"](1, SIZES[size])
+
+
+def response_payload(family, size):
+    """
+    getAll response, 5 or 500 records of a typical size
+    """
+    return [FAMILIES[family]["record"](i, 3) for i in range(SIZES[size])]
@@ -0,0 +1,210 @@
+"""
+Measures what the library costs per call on the request/response hot path, per endpoint family and payload size:
+request validation, form encoding (validated and trusted request data), path building, response validation, and full round-trips against a local
+fake Moloni server (requires pyyaml).
+
+    python benchmarks/hot_path.py
+    python benchmarks/hot_path.py --filter "invoices/large *" --save baseline.json
+    python benchmarks/hot_path.py --compare baseline.json --threshold 10
+
+Times are per call, allocations are the peak traced memory of one call. With --compare, the exit status is 1 when
+a benchmark got slower than the baseline by more than --threshold percent.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import timeit
+import tracemalloc
+from fnmatch import fnmatch
+
+# Run from a checkout, without installing the package
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from requests import Response
+from requests.models import RequestEncodingMixin
+
+from fixtures import FAMILIES, SIZES, request_data, response_payload
+from moloni.base import MoloniBaseClient, validate_data
+from moloni.base.form_encoding import encode_form
+from moloni.base.helpers import (
+    ApiResponseValidator,
+    fill_query_params,
+    trusted_data,
+)
+
+
+def make_response(payload) -> Response:
+    response = Response()
+    response._content = json.dumps(payload).encode()
+    response.status_code = 200
+    response.headers["Content-Type"] = "application/json"
+    return response
+
+
+def cases(server=None):
+    """
+    :return: dict of benchmark name to the function it times
+    """
+    client = MoloniBaseClient()
+    benchmarks = {}
+    for family, spec in FAMILIES.items():
+        model = spec["model"]
+        for size in SIZES:
+            data = request_data(family, size)
+            validated = validate_data(dict(data), True, model)
+            response = make_response(response_payload(family, size))
+            name = f"{family}/{size}"
+
+            benchmarks[f"{name} validate_data"] = lambda d=data, m=model: (
+                validate_data(dict(d), True, m)
+            )
+            benchmarks[f"{name} flatten_dict"] = (
+                lambda v=validated: client.flatten_dict(v)
+            )
+            benchmarks[f"{name} create_form_data"] = (
+                lambda v=validated: client.create_form_data(v)
+            )
+            benchmarks[f"{name} create_form_data+urlencode"] = lambda v=validated: (
+                RequestEncodingMixin._encode_params(client.create_form_data(v))
+            )
+            benchmarks[f"{name} encode_form"] = lambda v=validated: encode_form(v)
+            # Request data preparation as an endpoint call does it, validated or trusted
+            instance = model(**data)
+            benchmarks[f"{name} validated dict+encode_form"] = (
+                lambda d=data, m=model: encode_form(validate_data(dict(d), True, m))
+            )
+            benchmarks[f"{name} trusted dict+encode_form"] = lambda d=data: (
+                encode_form(trusted_data(d))
+            )
+            benchmarks[f"{name} model_dump+encode_form"] = lambda i=instance, m=model: (
+                encode_form(validate_data(i, True, m))
+            )
+            benchmarks[f"{name} trusted model+encode_form"] = lambda i=instance: (
+                encode_form(trusted_data(i))
+            )
+            benchmarks[f"{name} fill_query_params"] = lambda p=spec[
+                "path"
+            ]: fill_query_params(p, "v1")
+            benchmarks[f"{name} validate response"] = lambda r=response, v=validated: (
+                ApiResponseValidator(r, v).validate()
+            )
+            if server is not None:
+                benchmarks.update(round_trips(server, family, size, data))
+    return benchmarks
+
+
+def round_trips(server, family, size, data) -> dict:
+    from moloni.api import CustomersClient, InvoicesClient, ProductsClient
+
+    client_class = {
+        "customers": CustomersClient,
+        "products": ProductsClient,
+        "invoices": InvoicesClient,
+    }[family]
+    client = client_class(server.url)
+    server.seed(family, response_payload(family, size), company_id=5)
+    page = {"company_id": 5, "offset": 0, "qty": SIZES[size]}
+    return {
+        f"{family}/{size} round-trip insert": lambda: client.insert(dict(data)),
+        f"{family}/{size} round-trip getAll": lambda: client.get_all(dict(page)),
+    }
+
+
+def measure(function, repeat) -> dict:
+    function()  # warm up caches and connections
+    timer = timeit.Timer(function)
+    number, _ = timer.autorange()
+    timings = [t / number for t in timer.repeat(repeat=repeat, number=number)]
+
+    tracemalloc.start()
+    function()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "min_us": min(timings) * 1e6,
+        "median_us": statistics.median(timings) * 1e6,
+        "peak_kib": peak / 1024,
+    }
+
+
+def compare(results, baseline, threshold) -> list:
+    """
+    Prints the change against the baseline
+    :return: names of the benchmarks slower than the threshold
+    """
+    regressions = []
+    print(f"{'benchmark':<45} {'median us':>12} {'baseline':>12} {'change':>8}")
+    for name, result in results.items():
+        before = baseline.get(name)
+        if before is None:
+            print(f"{name:<45} {result['median_us']:>12.1f} {'-':>12} {'new':>8}")
+            continue
+        change = (result["median_us"] / before["median_us"] - 1) * 100
+        flag = ""
+        if change > threshold:
+            regressions.append(name)
+            flag = " !"
+        print(
+            f"{name:<45} {result['median_us']:>12.1f} {before['median_us']:>12.1f} {change:>+7.1f}%{flag}"
+        )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--filter", default="*", help="benchmarks to run, e.g. 'invoices/*'"
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--no-server",
+        action="store_true",
+        help="skip the round-trips against the fake server",
+    )
+    parser.add_argument("--save", help="write the results to a baseline file")
+    parser.add_argument("--compare", help="compare the results with a baseline file")
+    parser.add_argument("--threshold", type=float, default=10.0)
+    args = parser.parse_args()
+
+    server = None
+    if not args.no_server:
+        from moloni.testing import FakeMoloniServer
+
+        server = FakeMoloniServer().start()
+
+    try:
+        results = {}
+        for name, function in cases(server).items():
+            if fnmatch(name, args.filter):
+                results[name] = measure(function, args.repeat)
+    finally:
+        if server is not None:
+            server.stop()
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(results, json.load(f), args.threshold)
+    else:
+        regressions = []
+        print(f"{'benchmark':<45} {'min us':>12} {'median us':>12} {'peak KiB':>10}")
+        for name, result in results.items():
+            print(
+                f"{name:<45} {result['min_us']:>12.1f} {result['median_us']:>12.1f} {result['peak_kib']:>10.1f}"
+            )
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
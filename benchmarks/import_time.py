@@ -0,0 +1,58 @@
+"""
+Measures the import time of moloni.api in fresh interpreters.
+
+The "every name" scenario resolves all exported names, which is what importing
+anything from moloni.api used to cost before the package was made lazy.
+
+    python benchmarks/import_time.py --runs 10
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+SCENARIOS = {
+    "import moloni.api": "import moloni.api",
+    "one client": "from moloni.api import CustomersClient",
+    "one client module": "from moloni.api.customers_client import CustomersClient",
+    "two clients": "from moloni.api import CustomersClient, InvoicesClient",
+    "every name": "import moloni.api as api; [getattr(api, name) for name in api.__all__]",
+}
+
+TIMER = """
+import time
+start = time.perf_counter()
+{statement}
+print(time.perf_counter() - start)
+"""
+
+
+def measure(statement, runs):
+    timings = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", TIMER.format(statement=statement)],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        timings.append(float(output.strip().splitlines()[-1]))
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'scenario':<20} {'min ms':>10} {'median ms':>10}")
+    for name, statement in SCENARIOS.items():
+        timings = measure(statement, args.runs)
+        print(
+            f"{name:<20} {min(timings) * 1000:>10.1f} {statistics.median(timings) * 1000:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
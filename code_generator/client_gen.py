@@ -1,3 +1,4 @@
+import argparse
 import os
 import re
 import subprocess
@@ -6,15 +7,18 @@ import inflection
 import yaml
 from jinja2 import Template
 
+# The specs are shipped with the package, the fake server serves the same endpoints
+SPECS_DIR = "../moloni/testing/specs"
+
 
 class OpenAPIClientGenerator:
-    class_template = Template(
-        '''
+    class_template = Template('''
 from pydantic import BaseModel, ValidationError
 from typing import Union, Optional, List, Any
 
 from moloni.base.client import MoloniBaseClient
-from moloni.base.helpers import endpoint, fill_query_params, validate_data 
+from moloni.base.async_client import AsyncMoloniBaseClient
+from moloni.base.helpers import endpoint
 from moloni.base import ApiResponse
 
 
@@ -29,7 +33,8 @@ class ApiRequestModel(BaseModel):
         return self.connect()
 
     def __exit__(self, exc_type, exc_value, traceback):
-        pass
+        if self._api_client is not None:
+            self._api_client.close()
 
 
 {% for model_name, model_code in components.items() %}
@@ -43,7 +48,7 @@ class ApiRequestModel(BaseModel):
 
 class {{ class_name }}(MoloniBaseClient):        
     {% for method_name, details in methods.items() %}
-    @endpoint('/<version>{{ details['path'] }}', method='{{ details['method'] }}')
+    @endpoint('/<version>{{ details['path'] }}', method='{{ details['method'] }}', inject=False)
     def {{ method_name }}(self{% if details['model_name'] != 'dict' %}, data: Union[{{ details['model_name'] }}, dict], {% else %}, {% endif %}**kwargs):
         """
         {{ method_name }}(self{% if details['model_name'] != 'dict' %}, data: Union[{{ details['model_name'] }}, dict], {% else %}, {% endif %}**kwargs)
@@ -60,17 +65,23 @@ class {{ class_name }}(MoloniBaseClient):
             ApiResponse: The response from the API.
         """
         {% if details['model_name'] != 'dict' %}
-        data = validate_data(data, self.validate, {{ details['model_name'] }})
+        data = self.prepare_data(data, {{ details['model_name'] }})
 
-        return self._request(fill_query_params(kwargs.pop('path'), self.version), data={**data, **kwargs})
+        path, method = self.routes['{{ method_name }}']
+        return self._request(path, data={**data, **kwargs}, method=method)
         {% else %}
-        return self._request(fill_query_params(kwargs.pop('path'), self.version), data={**kwargs})
+        path, method = self.routes['{{ method_name }}']
+        return self._request(path, data={**kwargs}, method=method)
         {% endif %}
     {% endfor %}
-'''
-    )
-    test_template = Template(
-        """
+
+
+class Async{{ class_name }}({{ class_name }}, AsyncMoloniBaseClient):
+    """
+    Asyncio version of `{{ class_name }}`. Every endpoint method returns an awaitable `ApiResponse`.
+    """
+''')
+    test_template = Template("""
 import unittest
 from unittest.mock import patch, Mock
 from requests import Response
@@ -174,7 +185,70 @@ class Test{{ class_name }}(unittest.TestCase):
 
     {% endif %}
     {% endfor %}
+""")
+
+    compact_template = Template(
+        '''"""
+{{ class_name }} and its request models, built from the endpoint table in `moloni.api._endpoints`.
 """
+
+from moloni.api._factory import client_namespace
+
+_namespace = client_namespace("{{ class_name }}", __name__)
+
+{% for name in names %}
+{{ name }} = _namespace["{{ name }}"]
+{% endfor %}
+''',
+        trim_blocks=True,
+    )
+
+    table_template = Template('''"""
+Endpoint table of the Moloni API clients, generated by `code_generator/client_gen.py` and read by
+`moloni.api._factory`.
+
+COMPONENTS: nested model -> its field names, every field is `Optional[Any] = None`
+CLIENTS: client class -> the nested models its module exports (`components`), its endpoint methods as
+    method name -> (path, HTTP method, request model or None) (`endpoints`), and its request models as
+    model name -> fields as (name, type, default), `...` for a required field (`models`)
+"""
+
+COMPONENTS = {{ components }}
+
+CLIENTS = {{ clients }}
+''')
+
+    init_template = Template(
+        '''"""
+Clients and request models of the Moloni API.
+
+Names are resolved lazily, a client module is only imported the first time one of its names is used.
+"""
+import importlib
+
+_exports = {
+{% for name, (module_name, attribute) in exports.items() %}
+    "{{ name }}": ("{{ module_name }}", "{{ attribute }}"),
+{% endfor %}
+}
+
+__all__ = list(_exports)
+
+
+def __getattr__(name):
+    try:
+        module_name, attribute = _exports[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+''',
+        trim_blocks=True,
     )
 
     def __init__(self, openapi_spec_path):
@@ -203,9 +277,10 @@ class Test{{ class_name }}(unittest.TestCase):
         method_name = re.sub(r"\s+", "_", summary)
         return inflection.underscore(method_name).lstrip("_")
 
-    def generate_pydantic_model(
-        self, model_name, properties, required_fields, method_name
-    ):
+    def model_fields(self, properties):
+        """
+        Fields of a request model as (name, type, default) in declaration order, `...` for a required field
+        """
         required_fields = ["company_id"]
         fields = {}
         for prop_name, prop_details in properties.items():
@@ -231,18 +306,21 @@ class Test{{ class_name }}(unittest.TestCase):
             else:
                 fields[prop_name] = (field_type, None)  # Optional fields
 
+        return [
+            (field_name, field_type, default_value)
+            for field_name, (field_type, default_value) in sorted(
+                fields.items(), key=lambda x: x[0] in required_fields, reverse=True
+            )
+        ]
+
+    def generate_pydantic_model(
+        self, model_name, properties, required_fields, method_name
+    ):
         model_code = f"class {model_name}(ApiRequestModel):\n"
-        for field_name, (field_type, default_value) in sorted(
-            fields.items(), key=lambda x: x[0] in required_fields, reverse=True
-        ):
+        for field_name, field_type, default_value in self.model_fields(properties):
             model_code += f"    {field_name}: {field_type}"
-            if field_name not in required_fields and field_name not in (
-                "qty",
-                "offset",
-            ):
+            if default_value is not ...:
                 model_code += f" = {default_value}"
-            if field_name in ("qty", "offset"):
-                model_code += f" = {25 if field_name == 'qty' else 0}"
             model_code += "\n"
 
         model_code += "\n"
@@ -291,7 +369,11 @@ class Test{{ class_name }}(unittest.TestCase):
         for path, path_details in self.openapi_spec["paths"].items():
             class_name = self.generate_class_name(path)
             if class_name not in self.client_classes:
-                self.client_classes[class_name] = {"methods": {}, "models": {}}
+                self.client_classes[class_name] = {
+                    "methods": {},
+                    "models": {},
+                    "fields": {},
+                }
 
             for method, method_details in path_details.items():
                 method_name = self.sanitize_method_name(method_details["summary"])
@@ -338,19 +420,30 @@ class Test{{ class_name }}(unittest.TestCase):
 
                 if model_code:
                     self.client_classes[class_name]["models"][model_name] = model_code
+                    self.client_classes[class_name]["fields"][model_name] = (
+                        self.model_fields(body_params)
+                    )
 
-    def generate_code(self):
+    def generate_code(self, compact=False):
         self.parse_paths()
         generated_files = []
 
         for class_name, details in self.client_classes.items():
             module_name = inflection.underscore(class_name)
-            rendered_class = self.class_template.render(
-                class_name=class_name,
-                methods=details["methods"],
-                models=details["models"],
-                components=self.generate_components(),
-            )
+            if compact:
+                rendered_class = self.compact_template.render(
+                    class_name=class_name,
+                    names=[class_name, f"Async{class_name}", "ApiRequestModel"]
+                    + [name.capitalize() for name in self.generate_components()]
+                    + list(details["models"]),
+                )
+            else:
+                rendered_class = self.class_template.render(
+                    class_name=class_name,
+                    methods=details["methods"],
+                    models=details["models"],
+                    components=self.generate_components(),
+                )
 
             file_name = f"../moloni/api/{inflection.underscore(class_name)}.py"
             with open(file_name, "w") as f:
@@ -408,6 +501,53 @@ class Test{{ class_name }}(unittest.TestCase):
             print(model_code)
         return models
 
+    def compact_clients(self):
+        """
+        Entries of the endpoint table for the clients of this spec
+        """
+        return {
+            class_name: {
+                "components": tuple(
+                    name.capitalize() for name in self.generate_components()
+                ),
+                "endpoints": {
+                    method_name: (
+                        details["path"],
+                        details["method"],
+                        (
+                            details["model_name"]
+                            if details["model_name"] != "dict"
+                            else None
+                        ),
+                    )
+                    for method_name, details in client["methods"].items()
+                },
+                "models": {
+                    model_name: tuple(fields)
+                    for model_name, fields in client["fields"].items()
+                },
+            }
+            for class_name, client in self.client_classes.items()
+        }
+
+    def compact_components(self):
+        return {
+            name.capitalize(): tuple(info.get("properties", {}))
+            for name, info in self.openapi_spec["components"]["schemas"].items()
+        }
+
+    def write_endpoint_table(self, clients, components):
+        file_name = "../moloni/api/_endpoints.py"
+        with open(file_name, "w") as f:
+            f.write(
+                self.table_template.render(
+                    components=python_literal(dict(sorted(components.items()))),
+                    clients=python_literal(dict(sorted(clients.items()))),
+                )
+            )
+        print("_endpoints.py has been generated.")
+        return file_name
+
     def format_code_with_black(self, files):
         try:
             subprocess.run(["black"] + files, check=True)
@@ -416,93 +556,92 @@ class Test{{ class_name }}(unittest.TestCase):
             print(f"Error formatting code with Black: {e}")
 
     def update_init_file(self, files):
-        new_imports = []
-        new_exports = []
+        exports = {}
 
-        # Collect imports and names to export from the generated classes
+        # Collect the names to export from the generated classes
         for class_name, details in self.client_classes.items():
-            class_import = (
-                f"from .{inflection.underscore(class_name)} import {class_name}"
-            )
-            new_imports.append(class_import)
-            new_exports.append(class_name)
+            module_name = f".{inflection.underscore(class_name)}"
+            exports[class_name] = (module_name, class_name)
+            exports[f"Async{class_name}"] = (module_name, f"Async{class_name}")
 
             for model_name, code in self.generate_components().items():
-                model_import = f"from .{inflection.underscore(class_name)} import {model_name.capitalize()} as {class_name}{model_name.capitalize()}Model"
-                new_imports.append(model_import)
-                new_exports.append(f"{class_name}{model_name.capitalize()}Model")
+                exports[f"{class_name}{model_name.capitalize()}Model"] = (
+                    module_name,
+                    model_name.capitalize(),
+                )
 
             for model_name in details["models"].keys():
-                model_import = (
-                    f"from .{inflection.underscore(class_name)} import {model_name}"
-                )
-                new_imports.append(model_import)
-                new_exports.append(model_name)
+                exports[model_name] = (module_name, model_name)
 
-        # Read the existing __init__.py file if it exists
+        # Keep the names exported by the previously generated specs
         try:
             with open("../moloni/api/__init__.py", "r") as init_file:
-                init_lines = init_file.readlines()
+                existing = re.findall(
+                    r'"(\w+)": \("(\.\w+)", "(\w+)"\)', init_file.read()
+                )
         except FileNotFoundError:
-            init_lines = []
-
-        # Prepare lists for existing imports and the __all__ list
-        existing_imports = []
-        existing_all = []
-        in_all_section = False
-
-        # Parse the existing __init__.py content
-        for line in init_lines:
-            stripped_line = line.strip()
-
-            # Identify existing imports
-            if stripped_line.startswith("from .") and "import" in stripped_line:
-                existing_imports.append(stripped_line)
-
-            # Identify and parse the __all__ list
-            if stripped_line.startswith("__all__"):
-                in_all_section = True
-                all_items = re.findall(r'"(.*?)"', stripped_line)
-                existing_all.extend(all_items)
-            elif in_all_section:
-                all_items = re.findall(r'"(.*?)"', stripped_line)
-                if all_items:
-                    existing_all.extend(all_items)
-                if stripped_line.endswith("]"):
-                    in_all_section = False
-
-        # Combine and deduplicate imports and exports
-        all_imports = list(set(existing_imports + new_imports))
-        all_exports = list(set(existing_all + new_exports))
-
-        # Sort imports and exports for consistency
-        all_imports.sort()
-        all_exports.sort()
-
-        # Create the updated __init__.py content
-        new_init_content = "\n".join(all_imports) + "\n\n__all__ = [\n"
-        new_init_content += ",\n".join([f'"{name}"' for name in all_exports])
-        new_init_content += "\n]\n"
-
-        # Write back the updated __init__.py
+            existing = []
+        for name, module_name, attribute in existing:
+            exports.setdefault(name, (module_name, attribute))
+
+        # users_client is generated from a later spec that has no updateMe
+        exports.pop("UsersUpdateMeModel", None)
+
         with open("../moloni/api/__init__.py", "w") as init_file:
             init_file.write(
-                "\n".join(
-                    "/n".join(
-                        new_init_content.split(
-                            "from .users_client import UsersUpdateMeModel"
-                        )
-                    ).split('"UsersUpdateMeModel",')
-                )
+                self.init_template.render(exports=dict(sorted(exports.items())))
             )
         print("__init__.py has been updated with the generated classes and models.")
 
 
+def python_literal(value):
+    """
+    Source of a table value, dicts get trailing commas so black lays them out one entry per line
+    """
+    if value is ...:
+        return "..."
+    if isinstance(value, dict):
+        items = "".join(
+            f"{python_literal(key)}: {python_literal(item)}, "
+            for key, item in value.items()
+        )
+        return f"{{{items}}}"
+    if isinstance(value, (list, tuple)):
+        items = ", ".join(python_literal(item) for item in value)
+        return f"({items},)" if len(value) == 1 else f"({items})"
+    return repr(value)
+
+
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Generates the clients in moloni/api from the OpenAPI specs"
+    )
+    layout = parser.add_mutually_exclusive_group()
+    layout.add_argument(
+        "--compact",
+        dest="verbose",
+        action="store_false",
+        help="emit an endpoint table and client modules that are built from it at runtime (default)",
+    )
+    layout.add_argument(
+        "--verbose",
+        action="store_true",
+        help="write every method and model out as source",
+    )
+    parser.set_defaults(verbose=False)
+    args = parser.parse_args()
+
     os.unlink("../moloni/api/__init__.py")
+    clients, components = {}, {}
     for i in range(1, 7):
-        generator = OpenAPIClientGenerator(f"{i}.yaml")
-        files = generator.generate_code()
+        generator = OpenAPIClientGenerator(f"{SPECS_DIR}/{i}.yaml")
+        files = generator.generate_code(compact=not args.verbose)
         generator.format_code_with_black(files)
         generator.update_init_file(files)
+        clients.update(generator.compact_clients())
+        components.update(generator.compact_components())
+    if not args.verbose:
+        generator.format_code_with_black(
+            [generator.write_endpoint_table(clients, components)]
+        )
     generator.format_code_with_black(["../moloni/api/__init__.py"])
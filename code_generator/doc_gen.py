@@ -1,42 +1,58 @@
+import importlib
 import os
-import re
 from pathlib import Path
 
+from pydantic import BaseModel
 
-def extract_class_names(file_content):
-    """
-    Extract class names from the file content.
-    This includes both BaseModel (Pydantic models) and Client classes.
-    """
-    # Regular expression to match class definitions
-    class_pattern = re.compile(r"class (\w+)\(.*\):")
+from moloni.base.async_client import AsyncMoloniBaseClient
+from moloni.base.client import MoloniBaseClient
 
-    # Extract class names
-    classes = class_pattern.findall(file_content)
+# Bases every client module imports or defines, not documented on their own
+SHARED_CLASSES = {
+    "ApiRequestModel",
+    "BaseModel",
+    "MoloniBaseClient",
+    "AsyncMoloniBaseClient",
+}
 
-    # Identify which classes are models (BaseModel) and which is the client
-    base_models = []
-    client_name = None
 
-    for class_name in classes:
-        if "Client" in class_name:
-            client_name = class_name
-        else:
-            base_models.append(class_name)
+def extract_class_names(module):
+    """
+    Extract the model and client classes a client module exports, in the order it defines them.
+    The module is imported: the compact modules build their classes at runtime and contain no class statements.
+    """
+    base_models = []
+    client_names = []
+
+    for name, value in vars(module).items():
+        if (
+            not isinstance(value, type)
+            or name.startswith("_")
+            or name in SHARED_CLASSES
+        ):
+            continue
+        if issubclass(value, (MoloniBaseClient, AsyncMoloniBaseClient)):
+            client_names.append(name)
+        elif issubclass(value, BaseModel):
+            base_models.append(name)
 
-    return base_models, client_name
+    if not client_names:
+        raise ValueError(f"No client class found in {module.__name__}")
+    return base_models, client_names
 
 
-def generate_documentation_file(base_models, client_name, module_name, output_dir):
+def generate_documentation_file(base_models, client_names, module_name, output_dir):
     """
     Generate the documentation content based on the extracted class names.
     """
-    if not client_name:
+    if not client_names:
         return
 
+    client_name = client_names[0]
     doc_content = f"{client_name}\n{'=' * len(client_name)}\n\n"
 
-    doc_content += f".. autoclass:: moloni.api.{client_name}\n\n"
+    for name in client_names:
+        doc_content += f".. autoclass:: moloni.api.{name}\n\n"
 
     doc_content += f"Models:\n{'-' * len('Models:')}\n\n"
     for model in base_models:
@@ -56,20 +72,18 @@ def main(api_dir, output_dir):
     if not os.path.exists(output_dir):
         os.makedirs(output_dir)
 
-    for file_name in os.listdir(api_dir):
-        if file_name == "__init__.py":
-            continue
-        if file_name.endswith(".py"):
-            file_path = os.path.join(api_dir, file_name)
-            module_name = file_name[:-3]  # Remove the .py extension
-
-            with open(file_path, "r") as file:
-                file_content = file.read()
-
-            base_models, client_name = extract_class_names(file_content)
-            generate_documentation_file(
-                base_models, client_name, module_name, output_dir
-            )
+    module_names = sorted(
+        file_name[:-3]  # Remove the .py extension
+        for file_name in os.listdir(api_dir)
+        if file_name.endswith(".py") and not file_name.startswith("_")
+    )
+    if not module_names:
+        raise ValueError(f"No client modules found in {api_dir}")
+
+    for module_name in module_names:
+        module = importlib.import_module(f"moloni.api.{module_name}")
+        base_models, client_names = extract_class_names(module)
+        generate_documentation_file(base_models, client_names, module_name, output_dir)
 
 
 if __name__ == "__main__":
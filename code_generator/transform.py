@@ -238,7 +238,7 @@ def main():
         openapi_spec = create_openapi_spec(paths, schemas)
 
         # Write the OpenAPI specification to a YAML file
-        with open(f"./{i}.yaml", "w") as yaml_file:
+        with open(f"../moloni/testing/specs/{i}.yaml", "w") as yaml_file:
             yaml.dump(openapi_spec, yaml_file, default_flow_style=False)
 
         print("OpenAPI specification generated successfully!")
@@ -1,701 +1,786 @@
-from .bankaccounts_client import BankaccountsClient
-from .bankaccounts_client import BankaccountsCountModifiedSinceModel
-from .bankaccounts_client import BankaccountsDeleteModel
-from .bankaccounts_client import BankaccountsGetAllModel
-from .bankaccounts_client import BankaccountsInsertModel
-from .bankaccounts_client import BankaccountsUpdateModel
-from .billsoflading_client import (
-    Associated_documents as BillsofladingClientAssociated_documentsModel,
-)
-from .billsoflading_client import BillsofladingClient
-from .billsoflading_client import BillsofladingCountModel
-from .billsoflading_client import BillsofladingDeleteModel
-from .billsoflading_client import BillsofladingGetAllModel
-from .billsoflading_client import BillsofladingGetOneModel
-from .billsoflading_client import BillsofladingInsertModel
-from .billsoflading_client import BillsofladingSetTransportCodeModel
-from .billsoflading_client import BillsofladingUpdateModel
-from .billsoflading_client import Payments as BillsofladingClientPaymentsModel
-from .billsoflading_client import Products as BillsofladingClientProductsModel
-from .companies_client import CompaniesClient
-from .companies_client import CompaniesGetOneModel
-from .companies_client import CompaniesUpdateModel
-from .companies_client import Suppliers as CompaniesClientSuppliersModel
-from .companies_client import Taxes as CompaniesClientTaxesModel
-from .companies_client import Warehouses as CompaniesClientWarehousesModel
-from .countries_client import CountriesClient
-from .countries_client import CountriesCountModifiedSinceModel
-from .countries_client import CountriesGetModifiedSinceModel
-from .creditnotes_client import (
-    Associated_documents as CreditnotesClientAssociated_documentsModel,
-)
-from .creditnotes_client import CreditnotesClient
-from .creditnotes_client import CreditnotesCountModel
-from .creditnotes_client import CreditnotesDeleteModel
-from .creditnotes_client import CreditnotesGetAllModel
-from .creditnotes_client import CreditnotesGetOneModel
-from .creditnotes_client import CreditnotesInsertModel
-from .creditnotes_client import CreditnotesUpdateModel
-from .creditnotes_client import Payments as CreditnotesClientPaymentsModel
-from .creditnotes_client import Products as CreditnotesClientProductsModel
-from .currencies_client import CurrenciesClient
-from .currencies_client import CurrenciesCountModifiedSinceModel
-from .currencies_client import CurrenciesGetModifiedSinceModel
-from .customeralternateaddresses_client import CustomeralternateaddressesClient
-from .customeralternateaddresses_client import (
-    CustomeralternateaddressesCountModifiedSinceModel,
-)
-from .customeralternateaddresses_client import CustomeralternateaddressesDeleteModel
-from .customeralternateaddresses_client import CustomeralternateaddressesGetAllModel
-from .customeralternateaddresses_client import (
-    CustomeralternateaddressesGetModifiedSinceModel,
-)
-from .customeralternateaddresses_client import CustomeralternateaddressesInsertModel
-from .customeralternateaddresses_client import CustomeralternateaddressesUpdateModel
-from .customerreturnnotes_client import (
-    Associated_documents as CustomerreturnnotesClientAssociated_documentsModel,
-)
-from .customerreturnnotes_client import CustomerreturnnotesClient
-from .customerreturnnotes_client import CustomerreturnnotesCountModel
-from .customerreturnnotes_client import CustomerreturnnotesDeleteModel
-from .customerreturnnotes_client import CustomerreturnnotesGetAllModel
-from .customerreturnnotes_client import CustomerreturnnotesGetOneModel
-from .customerreturnnotes_client import CustomerreturnnotesInsertModel
-from .customerreturnnotes_client import CustomerreturnnotesSetTransportCodeModel
-from .customerreturnnotes_client import CustomerreturnnotesUpdateModel
-from .customerreturnnotes_client import (
-    Payments as CustomerreturnnotesClientPaymentsModel,
-)
-from .customerreturnnotes_client import (
-    Products as CustomerreturnnotesClientProductsModel,
-)
-from .customers_client import CustomersClient
-from .customers_client import CustomersCountByNameModel
-from .customers_client import CustomersCountByNumberModel
-from .customers_client import CustomersCountBySearchModel
-from .customers_client import CustomersCountByVatModel
-from .customers_client import CustomersCountModel
-from .customers_client import CustomersCountModifiedSinceModel
-from .customers_client import CustomersDeleteModel
-from .customers_client import CustomersGetAllModel
-from .customers_client import CustomersGetByEmailModel
-from .customers_client import CustomersGetByNameModel
-from .customers_client import CustomersGetByNumberModel
-from .customers_client import CustomersGetBySearchModel
-from .customers_client import CustomersGetByVatModel
-from .customers_client import CustomersGetLastNumberModel
-from .customers_client import CustomersGetModifiedSinceModel
-from .customers_client import CustomersGetOneModel
-from .customers_client import CustomersInsertModel
-from .customers_client import CustomersUpdateModel
-from .debitnotes_client import (
-    Associated_documents as DebitnotesClientAssociated_documentsModel,
-)
-from .debitnotes_client import DebitnotesClient
-from .debitnotes_client import DebitnotesCountModel
-from .debitnotes_client import DebitnotesDeleteModel
-from .debitnotes_client import DebitnotesGetAllModel
-from .debitnotes_client import DebitnotesGetOneModel
-from .debitnotes_client import DebitnotesInsertModel
-from .debitnotes_client import DebitnotesUpdateModel
-from .debitnotes_client import Payments as DebitnotesClientPaymentsModel
-from .debitnotes_client import Products as DebitnotesClientProductsModel
-from .deductions_client import DeductionsClient
-from .deductions_client import DeductionsCountModifiedSinceModel
-from .deductions_client import DeductionsDeleteModel
-from .deductions_client import DeductionsGetAllModel
-from .deductions_client import DeductionsGetModifiedSinceModel
-from .deductions_client import DeductionsInsertModel
-from .deductions_client import DeductionsUpdateModel
-from .deliverymethods_client import DeliverymethodsClient
-from .deliverymethods_client import DeliverymethodsCountModifiedSinceModel
-from .deliverymethods_client import DeliverymethodsDeleteModel
-from .deliverymethods_client import DeliverymethodsGetAllModel
-from .deliverymethods_client import DeliverymethodsGetModifiedSinceModel
-from .deliverymethods_client import DeliverymethodsInsertModel
-from .deliverymethods_client import DeliverymethodsUpdateModel
-from .deliverynotes_client import (
-    Associated_documents as DeliverynotesClientAssociated_documentsModel,
-)
-from .deliverynotes_client import DeliverynotesClient
-from .deliverynotes_client import DeliverynotesCountModel
-from .deliverynotes_client import DeliverynotesDeleteModel
-from .deliverynotes_client import DeliverynotesGetAllModel
-from .deliverynotes_client import DeliverynotesGetOneModel
-from .deliverynotes_client import DeliverynotesInsertModel
-from .deliverynotes_client import DeliverynotesSetTransportCodeModel
-from .deliverynotes_client import DeliverynotesUpdateModel
-from .deliverynotes_client import Payments as DeliverynotesClientPaymentsModel
-from .deliverynotes_client import Products as DeliverynotesClientProductsModel
-from .documentmodels_client import DocumentmodelsClient
-from .documentmodels_client import DocumentmodelsCountModifiedSinceModel
-from .documentmodels_client import DocumentmodelsGetModifiedSinceModel
-from .documents_client import (
-    Associated_documents as DocumentsClientAssociated_documentsModel,
-)
-from .documents_client import DocumentsClient
-from .documents_client import DocumentsCountModel
-from .documents_client import DocumentsGetAllDocumentTypesModel
-from .documents_client import DocumentsGetAllModel
-from .documents_client import DocumentsGetOneModel
-from .documents_client import DocumentsGetPdfLinkModel
-from .documents_client import Payments as DocumentsClientPaymentsModel
-from .documents_client import Products as DocumentsClientProductsModel
-from .documentsets_client import DocumentsetsClient
-from .documentsets_client import DocumentsetsCountModifiedSinceModel
-from .documentsets_client import DocumentsetsDeleteModel
-from .documentsets_client import DocumentsetsGetAllModel
-from .documentsets_client import DocumentsetsGetModifiedSinceModel
-from .documentsets_client import DocumentsetsInsertModel
-from .documentsets_client import DocumentsetsUpdateModel
-from .estimates_client import (
-    Associated_documents as EstimatesClientAssociated_documentsModel,
-)
-from .estimates_client import EstimatesClient
-from .estimates_client import EstimatesCountModel
-from .estimates_client import EstimatesDeleteModel
-from .estimates_client import EstimatesGetAllModel
-from .estimates_client import EstimatesGetOneModel
-from .estimates_client import EstimatesInsertModel
-from .estimates_client import EstimatesUpdateModel
-from .estimates_client import Payments as EstimatesClientPaymentsModel
-from .estimates_client import Products as EstimatesClientProductsModel
-from .fiscalzones_client import FiscalzonesClient
-from .fiscalzones_client import FiscalzonesCountModifiedSinceModel
-from .fiscalzones_client import FiscalzonesGetAllModel
-from .fiscalzones_client import FiscalzonesGetModifiedSinceModel
-from .identificationtemplates_client import IdentificationtemplatesClient
-from .identificationtemplates_client import (
-    IdentificationtemplatesCountModifiedSinceModel,
-)
-from .identificationtemplates_client import IdentificationtemplatesDeleteModel
-from .identificationtemplates_client import IdentificationtemplatesGetAllModel
-from .identificationtemplates_client import IdentificationtemplatesGetModifiedSinceModel
-from .identificationtemplates_client import IdentificationtemplatesInsertModel
-from .identificationtemplates_client import IdentificationtemplatesUpdateModel
-from .invoicereceipts_client import (
-    Associated_documents as InvoicereceiptsClientAssociated_documentsModel,
-)
-from .invoicereceipts_client import InvoicereceiptsClient
-from .invoicereceipts_client import InvoicereceiptsCountModel
-from .invoicereceipts_client import InvoicereceiptsDeleteModel
-from .invoicereceipts_client import InvoicereceiptsGetAllModel
-from .invoicereceipts_client import InvoicereceiptsGetOneModel
-from .invoicereceipts_client import InvoicereceiptsInsertModel
-from .invoicereceipts_client import InvoicereceiptsUpdateModel
-from .invoicereceipts_client import Payments as InvoicereceiptsClientPaymentsModel
-from .invoicereceipts_client import Products as InvoicereceiptsClientProductsModel
-from .invoices_client import (
-    Associated_documents as InvoicesClientAssociated_documentsModel,
-)
-from .invoices_client import InvoicesClient
-from .invoices_client import InvoicesCountModel
-from .invoices_client import InvoicesDeleteModel
-from .invoices_client import InvoicesGetAllModel
-from .invoices_client import InvoicesGetOneModel
-from .invoices_client import InvoicesInsertModel
-from .invoices_client import InvoicesUpdateModel
-from .invoices_client import Payments as InvoicesClientPaymentsModel
-from .invoices_client import Products as InvoicesClientProductsModel
-from .languages_client import LanguagesClient
-from .languages_client import LanguagesCountModifiedSinceModel
-from .languages_client import LanguagesGetModifiedSinceModel
-from .maturitydates_client import MaturitydatesClient
-from .maturitydates_client import MaturitydatesCountModifiedSinceModel
-from .maturitydates_client import MaturitydatesDeleteModel
-from .maturitydates_client import MaturitydatesGetAllModel
-from .maturitydates_client import MaturitydatesGetModifiedSinceModel
-from .maturitydates_client import MaturitydatesInsertModel
-from .maturitydates_client import MaturitydatesUpdateModel
-from .measurementunits_client import MeasurementunitsClient
-from .measurementunits_client import MeasurementunitsCountModifiedSinceModel
-from .measurementunits_client import MeasurementunitsDeleteModel
-from .measurementunits_client import MeasurementunitsGetAllModel
-from .measurementunits_client import MeasurementunitsGetModifiedSinceModel
-from .measurementunits_client import MeasurementunitsInsertModel
-from .measurementunits_client import MeasurementunitsUpdateModel
-from .ownassetsmovementguides_client import (
-    Associated_documents as OwnassetsmovementguidesClientAssociated_documentsModel,
-)
-from .ownassetsmovementguides_client import OwnassetsmovementguidesClient
-from .ownassetsmovementguides_client import OwnassetsmovementguidesCountModel
-from .ownassetsmovementguides_client import OwnassetsmovementguidesDeleteModel
-from .ownassetsmovementguides_client import OwnassetsmovementguidesGetAllModel
-from .ownassetsmovementguides_client import OwnassetsmovementguidesGetOneModel
-from .ownassetsmovementguides_client import OwnassetsmovementguidesInsertModel
-from .ownassetsmovementguides_client import OwnassetsmovementguidesSetTransportCodeModel
-from .ownassetsmovementguides_client import OwnassetsmovementguidesUpdateModel
-from .ownassetsmovementguides_client import (
-    Payments as OwnassetsmovementguidesClientPaymentsModel,
-)
-from .ownassetsmovementguides_client import (
-    Products as OwnassetsmovementguidesClientProductsModel,
-)
-from .paymentmethods_client import PaymentmethodsClient
-from .paymentmethods_client import PaymentmethodsCountModifiedSinceModel
-from .paymentmethods_client import PaymentmethodsDeleteModel
-from .paymentmethods_client import PaymentmethodsGetAllModel
-from .paymentmethods_client import PaymentmethodsGetModifiedSinceModel
-from .paymentmethods_client import PaymentmethodsInsertModel
-from .paymentmethods_client import PaymentmethodsUpdateModel
-from .productcategories_client import ProductcategoriesClient
-from .productcategories_client import ProductcategoriesDeleteModel
-from .productcategories_client import ProductcategoriesGetAllModel
-from .productcategories_client import ProductcategoriesGetModifiedSinceModel
-from .productcategories_client import ProductcategoriesInsertModel
-from .productcategories_client import ProductcategoriesUpdateModel
-from .productcategories_client import Suppliers as ProductcategoriesClientSuppliersModel
-from .productcategories_client import Taxes as ProductcategoriesClientTaxesModel
-from .productcategories_client import (
-    Warehouses as ProductcategoriesClientWarehousesModel,
-)
-from .products_client import ProductsClient
-from .products_client import ProductsCountByEanModel
-from .products_client import ProductsCountByNameModel
-from .products_client import ProductsCountByReferenceModel
-from .products_client import ProductsCountBySearchModel
-from .products_client import ProductsCountModel
-from .products_client import ProductsCountModifiedSinceModel
-from .products_client import ProductsDeleteModel
-from .products_client import ProductsGetAllModel
-from .products_client import ProductsGetByEanModel
-from .products_client import ProductsGetByNameModel
-from .products_client import ProductsGetByReferenceModel
-from .products_client import ProductsGetBySearchModel
-from .products_client import ProductsGetModifiedSinceModel
-from .products_client import ProductsGetOneModel
-from .products_client import ProductsInsertModel
-from .products_client import ProductsUpdateModel
-from .products_client import Suppliers as ProductsClientSuppliersModel
-from .products_client import Taxes as ProductsClientTaxesModel
-from .products_client import Warehouses as ProductsClientWarehousesModel
-from .receipts_client import (
-    Associated_documents as ReceiptsClientAssociated_documentsModel,
-)
-from .receipts_client import Payments as ReceiptsClientPaymentsModel
-from .receipts_client import Products as ReceiptsClientProductsModel
-from .receipts_client import ReceiptsClient
-from .receipts_client import ReceiptsCountModel
-from .receipts_client import ReceiptsDeleteModel
-from .receipts_client import ReceiptsGetAllModel
-from .receipts_client import ReceiptsGetOneModel
-from .receipts_client import ReceiptsInsertModel
-from .receipts_client import ReceiptsUpdateModel
-from .salesmen_client import SalesmenClient
-from .salesmen_client import SalesmenCountModifiedSinceModel
-from .salesmen_client import SalesmenDeleteModel
-from .salesmen_client import SalesmenGetAllModel
-from .salesmen_client import SalesmenGetModifiedSinceModel
-from .salesmen_client import SalesmenGetOneModel
-from .salesmen_client import SalesmenInsertModel
-from .salesmen_client import SalesmenUpdateModel
-from .simplifiedinvoices_client import (
-    Associated_documents as SimplifiedinvoicesClientAssociated_documentsModel,
-)
-from .simplifiedinvoices_client import Payments as SimplifiedinvoicesClientPaymentsModel
-from .simplifiedinvoices_client import Products as SimplifiedinvoicesClientProductsModel
-from .simplifiedinvoices_client import SimplifiedinvoicesClient
-from .simplifiedinvoices_client import SimplifiedinvoicesCountModel
-from .simplifiedinvoices_client import SimplifiedinvoicesDeleteModel
-from .simplifiedinvoices_client import SimplifiedinvoicesGetAllModel
-from .simplifiedinvoices_client import SimplifiedinvoicesGetOneModel
-from .simplifiedinvoices_client import SimplifiedinvoicesInsertModel
-from .simplifiedinvoices_client import SimplifiedinvoicesUpdateModel
-from .subscription_client import SubscriptionClient
-from .subscription_client import SubscriptionGetOneModel
-from .subscription_client import Suppliers as SubscriptionClientSuppliersModel
-from .subscription_client import Taxes as SubscriptionClientTaxesModel
-from .subscription_client import Warehouses as SubscriptionClientWarehousesModel
-from .suppliers_client import SuppliersClient
-from .suppliers_client import SuppliersCountByNameModel
-from .suppliers_client import SuppliersCountByNumberModel
-from .suppliers_client import SuppliersCountBySearchModel
-from .suppliers_client import SuppliersCountByVatModel
-from .suppliers_client import SuppliersCountModel
-from .suppliers_client import SuppliersCountModifiedSinceModel
-from .suppliers_client import SuppliersDeleteModel
-from .suppliers_client import SuppliersGetAllModel
-from .suppliers_client import SuppliersGetByNameModel
-from .suppliers_client import SuppliersGetByNumberModel
-from .suppliers_client import SuppliersGetBySearchModel
-from .suppliers_client import SuppliersGetByVatModel
-from .suppliers_client import SuppliersGetModifiedSinceModel
-from .suppliers_client import SuppliersGetOneModel
-from .suppliers_client import SuppliersInsertModel
-from .suppliers_client import SuppliersUpdateModel
-from .taxes_client import TaxesClient
-from .taxes_client import TaxesCountModifiedSinceModel
-from .taxes_client import TaxesDeleteModel
-from .taxes_client import TaxesGetAllModel
-from .taxes_client import TaxesGetModifiedSinceModel
-from .taxes_client import TaxesInsertModel
-from .taxes_client import TaxesUpdateModel
-from .taxexemptions_client import TaxexemptionsClient
-from .taxexemptions_client import TaxexemptionsCountModifiedSinceModel
-from .taxexemptions_client import TaxexemptionsGetModifiedSinceModel
-from .users_client import Suppliers as UsersClientSuppliersModel
-from .users_client import Taxes as UsersClientTaxesModel
-from .users_client import UsersClient
-from .users_client import UsersGetAllModel
-from .users_client import Warehouses as UsersClientWarehousesModel
-from .vehicles_client import VehiclesClient
-from .vehicles_client import VehiclesCountModifiedSinceModel
-from .vehicles_client import VehiclesDeleteModel
-from .vehicles_client import VehiclesGetAllModel
-from .vehicles_client import VehiclesGetModifiedSinceModel
-from .vehicles_client import VehiclesInsertModel
-from .vehicles_client import VehiclesUpdateModel
-from .warehouses_client import Suppliers as WarehousesClientSuppliersModel
-from .warehouses_client import Taxes as WarehousesClientTaxesModel
-from .warehouses_client import Warehouses as WarehousesClientWarehousesModel
-from .warehouses_client import WarehousesClient
-from .warehouses_client import WarehousesCountModifiedSinceModel
-from .warehouses_client import WarehousesDeleteModel
-from .warehouses_client import WarehousesGetAllModel
-from .warehouses_client import WarehousesGetModifiedSinceModel
-from .warehouses_client import WarehousesInsertModel
-from .warehouses_client import WarehousesUpdateModel
-from .waybills_client import (
-    Associated_documents as WaybillsClientAssociated_documentsModel,
-)
-from .waybills_client import Payments as WaybillsClientPaymentsModel
-from .waybills_client import Products as WaybillsClientProductsModel
-from .waybills_client import WaybillsClient
-from .waybills_client import WaybillsCountModel
-from .waybills_client import WaybillsDeleteModel
-from .waybills_client import WaybillsGetAllModel
-from .waybills_client import WaybillsGetOneModel
-from .waybills_client import WaybillsInsertModel
-from .waybills_client import WaybillsSetTransportCodeModel
-from .waybills_client import WaybillsUpdateModel
+"""
+Clients and request models of the Moloni API.
 
-__all__ = [
-    "BankaccountsClient",
-    "BankaccountsCountModifiedSinceModel",
-    "BankaccountsDeleteModel",
-    "BankaccountsGetAllModel",
-    "BankaccountsInsertModel",
-    "BankaccountsUpdateModel",
-    "BillsofladingClient",
-    "BillsofladingClientAssociated_documentsModel",
-    "BillsofladingClientPaymentsModel",
-    "BillsofladingClientProductsModel",
-    "BillsofladingCountModel",
-    "BillsofladingDeleteModel",
-    "BillsofladingGetAllModel",
-    "BillsofladingGetOneModel",
-    "BillsofladingInsertModel",
-    "BillsofladingSetTransportCodeModel",
-    "BillsofladingUpdateModel",
-    "CompaniesClient",
-    "CompaniesClientSuppliersModel",
-    "CompaniesClientTaxesModel",
-    "CompaniesClientWarehousesModel",
-    "CompaniesGetOneModel",
-    "CompaniesUpdateModel",
-    "CountriesClient",
-    "CountriesCountModifiedSinceModel",
-    "CountriesGetModifiedSinceModel",
-    "CreditnotesClient",
-    "CreditnotesClientAssociated_documentsModel",
-    "CreditnotesClientPaymentsModel",
-    "CreditnotesClientProductsModel",
-    "CreditnotesCountModel",
-    "CreditnotesDeleteModel",
-    "CreditnotesGetAllModel",
-    "CreditnotesGetOneModel",
-    "CreditnotesInsertModel",
-    "CreditnotesUpdateModel",
-    "CurrenciesClient",
-    "CurrenciesCountModifiedSinceModel",
-    "CurrenciesGetModifiedSinceModel",
-    "CustomeralternateaddressesClient",
-    "CustomeralternateaddressesCountModifiedSinceModel",
-    "CustomeralternateaddressesDeleteModel",
-    "CustomeralternateaddressesGetAllModel",
-    "CustomeralternateaddressesGetModifiedSinceModel",
-    "CustomeralternateaddressesInsertModel",
-    "CustomeralternateaddressesUpdateModel",
-    "CustomerreturnnotesClient",
-    "CustomerreturnnotesClientAssociated_documentsModel",
-    "CustomerreturnnotesClientPaymentsModel",
-    "CustomerreturnnotesClientProductsModel",
-    "CustomerreturnnotesCountModel",
-    "CustomerreturnnotesDeleteModel",
-    "CustomerreturnnotesGetAllModel",
-    "CustomerreturnnotesGetOneModel",
-    "CustomerreturnnotesInsertModel",
-    "CustomerreturnnotesSetTransportCodeModel",
-    "CustomerreturnnotesUpdateModel",
-    "CustomersClient",
-    "CustomersCountByNameModel",
-    "CustomersCountByNumberModel",
-    "CustomersCountBySearchModel",
-    "CustomersCountByVatModel",
-    "CustomersCountModel",
-    "CustomersCountModifiedSinceModel",
-    "CustomersDeleteModel",
-    "CustomersGetAllModel",
-    "CustomersGetByEmailModel",
-    "CustomersGetByNameModel",
-    "CustomersGetByNumberModel",
-    "CustomersGetBySearchModel",
-    "CustomersGetByVatModel",
-    "CustomersGetLastNumberModel",
-    "CustomersGetModifiedSinceModel",
-    "CustomersGetOneModel",
-    "CustomersInsertModel",
-    "CustomersUpdateModel",
-    "DebitnotesClient",
-    "DebitnotesClientAssociated_documentsModel",
-    "DebitnotesClientPaymentsModel",
-    "DebitnotesClientProductsModel",
-    "DebitnotesCountModel",
-    "DebitnotesDeleteModel",
-    "DebitnotesGetAllModel",
-    "DebitnotesGetOneModel",
-    "DebitnotesInsertModel",
-    "DebitnotesUpdateModel",
-    "DeductionsClient",
-    "DeductionsCountModifiedSinceModel",
-    "DeductionsDeleteModel",
-    "DeductionsGetAllModel",
-    "DeductionsGetModifiedSinceModel",
-    "DeductionsInsertModel",
-    "DeductionsUpdateModel",
-    "DeliverymethodsClient",
-    "DeliverymethodsCountModifiedSinceModel",
-    "DeliverymethodsDeleteModel",
-    "DeliverymethodsGetAllModel",
-    "DeliverymethodsGetModifiedSinceModel",
-    "DeliverymethodsInsertModel",
-    "DeliverymethodsUpdateModel",
-    "DeliverynotesClient",
-    "DeliverynotesClientAssociated_documentsModel",
-    "DeliverynotesClientPaymentsModel",
-    "DeliverynotesClientProductsModel",
-    "DeliverynotesCountModel",
-    "DeliverynotesDeleteModel",
-    "DeliverynotesGetAllModel",
-    "DeliverynotesGetOneModel",
-    "DeliverynotesInsertModel",
-    "DeliverynotesSetTransportCodeModel",
-    "DeliverynotesUpdateModel",
-    "DocumentmodelsClient",
-    "DocumentmodelsCountModifiedSinceModel",
-    "DocumentmodelsGetModifiedSinceModel",
-    "DocumentsClient",
-    "DocumentsClientAssociated_documentsModel",
-    "DocumentsClientPaymentsModel",
-    "DocumentsClientProductsModel",
-    "DocumentsCountModel",
-    "DocumentsGetAllDocumentTypesModel",
-    "DocumentsGetAllModel",
-    "DocumentsGetOneModel",
-    "DocumentsGetPdfLinkModel",
-    "DocumentsetsClient",
-    "DocumentsetsCountModifiedSinceModel",
-    "DocumentsetsDeleteModel",
-    "DocumentsetsGetAllModel",
-    "DocumentsetsGetModifiedSinceModel",
-    "DocumentsetsInsertModel",
-    "DocumentsetsUpdateModel",
-    "EstimatesClient",
-    "EstimatesClientAssociated_documentsModel",
-    "EstimatesClientPaymentsModel",
-    "EstimatesClientProductsModel",
-    "EstimatesCountModel",
-    "EstimatesDeleteModel",
-    "EstimatesGetAllModel",
-    "EstimatesGetOneModel",
-    "EstimatesInsertModel",
-    "EstimatesUpdateModel",
-    "FiscalzonesClient",
-    "FiscalzonesCountModifiedSinceModel",
-    "FiscalzonesGetAllModel",
-    "FiscalzonesGetModifiedSinceModel",
-    "IdentificationtemplatesClient",
-    "IdentificationtemplatesCountModifiedSinceModel",
-    "IdentificationtemplatesDeleteModel",
-    "IdentificationtemplatesGetAllModel",
-    "IdentificationtemplatesGetModifiedSinceModel",
-    "IdentificationtemplatesInsertModel",
-    "IdentificationtemplatesUpdateModel",
-    "InvoicereceiptsClient",
-    "InvoicereceiptsClientAssociated_documentsModel",
-    "InvoicereceiptsClientPaymentsModel",
-    "InvoicereceiptsClientProductsModel",
-    "InvoicereceiptsCountModel",
-    "InvoicereceiptsDeleteModel",
-    "InvoicereceiptsGetAllModel",
-    "InvoicereceiptsGetOneModel",
-    "InvoicereceiptsInsertModel",
-    "InvoicereceiptsUpdateModel",
-    "InvoicesClient",
-    "InvoicesClientAssociated_documentsModel",
-    "InvoicesClientPaymentsModel",
-    "InvoicesClientProductsModel",
-    "InvoicesCountModel",
-    "InvoicesDeleteModel",
-    "InvoicesGetAllModel",
-    "InvoicesGetOneModel",
-    "InvoicesInsertModel",
-    "InvoicesUpdateModel",
-    "LanguagesClient",
-    "LanguagesCountModifiedSinceModel",
-    "LanguagesGetModifiedSinceModel",
-    "MaturitydatesClient",
-    "MaturitydatesCountModifiedSinceModel",
-    "MaturitydatesDeleteModel",
-    "MaturitydatesGetAllModel",
-    "MaturitydatesGetModifiedSinceModel",
-    "MaturitydatesInsertModel",
-    "MaturitydatesUpdateModel",
-    "MeasurementunitsClient",
-    "MeasurementunitsCountModifiedSinceModel",
-    "MeasurementunitsDeleteModel",
-    "MeasurementunitsGetAllModel",
-    "MeasurementunitsGetModifiedSinceModel",
-    "MeasurementunitsInsertModel",
-    "MeasurementunitsUpdateModel",
-    "OwnassetsmovementguidesClient",
-    "OwnassetsmovementguidesClientAssociated_documentsModel",
-    "OwnassetsmovementguidesClientPaymentsModel",
-    "OwnassetsmovementguidesClientProductsModel",
-    "OwnassetsmovementguidesCountModel",
-    "OwnassetsmovementguidesDeleteModel",
-    "OwnassetsmovementguidesGetAllModel",
-    "OwnassetsmovementguidesGetOneModel",
-    "OwnassetsmovementguidesInsertModel",
-    "OwnassetsmovementguidesSetTransportCodeModel",
-    "OwnassetsmovementguidesUpdateModel",
-    "PaymentmethodsClient",
-    "PaymentmethodsCountModifiedSinceModel",
-    "PaymentmethodsDeleteModel",
-    "PaymentmethodsGetAllModel",
-    "PaymentmethodsGetModifiedSinceModel",
-    "PaymentmethodsInsertModel",
-    "PaymentmethodsUpdateModel",
-    "ProductcategoriesClient",
-    "ProductcategoriesClientSuppliersModel",
-    "ProductcategoriesClientTaxesModel",
-    "ProductcategoriesClientWarehousesModel",
-    "ProductcategoriesDeleteModel",
-    "ProductcategoriesGetAllModel",
-    "ProductcategoriesGetModifiedSinceModel",
-    "ProductcategoriesInsertModel",
-    "ProductcategoriesUpdateModel",
-    "ProductsClient",
-    "ProductsClientSuppliersModel",
-    "ProductsClientTaxesModel",
-    "ProductsClientWarehousesModel",
-    "ProductsCountByEanModel",
-    "ProductsCountByNameModel",
-    "ProductsCountByReferenceModel",
-    "ProductsCountBySearchModel",
-    "ProductsCountModel",
-    "ProductsCountModifiedSinceModel",
-    "ProductsDeleteModel",
-    "ProductsGetAllModel",
-    "ProductsGetByEanModel",
-    "ProductsGetByNameModel",
-    "ProductsGetByReferenceModel",
-    "ProductsGetBySearchModel",
-    "ProductsGetModifiedSinceModel",
-    "ProductsGetOneModel",
-    "ProductsInsertModel",
-    "ProductsUpdateModel",
-    "ReceiptsClient",
-    "ReceiptsClientAssociated_documentsModel",
-    "ReceiptsClientPaymentsModel",
-    "ReceiptsClientProductsModel",
-    "ReceiptsCountModel",
-    "ReceiptsDeleteModel",
-    "ReceiptsGetAllModel",
-    "ReceiptsGetOneModel",
-    "ReceiptsInsertModel",
-    "ReceiptsUpdateModel",
-    "SalesmenClient",
-    "SalesmenCountModifiedSinceModel",
-    "SalesmenDeleteModel",
-    "SalesmenGetAllModel",
-    "SalesmenGetModifiedSinceModel",
-    "SalesmenGetOneModel",
-    "SalesmenInsertModel",
-    "SalesmenUpdateModel",
-    "SimplifiedinvoicesClient",
-    "SimplifiedinvoicesClientAssociated_documentsModel",
-    "SimplifiedinvoicesClientPaymentsModel",
-    "SimplifiedinvoicesClientProductsModel",
-    "SimplifiedinvoicesCountModel",
-    "SimplifiedinvoicesDeleteModel",
-    "SimplifiedinvoicesGetAllModel",
-    "SimplifiedinvoicesGetOneModel",
-    "SimplifiedinvoicesInsertModel",
-    "SimplifiedinvoicesUpdateModel",
-    "SubscriptionClient",
-    "SubscriptionClientSuppliersModel",
-    "SubscriptionClientTaxesModel",
-    "SubscriptionClientWarehousesModel",
-    "SubscriptionGetOneModel",
-    "SuppliersClient",
-    "SuppliersCountByNameModel",
-    "SuppliersCountByNumberModel",
-    "SuppliersCountBySearchModel",
-    "SuppliersCountByVatModel",
-    "SuppliersCountModel",
-    "SuppliersCountModifiedSinceModel",
-    "SuppliersDeleteModel",
-    "SuppliersGetAllModel",
-    "SuppliersGetByNameModel",
-    "SuppliersGetByNumberModel",
-    "SuppliersGetBySearchModel",
-    "SuppliersGetByVatModel",
-    "SuppliersGetModifiedSinceModel",
-    "SuppliersGetOneModel",
-    "SuppliersInsertModel",
-    "SuppliersUpdateModel",
-    "TaxesClient",
-    "TaxesCountModifiedSinceModel",
-    "TaxesDeleteModel",
-    "TaxesGetAllModel",
-    "TaxesGetModifiedSinceModel",
-    "TaxesInsertModel",
-    "TaxesUpdateModel",
-    "TaxexemptionsClient",
-    "TaxexemptionsCountModifiedSinceModel",
-    "TaxexemptionsGetModifiedSinceModel",
-    "UsersClient",
-    "UsersClientSuppliersModel",
-    "UsersClientTaxesModel",
-    "UsersClientWarehousesModel",
-    "UsersGetAllModel",
-    "VehiclesClient",
-    "VehiclesCountModifiedSinceModel",
-    "VehiclesDeleteModel",
-    "VehiclesGetAllModel",
-    "VehiclesGetModifiedSinceModel",
-    "VehiclesInsertModel",
-    "VehiclesUpdateModel",
-    "WarehousesClient",
-    "WarehousesClientSuppliersModel",
-    "WarehousesClientTaxesModel",
-    "WarehousesClientWarehousesModel",
-    "WarehousesCountModifiedSinceModel",
-    "WarehousesDeleteModel",
-    "WarehousesGetAllModel",
-    "WarehousesGetModifiedSinceModel",
-    "WarehousesInsertModel",
-    "WarehousesUpdateModel",
-    "WaybillsClient",
-    "WaybillsClientAssociated_documentsModel",
-    "WaybillsClientPaymentsModel",
-    "WaybillsClientProductsModel",
-    "WaybillsCountModel",
-    "WaybillsDeleteModel",
-    "WaybillsGetAllModel",
-    "WaybillsGetOneModel",
-    "WaybillsInsertModel",
-    "WaybillsSetTransportCodeModel",
-    "WaybillsUpdateModel",
-]
+Names are resolved lazily, a client module is only imported the first time one of its names is used.
+"""
+
+import importlib
+
+_exports = {
+    "AsyncBankaccountsClient": (".bankaccounts_client", "AsyncBankaccountsClient"),
+    "AsyncBillsofladingClient": (".billsoflading_client", "AsyncBillsofladingClient"),
+    "AsyncCompaniesClient": (".companies_client", "AsyncCompaniesClient"),
+    "AsyncCountriesClient": (".countries_client", "AsyncCountriesClient"),
+    "AsyncCreditnotesClient": (".creditnotes_client", "AsyncCreditnotesClient"),
+    "AsyncCurrenciesClient": (".currencies_client", "AsyncCurrenciesClient"),
+    "AsyncCustomeralternateaddressesClient": (
+        ".customeralternateaddresses_client",
+        "AsyncCustomeralternateaddressesClient",
+    ),
+    "AsyncCustomerreturnnotesClient": (
+        ".customerreturnnotes_client",
+        "AsyncCustomerreturnnotesClient",
+    ),
+    "AsyncCustomersClient": (".customers_client", "AsyncCustomersClient"),
+    "AsyncDebitnotesClient": (".debitnotes_client", "AsyncDebitnotesClient"),
+    "AsyncDeductionsClient": (".deductions_client", "AsyncDeductionsClient"),
+    "AsyncDeliverymethodsClient": (
+        ".deliverymethods_client",
+        "AsyncDeliverymethodsClient",
+    ),
+    "AsyncDeliverynotesClient": (".deliverynotes_client", "AsyncDeliverynotesClient"),
+    "AsyncDocumentmodelsClient": (
+        ".documentmodels_client",
+        "AsyncDocumentmodelsClient",
+    ),
+    "AsyncDocumentsClient": (".documents_client", "AsyncDocumentsClient"),
+    "AsyncDocumentsetsClient": (".documentsets_client", "AsyncDocumentsetsClient"),
+    "AsyncEstimatesClient": (".estimates_client", "AsyncEstimatesClient"),
+    "AsyncFiscalzonesClient": (".fiscalzones_client", "AsyncFiscalzonesClient"),
+    "AsyncIdentificationtemplatesClient": (
+        ".identificationtemplates_client",
+        "AsyncIdentificationtemplatesClient",
+    ),
+    "AsyncInvoicereceiptsClient": (
+        ".invoicereceipts_client",
+        "AsyncInvoicereceiptsClient",
+    ),
+    "AsyncInvoicesClient": (".invoices_client", "AsyncInvoicesClient"),
+    "AsyncLanguagesClient": (".languages_client", "AsyncLanguagesClient"),
+    "AsyncMaturitydatesClient": (".maturitydates_client", "AsyncMaturitydatesClient"),
+    "AsyncMeasurementunitsClient": (
+        ".measurementunits_client",
+        "AsyncMeasurementunitsClient",
+    ),
+    "AsyncOwnassetsmovementguidesClient": (
+        ".ownassetsmovementguides_client",
+        "AsyncOwnassetsmovementguidesClient",
+    ),
+    "AsyncPaymentmethodsClient": (
+        ".paymentmethods_client",
+        "AsyncPaymentmethodsClient",
+    ),
+    "AsyncProductcategoriesClient": (
+        ".productcategories_client",
+        "AsyncProductcategoriesClient",
+    ),
+    "AsyncProductsClient": (".products_client", "AsyncProductsClient"),
+    "AsyncReceiptsClient": (".receipts_client", "AsyncReceiptsClient"),
+    "AsyncSalesmenClient": (".salesmen_client", "AsyncSalesmenClient"),
+    "AsyncSimplifiedinvoicesClient": (
+        ".simplifiedinvoices_client",
+        "AsyncSimplifiedinvoicesClient",
+    ),
+    "AsyncSubscriptionClient": (".subscription_client", "AsyncSubscriptionClient"),
+    "AsyncSuppliersClient": (".suppliers_client", "AsyncSuppliersClient"),
+    "AsyncTaxesClient": (".taxes_client", "AsyncTaxesClient"),
+    "AsyncTaxexemptionsClient": (".taxexemptions_client", "AsyncTaxexemptionsClient"),
+    "AsyncUsersClient": (".users_client", "AsyncUsersClient"),
+    "AsyncVehiclesClient": (".vehicles_client", "AsyncVehiclesClient"),
+    "AsyncWarehousesClient": (".warehouses_client", "AsyncWarehousesClient"),
+    "AsyncWaybillsClient": (".waybills_client", "AsyncWaybillsClient"),
+    "BankaccountsClient": (".bankaccounts_client", "BankaccountsClient"),
+    "BankaccountsCountModifiedSinceModel": (
+        ".bankaccounts_client",
+        "BankaccountsCountModifiedSinceModel",
+    ),
+    "BankaccountsDeleteModel": (".bankaccounts_client", "BankaccountsDeleteModel"),
+    "BankaccountsGetAllModel": (".bankaccounts_client", "BankaccountsGetAllModel"),
+    "BankaccountsInsertModel": (".bankaccounts_client", "BankaccountsInsertModel"),
+    "BankaccountsUpdateModel": (".bankaccounts_client", "BankaccountsUpdateModel"),
+    "BillsofladingClient": (".billsoflading_client", "BillsofladingClient"),
+    "BillsofladingClientAssociated_documentsModel": (
+        ".billsoflading_client",
+        "Associated_documents",
+    ),
+    "BillsofladingClientPaymentsModel": (".billsoflading_client", "Payments"),
+    "BillsofladingClientProductsModel": (".billsoflading_client", "Products"),
+    "BillsofladingCountModel": (".billsoflading_client", "BillsofladingCountModel"),
+    "BillsofladingDeleteModel": (".billsoflading_client", "BillsofladingDeleteModel"),
+    "BillsofladingGetAllModel": (".billsoflading_client", "BillsofladingGetAllModel"),
+    "BillsofladingGetOneModel": (".billsoflading_client", "BillsofladingGetOneModel"),
+    "BillsofladingInsertModel": (".billsoflading_client", "BillsofladingInsertModel"),
+    "BillsofladingSetTransportCodeModel": (
+        ".billsoflading_client",
+        "BillsofladingSetTransportCodeModel",
+    ),
+    "BillsofladingUpdateModel": (".billsoflading_client", "BillsofladingUpdateModel"),
+    "CompaniesClient": (".companies_client", "CompaniesClient"),
+    "CompaniesClientSuppliersModel": (".companies_client", "Suppliers"),
+    "CompaniesClientTaxesModel": (".companies_client", "Taxes"),
+    "CompaniesClientWarehousesModel": (".companies_client", "Warehouses"),
+    "CompaniesGetOneModel": (".companies_client", "CompaniesGetOneModel"),
+    "CompaniesUpdateModel": (".companies_client", "CompaniesUpdateModel"),
+    "CountriesClient": (".countries_client", "CountriesClient"),
+    "CountriesCountModifiedSinceModel": (
+        ".countries_client",
+        "CountriesCountModifiedSinceModel",
+    ),
+    "CountriesGetModifiedSinceModel": (
+        ".countries_client",
+        "CountriesGetModifiedSinceModel",
+    ),
+    "CreditnotesClient": (".creditnotes_client", "CreditnotesClient"),
+    "CreditnotesClientAssociated_documentsModel": (
+        ".creditnotes_client",
+        "Associated_documents",
+    ),
+    "CreditnotesClientPaymentsModel": (".creditnotes_client", "Payments"),
+    "CreditnotesClientProductsModel": (".creditnotes_client", "Products"),
+    "CreditnotesCountModel": (".creditnotes_client", "CreditnotesCountModel"),
+    "CreditnotesDeleteModel": (".creditnotes_client", "CreditnotesDeleteModel"),
+    "CreditnotesGetAllModel": (".creditnotes_client", "CreditnotesGetAllModel"),
+    "CreditnotesGetOneModel": (".creditnotes_client", "CreditnotesGetOneModel"),
+    "CreditnotesInsertModel": (".creditnotes_client", "CreditnotesInsertModel"),
+    "CreditnotesUpdateModel": (".creditnotes_client", "CreditnotesUpdateModel"),
+    "CurrenciesClient": (".currencies_client", "CurrenciesClient"),
+    "CurrenciesCountModifiedSinceModel": (
+        ".currencies_client",
+        "CurrenciesCountModifiedSinceModel",
+    ),
+    "CurrenciesGetModifiedSinceModel": (
+        ".currencies_client",
+        "CurrenciesGetModifiedSinceModel",
+    ),
+    "CustomeralternateaddressesClient": (
+        ".customeralternateaddresses_client",
+        "CustomeralternateaddressesClient",
+    ),
+    "CustomeralternateaddressesCountModifiedSinceModel": (
+        ".customeralternateaddresses_client",
+        "CustomeralternateaddressesCountModifiedSinceModel",
+    ),
+    "CustomeralternateaddressesDeleteModel": (
+        ".customeralternateaddresses_client",
+        "CustomeralternateaddressesDeleteModel",
+    ),
+    "CustomeralternateaddressesGetAllModel": (
+        ".customeralternateaddresses_client",
+        "CustomeralternateaddressesGetAllModel",
+    ),
+    "CustomeralternateaddressesGetModifiedSinceModel": (
+        ".customeralternateaddresses_client",
+        "CustomeralternateaddressesGetModifiedSinceModel",
+    ),
+    "CustomeralternateaddressesInsertModel": (
+        ".customeralternateaddresses_client",
+        "CustomeralternateaddressesInsertModel",
+    ),
+    "CustomeralternateaddressesUpdateModel": (
+        ".customeralternateaddresses_client",
+        "CustomeralternateaddressesUpdateModel",
+    ),
+    "CustomerreturnnotesClient": (
+        ".customerreturnnotes_client",
+        "CustomerreturnnotesClient",
+    ),
+    "CustomerreturnnotesClientAssociated_documentsModel": (
+        ".customerreturnnotes_client",
+        "Associated_documents",
+    ),
+    "CustomerreturnnotesClientPaymentsModel": (
+        ".customerreturnnotes_client",
+        "Payments",
+    ),
+    "CustomerreturnnotesClientProductsModel": (
+        ".customerreturnnotes_client",
+        "Products",
+    ),
+    "CustomerreturnnotesCountModel": (
+        ".customerreturnnotes_client",
+        "CustomerreturnnotesCountModel",
+    ),
+    "CustomerreturnnotesDeleteModel": (
+        ".customerreturnnotes_client",
+        "CustomerreturnnotesDeleteModel",
+    ),
+    "CustomerreturnnotesGetAllModel": (
+        ".customerreturnnotes_client",
+        "CustomerreturnnotesGetAllModel",
+    ),
+    "CustomerreturnnotesGetOneModel": (
+        ".customerreturnnotes_client",
+        "CustomerreturnnotesGetOneModel",
+    ),
+    "CustomerreturnnotesInsertModel": (
+        ".customerreturnnotes_client",
+        "CustomerreturnnotesInsertModel",
+    ),
+    "CustomerreturnnotesSetTransportCodeModel": (
+        ".customerreturnnotes_client",
+        "CustomerreturnnotesSetTransportCodeModel",
+    ),
+    "CustomerreturnnotesUpdateModel": (
+        ".customerreturnnotes_client",
+        "CustomerreturnnotesUpdateModel",
+    ),
+    "CustomersClient": (".customers_client", "CustomersClient"),
+    "CustomersCountByNameModel": (".customers_client", "CustomersCountByNameModel"),
+    "CustomersCountByNumberModel": (".customers_client", "CustomersCountByNumberModel"),
+    "CustomersCountBySearchModel": (".customers_client", "CustomersCountBySearchModel"),
+    "CustomersCountByVatModel": (".customers_client", "CustomersCountByVatModel"),
+    "CustomersCountModel": (".customers_client", "CustomersCountModel"),
+    "CustomersCountModifiedSinceModel": (
+        ".customers_client",
+        "CustomersCountModifiedSinceModel",
+    ),
+    "CustomersDeleteModel": (".customers_client", "CustomersDeleteModel"),
+    "CustomersGetAllModel": (".customers_client", "CustomersGetAllModel"),
+    "CustomersGetByEmailModel": (".customers_client", "CustomersGetByEmailModel"),
+    "CustomersGetByNameModel": (".customers_client", "CustomersGetByNameModel"),
+    "CustomersGetByNumberModel": (".customers_client", "CustomersGetByNumberModel"),
+    "CustomersGetBySearchModel": (".customers_client", "CustomersGetBySearchModel"),
+    "CustomersGetByVatModel": (".customers_client", "CustomersGetByVatModel"),
+    "CustomersGetLastNumberModel": (".customers_client", "CustomersGetLastNumberModel"),
+    "CustomersGetModifiedSinceModel": (
+        ".customers_client",
+        "CustomersGetModifiedSinceModel",
+    ),
+    "CustomersGetOneModel": (".customers_client", "CustomersGetOneModel"),
+    "CustomersInsertModel": (".customers_client", "CustomersInsertModel"),
+    "CustomersUpdateModel": (".customers_client", "CustomersUpdateModel"),
+    "DebitnotesClient": (".debitnotes_client", "DebitnotesClient"),
+    "DebitnotesClientAssociated_documentsModel": (
+        ".debitnotes_client",
+        "Associated_documents",
+    ),
+    "DebitnotesClientPaymentsModel": (".debitnotes_client", "Payments"),
+    "DebitnotesClientProductsModel": (".debitnotes_client", "Products"),
+    "DebitnotesCountModel": (".debitnotes_client", "DebitnotesCountModel"),
+    "DebitnotesDeleteModel": (".debitnotes_client", "DebitnotesDeleteModel"),
+    "DebitnotesGetAllModel": (".debitnotes_client", "DebitnotesGetAllModel"),
+    "DebitnotesGetOneModel": (".debitnotes_client", "DebitnotesGetOneModel"),
+    "DebitnotesInsertModel": (".debitnotes_client", "DebitnotesInsertModel"),
+    "DebitnotesUpdateModel": (".debitnotes_client", "DebitnotesUpdateModel"),
+    "DeductionsClient": (".deductions_client", "DeductionsClient"),
+    "DeductionsCountModifiedSinceModel": (
+        ".deductions_client",
+        "DeductionsCountModifiedSinceModel",
+    ),
+    "DeductionsDeleteModel": (".deductions_client", "DeductionsDeleteModel"),
+    "DeductionsGetAllModel": (".deductions_client", "DeductionsGetAllModel"),
+    "DeductionsGetModifiedSinceModel": (
+        ".deductions_client",
+        "DeductionsGetModifiedSinceModel",
+    ),
+    "DeductionsInsertModel": (".deductions_client", "DeductionsInsertModel"),
+    "DeductionsUpdateModel": (".deductions_client", "DeductionsUpdateModel"),
+    "DeliverymethodsClient": (".deliverymethods_client", "DeliverymethodsClient"),
+    "DeliverymethodsCountModifiedSinceModel": (
+        ".deliverymethods_client",
+        "DeliverymethodsCountModifiedSinceModel",
+    ),
+    "DeliverymethodsDeleteModel": (
+        ".deliverymethods_client",
+        "DeliverymethodsDeleteModel",
+    ),
+    "DeliverymethodsGetAllModel": (
+        ".deliverymethods_client",
+        "DeliverymethodsGetAllModel",
+    ),
+    "DeliverymethodsGetModifiedSinceModel": (
+        ".deliverymethods_client",
+        "DeliverymethodsGetModifiedSinceModel",
+    ),
+    "DeliverymethodsInsertModel": (
+        ".deliverymethods_client",
+        "DeliverymethodsInsertModel",
+    ),
+    "DeliverymethodsUpdateModel": (
+        ".deliverymethods_client",
+        "DeliverymethodsUpdateModel",
+    ),
+    "DeliverynotesClient": (".deliverynotes_client", "DeliverynotesClient"),
+    "DeliverynotesClientAssociated_documentsModel": (
+        ".deliverynotes_client",
+        "Associated_documents",
+    ),
+    "DeliverynotesClientPaymentsModel": (".deliverynotes_client", "Payments"),
+    "DeliverynotesClientProductsModel": (".deliverynotes_client", "Products"),
+    "DeliverynotesCountModel": (".deliverynotes_client", "DeliverynotesCountModel"),
+    "DeliverynotesDeleteModel": (".deliverynotes_client", "DeliverynotesDeleteModel"),
+    "DeliverynotesGetAllModel": (".deliverynotes_client", "DeliverynotesGetAllModel"),
+    "DeliverynotesGetOneModel": (".deliverynotes_client", "DeliverynotesGetOneModel"),
+    "DeliverynotesInsertModel": (".deliverynotes_client", "DeliverynotesInsertModel"),
+    "DeliverynotesSetTransportCodeModel": (
+        ".deliverynotes_client",
+        "DeliverynotesSetTransportCodeModel",
+    ),
+    "DeliverynotesUpdateModel": (".deliverynotes_client", "DeliverynotesUpdateModel"),
+    "DocumentmodelsClient": (".documentmodels_client", "DocumentmodelsClient"),
+    "DocumentmodelsCountModifiedSinceModel": (
+        ".documentmodels_client",
+        "DocumentmodelsCountModifiedSinceModel",
+    ),
+    "DocumentmodelsGetModifiedSinceModel": (
+        ".documentmodels_client",
+        "DocumentmodelsGetModifiedSinceModel",
+    ),
+    "DocumentsClient": (".documents_client", "DocumentsClient"),
+    "DocumentsClientAssociated_documentsModel": (
+        ".documents_client",
+        "Associated_documents",
+    ),
+    "DocumentsClientPaymentsModel": (".documents_client", "Payments"),
+    "DocumentsClientProductsModel": (".documents_client", "Products"),
+    "DocumentsCountModel": (".documents_client", "DocumentsCountModel"),
+    "DocumentsGetAllDocumentTypesModel": (
+        ".documents_client",
+        "DocumentsGetAllDocumentTypesModel",
+    ),
+    "DocumentsGetAllModel": (".documents_client", "DocumentsGetAllModel"),
+    "DocumentsGetOneModel": (".documents_client", "DocumentsGetOneModel"),
+    "DocumentsGetPdfLinkModel": (".documents_client", "DocumentsGetPdfLinkModel"),
+    "DocumentsetsClient": (".documentsets_client", "DocumentsetsClient"),
+    "DocumentsetsCountModifiedSinceModel": (
+        ".documentsets_client",
+        "DocumentsetsCountModifiedSinceModel",
+    ),
+    "DocumentsetsDeleteModel": (".documentsets_client", "DocumentsetsDeleteModel"),
+    "DocumentsetsGetAllModel": (".documentsets_client", "DocumentsetsGetAllModel"),
+    "DocumentsetsGetModifiedSinceModel": (
+        ".documentsets_client",
+        "DocumentsetsGetModifiedSinceModel",
+    ),
+    "DocumentsetsInsertModel": (".documentsets_client", "DocumentsetsInsertModel"),
+    "DocumentsetsUpdateModel": (".documentsets_client", "DocumentsetsUpdateModel"),
+    "EstimatesClient": (".estimates_client", "EstimatesClient"),
+    "EstimatesClientAssociated_documentsModel": (
+        ".estimates_client",
+        "Associated_documents",
+    ),
+    "EstimatesClientPaymentsModel": (".estimates_client", "Payments"),
+    "EstimatesClientProductsModel": (".estimates_client", "Products"),
+    "EstimatesCountModel": (".estimates_client", "EstimatesCountModel"),
+    "EstimatesDeleteModel": (".estimates_client", "EstimatesDeleteModel"),
+    "EstimatesGetAllModel": (".estimates_client", "EstimatesGetAllModel"),
+    "EstimatesGetOneModel": (".estimates_client", "EstimatesGetOneModel"),
+    "EstimatesInsertModel": (".estimates_client", "EstimatesInsertModel"),
+    "EstimatesUpdateModel": (".estimates_client", "EstimatesUpdateModel"),
+    "FiscalzonesClient": (".fiscalzones_client", "FiscalzonesClient"),
+    "FiscalzonesCountModifiedSinceModel": (
+        ".fiscalzones_client",
+        "FiscalzonesCountModifiedSinceModel",
+    ),
+    "FiscalzonesGetAllModel": (".fiscalzones_client", "FiscalzonesGetAllModel"),
+    "FiscalzonesGetModifiedSinceModel": (
+        ".fiscalzones_client",
+        "FiscalzonesGetModifiedSinceModel",
+    ),
+    "IdentificationtemplatesClient": (
+        ".identificationtemplates_client",
+        "IdentificationtemplatesClient",
+    ),
+    "IdentificationtemplatesCountModifiedSinceModel": (
+        ".identificationtemplates_client",
+        "IdentificationtemplatesCountModifiedSinceModel",
+    ),
+    "IdentificationtemplatesDeleteModel": (
+        ".identificationtemplates_client",
+        "IdentificationtemplatesDeleteModel",
+    ),
+    "IdentificationtemplatesGetAllModel": (
+        ".identificationtemplates_client",
+        "IdentificationtemplatesGetAllModel",
+    ),
+    "IdentificationtemplatesGetModifiedSinceModel": (
+        ".identificationtemplates_client",
+        "IdentificationtemplatesGetModifiedSinceModel",
+    ),
+    "IdentificationtemplatesInsertModel": (
+        ".identificationtemplates_client",
+        "IdentificationtemplatesInsertModel",
+    ),
+    "IdentificationtemplatesUpdateModel": (
+        ".identificationtemplates_client",
+        "IdentificationtemplatesUpdateModel",
+    ),
+    "InvoicereceiptsClient": (".invoicereceipts_client", "InvoicereceiptsClient"),
+    "InvoicereceiptsClientAssociated_documentsModel": (
+        ".invoicereceipts_client",
+        "Associated_documents",
+    ),
+    "InvoicereceiptsClientPaymentsModel": (".invoicereceipts_client", "Payments"),
+    "InvoicereceiptsClientProductsModel": (".invoicereceipts_client", "Products"),
+    "InvoicereceiptsCountModel": (
+        ".invoicereceipts_client",
+        "InvoicereceiptsCountModel",
+    ),
+    "InvoicereceiptsDeleteModel": (
+        ".invoicereceipts_client",
+        "InvoicereceiptsDeleteModel",
+    ),
+    "InvoicereceiptsGetAllModel": (
+        ".invoicereceipts_client",
+        "InvoicereceiptsGetAllModel",
+    ),
+    "InvoicereceiptsGetOneModel": (
+        ".invoicereceipts_client",
+        "InvoicereceiptsGetOneModel",
+    ),
+    "InvoicereceiptsInsertModel": (
+        ".invoicereceipts_client",
+        "InvoicereceiptsInsertModel",
+    ),
+    "InvoicereceiptsUpdateModel": (
+        ".invoicereceipts_client",
+        "InvoicereceiptsUpdateModel",
+    ),
+    "InvoicesClient": (".invoices_client", "InvoicesClient"),
+    "InvoicesClientAssociated_documentsModel": (
+        ".invoices_client",
+        "Associated_documents",
+    ),
+    "InvoicesClientPaymentsModel": (".invoices_client", "Payments"),
+    "InvoicesClientProductsModel": (".invoices_client", "Products"),
+    "InvoicesCountModel": (".invoices_client", "InvoicesCountModel"),
+    "InvoicesDeleteModel": (".invoices_client", "InvoicesDeleteModel"),
+    "InvoicesGetAllModel": (".invoices_client", "InvoicesGetAllModel"),
+    "InvoicesGetOneModel": (".invoices_client", "InvoicesGetOneModel"),
+    "InvoicesInsertModel": (".invoices_client", "InvoicesInsertModel"),
+    "InvoicesUpdateModel": (".invoices_client", "InvoicesUpdateModel"),
+    "LanguagesClient": (".languages_client", "LanguagesClient"),
+    "LanguagesCountModifiedSinceModel": (
+        ".languages_client",
+        "LanguagesCountModifiedSinceModel",
+    ),
+    "LanguagesGetModifiedSinceModel": (
+        ".languages_client",
+        "LanguagesGetModifiedSinceModel",
+    ),
+    "MaturitydatesClient": (".maturitydates_client", "MaturitydatesClient"),
+    "MaturitydatesCountModifiedSinceModel": (
+        ".maturitydates_client",
+        "MaturitydatesCountModifiedSinceModel",
+    ),
+    "MaturitydatesDeleteModel": (".maturitydates_client", "MaturitydatesDeleteModel"),
+    "MaturitydatesGetAllModel": (".maturitydates_client", "MaturitydatesGetAllModel"),
+    "MaturitydatesGetModifiedSinceModel": (
+        ".maturitydates_client",
+        "MaturitydatesGetModifiedSinceModel",
+    ),
+    "MaturitydatesInsertModel": (".maturitydates_client", "MaturitydatesInsertModel"),
+    "MaturitydatesUpdateModel": (".maturitydates_client", "MaturitydatesUpdateModel"),
+    "MeasurementunitsClient": (".measurementunits_client", "MeasurementunitsClient"),
+    "MeasurementunitsCountModifiedSinceModel": (
+        ".measurementunits_client",
+        "MeasurementunitsCountModifiedSinceModel",
+    ),
+    "MeasurementunitsDeleteModel": (
+        ".measurementunits_client",
+        "MeasurementunitsDeleteModel",
+    ),
+    "MeasurementunitsGetAllModel": (
+        ".measurementunits_client",
+        "MeasurementunitsGetAllModel",
+    ),
+    "MeasurementunitsGetModifiedSinceModel": (
+        ".measurementunits_client",
+        "MeasurementunitsGetModifiedSinceModel",
+    ),
+    "MeasurementunitsInsertModel": (
+        ".measurementunits_client",
+        "MeasurementunitsInsertModel",
+    ),
+    "MeasurementunitsUpdateModel": (
+        ".measurementunits_client",
+        "MeasurementunitsUpdateModel",
+    ),
+    "OwnassetsmovementguidesClient": (
+        ".ownassetsmovementguides_client",
+        "OwnassetsmovementguidesClient",
+    ),
+    "OwnassetsmovementguidesClientAssociated_documentsModel": (
+        ".ownassetsmovementguides_client",
+        "Associated_documents",
+    ),
+    "OwnassetsmovementguidesClientPaymentsModel": (
+        ".ownassetsmovementguides_client",
+        "Payments",
+    ),
+    "OwnassetsmovementguidesClientProductsModel": (
+        ".ownassetsmovementguides_client",
+        "Products",
+    ),
+    "OwnassetsmovementguidesCountModel": (
+        ".ownassetsmovementguides_client",
+        "OwnassetsmovementguidesCountModel",
+    ),
+    "OwnassetsmovementguidesDeleteModel": (
+        ".ownassetsmovementguides_client",
+        "OwnassetsmovementguidesDeleteModel",
+    ),
+    "OwnassetsmovementguidesGetAllModel": (
+        ".ownassetsmovementguides_client",
+        "OwnassetsmovementguidesGetAllModel",
+    ),
+    "OwnassetsmovementguidesGetOneModel": (
+        ".ownassetsmovementguides_client",
+        "OwnassetsmovementguidesGetOneModel",
+    ),
+    "OwnassetsmovementguidesInsertModel": (
+        ".ownassetsmovementguides_client",
+        "OwnassetsmovementguidesInsertModel",
+    ),
+    "OwnassetsmovementguidesSetTransportCodeModel": (
+        ".ownassetsmovementguides_client",
+        "OwnassetsmovementguidesSetTransportCodeModel",
+    ),
+    "OwnassetsmovementguidesUpdateModel": (
+        ".ownassetsmovementguides_client",
+        "OwnassetsmovementguidesUpdateModel",
+    ),
+    "PaymentmethodsClient": (".paymentmethods_client", "PaymentmethodsClient"),
+    "PaymentmethodsCountModifiedSinceModel": (
+        ".paymentmethods_client",
+        "PaymentmethodsCountModifiedSinceModel",
+    ),
+    "PaymentmethodsDeleteModel": (
+        ".paymentmethods_client",
+        "PaymentmethodsDeleteModel",
+    ),
+    "PaymentmethodsGetAllModel": (
+        ".paymentmethods_client",
+        "PaymentmethodsGetAllModel",
+    ),
+    "PaymentmethodsGetModifiedSinceModel": (
+        ".paymentmethods_client",
+        "PaymentmethodsGetModifiedSinceModel",
+    ),
+    "PaymentmethodsInsertModel": (
+        ".paymentmethods_client",
+        "PaymentmethodsInsertModel",
+    ),
+    "PaymentmethodsUpdateModel": (
+        ".paymentmethods_client",
+        "PaymentmethodsUpdateModel",
+    ),
+    "ProductcategoriesClient": (".productcategories_client", "ProductcategoriesClient"),
+    "ProductcategoriesClientSuppliersModel": (".productcategories_client", "Suppliers"),
+    "ProductcategoriesClientTaxesModel": (".productcategories_client", "Taxes"),
+    "ProductcategoriesClientWarehousesModel": (
+        ".productcategories_client",
+        "Warehouses",
+    ),
+    "ProductcategoriesDeleteModel": (
+        ".productcategories_client",
+        "ProductcategoriesDeleteModel",
+    ),
+    "ProductcategoriesGetAllModel": (
+        ".productcategories_client",
+        "ProductcategoriesGetAllModel",
+    ),
+    "ProductcategoriesGetModifiedSinceModel": (
+        ".productcategories_client",
+        "ProductcategoriesGetModifiedSinceModel",
+    ),
+    "ProductcategoriesInsertModel": (
+        ".productcategories_client",
+        "ProductcategoriesInsertModel",
+    ),
+    "ProductcategoriesUpdateModel": (
+        ".productcategories_client",
+        "ProductcategoriesUpdateModel",
+    ),
+    "ProductsClient": (".products_client", "ProductsClient"),
+    "ProductsClientSuppliersModel": (".products_client", "Suppliers"),
+    "ProductsClientTaxesModel": (".products_client", "Taxes"),
+    "ProductsClientWarehousesModel": (".products_client", "Warehouses"),
+    "ProductsCountByEanModel": (".products_client", "ProductsCountByEanModel"),
+    "ProductsCountByNameModel": (".products_client", "ProductsCountByNameModel"),
+    "ProductsCountByReferenceModel": (
+        ".products_client",
+        "ProductsCountByReferenceModel",
+    ),
+    "ProductsCountBySearchModel": (".products_client", "ProductsCountBySearchModel"),
+    "ProductsCountModel": (".products_client", "ProductsCountModel"),
+    "ProductsCountModifiedSinceModel": (
+        ".products_client",
+        "ProductsCountModifiedSinceModel",
+    ),
+    "ProductsDeleteModel": (".products_client", "ProductsDeleteModel"),
+    "ProductsGetAllModel": (".products_client", "ProductsGetAllModel"),
+    "ProductsGetByEanModel": (".products_client", "ProductsGetByEanModel"),
+    "ProductsGetByNameModel": (".products_client", "ProductsGetByNameModel"),
+    "ProductsGetByReferenceModel": (".products_client", "ProductsGetByReferenceModel"),
+    "ProductsGetBySearchModel": (".products_client", "ProductsGetBySearchModel"),
+    "ProductsGetModifiedSinceModel": (
+        ".products_client",
+        "ProductsGetModifiedSinceModel",
+    ),
+    "ProductsGetOneModel": (".products_client", "ProductsGetOneModel"),
+    "ProductsInsertModel": (".products_client", "ProductsInsertModel"),
+    "ProductsUpdateModel": (".products_client", "ProductsUpdateModel"),
+    "ReceiptsClient": (".receipts_client", "ReceiptsClient"),
+    "ReceiptsClientAssociated_documentsModel": (
+        ".receipts_client",
+        "Associated_documents",
+    ),
+    "ReceiptsClientPaymentsModel": (".receipts_client", "Payments"),
+    "ReceiptsClientProductsModel": (".receipts_client", "Products"),
+    "ReceiptsCountModel": (".receipts_client", "ReceiptsCountModel"),
+    "ReceiptsDeleteModel": (".receipts_client", "ReceiptsDeleteModel"),
+    "ReceiptsGetAllModel": (".receipts_client", "ReceiptsGetAllModel"),
+    "ReceiptsGetOneModel": (".receipts_client", "ReceiptsGetOneModel"),
+    "ReceiptsInsertModel": (".receipts_client", "ReceiptsInsertModel"),
+    "ReceiptsUpdateModel": (".receipts_client", "ReceiptsUpdateModel"),
+    "SalesmenClient": (".salesmen_client", "SalesmenClient"),
+    "SalesmenCountModifiedSinceModel": (
+        ".salesmen_client",
+        "SalesmenCountModifiedSinceModel",
+    ),
+    "SalesmenDeleteModel": (".salesmen_client", "SalesmenDeleteModel"),
+    "SalesmenGetAllModel": (".salesmen_client", "SalesmenGetAllModel"),
+    "SalesmenGetModifiedSinceModel": (
+        ".salesmen_client",
+        "SalesmenGetModifiedSinceModel",
+    ),
+    "SalesmenGetOneModel": (".salesmen_client", "SalesmenGetOneModel"),
+    "SalesmenInsertModel": (".salesmen_client", "SalesmenInsertModel"),
+    "SalesmenUpdateModel": (".salesmen_client", "SalesmenUpdateModel"),
+    "SimplifiedinvoicesClient": (
+        ".simplifiedinvoices_client",
+        "SimplifiedinvoicesClient",
+    ),
+    "SimplifiedinvoicesClientAssociated_documentsModel": (
+        ".simplifiedinvoices_client",
+        "Associated_documents",
+    ),
+    "SimplifiedinvoicesClientPaymentsModel": (".simplifiedinvoices_client", "Payments"),
+    "SimplifiedinvoicesClientProductsModel": (".simplifiedinvoices_client", "Products"),
+    "SimplifiedinvoicesCountModel": (
+        ".simplifiedinvoices_client",
+        "SimplifiedinvoicesCountModel",
+    ),
+    "SimplifiedinvoicesDeleteModel": (
+        ".simplifiedinvoices_client",
+        "SimplifiedinvoicesDeleteModel",
+    ),
+    "SimplifiedinvoicesGetAllModel": (
+        ".simplifiedinvoices_client",
+        "SimplifiedinvoicesGetAllModel",
+    ),
+    "SimplifiedinvoicesGetOneModel": (
+        ".simplifiedinvoices_client",
+        "SimplifiedinvoicesGetOneModel",
+    ),
+    "SimplifiedinvoicesInsertModel": (
+        ".simplifiedinvoices_client",
+        "SimplifiedinvoicesInsertModel",
+    ),
+    "SimplifiedinvoicesUpdateModel": (
+        ".simplifiedinvoices_client",
+        "SimplifiedinvoicesUpdateModel",
+    ),
+    "SubscriptionClient": (".subscription_client", "SubscriptionClient"),
+    "SubscriptionClientSuppliersModel": (".subscription_client", "Suppliers"),
+    "SubscriptionClientTaxesModel": (".subscription_client", "Taxes"),
+    "SubscriptionClientWarehousesModel": (".subscription_client", "Warehouses"),
+    "SubscriptionGetOneModel": (".subscription_client", "SubscriptionGetOneModel"),
+    "SuppliersClient": (".suppliers_client", "SuppliersClient"),
+    "SuppliersCountByNameModel": (".suppliers_client", "SuppliersCountByNameModel"),
+    "SuppliersCountByNumberModel": (".suppliers_client", "SuppliersCountByNumberModel"),
+    "SuppliersCountBySearchModel": (".suppliers_client", "SuppliersCountBySearchModel"),
+    "SuppliersCountByVatModel": (".suppliers_client", "SuppliersCountByVatModel"),
+    "SuppliersCountModel": (".suppliers_client", "SuppliersCountModel"),
+    "SuppliersCountModifiedSinceModel": (
+        ".suppliers_client",
+        "SuppliersCountModifiedSinceModel",
+    ),
+    "SuppliersDeleteModel": (".suppliers_client", "SuppliersDeleteModel"),
+    "SuppliersGetAllModel": (".suppliers_client", "SuppliersGetAllModel"),
+    "SuppliersGetByNameModel": (".suppliers_client", "SuppliersGetByNameModel"),
+    "SuppliersGetByNumberModel": (".suppliers_client", "SuppliersGetByNumberModel"),
+    "SuppliersGetBySearchModel": (".suppliers_client", "SuppliersGetBySearchModel"),
+    "SuppliersGetByVatModel": (".suppliers_client", "SuppliersGetByVatModel"),
+    "SuppliersGetModifiedSinceModel": (
+        ".suppliers_client",
+        "SuppliersGetModifiedSinceModel",
+    ),
+    "SuppliersGetOneModel": (".suppliers_client", "SuppliersGetOneModel"),
+    "SuppliersInsertModel": (".suppliers_client", "SuppliersInsertModel"),
+    "SuppliersUpdateModel": (".suppliers_client", "SuppliersUpdateModel"),
+    "TaxesClient": (".taxes_client", "TaxesClient"),
+    "TaxesCountModifiedSinceModel": (".taxes_client", "TaxesCountModifiedSinceModel"),
+    "TaxesDeleteModel": (".taxes_client", "TaxesDeleteModel"),
+    "TaxesGetAllModel": (".taxes_client", "TaxesGetAllModel"),
+    "TaxesGetModifiedSinceModel": (".taxes_client", "TaxesGetModifiedSinceModel"),
+    "TaxesInsertModel": (".taxes_client", "TaxesInsertModel"),
+    "TaxesUpdateModel": (".taxes_client", "TaxesUpdateModel"),
+    "TaxexemptionsClient": (".taxexemptions_client", "TaxexemptionsClient"),
+    "TaxexemptionsCountModifiedSinceModel": (
+        ".taxexemptions_client",
+        "TaxexemptionsCountModifiedSinceModel",
+    ),
+    "TaxexemptionsGetModifiedSinceModel": (
+        ".taxexemptions_client",
+        "TaxexemptionsGetModifiedSinceModel",
+    ),
+    "UsersClient": (".users_client", "UsersClient"),
+    "UsersClientSuppliersModel": (".users_client", "Suppliers"),
+    "UsersClientTaxesModel": (".users_client", "Taxes"),
+    "UsersClientWarehousesModel": (".users_client", "Warehouses"),
+    "UsersGetAllModel": (".users_client", "UsersGetAllModel"),
+    "VehiclesClient": (".vehicles_client", "VehiclesClient"),
+    "VehiclesCountModifiedSinceModel": (
+        ".vehicles_client",
+        "VehiclesCountModifiedSinceModel",
+    ),
+    "VehiclesDeleteModel": (".vehicles_client", "VehiclesDeleteModel"),
+    "VehiclesGetAllModel": (".vehicles_client", "VehiclesGetAllModel"),
+    "VehiclesGetModifiedSinceModel": (
+        ".vehicles_client",
+        "VehiclesGetModifiedSinceModel",
+    ),
+    "VehiclesInsertModel": (".vehicles_client", "VehiclesInsertModel"),
+    "VehiclesUpdateModel": (".vehicles_client", "VehiclesUpdateModel"),
+    "WarehousesClient": (".warehouses_client", "WarehousesClient"),
+    "WarehousesClientSuppliersModel": (".warehouses_client", "Suppliers"),
+    "WarehousesClientTaxesModel": (".warehouses_client", "Taxes"),
+    "WarehousesClientWarehousesModel": (".warehouses_client", "Warehouses"),
+    "WarehousesCountModifiedSinceModel": (
+        ".warehouses_client",
+        "WarehousesCountModifiedSinceModel",
+    ),
+    "WarehousesDeleteModel": (".warehouses_client", "WarehousesDeleteModel"),
+    "WarehousesGetAllModel": (".warehouses_client", "WarehousesGetAllModel"),
+    "WarehousesGetModifiedSinceModel": (
+        ".warehouses_client",
+        "WarehousesGetModifiedSinceModel",
+    ),
+    "WarehousesInsertModel": (".warehouses_client", "WarehousesInsertModel"),
+    "WarehousesUpdateModel": (".warehouses_client", "WarehousesUpdateModel"),
+    "WaybillsClient": (".waybills_client", "WaybillsClient"),
+    "WaybillsClientAssociated_documentsModel": (
+        ".waybills_client",
+        "Associated_documents",
+    ),
+    "WaybillsClientPaymentsModel": (".waybills_client", "Payments"),
+    "WaybillsClientProductsModel": (".waybills_client", "Products"),
+    "WaybillsCountModel": (".waybills_client", "WaybillsCountModel"),
+    "WaybillsDeleteModel": (".waybills_client", "WaybillsDeleteModel"),
+    "WaybillsGetAllModel": (".waybills_client", "WaybillsGetAllModel"),
+    "WaybillsGetOneModel": (".waybills_client", "WaybillsGetOneModel"),
+    "WaybillsInsertModel": (".waybills_client", "WaybillsInsertModel"),
+    "WaybillsSetTransportCodeModel": (
+        ".waybills_client",
+        "WaybillsSetTransportCodeModel",
+    ),
+    "WaybillsUpdateModel": (".waybills_client", "WaybillsUpdateModel"),
+}
+
+__all__ = list(_exports)
+
+
+def __getattr__(name):
+    try:
+        module_name, attribute = _exports[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,3025 @@
+"""
+Endpoint table of the Moloni API clients, generated by `code_generator/client_gen.py` and read by
+`moloni.api._factory`.
+
+COMPONENTS: nested model -> its field names, every field is `Optional[Any] = None`
+CLIENTS: client class -> the nested models its module exports (`components`), its endpoint methods as
+    method name -> (path, HTTP method, request model or None) (`endpoints`), and its request models as
+    model name -> fields as (name, type, default), `...` for a required field (`models`)
+"""
+
+COMPONENTS = {
+    "Associated_documents": ("associated_id", "value"),
+    "Payments": ("date", "notes", "payment_method_id", "value"),
+    "Products": (
+        "discount",
+        "exemption_reason",
+        "name",
+        "order",
+        "price",
+        "product_id",
+        "qty",
+        "summary",
+        "taxes",
+        "warehouse_id",
+    ),
+    "Suppliers": ("cost_price", "supplier_id"),
+    "Taxes": ("cumulative", "order", "tax_id", "value"),
+    "Warehouses": ("stock", "warehouse_id"),
+}
+
+CLIENTS = {
+    "BankaccountsClient": {
+        "components": (),
+        "endpoints": {
+            "count_modified_since": (
+                "/bankAccounts/countModifiedSince/",
+                "post",
+                "BankaccountsCountModifiedSinceModel",
+            ),
+            "delete": ("/bankAccounts/delete/", "post", "BankaccountsDeleteModel"),
+            "get_all": ("/bankAccounts/getAll/", "post", "BankaccountsGetAllModel"),
+            "insert": ("/bankAccounts/insert/", "post", "BankaccountsInsertModel"),
+            "update": ("/bankAccounts/update/", "post", "BankaccountsUpdateModel"),
+        },
+        "models": {
+            "BankaccountsCountModifiedSinceModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("lastmodified", "Optional[str]", None),
+            ),
+            "BankaccountsDeleteModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("bank_account_id", "Optional[Union[str, int]]", None),
+            ),
+            "BankaccountsGetAllModel": (("company_id", "Union[str, int]", ...),),
+            "BankaccountsInsertModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("name", "Optional[str]", None),
+                ("order", "Optional[str]", None),
+                ("value", "Optional[str]", None),
+            ),
+            "BankaccountsUpdateModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("bank_account_id", "Optional[Union[str, int]]", None),
+                ("name", "Optional[str]", None),
+                ("order", "Optional[str]", None),
+                ("value", "Optional[str]", None),
+            ),
+        },
+    },
+    "BillsofladingClient": {
+        "components": ("Associated_documents", "Payments", "Products"),
+        "endpoints": {
+            "count": ("/billsOfLading/count/", "post", "BillsofladingCountModel"),
+            "delete": ("/billsOfLading/delete/", "post", "BillsofladingDeleteModel"),
+            "get_all": ("/billsOfLading/getAll/", "post", "BillsofladingGetAllModel"),
+            "get_one": ("/billsOfLading/getOne/", "post", "BillsofladingGetOneModel"),
+            "insert": ("/billsOfLading/insert/", "post", "BillsofladingInsertModel"),
+            "set_transport_code": (
+                "/billsOfLading/setTransportCode/",
+                "post",
+                "BillsofladingSetTransportCodeModel",
+            ),
+            "update": ("/billsOfLading/update/", "post", "BillsofladingUpdateModel"),
+        },
+        "models": {
+            "BillsofladingCountModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("customer_id", "Optional[Union[str, int]]", None),
+                ("date", "Optional[str]", None),
+                ("document_set_id", "Optional[Union[str, int]]", None),
+                ("number", "Optional[str]", None),
+                ("year", "Optional[str]", None),
+                ("your_reference", "Optional[str]", None),
+            ),
+            "BillsofladingDeleteModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("document_id", "Optional[Union[str, int]]", None),
+            ),
+            "BillsofladingGetAllModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("customer_id", "Optional[Union[str, int]]", None),
+                ("date", "Optional[str]", None),
+                ("document_set_id", "Optional[Union[str, int]]", None),
+                ("number", "Optional[str]", None),
+                ("offset", "Optional[Union[str, int]]", 0),
+                ("qty", "Optional[Union[str, int]]", 25),
+                ("year", "Optional[str]", None),
+                ("your_reference", "Optional[str]", None),
+            ),
+            "BillsofladingGetOneModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("customer_id", "Optional[Union[str, int]]", None),
+                ("date", "Optional[str]", None),
+                ("document_id", "Optional[Union[str, int]]", None),
+                ("document_set_id", "Optional[Union[str, int]]", None),
+                ("number", "Optional[str]", None),
+                ("year", "Optional[str]", None),
+                ("your_reference", "Optional[str]", None),
+            ),
+            "BillsofladingInsertModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("associated_documents", "Optional[List[Associated_documents]]", None),
+                ("customer_id", "Optional[Union[str, int]]", None),
+                ("date", "Optional[str]", None),
+                ("delivery_datetime", "Optional[str]", None),
+                ("delivery_departure_address", "Optional[str]", None),
+                ("delivery_departure_city", "Optional[str]", None),
+                ("delivery_departure_country", "Optional[str]", None),
+                ("delivery_departure_zip_code", "Optional[str]", None),
+                ("delivery_destination_address", "Optional[str]", None),
+                ("delivery_destination_city", "Optional[str]", None),
+                ("delivery_destination_country", "Optional[str]", None),
+                ("delivery_destination_zip_code", "Optional[str]", None),
+                ("delivery_method_id", "Optional[Union[str, int]]", None),
+                ("document_set_id", "Optional[Union[str, int]]", None),
+                ("notes", "Optional[str]", None),
+                ("products", "Optional[List[Products]]", None),
+                ("related_documents_notes", "Optional[str]", None),
+                ("status", "Optional[str]", None),
+                ("vehicle_id", "Optional[Union[str, int]]", None),
+                ("your_reference", "Optional[str]", None),
+            ),
+            "BillsofladingSetTransportCodeModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("document_id", "Optional[Union[str, int]]", None),
+                ("transport_code", "Optional[str]", None),
+            ),
+            "BillsofladingUpdateModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("associated_documents", "Optional[List[Associated_documents]]", None),
+                ("customer_id", "Optional[Union[str, int]]", None),
+                ("date", "Optional[str]", None),
+                ("delivery_datetime", "Optional[str]", None),
+                ("delivery_departure_address", "Optional[str]", None),
+                ("delivery_departure_city", "Optional[str]", None),
+                ("delivery_departure_country", "Optional[str]", None),
+                ("delivery_departure_zip_code", "Optional[str]", None),
+                ("delivery_destination_address", "Optional[str]", None),
+                ("delivery_destination_city", "Optional[str]", None),
+                ("delivery_destination_country", "Optional[str]", None),
+                ("delivery_destination_zip_code", "Optional[str]", None),
+                ("delivery_method_id", "Optional[Union[str, int]]", None),
+                ("document_id", "Optional[Union[str, int]]", None),
+                ("document_set_id", "Optional[Union[str, int]]", None),
+                ("notes", "Optional[str]", None),
+                ("products", "Optional[List[Products]]", None),
+                ("related_documents_notes", "Optional[str]", None),
+                ("status", "Optional[str]", None),
+                ("vehicle_id", "Optional[Union[str, int]]", None),
+                ("your_reference", "Optional[str]", None),
+            ),
+        },
+    },
+    "CompaniesClient": {
+        "components": ("Suppliers", "Taxes", "Warehouses"),
+        "endpoints": {
+            "get_all": ("/companies/getAll/", "post", None),
+            "get_one": ("/companies/getOne/", "post", "CompaniesGetOneModel"),
+            "update": ("/companies/update/", "post", "CompaniesUpdateModel"),
+        },
+        "models": {
+            "CompaniesGetOneModel": (("company_id", "Union[str, int]", ...),),
+            "CompaniesUpdateModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("address", "Optional[str]", None),
+                ("capital", "Optional[str]", None),
+                ("city", "Optional[str]", None),
+                ("commercial_registration_number", "Optional[str]", None),
+                ("country_id", "Optional[Union[str, int]]", None),
+                ("currency_id", "Optional[Union[str, int]]", None),
+                ("customer_series", "Optional[str]", None),
+                ("decimal_places", "Optional[str]", None),
+                ("decimal_separator", "Optional[str]", None),
+                ("delivery_method_id", "Optional[Union[str, int]]", None),
+                ("detached_series_doc_number", "Optional[str]", None),
+                ("docs_commercial_info_on_footer", "Optional[str]", None),
+                ("docs_company_info_position", "Optional[str]", None),
+                ("docs_copies", "Optional[str]", None),
+                ("docs_footer", "Optional[str]", None),
+                ("docs_pdf_model_id", "Optional[Union[str, int]]", None),
+                ("docs_qty_products_page", "Optional[str]", None),
+                ("docs_show_client_phone", "Optional[str]", None),
+                ("docs_show_client_vat_prefix", "Optional[str]", None),
+                ("docs_show_company_notes", "Optional[str]", None),
+                ("docs_show_related", "Optional[str]", None),
+                ("docs_show_values_on_movement_docs", "Optional[str]", None),
+                ("docs_show_values_on_return_docs", "Optional[str]", None),
+                ("docs_show_values_orders_docs", "Optional[str]", None),
+                ("docs_show_values_with_taxes", "Optional[str]", None),
+                ("email", "Optional[str]", None),
+                ("fax", "Optional[str]", None),
+                ("is_retailer_or_tsp", "Optional[bool]", None),
+                ("mails_sender_address", "Optional[str]", None),
+                ("mails_sender_name", "Optional[str]", None),
+                ("maturity_date_id", "Optional[Union[str, int]]", None),
+                ("maturity_on_week_day", "Optional[str]", None),
+                ("name", "Optional[str]", None),
+                ("notes", "Optional[str]", None),
+                ("notify_late_documents", "Optional[str]", None),
+                ("numeric_code_ordering", "Optional[str]", None),
+                ("payment_method_id", "Optional[Union[str, int]]", None),
+                ("phone", "Optional[str]", None),
+                ("registry_office", "Optional[str]", None),
+                ("show_home_charts", "Optional[str]", None),
+                ("show_inactive_customers", "Optional[str]", None),
+                ("show_inactive_products", "Optional[str]", None),
+                ("thousands_separator", "Optional[str]", None),
+                ("vat", "Optional[str]", None),
+                ("website", "Optional[str]", None),
+                ("zip_code", "Optional[str]", None),
+            ),
+        },
+    },
+    "CountriesClient": {
+        "components": (),
+        "endpoints": {
+            "count_modified_since": (
+                "/countries/countModifiedSince/",
+                "post",
+                "CountriesCountModifiedSinceModel",
+            ),
+            "get_all": ("/countries/getAll/", "post", None),
+            "get_modified_since": (
+                "/countries/getModifiedSince/",
+                "post",
+                "CountriesGetModifiedSinceModel",
+            ),
+        },
+        "models": {
+            "CountriesCountModifiedSinceModel": (
+                ("lastmodified", "Optional[str]", None),
+            ),
+            "CountriesGetModifiedSinceModel": (
+                ("lastmodified", "Optional[str]", None),
+            ),
+        },
+    },
+    "CreditnotesClient": {
+        "components": ("Associated_documents", "Payments", "Products"),
+        "endpoints": {
+            "count": ("/creditNotes/count/", "post", "CreditnotesCountModel"),
+            "delete": ("/creditNotes/delete/", "post", "CreditnotesDeleteModel"),
+            "get_all": ("/creditNotes/getAll/", "post", "CreditnotesGetAllModel"),
+            "get_one": ("/creditNotes/getOne/", "post", "CreditnotesGetOneModel"),
+            "insert": ("/creditNotes/insert/", "post", "CreditnotesInsertModel"),
+            "update": ("/creditNotes/update/", "post", "CreditnotesUpdateModel"),
+        },
+        "models": {
+            "CreditnotesCountModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("customer_id", "Optional[Union[str, int]]", None),
+                ("date", "Optional[str]", None),
+                ("document_set_id", "Optional[Union[str, int]]", None),
+                ("expiration_date", "Optional[str]", None),
+                ("number", "Optional[str]", None),
+                ("our_reference", "Optional[str]", None),
+                ("salesman_id", "Optional[Union[str, int]]", None),
+                ("supplier_id", "Optional[Union[str, int]]", None),
+                ("year", "Optional[str]", None),
+                ("your_reference", "Optional[str]", None),
+            ),
+            "CreditnotesDeleteModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("document_id", "Optional[Union[str, int]]", None),
+            ),
+            "CreditnotesGetAllModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("customer_id", "Optional[Union[str, int]]", None),
+                ("date", "Optional[str]", None),
+                ("document_set_id", "Optional[Union[str, int]]", None),
+                ("expiration_date", "Optional[str]", None),
+                ("number", "Optional[str]", None),
+                ("offset", "Optional[Union[str, int]]", 0),
+                ("our_reference", "Optional[str]", None),
+                ("qty", "Optional[Union[str, int]]", 25),
+                ("salesman_id", "Optional[Union[str, int]]", None),
+                ("supplier_id", "Optional[Union[str, int]]", None),
+                ("year", "Optional[str]", None),
+                ("your_reference", "Optional[str]", None),
+            ),
+            "CreditnotesGetOneModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("customer_id", "Optional[Union[str, int]]", None),
+                ("date", "Optional[str]", None),
+                ("document_id", "Optional[Union[str, int]]", None),
+                ("document_set_id", "Optional[Union[str, int]]", None),
+                ("expiration_date", "Optional[str]", None),
+                ("number", "Optional[str]", None),
+                ("our_reference", "Optional[str]", None),
+                ("salesman_id", "Optional[Union[str, int]]", None),
+                ("supplier_id", "Optional[Union[str, int]]", None),
+                ("year", "Optional[str]", None),
+                ("your_reference", "Optional[str]", None),
+            ),
+            "CreditnotesInsertModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("associated_documents", "Optional[List[Associated_documents]]", None),
+                ("customer_id", "Optional[Union[str, int]]", None),
+                ("date", "Optional[str]", None),
+                ("deduction_id", "Optional[Union[str, int]]", None),
+                ("document_set_id", "Optional[Union[str, int]]", None),
+                ("financial_discount", "Optional[str]", None),
+                ("notes", "Optional[str]", None),
+                ("products", "Optional[List[Products]]", None),
+                ("related_documents_notes", "Optional[str]", None),
+                ("salesman_commission", "Optional[str]", None),
+                ("salesman_id", "Optional[Union[str, int]]", None),
+                ("status", "Optional[str]", None),
+                ("your_reference", "Optional[str]", None),
+            ),
+            "CreditnotesUpdateModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("associated_documents", "Optional[List[Associated_documents]]", None),
+                ("customer_id", "Optional[Union[str, int]]", None),
+                ("date", "Optional[str]", None),
+                ("deduction_id", "Optional[Union[str, int]]", None),
+                ("document_id", "Optional[Union[str, int]]", None),
+                ("document_set_id", "Optional[Union[str, int]]", None),
+                ("financial_discount", "Optional[str]", None),
+                ("notes", "Optional[str]", None),
+                ("products", "Optional[List[Products]]", None),
+                ("related_documents_notes", "Optional[str]", None),
+                ("salesman_commission", "Optional[str]", None),
+                ("salesman_id", "Optional[Union[str, int]]", None),
+                ("status", "Optional[str]", None),
+                ("your_reference", "Optional[str]", None),
+            ),
+        },
+    },
+    "CurrenciesClient": {
+        "components": (),
+        "endpoints": {
+            "count_modified_since": (
+                "/currencies/countModifiedSince/",
+                "post",
+                "CurrenciesCountModifiedSinceModel",
+            ),
+            "get_all": ("/currencies/getAll/", "post", None),
+            "get_modified_since": (
+                "/currencies/getModifiedSince/",
+                "post",
+                "CurrenciesGetModifiedSinceModel",
+            ),
+        },
+        "models": {
+            "CurrenciesCountModifiedSinceModel": (
+                ("lastmodified", "Optional[str]", None),
+            ),
+            "CurrenciesGetModifiedSinceModel": (
+                ("lastmodified", "Optional[str]", None),
+            ),
+        },
+    },
+    "CustomeralternateaddressesClient": {
+        "components": (),
+        "endpoints": {
+            "count_modified_since": (
+                "/customerAlternateAddresses/countModifiedSince/",
+                "post",
+                "CustomeralternateaddressesCountModifiedSinceModel",
+            ),
+            "delete": (
+                "/customerAlternateAddresses/delete/",
+                "post",
+                "CustomeralternateaddressesDeleteModel",
+            ),
+            "get_all": (
+                "/customerAlternateAddresses/getAll/",
+                "post",
+                "CustomeralternateaddressesGetAllModel",
+            ),
+            "get_modified_since": (
+                "/customerAlternateAddresses/getModifiedSince/",
+                "post",
+                "CustomeralternateaddressesGetModifiedSinceModel",
+            ),
+            "insert": (
+                "/customerAlternateAddresses/insert/",
+                "post",
+                "CustomeralternateaddressesInsertModel",
+            ),
+            "update": (
+                "/customerAlternateAddresses/update/",
+                "post",
+                "CustomeralternateaddressesUpdateModel",
+            ),
+        },
+        "models": {
+            "CustomeralternateaddressesCountModifiedSinceModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("lastmodified", "Optional[str]", None),
+            ),
+            "CustomeralternateaddressesDeleteModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("address_id", "Optional[Union[str, int]]", None),
+                ("customer_id", "Optional[Union[str, int]]", None),
+            ),
+            "CustomeralternateaddressesGetAllModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("customer_id", "Optional[Union[str, int]]", None),
+            ),
+            "CustomeralternateaddressesGetModifiedSinceModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("lastmodified", "Optional[str]", None),
+                ("offset", "Optional[Union[str, int]]", 0),
+                ("qty", "Optional[Union[str, int]]", 25),
+            ),
+            "CustomeralternateaddressesInsertModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("address", "Optional[str]", None),
+                ("city", "Optional[str]", None),
+                ("code", "Optional[str]", None),
+                ("contact_name", "Optional[str]", None),
+                ("country_id", "Optional[Union[str, int]]", None),
+                ("customer_id", "Optional[Union[str, int]]", None),
+                ("designation", "Optional[str]", None),
+                ("email", "Optional[str]", None),
+                ("fax", "Optional[str]", None),
+                ("phone", "Optional[str]", None),
+                ("zip_code", "Optional[str]", None),
+            ),
+            "CustomeralternateaddressesUpdateModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("address", "Optional[str]", None),
+                ("address_id", "Optional[Union[str, int]]", None),
+                ("city", "Optional[str]", None),
+                ("code", "Optional[str]", None),
+                ("contact_name", "Optional[str]", None),
+                ("country_id", "Optional[Union[str, int]]", None),
+                ("customer_id", "Optional[Union[str, int]]", None),
+                ("designation", "Optional[str]", None),
+                ("email", "Optional[str]", None),
+                ("fax", "Optional[str]", None),
+                ("phone", "Optional[str]", None),
+                ("zip_code", "Optional[str]", None),
+            ),
+        },
+    },
+    "CustomerreturnnotesClient": {
+        "components": ("Associated_documents", "Payments", "Products"),
+        "endpoints": {
+            "count": (
+                "/customerReturnNotes/count/",
+                "post",
+                "CustomerreturnnotesCountModel",
+            ),
+            "delete": (
+                "/customerReturnNotes/delete/",
+                "post",
+                "CustomerreturnnotesDeleteModel",
+            ),
+            "get_all": (
+                "/customerReturnNotes/getAll/",
+                "post",
+                "CustomerreturnnotesGetAllModel",
+            ),
+            "get_one": (
+                "/customerReturnNotes/getOne/",
+                "post",
+                "CustomerreturnnotesGetOneModel",
+            ),
+            "insert": (
+                "/customerReturnNotes/insert/",
+                "post",
+                "CustomerreturnnotesInsertModel",
+            ),
+            "set_transport_code": (
+                "/customerReturnNotes/setTransportCode/",
+                "post",
+                "CustomerreturnnotesSetTransportCodeModel",
+            ),
+            "update": (
+                "/customerReturnNotes/update/",
+                "post",
+                "CustomerreturnnotesUpdateModel",
+            ),
+        },
+        "models": {
+            "CustomerreturnnotesCountModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("customer_id", "Optional[Union[str, int]]", None),
+                ("date", "Optional[str]", None),
+                ("document_set_id", "Optional[Union[str, int]]", None),
+                ("number", "Optional[str]", None),
+                ("year", "Optional[str]", None),
+                ("your_reference", "Optional[str]", None),
+            ),
+            "CustomerreturnnotesDeleteModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("document_id", "Optional[Union[str, int]]", None),
+            ),
+            "CustomerreturnnotesGetAllModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("customer_id", "Optional[Union[str, int]]", None),
+                ("date", "Optional[str]", None),
+                ("document_set_id", "Optional[Union[str, int]]", None),
+                ("number", "Optional[str]", None),
+                ("offset", "Optional[Union[str, int]]", 0),
+                ("qty", "Optional[Union[str, int]]", 25),
+                ("year", "Optional[str]", None),
+                ("your_reference", "Optional[str]", None),
+            ),
+            "CustomerreturnnotesGetOneModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("customer_id", "Optional[Union[str, int]]", None),
+                ("date", "Optional[str]", None),
+                ("document_id", "Optional[Union[str, int]]", None),
+                ("document_set_id", "Optional[Union[str, int]]", None),
+                ("number", "Optional[str]", None),
+                ("year", "Optional[str]", None),
+                ("your_reference", "Optional[str]", None),
+            ),
+            "CustomerreturnnotesInsertModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("associated_documents", "Optional[List[Associated_documents]]", None),
+                ("customer_id", "Optional[Union[str, int]]", None),
+                ("date", "Optional[str]", None),
+                ("delivery_datetime", "Optional[str]", None),
+                ("delivery_departure_address", "Optional[str]", None),
+                ("delivery_departure_city", "Optional[str]", None),
+                ("delivery_departure_country", "Optional[str]", None),
+                ("delivery_departure_zip_code", "Optional[str]", None),
+                ("delivery_destination_address", "Optional[str]", None),
+                ("delivery_destination_city", "Optional[str]", None),
+                ("delivery_destination_country", "Optional[str]", None),
+                ("delivery_destination_zip_code", "Optional[str]", None),
+                ("delivery_method_id", "Optional[Union[str, int]]", None),
+                ("document_set_id", "Optional[Union[str, int]]", None),
+                ("financial_discount", "Optional[str]", None),
+                ("notes", "Optional[str]", None),
+                ("products", "Optional[List[Products]]", None),
+                ("related_documents_notes", "Optional[str]", None),
+                ("status", "Optional[str]", None),
+                ("vehicle_id", "Optional[Union[str, int]]", None),
+                ("your_reference", "Optional[str]", None),
+            ),
+            "CustomerreturnnotesSetTransportCodeModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("document_id", "Optional[Union[str, int]]", None),
+                ("transport_code", "Optional[str]", None),
+            ),
+            "CustomerreturnnotesUpdateModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("associated_documents", "Optional[List[Associated_documents]]", None),
+                ("customer_id", "Optional[Union[str, int]]", None),
+                ("date", "Optional[str]", None),
+                ("delivery_datetime", "Optional[str]", None),
+                ("delivery_departure_address", "Optional[str]", None),
+                ("delivery_departure_city", "Optional[str]", None),
+                ("delivery_departure_country", "Optional[str]", None),
+                ("delivery_departure_zip_code", "Optional[str]", None),
+                ("delivery_destination_address", "Optional[str]", None),
+                ("delivery_destination_city", "Optional[str]", None),
+                ("delivery_destination_country", "Optional[str]", None),
+                ("delivery_destination_zip_code", "Optional[str]", None),
+                ("delivery_method_id", "Optional[Union[str, int]]", None),
+                ("document_id", "Optional[Union[str, int]]", None),
+                ("document_set_id", "Optional[Union[str, int]]", None),
+                ("financial_discount", "Optional[str]", None),
+                ("notes", "Optional[str]", None),
+                ("products", "Optional[List[Products]]", None),
+                ("related_documents_notes", "Optional[str]", None),
+                ("status", "Optional[str]", None),
+                ("vehicle_id", "Optional[Union[str, int]]", None),
+                ("your_reference", "Optional[str]", None),
+            ),
+        },
+    },
+    "CustomersClient": {
+        "components": (),
+        "endpoints": {
+            "count": ("/customers/count/", "post", "CustomersCountModel"),
+            "count_by_name": (
+                "/customers/countByName/",
+                "post",
+                "CustomersCountByNameModel",
+            ),
+            "count_by_number": (
+                "/customers/countByNumber/",
+                "post",
+                "CustomersCountByNumberModel",
+            ),
+            "count_by_search": (
+                "/customers/countBySearch/",
+                "post",
+                "CustomersCountBySearchModel",
+            ),
+            "count_by_vat": (
+                "/customers/countByVat/",
+                "post",
+                "CustomersCountByVatModel",
+            ),
+            "count_modified_since": (
+                "/customers/countModifiedSince/",
+                "post",
+                "CustomersCountModifiedSinceModel",
+            ),
+            "delete": ("/customers/delete/", "post", "CustomersDeleteModel"),
+            "get_all": ("/customers/getAll/", "post", "CustomersGetAllModel"),
+            "get_by_name": ("/customers/getByName/", "post", "CustomersGetByNameModel"),
+            "get_by_email": (
+                "/customers/getByEmail/",
+                "post",
+                "CustomersGetByEmailModel",
+            ),
+            "get_by_number": (
+                "/customers/getByNumber/",
+                "post",
+                "CustomersGetByNumberModel",
+            ),
+            "get_by_search": (
+                "/customers/getBySearch/",
+                "post",
+                "CustomersGetBySearchModel",
+            ),
+            "get_by_vat": ("/customers/getByVat/", "post", "CustomersGetByVatModel"),
+            "get_last_number": (
+                "/customers/getLastNumber/",
+                "post",
+                "CustomersGetLastNumberModel",
+            ),
+            "get_modified_since": (
+                "/customers/getModifiedSince/",
+                "post",
+                "CustomersGetModifiedSinceModel",
+            ),
+            "get_one": ("/customers/getOne/", "post", "CustomersGetOneModel"),
+            "insert": ("/customers/insert/", "post", "CustomersInsertModel"),
+            "update": ("/customers/update/", "post", "CustomersUpdateModel"),
+        },
+        "models": {
+            "CustomersCountModel": (("company_id", "Union[str, int]", ...),),
+            "CustomersCountByNameModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("name", "Optional[str]", None),
+            ),
+            "CustomersCountByNumberModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("number", "Optional[str]", None),
+            ),
+            "CustomersCountBySearchModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("search", "Optional[str]", None),
+            ),
+            "CustomersCountByVatModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("vat", "Optional[str]", None),
+            ),
+            "CustomersCountModifiedSinceModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("lastmodified", "Optional[str]", None),
+            ),
+            "CustomersDeleteModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("customer_id", "Optional[Union[str, int]]", None),
+            ),
+            "CustomersGetAllModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("offset", "Optional[Union[str, int]]", 0),
+                ("qty", "Optional[Union[str, int]]", 25),
+            ),
+            "CustomersGetByNameModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("name", "Optional[str]", None),
+                ("offset", "Optional[Union[str, int]]", 0),
+                ("qty", "Optional[Union[str, int]]", 25),
+            ),
+            "CustomersGetByEmailModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("email", "Optional[str]", None),
+                ("offset", "Optional[Union[str, int]]", 0),
+                ("qty", "Optional[Union[str, int]]", 25),
+            ),
+            "CustomersGetByNumberModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("number", "Optional[str]", None),
+                ("offset", "Optional[Union[str, int]]", 0),
+                ("qty", "Optional[Union[str, int]]", 25),
+            ),
+            "CustomersGetBySearchModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("offset", "Optional[Union[str, int]]", 0),
+                ("qty", "Optional[Union[str, int]]", 25),
+                ("search", "Optional[str]", None),
+            ),
+            "CustomersGetByVatModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("offset", "Optional[Union[str, int]]", 0),
+                ("qty", "Optional[Union[str, int]]", 25),
+                ("vat", "Optional[str]", None),
+            ),
+            "CustomersGetLastNumberModel": (("company_id", "Union[str, int]", ...),),
+            "CustomersGetModifiedSinceModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("lastmodified", "Optional[str]", None),
+                ("offset", "Optional[Union[str, int]]", 0),
+                ("qty", "Optional[Union[str, int]]", 25),
+            ),
+            "CustomersGetOneModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("customer_id", "Optional[Union[str, int]]", None),
+            ),
+            "CustomersInsertModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("address", "Optional[str]", None),
+                ("city", "Optional[str]", None),
+                ("contact_email", "Optional[str]", None),
+                ("contact_name", "Optional[str]", None),
+                ("contact_phone", "Optional[str]", None),
+                ("country_id", "Optional[Union[str, int]]", None),
+                ("credit_limit", "Optional[str]", None),
+                ("delivery_method_id", "Optional[Union[str, int]]", None),
+                ("discount", "Optional[str]", None),
+                ("email", "Optional[str]", None),
+                ("fax", "Optional[str]", None),
+                ("field_notes", "Optional[str]", None),
+                ("language_id", "Optional[Union[str, int]]", None),
+                ("maturity_date_id", "Optional[Union[str, int]]", None),
+                ("name", "Optional[str]", None),
+                ("notes", "Optional[str]", None),
+                ("number", "Optional[str]", None),
+                ("payment_day", "Optional[str]", None),
+                ("payment_method_id", "Optional[Union[str, int]]", None),
+                ("phone", "Optional[str]", None),
+                ("qty_copies_document", "Optional[str]", None),
+                ("salesman_id", "Optional[Union[str, int]]", None),
+                ("vat", "Optional[str]", None),
+                ("website", "Optional[str]", None),
+                ("zip_code", "Optional[str]", None),
+            ),
+            "CustomersUpdateModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("address", "Optional[str]", None),
+                ("city", "Optional[str]", None),
+                ("contact_email", "Optional[str]", None),
+                ("contact_name", "Optional[str]", None),
+                ("contact_phone", "Optional[str]", None),
+                ("country_id", "Optional[Union[str, int]]", None),
+                ("credit_limit", "Optional[str]", None),
+                ("customer_id", "Optional[Union[str, int]]", None),
+                ("delivery_method_id", "Optional[Union[str, int]]", None),
+                ("discount", "Optional[str]", None),
+                ("email", "Optional[str]", None),
+                ("fax", "Optional[str]", None),
+                ("field_notes", "Optional[str]", None),
+                ("language_id", "Optional[Union[str, int]]", None),
+                ("maturity_date_id", "Optional[Union[str, int]]", None),
+                ("name", "Optional[str]", None),
+                ("notes", "Optional[str]", None),
+                ("number", "Optional[str]", None),
+                ("payment_day", "Optional[str]", None),
+                ("payment_method_id", "Optional[Union[str, int]]", None),
+                ("phone", "Optional[str]", None),
+                ("qty_copies_document", "Optional[str]", None),
+                ("salesman_id", "Optional[Union[str, int]]", None),
+                ("vat", "Optional[str]", None),
+                ("website", "Optional[str]", None),
+                ("zip_code", "Optional[str]", None),
+            ),
+        },
+    },
+    "DebitnotesClient": {
+        "components": ("Associated_documents", "Payments", "Products"),
+        "endpoints": {
+            "count": ("/debitNotes/count/", "post", "DebitnotesCountModel"),
+            "delete": ("/debitNotes/delete/", "post", "DebitnotesDeleteModel"),
+            "get_all": ("/debitNotes/getAll/", "post", "DebitnotesGetAllModel"),
+            "get_one": ("/debitNotes/getOne/", "post", "DebitnotesGetOneModel"),
+            "insert": ("/debitNotes/insert/", "post", "DebitnotesInsertModel"),
+            "update": ("/debitNotes/update/", "post", "DebitnotesUpdateModel"),
+        },
+        "models": {
+            "DebitnotesCountModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("customer_id", "Optional[Union[str, int]]", None),
+                ("date", "Optional[str]", None),
+                ("document_set_id", "Optional[Union[str, int]]", None),
+                ("expiration_date", "Optional[str]", None),
+                ("number", "Optional[str]", None),
+                ("our_reference", "Optional[str]", None),
+                ("salesman_id", "Optional[Union[str, int]]", None),
+                ("supplier_id", "Optional[Union[str, int]]", None),
+                ("year", "Optional[str]", None),
+                ("your_reference", "Optional[str]", None),
+            ),
+            "DebitnotesDeleteModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("document_id", "Optional[Union[str, int]]", None),
+            ),
+            "DebitnotesGetAllModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("customer_id", "Optional[Union[str, int]]", None),
+                ("date", "Optional[str]", None),
+                ("document_set_id", "Optional[Union[str, int]]", None),
+                ("expiration_date", "Optional[str]", None),
+                ("number", "Optional[str]", None),
+                ("offset", "Optional[Union[str, int]]", 0),
+                ("our_reference", "Optional[str]", None),
+                ("qty", "Optional[Union[str, int]]", 25),
+                ("salesman_id", "Optional[Union[str, int]]", None),
+                ("supplier_id", "Optional[Union[str, int]]", None),
+                ("year", "Optional[str]", None),
+                ("your_reference", "Optional[str]", None),
+            ),
+            "DebitnotesGetOneModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("customer_id", "Optional[Union[str, int]]", None),
+                ("date", "Optional[str]", None),
+                ("document_id", "Optional[Union[str, int]]", None),
+                ("document_set_id", "Optional[Union[str, int]]", None),
+                ("expiration_date", "Optional[str]", None),
+                ("number", "Optional[str]", None),
+                ("our_reference", "Optional[str]", None),
+                ("salesman_id", "Optional[Union[str, int]]", None),
+                ("supplier_id", "Optional[Union[str, int]]", None),
+                ("year", "Optional[str]", None),
+                ("your_reference", "Optional[str]", None),
+            ),
+            "DebitnotesInsertModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("customer_id", "Optional[Union[str, int]]", None),
+                ("date", "Optional[str]", None),
+                ("document_set_id", "Optional[Union[str, int]]", None),
+                ("expiration_date", "Optional[str]", None),
+                ("notes", "Optional[str]", None),
+                ("products", "Optional[List[Products]]", None),
+                ("salesman_commission", "Optional[str]", None),
+                ("salesman_id", "Optional[Union[str, int]]", None),
+                ("status", "Optional[str]", None),
+                ("your_reference", "Optional[str]", None),
+            ),
+            "DebitnotesUpdateModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("customer_id", "Optional[Union[str, int]]", None),
+                ("date", "Optional[str]", None),
+                ("document_id", "Optional[Union[str, int]]", None),
+                ("document_set_id", "Optional[Union[str, int]]", None),
+                ("expiration_date", "Optional[str]", None),
+                ("notes", "Optional[str]", None),
+                ("products", "Optional[List[Products]]", None),
+                ("salesman_commission", "Optional[str]", None),
+                ("salesman_id", "Optional[Union[str, int]]", None),
+                ("status", "Optional[str]", None),
+                ("your_reference", "Optional[str]", None),
+            ),
+        },
+    },
+    "DeductionsClient": {
+        "components": (),
+        "endpoints": {
+            "count_modified_since": (
+                "/deductions/countModifiedSince/",
+                "post",
+                "DeductionsCountModifiedSinceModel",
+            ),
+            "delete": ("/deductions/delete/", "post", "DeductionsDeleteModel"),
+            "get_all": ("/deductions/getAll/", "post", "DeductionsGetAllModel"),
+            "get_modified_since": (
+                "/deductions/getModifiedSince/",
+                "post",
+                "DeductionsGetModifiedSinceModel",
+            ),
+            "insert": ("/deductions/insert/", "post", "DeductionsInsertModel"),
+            "update": ("/deductions/update/", "post", "DeductionsUpdateModel"),
+        },
+        "models": {
+            "DeductionsCountModifiedSinceModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("lastmodified", "Optional[str]", None),
+            ),
+            "DeductionsDeleteModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("deduction_id", "Optional[Union[str, int]]", None),
+            ),
+            "DeductionsGetAllModel": (("company_id", "Union[str, int]", ...),),
+            "DeductionsGetModifiedSinceModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("lastmodified", "Optional[str]", None),
+            ),
+            "DeductionsInsertModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("name", "Optional[str]", None),
+                ("value", "Optional[str]", None),
+            ),
+            "DeductionsUpdateModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("deduction_id", "Optional[Union[str, int]]", None),
+                ("name", "Optional[str]", None),
+                ("value", "Optional[str]", None),
+            ),
+        },
+    },
+    "DeliverymethodsClient": {
+        "components": (),
+        "endpoints": {
+            "count_modified_since": (
+                "/deliveryMethods/countModifiedSince/",
+                "post",
+                "DeliverymethodsCountModifiedSinceModel",
+            ),
+            "delete": (
+                "/deliveryMethods/delete/",
+                "post",
+                "DeliverymethodsDeleteModel",
+            ),
+            "get_all": (
+                "/deliveryMethods/getAll/",
+                "post",
+                "DeliverymethodsGetAllModel",
+            ),
+            "get_modified_since": (
+                "/deliveryMethods/getModifiedSince/",
+                "post",
+                "DeliverymethodsGetModifiedSinceModel",
+            ),
+            "insert": (
+                "/deliveryMethods/insert/",
+                "post",
+                "DeliverymethodsInsertModel",
+            ),
+            "update": (
+                "/deliveryMethods/update/",
+                "post",
+                "DeliverymethodsUpdateModel",
+            ),
+        },
+        "models": {
+            "DeliverymethodsCountModifiedSinceModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("lastmodified", "Optional[str]", None),
+            ),
+            "DeliverymethodsDeleteModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("delivery_method_id", "Optional[Union[str, int]]", None),
+            ),
+            "DeliverymethodsGetAllModel": (("company_id", "Union[str, int]", ...),),
+            "DeliverymethodsGetModifiedSinceModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("lastmodified", "Optional[str]", None),
+            ),
+            "DeliverymethodsInsertModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("name", "Optional[str]", None),
+            ),
+            "DeliverymethodsUpdateModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("delivery_method_id", "Optional[Union[str, int]]", None),
+                ("name", "Optional[str]", None),
+            ),
+        },
+    },
+    "DeliverynotesClient": {
+        "components": ("Associated_documents", "Payments", "Products"),
+        "endpoints": {
+            "count": ("/deliveryNotes/count/", "post", "DeliverynotesCountModel"),
+            "delete": ("/deliveryNotes/delete/", "post", "DeliverynotesDeleteModel"),
+            "get_all": ("/deliveryNotes/getAll/", "post", "DeliverynotesGetAllModel"),
+            "get_one": ("/deliveryNotes/getOne/", "post", "DeliverynotesGetOneModel"),
+            "insert": ("/deliveryNotes/insert/", "post", "DeliverynotesInsertModel"),
+            "set_transport_code": (
+                "/deliveryNotes/setTransportCode/",
+                "post",
+                "DeliverynotesSetTransportCodeModel",
+            ),
+            "update": ("/deliveryNotes/update/", "post", "DeliverynotesUpdateModel"),
+        },
+        "models": {
+            "DeliverynotesCountModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("customer_id", "Optional[Union[str, int]]", None),
+                ("date", "Optional[str]", None),
+                ("document_set_id", "Optional[Union[str, int]]", None),
+                ("number", "Optional[str]", None),
+                ("salesman_id", "Optional[Union[str, int]]", None),
+                ("year", "Optional[str]", None),
+                ("your_reference", "Optional[str]", None),
+            ),
+            "DeliverynotesDeleteModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("document_id", "Optional[Union[str, int]]", None),
+            ),
+            "DeliverynotesGetAllModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("customer_id", "Optional[Union[str, int]]", None),
+                ("date", "Optional[str]", None),
+                ("document_set_id", "Optional[Union[str, int]]", None),
+                ("number", "Optional[str]", None),
+                ("offset", "Optional[Union[str, int]]", 0),
+                ("qty", "Optional[Union[str, int]]", 25),
+                ("salesman_id", "Optional[Union[str, int]]", None),
+                ("year", "Optional[str]", None),
+                ("your_reference", "Optional[str]", None),
+            ),
+            "DeliverynotesGetOneModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("customer_id", "Optional[Union[str, int]]", None),
+                ("date", "Optional[str]", None),
+                ("document_id", "Optional[Union[str, int]]", None),
+                ("document_set_id", "Optional[Union[str, int]]", None),
+                ("number", "Optional[str]", None),
+                ("salesman_id", "Optional[Union[str, int]]", None),
+                ("year", "Optional[str]", None),
+                ("your_reference", "Optional[str]", None),
+            ),
+            "DeliverynotesInsertModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("associated_documents", "Optional[List[Associated_documents]]", None),
+                ("customer_id", "Optional[Union[str, int]]", None),
+                ("date", "Optional[str]", None),
+                ("delivery_datetime", "Optional[str]", None),
+                ("delivery_departure_address", "Optional[str]", None),
+                ("delivery_departure_city", "Optional[str]", None),
+                ("delivery_departure_country", "Optional[str]", None),
+                ("delivery_departure_zip_code", "Optional[str]", None),
+                ("delivery_destination_address", "Optional[str]", None),
+                ("delivery_destination_city", "Optional[str]", None),
+                ("delivery_destination_country", "Optional[str]", None),
+                ("delivery_destination_zip_code", "Optional[str]", None),
+                ("delivery_method_id", "Optional[Union[str, int]]", None),
+                ("document_set_id", "Optional[Union[str, int]]", None),
+                ("notes", "Optional[str]", None),
+                ("products", "Optional[List[Products]]", None),
+                ("related_documents_notes", "Optional[str]", None),
+                ("salesman_commission", "Optional[str]", None),
+                ("salesman_id", "Optional[Union[str, int]]", None),
+                ("status", "Optional[str]", None),
+                ("vehicle_id", "Optional[Union[str, int]]", None),
+                ("your_reference", "Optional[str]", None),
+            ),
+            "DeliverynotesSetTransportCodeModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("document_id", "Optional[Union[str, int]]", None),
+                ("transport_code", "Optional[str]", None),
+            ),
+            "DeliverynotesUpdateModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("associated_documents", "Optional[List[Associated_documents]]", None),
+                ("customer_id", "Optional[Union[str, int]]", None),
+                ("date", "Optional[str]", None),
+                ("delivery_datetime", "Optional[str]", None),
+                ("delivery_departure_address", "Optional[str]", None),
+                ("delivery_departure_city", "Optional[str]", None),
+                ("delivery_departure_country", "Optional[str]", None),
+                ("delivery_departure_zip_code", "Optional[str]", None),
+                ("delivery_destination_address", "Optional[str]", None),
+                ("delivery_destination_city", "Optional[str]", None),
+                ("delivery_destination_country", "Optional[str]", None),
+                ("delivery_destination_zip_code", "Optional[str]", None),
+                ("delivery_method_id", "Optional[Union[str, int]]", None),
+                ("document_id", "Optional[Union[str, int]]", None),
+                ("document_set_id", "Optional[Union[str, int]]", None),
+                ("notes", "Optional[str]", None),
+                ("products", "Optional[List[Products]]", None),
+                ("related_documents_notes", "Optional[str]", None),
+                ("salesman_commission", "Optional[str]", None),
+                ("salesman_id", "Optional[Union[str, int]]", None),
+                ("status", "Optional[str]", None),
+                ("vehicle_id", "Optional[Union[str, int]]", None),
+                ("your_reference", "Optional[str]", None),
+            ),
+        },
+    },
+    "DocumentmodelsClient": {
+        "components": (),
+        "endpoints": {
+            "count_modified_since": (
+                "/documentModels/countModifiedSince/",
+                "post",
+                "DocumentmodelsCountModifiedSinceModel",
+            ),
+            "get_all": ("/documentModels/getAll/", "post", None),
+            "get_modified_since": (
+                "/documentModels/getModifiedSince/",
+                "post",
+                "DocumentmodelsGetModifiedSinceModel",
+            ),
+        },
+        "models": {
+            "DocumentmodelsCountModifiedSinceModel": (
+                ("lastmodified", "Optional[str]", None),
+            ),
+            "DocumentmodelsGetModifiedSinceModel": (
+                ("lastmodified", "Optional[str]", None),
+            ),
+        },
+    },
+    "DocumentsClient": {
+        "components": ("Associated_documents", "Payments", "Products"),
+        "endpoints": {
+            "count": ("/documents/count/", "post", "DocumentsCountModel"),
+            "get_all": ("/documents/getAll/", "post", "DocumentsGetAllModel"),
+            "get_all_document_types": (
+                "/documents/getAllDocumentTypes/",
+                "post",
+                "DocumentsGetAllDocumentTypesModel",
+            ),
+            "get_one": ("/documents/getOne/", "post", "DocumentsGetOneModel"),
+            "get_pdf_link": (
+                "/documents/getPDFLink/",
+                "post",
+                "DocumentsGetPdfLinkModel",
+            ),
+        },
+        "models": {
+            "DocumentsCountModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("customer_id", "Optional[Union[str, int]]", None),
+                ("date", "Optional[str]", None),
+                ("document_set_id", "Optional[Union[str, int]]", None),
+                ("expiration_date", "Optional[str]", None),
+                ("number", "Optional[str]", None),
+                ("our_reference", "Optional[str]", None),
+                ("salesman_id", "Optional[Union[str, int]]", None),
+                ("supplier_id", "Optional[Union[str, int]]", None),
+                ("year", "Optional[str]", None),
+                ("your_reference", "Optional[str]", None),
+            ),
+            "DocumentsGetAllModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("customer_id", "Optional[Union[str, int]]", None),
+                ("date", "Optional[str]", None),
+                ("document_set_id", "Optional[Union[str, int]]", None),
+                ("expiration_date", "Optional[str]", None),
+                ("number", "Optional[str]", None),
+                ("offset", "Optional[Union[str, int]]", 0),
+                ("our_reference", "Optional[str]", None),
+                ("qty", "Optional[Union[str, int]]", 25),
+                ("salesman_id", "Optional[Union[str, int]]", None),
+                ("supplier_id", "Optional[Union[str, int]]", None),
+                ("year", "Optional[str]", None),
+                ("your_reference", "Optional[str]", None),
+            ),
+            "DocumentsGetAllDocumentTypesModel": (
+                ("language_id", "Optional[Union[str, int]]", None),
+            ),
+            "DocumentsGetOneModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("customer_id", "Optional[Union[str, int]]", None),
+                ("date", "Optional[str]", None),
+                ("document_id", "Optional[Union[str, int]]", None),
+                ("document_set_id", "Optional[Union[str, int]]", None),
+                ("expiration_date", "Optional[str]", None),
+                ("number", "Optional[str]", None),
+                ("our_reference", "Optional[str]", None),
+                ("salesman_id", "Optional[Union[str, int]]", None),
+                ("supplier_id", "Optional[Union[str, int]]", None),
+                ("year", "Optional[str]", None),
+                ("your_reference", "Optional[str]", None),
+            ),
+            "DocumentsGetPdfLinkModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("document_id", "Optional[Union[str, int]]", None),
+            ),
+        },
+    },
+    "DocumentsetsClient": {
+        "components": (),
+        "endpoints": {
+            "count_modified_since": (
+                "/documentSets/countModifiedSince/",
+                "post",
+                "DocumentsetsCountModifiedSinceModel",
+            ),
+            "delete": ("/documentSets/delete/", "post", "DocumentsetsDeleteModel"),
+            "get_all": ("/documentSets/getAll/", "post", "DocumentsetsGetAllModel"),
+            "get_modified_since": (
+                "/documentSets/getModifiedSince/",
+                "post",
+                "DocumentsetsGetModifiedSinceModel",
+            ),
+            "insert": ("/documentSets/insert/", "post", "DocumentsetsInsertModel"),
+            "update": ("/documentSets/update/", "post", "DocumentsetsUpdateModel"),
+        },
+        "models": {
+            "DocumentsetsCountModifiedSinceModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("lastmodified", "Optional[str]", None),
+            ),
+            "DocumentsetsDeleteModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("document_set_id", "Optional[Union[str, int]]", None),
+            ),
+            "DocumentsetsGetAllModel": (("company_id", "Union[str, int]", ...),),
+            "DocumentsetsGetModifiedSinceModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("lastmodified", "Optional[str]", None),
+            ),
+            "DocumentsetsInsertModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("active_by_default", "Optional[str]", None),
+                ("cash_vat_scheme_indicator", "Optional[str]", None),
+                ("name", "Optional[str]", None),
+                ("template_id", "Optional[Union[str, int]]", None),
+            ),
+            "DocumentsetsUpdateModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("active_by_default", "Optional[str]", None),
+                ("cash_vat_scheme_indicator", "Optional[str]", None),
+                ("document_set_id", "Optional[Union[str, int]]", None),
+                ("name", "Optional[str]", None),
+                ("template_id", "Optional[Union[str, int]]", None),
+            ),
+        },
+    },
+    "EstimatesClient": {
+        "components": ("Associated_documents", "Payments", "Products"),
+        "endpoints": {
+            "count": ("/estimates/count/", "post", "EstimatesCountModel"),
+            "delete": ("/estimates/delete/", "post", "EstimatesDeleteModel"),
+            "get_all": ("/estimates/getAll/", "post", "EstimatesGetAllModel"),
+            "get_one": ("/estimates/getOne/", "post", "EstimatesGetOneModel"),
+            "insert": ("/estimates/insert/", "post", "EstimatesInsertModel"),
+            "update": ("/estimates/update/", "post", "EstimatesUpdateModel"),
+        },
+        "models": {
+            "EstimatesCountModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("customer_id", "Optional[Union[str, int]]", None),
+                ("date", "Optional[str]", None),
+                ("document_set_id", "Optional[Union[str, int]]", None),
+                ("expiration_date", "Optional[str]", None),
+                ("number", "Optional[str]", None),
+                ("salesman_id", "Optional[Union[str, int]]", None),
+                ("year", "Optional[str]", None),
+                ("your_reference", "Optional[str]", None),
+            ),
+            "EstimatesDeleteModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("document_id", "Optional[Union[str, int]]", None),
+            ),
+            "EstimatesGetAllModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("customer_id", "Optional[Union[str, int]]", None),
+                ("date", "Optional[str]", None),
+                ("document_set_id", "Optional[Union[str, int]]", None),
+                ("expiration_date", "Optional[str]", None),
+                ("number", "Optional[str]", None),
+                ("offset", "Optional[Union[str, int]]", 0),
+                ("qty", "Optional[Union[str, int]]", 25),
+                ("salesman_id", "Optional[Union[str, int]]", None),
+                ("year", "Optional[str]", None),
+                ("your_reference", "Optional[str]", None),
+            ),
+            "EstimatesGetOneModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("customer_id", "Optional[Union[str, int]]", None),
+                ("date", "Optional[str]", None),
+                ("document_id", "Optional[Union[str, int]]", None),
+                ("document_set_id", "Optional[Union[str, int]]", None),
+                ("expiration_date", "Optional[str]", None),
+                ("number", "Optional[str]", None),
+                ("salesman_id", "Optional[Union[str, int]]", None),
+                ("year", "Optional[str]", None),
+                ("your_reference", "Optional[str]", None),
+            ),
+            "EstimatesInsertModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("customer_id", "Optional[Union[str, int]]", None),
+                ("date", "Optional[str]", None),
+                ("deduction_id", "Optional[Union[str, int]]", None),
+                ("delivery_datetime", "Optional[str]", None),
+                ("delivery_departure_address", "Optional[str]", None),
+                ("delivery_departure_city", "Optional[str]", None),
+                ("delivery_departure_country", "Optional[str]", None),
+                ("delivery_departure_zip_code", "Optional[str]", None),
+                ("delivery_destination_address", "Optional[str]", None),
+                ("delivery_destination_city", "Optional[str]", None),
+                ("delivery_destination_country", "Optional[str]", None),
+                ("delivery_destination_zip_code", "Optional[str]", None),
+                ("delivery_method_id", "Optional[Union[str, int]]", None),
+                ("document_set_id", "Optional[Union[str, int]]", None),
+                ("expiration_date", "Optional[str]", None),
+                ("financial_discount", "Optional[str]", None),
+                ("notes", "Optional[str]", None),
+                ("products", "Optional[List[Products]]", None),
+                ("salesman_commission", "Optional[str]", None),
+                ("salesman_id", "Optional[Union[str, int]]", None),
+                ("special_discount", "Optional[str]", None),
+                ("status", "Optional[str]", None),
+                ("vehicle_id", "Optional[Union[str, int]]", None),
+                ("your_reference", "Optional[str]", None),
+            ),
+            "EstimatesUpdateModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("customer_id", "Optional[Union[str, int]]", None),
+                ("date", "Optional[str]", None),
+                ("deduction_id", "Optional[Union[str, int]]", None),
+                ("delivery_datetime", "Optional[str]", None),
+                ("delivery_departure_address", "Optional[str]", None),
+                ("delivery_departure_city", "Optional[str]", None),
+                ("delivery_departure_country", "Optional[str]", None),
+                ("delivery_departure_zip_code", "Optional[str]", None),
+                ("delivery_destination_address", "Optional[str]", None),
+                ("delivery_destination_city", "Optional[str]", None),
+                ("delivery_destination_country", "Optional[str]", None),
+                ("delivery_destination_zip_code", "Optional[str]", None),
+                ("delivery_method_id", "Optional[Union[str, int]]", None),
+                ("document_id", "Optional[Union[str, int]]", None),
+                ("document_set_id", "Optional[Union[str, int]]", None),
+                ("expiration_date", "Optional[str]", None),
+                ("financial_discount", "Optional[str]", None),
+                ("notes", "Optional[str]", None),
+                ("products", "Optional[List[Products]]", None),
+                ("salesman_commission", "Optional[str]", None),
+                ("salesman_id", "Optional[Union[str, int]]", None),
+                ("special_discount", "Optional[str]", None),
+                ("status", "Optional[str]", None),
+                ("vehicle_id", "Optional[Union[str, int]]", None),
+                ("your_reference", "Optional[str]", None),
+            ),
+        },
+    },
+    "FiscalzonesClient": {
+        "components": (),
+        "endpoints": {
+            "count_modified_since": (
+                "/fiscalZones/countModifiedSince/",
+                "post",
+                "FiscalzonesCountModifiedSinceModel",
+            ),
+            "get_all": ("/fiscalZones/getAll/", "post", "FiscalzonesGetAllModel"),
+            "get_modified_since": (
+                "/fiscalZones/getModifiedSince/",
+                "post",
+                "FiscalzonesGetModifiedSinceModel",
+            ),
+        },
+        "models": {
+            "FiscalzonesCountModifiedSinceModel": (
+                ("lastmodified", "Optional[str]", None),
+            ),
+            "FiscalzonesGetAllModel": (
+                ("country_id", "Optional[Union[str, int]]", None),
+            ),
+            "FiscalzonesGetModifiedSinceModel": (
+                ("lastmodified", "Optional[str]", None),
+            ),
+        },
+    },
+    "IdentificationtemplatesClient": {
+        "components": (),
+        "endpoints": {
+            "count_modified_since": (
+                "/identificationTemplates/countModifiedSince/",
+                "post",
+                "IdentificationtemplatesCountModifiedSinceModel",
+            ),
+            "delete": (
+                "/identificationTemplates/delete/",
+                "post",
+                "IdentificationtemplatesDeleteModel",
+            ),
+            "get_all": (
+                "/identificationTemplates/getAll/",
+                "post",
+                "IdentificationtemplatesGetAllModel",
+            ),
+            "get_modified_since": (
+                "/identificationTemplates/getModifiedSince/",
+                "post",
+                "IdentificationtemplatesGetModifiedSinceModel",
+            ),
+            "insert": (
+                "/identificationTemplates/insert/",
+                "post",
+                "IdentificationtemplatesInsertModel",
+            ),
+            "update": (
+                "/identificationTemplates/update/",
+                "post",
+                "IdentificationtemplatesUpdateModel",
+            ),
+        },
+        "models": {
+            "IdentificationtemplatesCountModifiedSinceModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("lastmodified", "Optional[str]", None),
+            ),
+            "IdentificationtemplatesDeleteModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("template_id", "Optional[Union[str, int]]", None),
+            ),
+            "IdentificationtemplatesGetAllModel": (
+                ("company_id", "Union[str, int]", ...),
+            ),
+            "IdentificationtemplatesGetModifiedSinceModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("lastmodified", "Optional[str]", None),
+            ),
+            "IdentificationtemplatesInsertModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("address", "Optional[str]", None),
+                ("business_name", "Optional[str]", None),
+                ("city", "Optional[str]", None),
+                ("country_id", "Optional[Union[str, int]]", None),
+                ("documents_footnote", "Optional[str]", None),
+                ("email", "Optional[str]", None),
+                ("email_sender_address", "Optional[str]", None),
+                ("email_sender_name", "Optional[str]", None),
+                ("fax", "Optional[str]", None),
+                ("name", "Optional[str]", None),
+                ("notes", "Optional[str]", None),
+                ("phone", "Optional[str]", None),
+                ("website", "Optional[str]", None),
+                ("zip_code", "Optional[str]", None),
+            ),
+            "IdentificationtemplatesUpdateModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("address", "Optional[str]", None),
+                ("business_name", "Optional[str]", None),
+                ("city", "Optional[str]", None),
+                ("country_id", "Optional[Union[str, int]]", None),
+                ("documents_footnote", "Optional[str]", None),
+                ("email", "Optional[str]", None),
+                ("email_sender_address", "Optional[str]", None),
+                ("email_sender_name", "Optional[str]", None),
+                ("fax", "Optional[str]", None),
+                ("name", "Optional[str]", None),
+                ("notes", "Optional[str]", None),
+                ("phone", "Optional[str]", None),
+                ("template_id", "Optional[Union[str, int]]", None),
+                ("website", "Optional[str]", None),
+                ("zip_code", "Optional[str]", None),
+            ),
+        },
+    },
+    "InvoicereceiptsClient": {
+        "components": ("Associated_documents", "Payments", "Products"),
+        "endpoints": {
+            "count": ("/invoiceReceipts/count/", "post", "InvoicereceiptsCountModel"),
+            "delete": (
+                "/invoiceReceipts/delete/",
+                "post",
+                "InvoicereceiptsDeleteModel",
+            ),
+            "get_all": (
+                "/invoiceReceipts/getAll/",
+                "post",
+                "InvoicereceiptsGetAllModel",
+            ),
+            "get_one": (
+                "/invoiceReceipts/getOne/",
+                "post",
+                "InvoicereceiptsGetOneModel",
+            ),
+            "insert": (
+                "/invoiceReceipts/insert/",
+                "post",
+                "InvoicereceiptsInsertModel",
+            ),
+            "update": (
+                "/invoiceReceipts/update/",
+                "post",
+                "InvoicereceiptsUpdateModel",
+            ),
+        },
+        "models": {
+            "InvoicereceiptsCountModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("customer_id", "Optional[Union[str, int]]", None),
+                ("date", "Optional[str]", None),
+                ("document_set_id", "Optional[Union[str, int]]", None),
+                ("expiration_date", "Optional[str]", None),
+                ("number", "Optional[str]", None),
+                ("our_reference", "Optional[str]", None),
+                ("salesman_id", "Optional[Union[str, int]]", None),
+                ("supplier_id", "Optional[Union[str, int]]", None),
+                ("year", "Optional[str]", None),
+                ("your_reference", "Optional[str]", None),
+            ),
+            "InvoicereceiptsDeleteModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("document_id", "Optional[Union[str, int]]", None),
+            ),
+            "InvoicereceiptsGetAllModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("customer_id", "Optional[Union[str, int]]", None),
+                ("date", "Optional[str]", None),
+                ("document_set_id", "Optional[Union[str, int]]", None),
+                ("expiration_date", "Optional[str]", None),
+                ("number", "Optional[str]", None),
+                ("offset", "Optional[Union[str, int]]", 0),
+                ("our_reference", "Optional[str]", None),
+                ("qty", "Optional[Union[str, int]]", 25),
+                ("salesman_id", "Optional[Union[str, int]]", None),
+                ("supplier_id", "Optional[Union[str, int]]", None),
+                ("year", "Optional[str]", None),
+                ("your_reference", "Optional[str]", None),
+            ),
+            "InvoicereceiptsGetOneModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("customer_id", "Optional[Union[str, int]]", None),
+                ("date", "Optional[str]", None),
+                ("document_id", "Optional[Union[str, int]]", None),
+                ("document_set_id", "Optional[Union[str, int]]", None),
+                ("expiration_date", "Optional[str]", None),
+                ("number", "Optional[str]", None),
+                ("our_reference", "Optional[str]", None),
+                ("salesman_id", "Optional[Union[str, int]]", None),
+                ("supplier_id", "Optional[Union[str, int]]", None),
+                ("year", "Optional[str]", None),
+                ("your_reference", "Optional[str]", None),
+            ),
+            "InvoicereceiptsInsertModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("associated_documents", "Optional[List[Associated_documents]]", None),
+                ("customer_id", "Optional[Union[str, int]]", None),
+                ("date", "Optional[str]", None),
+                ("deduction_id", "Optional[Union[str, int]]", None),
+                ("delivery_datetime", "Optional[str]", None),
+                ("delivery_departure_address", "Optional[str]", None),
+                ("delivery_departure_city", "Optional[str]", None),
+                ("delivery_departure_country", "Optional[str]", None),
+                ("delivery_departure_zip_code", "Optional[str]", None),
+                ("delivery_destination_address", "Optional[str]", None),
+                ("delivery_destination_city", "Optional[str]", None),
+                ("delivery_destination_country", "Optional[str]", None),
+                ("delivery_destination_zip_code", "Optional[str]", None),
+                ("delivery_method_id", "Optional[Union[str, int]]", None),
+                ("document_set_id", "Optional[Union[str, int]]", None),
+                ("expiration_date", "Optional[str]", None),
+                ("financial_discount", "Optional[str]", None),
+                ("notes", "Optional[str]", None),
+                ("our_reference", "Optional[str]", None),
+                ("payments", "Optional[List[Payments]]", None),
+                ("products", "Optional[List[Products]]", None),
+                ("related_documents_notes", "Optional[str]", None),
+                ("salesman_commission", "Optional[str]", None),
+                ("salesman_id", "Optional[Union[str, int]]", None),
+                ("special_discount", "Optional[str]", None),
+                ("status", "Optional[str]", None),
+                ("vehicle_id", "Optional[Union[str, int]]", None),
+                ("your_reference", "Optional[str]", None),
+            ),
+            "InvoicereceiptsUpdateModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("associated_documents", "Optional[List[Associated_documents]]", None),
+                ("customer_id", "Optional[Union[str, int]]", None),
+                ("date", "Optional[str]", None),
+                ("deduction_id", "Optional[Union[str, int]]", None),
+                ("delivery_datetime", "Optional[str]", None),
+                ("delivery_departure_address", "Optional[str]", None),
+                ("delivery_departure_city", "Optional[str]", None),
+                ("delivery_departure_country", "Optional[str]", None),
+                ("delivery_departure_zip_code", "Optional[str]", None),
+                ("delivery_destination_address", "Optional[str]", None),
+                ("delivery_destination_city", "Optional[str]", None),
+                ("delivery_destination_country", "Optional[str]", None),
+                ("delivery_destination_zip_code", "Optional[str]", None),
+                ("delivery_method_id", "Optional[Union[str, int]]", None),
+                ("document_id", "Optional[Union[str, int]]", None),
+                ("document_set_id", "Optional[Union[str, int]]", None),
+                ("expiration_date", "Optional[str]", None),
+                ("financial_discount", "Optional[str]", None),
+                ("notes", "Optional[str]", None),
+                ("our_reference", "Optional[str]", None),
+                ("payments", "Optional[List[Payments]]", None),
+                ("products", "Optional[List[Products]]", None),
+                ("related_documents_notes", "Optional[str]", None),
+                ("salesman_commission", "Optional[str]", None),
+                ("salesman_id", "Optional[Union[str, int]]", None),
+                ("special_discount", "Optional[str]", None),
+                ("status", "Optional[str]", None),
+                ("vehicle_id", "Optional[Union[str, int]]", None),
+                ("your_reference", "Optional[str]", None),
+            ),
+        },
+    },
+    "InvoicesClient": {
+        "components": ("Associated_documents", "Payments", "Products"),
+        "endpoints": {
+            "count": ("/invoices/count/", "post", "InvoicesCountModel"),
+            "delete": ("/invoices/delete/", "post", "InvoicesDeleteModel"),
+            "get_all": ("/invoices/getAll/", "post", "InvoicesGetAllModel"),
+            "get_one": ("/invoices/getOne/", "post", "InvoicesGetOneModel"),
+            "insert": ("/invoices/insert/", "post", "InvoicesInsertModel"),
+            "update": ("/invoices/update/", "post", "InvoicesUpdateModel"),
+        },
+        "models": {
+            "InvoicesCountModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("customer_id", "Optional[Union[str, int]]", None),
+                ("date", "Optional[str]", None),
+                ("document_set_id", "Optional[Union[str, int]]", None),
+                ("expiration_date", "Optional[str]", None),
+                ("number", "Optional[str]", None),
+                ("our_reference", "Optional[str]", None),
+                ("salesman_id", "Optional[Union[str, int]]", None),
+                ("supplier_id", "Optional[Union[str, int]]", None),
+                ("year", "Optional[str]", None),
+                ("your_reference", "Optional[str]", None),
+            ),
+            "InvoicesDeleteModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("document_id", "Optional[Union[str, int]]", None),
+            ),
+            "InvoicesGetAllModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("customer_id", "Optional[Union[str, int]]", None),
+                ("date", "Optional[str]", None),
+                ("document_set_id", "Optional[Union[str, int]]", None),
+                ("expiration_date", "Optional[str]", None),
+                ("number", "Optional[str]", None),
+                ("offset", "Optional[Union[str, int]]", 0),
+                ("our_reference", "Optional[str]", None),
+                ("qty", "Optional[Union[str, int]]", 25),
+                ("salesman_id", "Optional[Union[str, int]]", None),
+                ("supplier_id", "Optional[Union[str, int]]", None),
+                ("year", "Optional[str]", None),
+                ("your_reference", "Optional[str]", None),
+            ),
+            "InvoicesGetOneModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("customer_id", "Optional[Union[str, int]]", None),
+                ("date", "Optional[str]", None),
+                ("document_id", "Optional[Union[str, int]]", None),
+                ("document_set_id", "Optional[Union[str, int]]", None),
+                ("expiration_date", "Optional[str]", None),
+                ("number", "Optional[str]", None),
+                ("our_reference", "Optional[str]", None),
+                ("salesman_id", "Optional[Union[str, int]]", None),
+                ("supplier_id", "Optional[Union[str, int]]", None),
+                ("year", "Optional[str]", None),
+                ("your_reference", "Optional[str]", None),
+            ),
+            "InvoicesInsertModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("alternate_address_id", "Optional[Union[str, int]]", None),
+                ("associated_documents", "Optional[List[Associated_documents]]", None),
+                ("customer_id", "Optional[Union[str, int]]", None),
+                ("date", "Optional[str]", None),
+                ("deduction_id", "Optional[Union[str, int]]", None),
+                ("delivery_datetime", "Optional[str]", None),
+                ("delivery_departure_address", "Optional[str]", None),
+                ("delivery_departure_city", "Optional[str]", None),
+                ("delivery_departure_country", "Optional[str]", None),
+                ("delivery_departure_zip_code", "Optional[str]", None),
+                ("delivery_destination_address", "Optional[str]", None),
+                ("delivery_destination_city", "Optional[str]", None),
+                ("delivery_destination_country", "Optional[str]", None),
+                ("delivery_destination_zip_code", "Optional[str]", None),
+                ("delivery_method_id", "Optional[Union[str, int]]", None),
+                ("document_set_id", "Optional[Union[str, int]]", None),
+                ("expiration_date", "Optional[str]", None),
+                ("financial_discount", "Optional[str]", None),
+                ("notes", "Optional[str]", None),
+                ("our_reference", "Optional[str]", None),
+                ("products", "Optional[List[Products]]", None),
+                ("related_documents_notes", "Optional[str]", None),
+                ("salesman_commission", "Optional[str]", None),
+                ("salesman_id", "Optional[Union[str, int]]", None),
+                ("special_discount", "Optional[str]", None),
+                ("status", "Optional[str]", None),
+                ("vehicle_id", "Optional[Union[str, int]]", None),
+                ("your_reference", "Optional[str]", None),
+            ),
+            "InvoicesUpdateModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("alternate_address_id", "Optional[Union[str, int]]", None),
+                ("associated_documents", "Optional[List[Associated_documents]]", None),
+                ("customer_id", "Optional[Union[str, int]]", None),
+                ("date", "Optional[str]", None),
+                ("deduction_id", "Optional[Union[str, int]]", None),
+                ("delivery_datetime", "Optional[str]", None),
+                ("delivery_departure_address", "Optional[str]", None),
+                ("delivery_departure_city", "Optional[str]", None),
+                ("delivery_departure_country", "Optional[str]", None),
+                ("delivery_departure_zip_code", "Optional[str]", None),
+                ("delivery_destination_address", "Optional[str]", None),
+                ("delivery_destination_city", "Optional[str]", None),
+                ("delivery_destination_country", "Optional[str]", None),
+                ("delivery_destination_zip_code", "Optional[str]", None),
+                ("delivery_method_id", "Optional[Union[str, int]]", None),
+                ("document_id", "Optional[Union[str, int]]", None),
+                ("document_set_id", "Optional[Union[str, int]]", None),
+                ("expiration_date", "Optional[str]", None),
+                ("financial_discount", "Optional[str]", None),
+                ("notes", "Optional[str]", None),
+                ("our_reference", "Optional[str]", None),
+                ("products", "Optional[List[Products]]", None),
+                ("related_documents_notes", "Optional[str]", None),
+                ("salesman_commission", "Optional[str]", None),
+                ("salesman_id", "Optional[Union[str, int]]", None),
+                ("special_discount", "Optional[str]", None),
+                ("status", "Optional[str]", None),
+                ("vehicle_id", "Optional[Union[str, int]]", None),
+                ("your_reference", "Optional[str]", None),
+            ),
+        },
+    },
+    "LanguagesClient": {
+        "components": (),
+        "endpoints": {
+            "count_modified_since": (
+                "/languages/countModifiedSince/",
+                "post",
+                "LanguagesCountModifiedSinceModel",
+            ),
+            "get_all": ("/languages/getAll/", "post", None),
+            "get_modified_since": (
+                "/languages/getModifiedSince/",
+                "post",
+                "LanguagesGetModifiedSinceModel",
+            ),
+        },
+        "models": {
+            "LanguagesCountModifiedSinceModel": (
+                ("lastmodified", "Optional[str]", None),
+            ),
+            "LanguagesGetModifiedSinceModel": (
+                ("lastmodified", "Optional[str]", None),
+            ),
+        },
+    },
+    "MaturitydatesClient": {
+        "components": (),
+        "endpoints": {
+            "count_modified_since": (
+                "/maturityDates/countModifiedSince/",
+                "post",
+                "MaturitydatesCountModifiedSinceModel",
+            ),
+            "delete": ("/maturityDates/delete/", "post", "MaturitydatesDeleteModel"),
+            "get_all": ("/maturityDates/getAll/", "post", "MaturitydatesGetAllModel"),
+            "get_modified_since": (
+                "/maturityDates/getModifiedSince/",
+                "post",
+                "MaturitydatesGetModifiedSinceModel",
+            ),
+            "insert": ("/maturityDates/insert/", "post", "MaturitydatesInsertModel"),
+            "update": ("/maturityDates/update/", "post", "MaturitydatesUpdateModel"),
+        },
+        "models": {
+            "MaturitydatesCountModifiedSinceModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("lastmodified", "Optional[str]", None),
+            ),
+            "MaturitydatesDeleteModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("maturity_date_id", "Optional[Union[str, int]]", None),
+            ),
+            "MaturitydatesGetAllModel": (("company_id", "Union[str, int]", ...),),
+            "MaturitydatesGetModifiedSinceModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("lastmodified", "Optional[str]", None),
+            ),
+            "MaturitydatesInsertModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("associated_discount", "Optional[str]", None),
+                ("days", "Optional[str]", None),
+                ("name", "Optional[str]", None),
+            ),
+            "MaturitydatesUpdateModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("associated_discount", "Optional[str]", None),
+                ("days", "Optional[str]", None),
+                ("maturity_date_id", "Optional[Union[str, int]]", None),
+                ("name", "Optional[str]", None),
+            ),
+        },
+    },
+    "MeasurementunitsClient": {
+        "components": (),
+        "endpoints": {
+            "count_modified_since": (
+                "/measurementUnits/countModifiedSince/",
+                "post",
+                "MeasurementunitsCountModifiedSinceModel",
+            ),
+            "delete": (
+                "/measurementUnits/delete/",
+                "post",
+                "MeasurementunitsDeleteModel",
+            ),
+            "get_all": (
+                "/measurementUnits/getAll/",
+                "post",
+                "MeasurementunitsGetAllModel",
+            ),
+            "get_modified_since": (
+                "/measurementUnits/getModifiedSince/",
+                "post",
+                "MeasurementunitsGetModifiedSinceModel",
+            ),
+            "insert": (
+                "/measurementUnits/insert/",
+                "post",
+                "MeasurementunitsInsertModel",
+            ),
+            "update": (
+                "/measurementUnits/update/",
+                "post",
+                "MeasurementunitsUpdateModel",
+            ),
+        },
+        "models": {
+            "MeasurementunitsCountModifiedSinceModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("lastmodified", "Optional[str]", None),
+            ),
+            "MeasurementunitsDeleteModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("unit_id", "Optional[Union[str, int]]", None),
+            ),
+            "MeasurementunitsGetAllModel": (("company_id", "Union[str, int]", ...),),
+            "MeasurementunitsGetModifiedSinceModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("lastmodified", "Optional[str]", None),
+            ),
+            "MeasurementunitsInsertModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("name", "Optional[str]", None),
+                ("short_name", "Optional[str]", None),
+            ),
+            "MeasurementunitsUpdateModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("name", "Optional[str]", None),
+                ("short_name", "Optional[str]", None),
+                ("unit_id", "Optional[Union[str, int]]", None),
+            ),
+        },
+    },
+    "OwnassetsmovementguidesClient": {
+        "components": ("Associated_documents", "Payments", "Products"),
+        "endpoints": {
+            "count": (
+                "/ownAssetsMovementGuides/count/",
+                "post",
+                "OwnassetsmovementguidesCountModel",
+            ),
+            "delete": (
+                "/ownAssetsMovementGuides/delete/",
+                "post",
+                "OwnassetsmovementguidesDeleteModel",
+            ),
+            "get_all": (
+                "/ownAssetsMovementGuides/getAll/",
+                "post",
+                "OwnassetsmovementguidesGetAllModel",
+            ),
+            "get_one": (
+                "/ownAssetsMovementGuides/getOne/",
+                "post",
+                "OwnassetsmovementguidesGetOneModel",
+            ),
+            "insert": (
+                "/ownAssetsMovementGuides/insert/",
+                "post",
+                "OwnassetsmovementguidesInsertModel",
+            ),
+            "set_transport_code": (
+                "/ownAssetsMovementGuides/setTransportCode/",
+                "post",
+                "OwnassetsmovementguidesSetTransportCodeModel",
+            ),
+            "update": (
+                "/ownAssetsMovementGuides/update/",
+                "post",
+                "OwnassetsmovementguidesUpdateModel",
+            ),
+        },
+        "models": {
+            "OwnassetsmovementguidesCountModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("customer_id", "Optional[Union[str, int]]", None),
+                ("date", "Optional[str]", None),
+                ("document_set_id", "Optional[Union[str, int]]", None),
+                ("number", "Optional[str]", None),
+                ("year", "Optional[str]", None),
+                ("your_reference", "Optional[str]", None),
+            ),
+            "OwnassetsmovementguidesDeleteModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("document_id", "Optional[Union[str, int]]", None),
+            ),
+            "OwnassetsmovementguidesGetAllModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("customer_id", "Optional[Union[str, int]]", None),
+                ("date", "Optional[str]", None),
+                ("document_set_id", "Optional[Union[str, int]]", None),
+                ("number", "Optional[str]", None),
+                ("offset", "Optional[Union[str, int]]", 0),
+                ("qty", "Optional[Union[str, int]]", 25),
+                ("year", "Optional[str]", None),
+                ("your_reference", "Optional[str]", None),
+            ),
+            "OwnassetsmovementguidesGetOneModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("customer_id", "Optional[Union[str, int]]", None),
+                ("date", "Optional[str]", None),
+                ("document_id", "Optional[Union[str, int]]", None),
+                ("document_set_id", "Optional[Union[str, int]]", None),
+                ("number", "Optional[str]", None),
+                ("year", "Optional[str]", None),
+                ("your_reference", "Optional[str]", None),
+            ),
+            "OwnassetsmovementguidesInsertModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("customer_id", "Optional[Union[str, int]]", None),
+                ("date", "Optional[str]", None),
+                ("delivery_datetime", "Optional[str]", None),
+                ("delivery_departure_address", "Optional[str]", None),
+                ("delivery_departure_city", "Optional[str]", None),
+                ("delivery_departure_country", "Optional[str]", None),
+                ("delivery_departure_zip_code", "Optional[str]", None),
+                ("delivery_destination_address", "Optional[str]", None),
+                ("delivery_destination_city", "Optional[str]", None),
+                ("delivery_destination_country", "Optional[str]", None),
+                ("delivery_destination_zip_code", "Optional[str]", None),
+                ("delivery_method_id", "Optional[Union[str, int]]", None),
+                ("document_set_id", "Optional[Union[str, int]]", None),
+                ("notes", "Optional[str]", None),
+                ("products", "Optional[List[Products]]", None),
+                ("status", "Optional[str]", None),
+                ("vehicle_id", "Optional[Union[str, int]]", None),
+                ("your_reference", "Optional[str]", None),
+            ),
+            "OwnassetsmovementguidesSetTransportCodeModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("document_id", "Optional[Union[str, int]]", None),
+                ("transport_code", "Optional[str]", None),
+            ),
+            "OwnassetsmovementguidesUpdateModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("customer_id", "Optional[Union[str, int]]", None),
+                ("date", "Optional[str]", None),
+                ("delivery_datetime", "Optional[str]", None),
+                ("delivery_departure_address", "Optional[str]", None),
+                ("delivery_departure_city", "Optional[str]", None),
+                ("delivery_departure_country", "Optional[str]", None),
+                ("delivery_departure_zip_code", "Optional[str]", None),
+                ("delivery_destination_address", "Optional[str]", None),
+                ("delivery_destination_city", "Optional[str]", None),
+                ("delivery_destination_country", "Optional[str]", None),
+                ("delivery_destination_zip_code", "Optional[str]", None),
+                ("delivery_method_id", "Optional[Union[str, int]]", None),
+                ("document_id", "Optional[Union[str, int]]", None),
+                ("document_set_id", "Optional[Union[str, int]]", None),
+                ("notes", "Optional[str]", None),
+                ("products", "Optional[List[Products]]", None),
+                ("status", "Optional[str]", None),
+                ("vehicle_id", "Optional[Union[str, int]]", None),
+                ("your_reference", "Optional[str]", None),
+            ),
+        },
+    },
+    "PaymentmethodsClient": {
+        "components": (),
+        "endpoints": {
+            "count_modified_since": (
+                "/paymentMethods/countModifiedSince/",
+                "post",
+                "PaymentmethodsCountModifiedSinceModel",
+            ),
+            "delete": ("/paymentMethods/delete/", "post", "PaymentmethodsDeleteModel"),
+            "get_all": ("/paymentMethods/getAll/", "post", "PaymentmethodsGetAllModel"),
+            "get_modified_since": (
+                "/paymentMethods/getModifiedSince/",
+                "post",
+                "PaymentmethodsGetModifiedSinceModel",
+            ),
+            "insert": ("/paymentMethods/insert/", "post", "PaymentmethodsInsertModel"),
+            "update": ("/paymentMethods/update/", "post", "PaymentmethodsUpdateModel"),
+        },
+        "models": {
+            "PaymentmethodsCountModifiedSinceModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("lastmodified", "Optional[str]", None),
+            ),
+            "PaymentmethodsDeleteModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("payment_method_id", "Optional[Union[str, int]]", None),
+            ),
+            "PaymentmethodsGetAllModel": (("company_id", "Union[str, int]", ...),),
+            "PaymentmethodsGetModifiedSinceModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("lastmodified", "Optional[str]", None),
+            ),
+            "PaymentmethodsInsertModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("name", "Optional[str]", None),
+            ),
+            "PaymentmethodsUpdateModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("name", "Optional[str]", None),
+                ("payment_method_id", "Optional[Union[str, int]]", None),
+            ),
+        },
+    },
+    "ProductcategoriesClient": {
+        "components": ("Suppliers", "Taxes", "Warehouses"),
+        "endpoints": {
+            "delete": (
+                "/productCategories/delete/",
+                "post",
+                "ProductcategoriesDeleteModel",
+            ),
+            "get_all": (
+                "/productCategories/getAll/",
+                "post",
+                "ProductcategoriesGetAllModel",
+            ),
+            "get_modified_since": (
+                "/productCategories/getModifiedSince/",
+                "post",
+                "ProductcategoriesGetModifiedSinceModel",
+            ),
+            "insert": (
+                "/productCategories/insert/",
+                "post",
+                "ProductcategoriesInsertModel",
+            ),
+            "update": (
+                "/productCategories/update/",
+                "post",
+                "ProductcategoriesUpdateModel",
+            ),
+        },
+        "models": {
+            "ProductcategoriesDeleteModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("category_id", "Optional[Union[str, int]]", None),
+            ),
+            "ProductcategoriesGetAllModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("parent_id", "Optional[Union[str, int]]", None),
+            ),
+            "ProductcategoriesGetModifiedSinceModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("lastmodified", "Optional[str]", None),
+            ),
+            "ProductcategoriesInsertModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("description", "Optional[str]", None),
+                ("name", "Optional[str]", None),
+                ("parent_id", "Optional[Union[str, int]]", None),
+                ("pos_enabled", "Optional[str]", None),
+            ),
+            "ProductcategoriesUpdateModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("category_id", "Optional[Union[str, int]]", None),
+                ("description", "Optional[str]", None),
+                ("name", "Optional[str]", None),
+                ("parent_id", "Optional[Union[str, int]]", None),
+                ("pos_enabled", "Optional[str]", None),
+            ),
+        },
+    },
+    "ProductsClient": {
+        "components": ("Suppliers", "Taxes", "Warehouses"),
+        "endpoints": {
+            "count": ("/products/count/", "post", "ProductsCountModel"),
+            "count_by_ean": (
+                "/products/countByEAN/",
+                "post",
+                "ProductsCountByEanModel",
+            ),
+            "count_by_name": (
+                "/products/countByName/",
+                "post",
+                "ProductsCountByNameModel",
+            ),
+            "count_by_reference": (
+                "/products/countByReference/",
+                "post",
+                "ProductsCountByReferenceModel",
+            ),
+            "count_by_search": (
+                "/products/countBySearch/",
+                "post",
+                "ProductsCountBySearchModel",
+            ),
+            "count_modified_since": (
+                "/products/countModifiedSince/",
+                "post",
+                "ProductsCountModifiedSinceModel",
+            ),
+            "delete": ("/products/delete/", "post", "ProductsDeleteModel"),
+            "get_all": ("/products/getAll/", "post", "ProductsGetAllModel"),
+            "get_by_ean": ("/products/getByEAN/", "post", "ProductsGetByEanModel"),
+            "get_by_name": ("/products/getByName/", "post", "ProductsGetByNameModel"),
+            "get_by_reference": (
+                "/products/getByReference/",
+                "post",
+                "ProductsGetByReferenceModel",
+            ),
+            "get_by_search": (
+                "/products/getBySearch/",
+                "post",
+                "ProductsGetBySearchModel",
+            ),
+            "get_modified_since": (
+                "/products/getModifiedSince/",
+                "post",
+                "ProductsGetModifiedSinceModel",
+            ),
+            "get_one": ("/products/getOne/", "post", "ProductsGetOneModel"),
+            "insert": ("/products/insert/", "post", "ProductsInsertModel"),
+            "update": ("/products/update/", "post", "ProductsUpdateModel"),
+        },
+        "models": {
+            "ProductsCountModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("category_id", "Optional[Union[str, int]]", None),
+            ),
+            "ProductsCountByEanModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("ean", "Optional[str]", None),
+            ),
+            "ProductsCountByNameModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("name", "Optional[str]", None),
+            ),
+            "ProductsCountByReferenceModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("reference", "Optional[str]", None),
+            ),
+            "ProductsCountBySearchModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("search", "Optional[str]", None),
+            ),
+            "ProductsCountModifiedSinceModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("lastmodified", "Optional[str]", None),
+            ),
+            "ProductsDeleteModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("product_id", "Optional[Union[str, int]]", None),
+            ),
+            "ProductsGetAllModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("category_id", "Optional[Union[str, int]]", None),
+                ("offset", "Optional[Union[str, int]]", 0),
+                ("qty", "Optional[Union[str, int]]", 25),
+            ),
+            "ProductsGetByEanModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("ean", "Optional[str]", None),
+                ("offset", "Optional[Union[str, int]]", 0),
+                ("qty", "Optional[Union[str, int]]", 25),
+            ),
+            "ProductsGetByNameModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("name", "Optional[str]", None),
+                ("offset", "Optional[Union[str, int]]", 0),
+                ("qty", "Optional[Union[str, int]]", 25),
+            ),
+            "ProductsGetByReferenceModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("offset", "Optional[Union[str, int]]", 0),
+                ("qty", "Optional[Union[str, int]]", 25),
+                ("reference", "Optional[str]", None),
+            ),
+            "ProductsGetBySearchModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("offset", "Optional[Union[str, int]]", 0),
+                ("qty", "Optional[Union[str, int]]", 25),
+                ("search", "Optional[str]", None),
+            ),
+            "ProductsGetModifiedSinceModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("lastmodified", "Optional[str]", None),
+                ("offset", "Optional[Union[str, int]]", 0),
+                ("qty", "Optional[Union[str, int]]", 25),
+            ),
+            "ProductsGetOneModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("product_id", "Optional[Union[str, int]]", None),
+            ),
+            "ProductsInsertModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("at_product_category", "Optional[str]", None),
+                ("category_id", "Optional[Union[str, int]]", None),
+                ("ean", "Optional[str]", None),
+                ("exemption_reason", "Optional[str]", None),
+                ("has_stock", "Optional[str]", None),
+                ("name", "Optional[str]", None),
+                ("pos_favorite", "Optional[str]", None),
+                ("price", "Optional[str]", None),
+                ("reference", "Optional[str]", None),
+                ("stock", "Optional[str]", None),
+                ("summary", "Optional[str]", None),
+                ("suppliers", "Optional[List[Suppliers]]", None),
+                ("taxes", "Optional[List[Taxes]]", None),
+                ("type", "Optional[str]", None),
+                ("unit_id", "Optional[Union[str, int]]", None),
+                ("warehouse_id", "Optional[Union[str, int]]", None),
+                ("warehouses", "Optional[List[Warehouses]]", None),
+            ),
+            "ProductsUpdateModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("at_product_category", "Optional[str]", None),
+                ("category_id", "Optional[Union[str, int]]", None),
+                ("ean", "Optional[str]", None),
+                ("exemption_reason", "Optional[str]", None),
+                ("has_stock", "Optional[str]", None),
+                ("name", "Optional[str]", None),
+                ("pos_favorite", "Optional[str]", None),
+                ("price", "Optional[str]", None),
+                ("product_id", "Optional[Union[str, int]]", None),
+                ("reference", "Optional[str]", None),
+                ("stock", "Optional[str]", None),
+                ("summary", "Optional[str]", None),
+                ("suppliers", "Optional[List[Suppliers]]", None),
+                ("taxes", "Optional[List[Taxes]]", None),
+                ("type", "Optional[str]", None),
+                ("unit_id", "Optional[Union[str, int]]", None),
+                ("warehouse_id", "Optional[Union[str, int]]", None),
+            ),
+        },
+    },
+    "ReceiptsClient": {
+        "components": ("Associated_documents", "Payments", "Products"),
+        "endpoints": {
+            "count": ("/receipts/count/", "post", "ReceiptsCountModel"),
+            "delete": ("/receipts/delete/", "post", "ReceiptsDeleteModel"),
+            "get_all": ("/receipts/getAll/", "post", "ReceiptsGetAllModel"),
+            "get_one": ("/receipts/getOne/", "post", "ReceiptsGetOneModel"),
+            "insert": ("/receipts/insert/", "post", "ReceiptsInsertModel"),
+            "update": ("/receipts/update/", "post", "ReceiptsUpdateModel"),
+        },
+        "models": {
+            "ReceiptsCountModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("customer_id", "Optional[Union[str, int]]", None),
+                ("date", "Optional[str]", None),
+                ("document_set_id", "Optional[Union[str, int]]", None),
+                ("expiration_date", "Optional[str]", None),
+                ("number", "Optional[str]", None),
+                ("our_reference", "Optional[str]", None),
+                ("salesman_id", "Optional[Union[str, int]]", None),
+                ("supplier_id", "Optional[Union[str, int]]", None),
+                ("year", "Optional[str]", None),
+                ("your_reference", "Optional[str]", None),
+            ),
+            "ReceiptsDeleteModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("document_id", "Optional[Union[str, int]]", None),
+            ),
+            "ReceiptsGetAllModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("customer_id", "Optional[Union[str, int]]", None),
+                ("date", "Optional[str]", None),
+                ("document_set_id", "Optional[Union[str, int]]", None),
+                ("expiration_date", "Optional[str]", None),
+                ("number", "Optional[str]", None),
+                ("offset", "Optional[Union[str, int]]", 0),
+                ("our_reference", "Optional[str]", None),
+                ("qty", "Optional[Union[str, int]]", 25),
+                ("salesman_id", "Optional[Union[str, int]]", None),
+                ("supplier_id", "Optional[Union[str, int]]", None),
+                ("year", "Optional[str]", None),
+                ("your_reference", "Optional[str]", None),
+            ),
+            "ReceiptsGetOneModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("customer_id", "Optional[Union[str, int]]", None),
+                ("date", "Optional[str]", None),
+                ("document_id", "Optional[Union[str, int]]", None),
+                ("document_set_id", "Optional[Union[str, int]]", None),
+                ("expiration_date", "Optional[str]", None),
+                ("number", "Optional[str]", None),
+                ("our_reference", "Optional[str]", None),
+                ("salesman_id", "Optional[Union[str, int]]", None),
+                ("supplier_id", "Optional[Union[str, int]]", None),
+                ("year", "Optional[str]", None),
+                ("your_reference", "Optional[str]", None),
+            ),
+            "ReceiptsInsertModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("associated_documents", "Optional[List[Associated_documents]]", None),
+                ("customer_id", "Optional[Union[str, int]]", None),
+                ("date", "Optional[str]", None),
+                ("document_set_id", "Optional[Union[str, int]]", None),
+                ("net_value", "Optional[str]", None),
+                ("notes", "Optional[str]", None),
+                ("payments", "Optional[List[Payments]]", None),
+                ("related_documents_notes", "Optional[str]", None),
+                ("status", "Optional[str]", None),
+            ),
+            "ReceiptsUpdateModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("associated_documents", "Optional[List[Associated_documents]]", None),
+                ("customer_id", "Optional[Union[str, int]]", None),
+                ("date", "Optional[str]", None),
+                ("document_id", "Optional[Union[str, int]]", None),
+                ("document_set_id", "Optional[Union[str, int]]", None),
+                ("net_value", "Optional[str]", None),
+                ("notes", "Optional[str]", None),
+                ("payments", "Optional[List[Payments]]", None),
+                ("related_documents_notes", "Optional[str]", None),
+                ("status", "Optional[str]", None),
+            ),
+        },
+    },
+    "SalesmenClient": {
+        "components": (),
+        "endpoints": {
+            "count_modified_since": (
+                "/salesmen/countModifiedSince/",
+                "post",
+                "SalesmenCountModifiedSinceModel",
+            ),
+            "delete": ("/salesmen/delete/", "post", "SalesmenDeleteModel"),
+            "get_all": ("/salesmen/getAll/", "post", "SalesmenGetAllModel"),
+            "get_modified_since": (
+                "/salesmen/getModifiedSince/",
+                "post",
+                "SalesmenGetModifiedSinceModel",
+            ),
+            "get_one": ("/salesmen/getOne/", "post", "SalesmenGetOneModel"),
+            "insert": ("/salesmen/insert/", "post", "SalesmenInsertModel"),
+            "update": ("/salesmen/update/", "post", "SalesmenUpdateModel"),
+        },
+        "models": {
+            "SalesmenCountModifiedSinceModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("lastmodified", "Optional[str]", None),
+            ),
+            "SalesmenDeleteModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("salesman_id", "Optional[Union[str, int]]", None),
+            ),
+            "SalesmenGetAllModel": (("company_id", "Union[str, int]", ...),),
+            "SalesmenGetModifiedSinceModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("lastmodified", "Optional[str]", None),
+            ),
+            "SalesmenGetOneModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("salesman_id", "Optional[Union[str, int]]", None),
+            ),
+            "SalesmenInsertModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("address", "Optional[str]", None),
+                ("base_commission", "Optional[str]", None),
+                ("city", "Optional[str]", None),
+                ("country_id", "Optional[Union[str, int]]", None),
+                ("email", "Optional[str]", None),
+                ("fax", "Optional[str]", None),
+                ("language_id", "Optional[Union[str, int]]", None),
+                ("name", "Optional[str]", None),
+                ("notes", "Optional[str]", None),
+                ("number", "Optional[str]", None),
+                ("phone", "Optional[str]", None),
+                ("qty_copies_document", "Optional[str]", None),
+                ("vat", "Optional[str]", None),
+                ("website", "Optional[str]", None),
+                ("zip_code", "Optional[str]", None),
+            ),
+            "SalesmenUpdateModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("address", "Optional[str]", None),
+                ("base_commission", "Optional[str]", None),
+                ("city", "Optional[str]", None),
+                ("country_id", "Optional[Union[str, int]]", None),
+                ("email", "Optional[str]", None),
+                ("fax", "Optional[str]", None),
+                ("language_id", "Optional[Union[str, int]]", None),
+                ("name", "Optional[str]", None),
+                ("notes", "Optional[str]", None),
+                ("number", "Optional[str]", None),
+                ("phone", "Optional[str]", None),
+                ("qty_copies_document", "Optional[str]", None),
+                ("salesman_id", "Optional[Union[str, int]]", None),
+                ("vat", "Optional[str]", None),
+                ("website", "Optional[str]", None),
+                ("zip_code", "Optional[str]", None),
+            ),
+        },
+    },
+    "SimplifiedinvoicesClient": {
+        "components": ("Associated_documents", "Payments", "Products"),
+        "endpoints": {
+            "count": (
+                "/simplifiedInvoices/count/",
+                "post",
+                "SimplifiedinvoicesCountModel",
+            ),
+            "delete": (
+                "/simplifiedInvoices/delete/",
+                "post",
+                "SimplifiedinvoicesDeleteModel",
+            ),
+            "get_all": (
+                "/simplifiedInvoices/getAll/",
+                "post",
+                "SimplifiedinvoicesGetAllModel",
+            ),
+            "get_one": (
+                "/simplifiedInvoices/getOne/",
+                "post",
+                "SimplifiedinvoicesGetOneModel",
+            ),
+            "insert": (
+                "/simplifiedInvoices/insert/",
+                "post",
+                "SimplifiedinvoicesInsertModel",
+            ),
+            "update": (
+                "/simplifiedInvoices/update/",
+                "post",
+                "SimplifiedinvoicesUpdateModel",
+            ),
+        },
+        "models": {
+            "SimplifiedinvoicesCountModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("customer_id", "Optional[Union[str, int]]", None),
+                ("date", "Optional[str]", None),
+                ("document_set_id", "Optional[Union[str, int]]", None),
+                ("expiration_date", "Optional[str]", None),
+                ("number", "Optional[str]", None),
+                ("our_reference", "Optional[str]", None),
+                ("salesman_id", "Optional[Union[str, int]]", None),
+                ("supplier_id", "Optional[Union[str, int]]", None),
+                ("year", "Optional[str]", None),
+                ("your_reference", "Optional[str]", None),
+            ),
+            "SimplifiedinvoicesDeleteModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("document_id", "Optional[Union[str, int]]", None),
+            ),
+            "SimplifiedinvoicesGetAllModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("customer_id", "Optional[Union[str, int]]", None),
+                ("date", "Optional[str]", None),
+                ("document_set_id", "Optional[Union[str, int]]", None),
+                ("expiration_date", "Optional[str]", None),
+                ("number", "Optional[str]", None),
+                ("offset", "Optional[Union[str, int]]", 0),
+                ("our_reference", "Optional[str]", None),
+                ("qty", "Optional[Union[str, int]]", 25),
+                ("salesman_id", "Optional[Union[str, int]]", None),
+                ("supplier_id", "Optional[Union[str, int]]", None),
+                ("year", "Optional[str]", None),
+                ("your_reference", "Optional[str]", None),
+            ),
+            "SimplifiedinvoicesGetOneModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("customer_id", "Optional[Union[str, int]]", None),
+                ("date", "Optional[str]", None),
+                ("document_id", "Optional[Union[str, int]]", None),
+                ("document_set_id", "Optional[Union[str, int]]", None),
+                ("expiration_date", "Optional[str]", None),
+                ("number", "Optional[str]", None),
+                ("our_reference", "Optional[str]", None),
+                ("salesman_id", "Optional[Union[str, int]]", None),
+                ("supplier_id", "Optional[Union[str, int]]", None),
+                ("year", "Optional[str]", None),
+                ("your_reference", "Optional[str]", None),
+            ),
+            "SimplifiedinvoicesInsertModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("associated_documents", "Optional[List[Associated_documents]]", None),
+                ("customer_id", "Optional[Union[str, int]]", None),
+                ("date", "Optional[str]", None),
+                ("deduction_id", "Optional[Union[str, int]]", None),
+                ("delivery_datetime", "Optional[str]", None),
+                ("delivery_departure_address", "Optional[str]", None),
+                ("delivery_departure_city", "Optional[str]", None),
+                ("delivery_departure_country", "Optional[str]", None),
+                ("delivery_departure_zip_code", "Optional[str]", None),
+                ("delivery_destination_address", "Optional[str]", None),
+                ("delivery_destination_city", "Optional[str]", None),
+                ("delivery_destination_country", "Optional[str]", None),
+                ("delivery_destination_zip_code", "Optional[str]", None),
+                ("delivery_method_id", "Optional[Union[str, int]]", None),
+                ("document_set_id", "Optional[Union[str, int]]", None),
+                ("expiration_date", "Optional[str]", None),
+                ("financial_discount", "Optional[str]", None),
+                ("notes", "Optional[str]", None),
+                ("our_reference", "Optional[str]", None),
+                ("payments", "Optional[List[Payments]]", None),
+                ("products", "Optional[List[Products]]", None),
+                ("related_documents_notes", "Optional[str]", None),
+                ("salesman_commission", "Optional[str]", None),
+                ("salesman_id", "Optional[Union[str, int]]", None),
+                ("special_discount", "Optional[str]", None),
+                ("status", "Optional[str]", None),
+                ("vehicle_id", "Optional[Union[str, int]]", None),
+                ("your_reference", "Optional[str]", None),
+            ),
+            "SimplifiedinvoicesUpdateModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("associated_documents", "Optional[List[Associated_documents]]", None),
+                ("customer_id", "Optional[Union[str, int]]", None),
+                ("date", "Optional[str]", None),
+                ("deduction_id", "Optional[Union[str, int]]", None),
+                ("delivery_datetime", "Optional[str]", None),
+                ("delivery_departure_address", "Optional[str]", None),
+                ("delivery_departure_city", "Optional[str]", None),
+                ("delivery_departure_country", "Optional[str]", None),
+                ("delivery_departure_zip_code", "Optional[str]", None),
+                ("delivery_destination_address", "Optional[str]", None),
+                ("delivery_destination_city", "Optional[str]", None),
+                ("delivery_destination_country", "Optional[str]", None),
+                ("delivery_destination_zip_code", "Optional[str]", None),
+                ("delivery_method_id", "Optional[Union[str, int]]", None),
+                ("document_id", "Optional[Union[str, int]]", None),
+                ("document_set_id", "Optional[Union[str, int]]", None),
+                ("expiration_date", "Optional[str]", None),
+                ("financial_discount", "Optional[str]", None),
+                ("notes", "Optional[str]", None),
+                ("our_reference", "Optional[str]", None),
+                ("payments", "Optional[List[Payments]]", None),
+                ("products", "Optional[List[Products]]", None),
+                ("related_documents_notes", "Optional[str]", None),
+                ("salesman_commission", "Optional[str]", None),
+                ("salesman_id", "Optional[Union[str, int]]", None),
+                ("special_discount", "Optional[str]", None),
+                ("status", "Optional[str]", None),
+                ("vehicle_id", "Optional[Union[str, int]]", None),
+                ("your_reference", "Optional[str]", None),
+            ),
+        },
+    },
+    "SubscriptionClient": {
+        "components": ("Suppliers", "Taxes", "Warehouses"),
+        "endpoints": {
+            "get_one": ("/subscription/getOne/", "post", "SubscriptionGetOneModel"),
+        },
+        "models": {
+            "SubscriptionGetOneModel": (("company_id", "Union[str, int]", ...),),
+        },
+    },
+    "SuppliersClient": {
+        "components": (),
+        "endpoints": {
+            "count": ("/suppliers/count/", "post", "SuppliersCountModel"),
+            "count_by_name": (
+                "/suppliers/countByName/",
+                "post",
+                "SuppliersCountByNameModel",
+            ),
+            "count_by_number": (
+                "/suppliers/countByNumber/",
+                "post",
+                "SuppliersCountByNumberModel",
+            ),
+            "count_by_search": (
+                "/suppliers/countBySearch/",
+                "post",
+                "SuppliersCountBySearchModel",
+            ),
+            "count_by_vat": (
+                "/suppliers/countByVat/",
+                "post",
+                "SuppliersCountByVatModel",
+            ),
+            "count_modified_since": (
+                "/suppliers/countModifiedSince/",
+                "post",
+                "SuppliersCountModifiedSinceModel",
+            ),
+            "delete": ("/suppliers/delete/", "post", "SuppliersDeleteModel"),
+            "get_all": ("/suppliers/getAll/", "post", "SuppliersGetAllModel"),
+            "get_by_name": ("/suppliers/getByName/", "post", "SuppliersGetByNameModel"),
+            "get_by_number": (
+                "/suppliers/getByNumber/",
+                "post",
+                "SuppliersGetByNumberModel",
+            ),
+            "get_by_search": (
+                "/suppliers/getBySearch/",
+                "post",
+                "SuppliersGetBySearchModel",
+            ),
+            "get_by_vat": ("/suppliers/getByVat/", "post", "SuppliersGetByVatModel"),
+            "get_modified_since": (
+                "/suppliers/getModifiedSince/",
+                "post",
+                "SuppliersGetModifiedSinceModel",
+            ),
+            "get_one": ("/suppliers/getOne/", "post", "SuppliersGetOneModel"),
+            "insert": ("/suppliers/insert/", "post", "SuppliersInsertModel"),
+            "update": ("/suppliers/update/", "post", "SuppliersUpdateModel"),
+        },
+        "models": {
+            "SuppliersCountModel": (("company_id", "Union[str, int]", ...),),
+            "SuppliersCountByNameModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("name", "Optional[str]", None),
+            ),
+            "SuppliersCountByNumberModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("number", "Optional[str]", None),
+            ),
+            "SuppliersCountBySearchModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("search", "Optional[str]", None),
+            ),
+            "SuppliersCountByVatModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("vat", "Optional[str]", None),
+            ),
+            "SuppliersCountModifiedSinceModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("lastmodified", "Optional[str]", None),
+            ),
+            "SuppliersDeleteModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("supplier_id", "Optional[Union[str, int]]", None),
+            ),
+            "SuppliersGetAllModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("offset", "Optional[Union[str, int]]", 0),
+                ("qty", "Optional[Union[str, int]]", 25),
+            ),
+            "SuppliersGetByNameModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("name", "Optional[str]", None),
+                ("offset", "Optional[Union[str, int]]", 0),
+                ("qty", "Optional[Union[str, int]]", 25),
+            ),
+            "SuppliersGetByNumberModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("number", "Optional[str]", None),
+                ("offset", "Optional[Union[str, int]]", 0),
+                ("qty", "Optional[Union[str, int]]", 25),
+            ),
+            "SuppliersGetBySearchModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("offset", "Optional[Union[str, int]]", 0),
+                ("qty", "Optional[Union[str, int]]", 25),
+                ("search", "Optional[str]", None),
+            ),
+            "SuppliersGetByVatModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("offset", "Optional[Union[str, int]]", 0),
+                ("qty", "Optional[Union[str, int]]", 25),
+                ("vat", "Optional[str]", None),
+            ),
+            "SuppliersGetModifiedSinceModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("lastmodified", "Optional[str]", None),
+                ("offset", "Optional[Union[str, int]]", 0),
+                ("qty", "Optional[Union[str, int]]", 25),
+            ),
+            "SuppliersGetOneModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("supplier_id", "Optional[Union[str, int]]", None),
+            ),
+            "SuppliersInsertModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("address", "Optional[str]", None),
+                ("city", "Optional[str]", None),
+                ("contact_email", "Optional[str]", None),
+                ("contact_name", "Optional[str]", None),
+                ("contact_phone", "Optional[str]", None),
+                ("country_id", "Optional[Union[str, int]]", None),
+                ("credit_limit", "Optional[str]", None),
+                ("delivery_method_id", "Optional[Union[str, int]]", None),
+                ("discount", "Optional[str]", None),
+                ("email", "Optional[str]", None),
+                ("fax", "Optional[str]", None),
+                ("field_notes", "Optional[str]", None),
+                ("language_id", "Optional[Union[str, int]]", None),
+                ("maturity_date_id", "Optional[Union[str, int]]", None),
+                ("name", "Optional[str]", None),
+                ("notes", "Optional[str]", None),
+                ("number", "Optional[str]", None),
+                ("payment_method_id", "Optional[Union[str, int]]", None),
+                ("phone", "Optional[str]", None),
+                ("qty_copies_document", "Optional[str]", None),
+                ("vat", "Optional[str]", None),
+                ("website", "Optional[str]", None),
+                ("zip_code", "Optional[str]", None),
+            ),
+            "SuppliersUpdateModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("address", "Optional[str]", None),
+                ("city", "Optional[str]", None),
+                ("contact_email", "Optional[str]", None),
+                ("contact_name", "Optional[str]", None),
+                ("contact_phone", "Optional[str]", None),
+                ("country_id", "Optional[Union[str, int]]", None),
+                ("credit_limit", "Optional[str]", None),
+                ("delivery_method_id", "Optional[Union[str, int]]", None),
+                ("discount", "Optional[str]", None),
+                ("email", "Optional[str]", None),
+                ("fax", "Optional[str]", None),
+                ("field_notes", "Optional[str]", None),
+                ("language_id", "Optional[Union[str, int]]", None),
+                ("maturity_date_id", "Optional[Union[str, int]]", None),
+                ("name", "Optional[str]", None),
+                ("notes", "Optional[str]", None),
+                ("number", "Optional[str]", None),
+                ("payment_method_id", "Optional[Union[str, int]]", None),
+                ("phone", "Optional[str]", None),
+                ("qty_copies_document", "Optional[str]", None),
+                ("supplier_id", "Optional[Union[str, int]]", None),
+                ("vat", "Optional[str]", None),
+                ("website", "Optional[str]", None),
+                ("zip_code", "Optional[str]", None),
+            ),
+        },
+    },
+    "TaxesClient": {
+        "components": (),
+        "endpoints": {
+            "count_modified_since": (
+                "/taxes/countModifiedSince/",
+                "post",
+                "TaxesCountModifiedSinceModel",
+            ),
+            "delete": ("/taxes/delete/", "post", "TaxesDeleteModel"),
+            "get_all": ("/taxes/getAll/", "post", "TaxesGetAllModel"),
+            "get_modified_since": (
+                "/taxes/getModifiedSince/",
+                "post",
+                "TaxesGetModifiedSinceModel",
+            ),
+            "insert": ("/taxes/insert/", "post", "TaxesInsertModel"),
+            "update": ("/taxes/update/", "post", "TaxesUpdateModel"),
+        },
+        "models": {
+            "TaxesCountModifiedSinceModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("lastmodified", "Optional[str]", None),
+            ),
+            "TaxesDeleteModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("tax_id", "Optional[Union[str, int]]", None),
+            ),
+            "TaxesGetAllModel": (("company_id", "Union[str, int]", ...),),
+            "TaxesGetModifiedSinceModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("lastmodified", "Optional[str]", None),
+            ),
+            "TaxesInsertModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("active_by_default", "Optional[str]", None),
+                ("exemption_reason", "Optional[str]", None),
+                ("fiscal_zone", "Optional[str]", None),
+                ("name", "Optional[str]", None),
+                ("saft_type", "Optional[str]", None),
+                ("stamp_tax", "Optional[str]", None),
+                ("type", "Optional[str]", None),
+                ("value", "Optional[str]", None),
+                ("vat_type", "Optional[str]", None),
+            ),
+            "TaxesUpdateModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("active_by_default", "Optional[str]", None),
+                ("exemption_reason", "Optional[str]", None),
+                ("fiscal_zone", "Optional[str]", None),
+                ("name", "Optional[str]", None),
+                ("saft_type", "Optional[str]", None),
+                ("stamp_tax", "Optional[str]", None),
+                ("tax_id", "Optional[Union[str, int]]", None),
+                ("type", "Optional[str]", None),
+                ("value", "Optional[str]", None),
+                ("vat_type", "Optional[str]", None),
+            ),
+        },
+    },
+    "TaxexemptionsClient": {
+        "components": (),
+        "endpoints": {
+            "count_modified_since": (
+                "/taxExemptions/countModifiedSince/",
+                "post",
+                "TaxexemptionsCountModifiedSinceModel",
+            ),
+            "get_all": ("/taxExemptions/getAll/", "post", None),
+            "get_modified_since": (
+                "/taxExemptions/getModifiedSince/",
+                "post",
+                "TaxexemptionsGetModifiedSinceModel",
+            ),
+        },
+        "models": {
+            "TaxexemptionsCountModifiedSinceModel": (
+                ("lastmodified", "Optional[str]", None),
+            ),
+            "TaxexemptionsGetModifiedSinceModel": (
+                ("lastmodified", "Optional[str]", None),
+            ),
+        },
+    },
+    "UsersClient": {
+        "components": ("Suppliers", "Taxes", "Warehouses"),
+        "endpoints": {
+            "get_all": ("/users/getAll/", "post", "UsersGetAllModel"),
+        },
+        "models": {
+            "UsersGetAllModel": (("company_id", "Union[str, int]", ...),),
+        },
+    },
+    "VehiclesClient": {
+        "components": (),
+        "endpoints": {
+            "count_modified_since": (
+                "/vehicles/countModifiedSince/",
+                "post",
+                "VehiclesCountModifiedSinceModel",
+            ),
+            "delete": ("/vehicles/delete/", "post", "VehiclesDeleteModel"),
+            "get_all": ("/vehicles/getAll/", "post", "VehiclesGetAllModel"),
+            "get_modified_since": (
+                "/vehicles/getModifiedSince/",
+                "post",
+                "VehiclesGetModifiedSinceModel",
+            ),
+            "insert": ("/vehicles/insert/", "post", "VehiclesInsertModel"),
+            "update": ("/vehicles/update/", "post", "VehiclesUpdateModel"),
+        },
+        "models": {
+            "VehiclesCountModifiedSinceModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("lastmodified", "Optional[str]", None),
+            ),
+            "VehiclesDeleteModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("vehicle_id", "Optional[Union[str, int]]", None),
+            ),
+            "VehiclesGetAllModel": (("company_id", "Union[str, int]", ...),),
+            "VehiclesGetModifiedSinceModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("lastmodified", "Optional[str]", None),
+            ),
+            "VehiclesInsertModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("description", "Optional[str]", None),
+                ("number_plate", "Optional[str]", None),
+            ),
+            "VehiclesUpdateModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("description", "Optional[str]", None),
+                ("number_plate", "Optional[str]", None),
+                ("vehicle_id", "Optional[Union[str, int]]", None),
+            ),
+        },
+    },
+    "WarehousesClient": {
+        "components": ("Suppliers", "Taxes", "Warehouses"),
+        "endpoints": {
+            "count_modified_since": (
+                "/warehouses/countModifiedSince/",
+                "post",
+                "WarehousesCountModifiedSinceModel",
+            ),
+            "delete": ("/warehouses/delete/", "post", "WarehousesDeleteModel"),
+            "get_all": ("/warehouses/getAll/", "post", "WarehousesGetAllModel"),
+            "get_modified_since": (
+                "/warehouses/getModifiedSince/",
+                "post",
+                "WarehousesGetModifiedSinceModel",
+            ),
+            "insert": ("/warehouses/insert/", "post", "WarehousesInsertModel"),
+            "update": ("/warehouses/update/", "post", "WarehousesUpdateModel"),
+        },
+        "models": {
+            "WarehousesCountModifiedSinceModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("lastmodified", "Optional[str]", None),
+            ),
+            "WarehousesDeleteModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("warehouse_id", "Optional[Union[str, int]]", None),
+            ),
+            "WarehousesGetAllModel": (("company_id", "Union[str, int]", ...),),
+            "WarehousesGetModifiedSinceModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("lastmodified", "Optional[str]", None),
+            ),
+            "WarehousesInsertModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("address", "Optional[str]", None),
+                ("city", "Optional[str]", None),
+                ("code", "Optional[str]", None),
+                ("contact_email", "Optional[str]", None),
+                ("contact_name", "Optional[str]", None),
+                ("country_id", "Optional[Union[str, int]]", None),
+                ("fax", "Optional[str]", None),
+                ("is_default", "Optional[bool]", None),
+                ("phone", "Optional[str]", None),
+                ("title", "Optional[str]", None),
+                ("zip_code", "Optional[str]", None),
+            ),
+            "WarehousesUpdateModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("address", "Optional[str]", None),
+                ("city", "Optional[str]", None),
+                ("code", "Optional[str]", None),
+                ("contact_email", "Optional[str]", None),
+                ("contact_name", "Optional[str]", None),
+                ("country_id", "Optional[Union[str, int]]", None),
+                ("fax", "Optional[str]", None),
+                ("is_default", "Optional[bool]", None),
+                ("phone", "Optional[str]", None),
+                ("title", "Optional[str]", None),
+                ("warehouse_id", "Optional[Union[str, int]]", None),
+                ("zip_code", "Optional[str]", None),
+            ),
+        },
+    },
+    "WaybillsClient": {
+        "components": ("Associated_documents", "Payments", "Products"),
+        "endpoints": {
+            "count": ("/waybills/count/", "post", "WaybillsCountModel"),
+            "delete": ("/waybills/delete/", "post", "WaybillsDeleteModel"),
+            "get_all": ("/waybills/getAll/", "post", "WaybillsGetAllModel"),
+            "get_one": ("/waybills/getOne/", "post", "WaybillsGetOneModel"),
+            "insert": ("/waybills/insert/", "post", "WaybillsInsertModel"),
+            "set_transport_code": (
+                "/waybills/setTransportCode/",
+                "post",
+                "WaybillsSetTransportCodeModel",
+            ),
+            "update": ("/waybills/update/", "post", "WaybillsUpdateModel"),
+        },
+        "models": {
+            "WaybillsCountModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("customer_id", "Optional[Union[str, int]]", None),
+                ("date", "Optional[str]", None),
+                ("document_set_id", "Optional[Union[str, int]]", None),
+                ("number", "Optional[str]", None),
+                ("year", "Optional[str]", None),
+                ("your_reference", "Optional[str]", None),
+            ),
+            "WaybillsDeleteModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("document_id", "Optional[Union[str, int]]", None),
+            ),
+            "WaybillsGetAllModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("customer_id", "Optional[Union[str, int]]", None),
+                ("date", "Optional[str]", None),
+                ("document_set_id", "Optional[Union[str, int]]", None),
+                ("number", "Optional[str]", None),
+                ("offset", "Optional[Union[str, int]]", 0),
+                ("qty", "Optional[Union[str, int]]", 25),
+                ("year", "Optional[str]", None),
+                ("your_reference", "Optional[str]", None),
+            ),
+            "WaybillsGetOneModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("customer_id", "Optional[Union[str, int]]", None),
+                ("date", "Optional[str]", None),
+                ("document_id", "Optional[Union[str, int]]", None),
+                ("document_set_id", "Optional[Union[str, int]]", None),
+                ("number", "Optional[str]", None),
+                ("year", "Optional[str]", None),
+                ("your_reference", "Optional[str]", None),
+            ),
+            "WaybillsInsertModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("associated_documents", "Optional[List[Associated_documents]]", None),
+                ("customer_id", "Optional[Union[str, int]]", None),
+                ("date", "Optional[str]", None),
+                ("delivery_datetime", "Optional[str]", None),
+                ("delivery_departure_address", "Optional[str]", None),
+                ("delivery_departure_city", "Optional[str]", None),
+                ("delivery_departure_country", "Optional[str]", None),
+                ("delivery_departure_zip_code", "Optional[str]", None),
+                ("delivery_destination_address", "Optional[str]", None),
+                ("delivery_destination_city", "Optional[str]", None),
+                ("delivery_destination_country", "Optional[str]", None),
+                ("delivery_destination_zip_code", "Optional[str]", None),
+                ("delivery_method_id", "Optional[Union[str, int]]", None),
+                ("document_set_id", "Optional[Union[str, int]]", None),
+                ("financial_discount", "Optional[str]", None),
+                ("notes", "Optional[str]", None),
+                ("products", "Optional[List[Products]]", None),
+                ("related_documents_notes", "Optional[str]", None),
+                ("status", "Optional[str]", None),
+                ("vehicle_id", "Optional[Union[str, int]]", None),
+                ("your_reference", "Optional[str]", None),
+            ),
+            "WaybillsSetTransportCodeModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("document_id", "Optional[Union[str, int]]", None),
+                ("transport_code", "Optional[str]", None),
+            ),
+            "WaybillsUpdateModel": (
+                ("company_id", "Union[str, int]", ...),
+                ("associated_documents", "Optional[List[Associated_documents]]", None),
+                ("customer_id", "Optional[Union[str, int]]", None),
+                ("date", "Optional[str]", None),
+                ("delivery_datetime", "Optional[str]", None),
+                ("delivery_departure_address", "Optional[str]", None),
+                ("delivery_departure_city", "Optional[str]", None),
+                ("delivery_departure_country", "Optional[str]", None),
+                ("delivery_departure_zip_code", "Optional[str]", None),
+                ("delivery_destination_address", "Optional[str]", None),
+                ("delivery_destination_city", "Optional[str]", None),
+                ("delivery_destination_country", "Optional[str]", None),
+                ("delivery_destination_zip_code", "Optional[str]", None),
+                ("delivery_method_id", "Optional[Union[str, int]]", None),
+                ("document_id", "Optional[Union[str, int]]", None),
+                ("document_set_id", "Optional[Union[str, int]]", None),
+                ("financial_discount", "Optional[str]", None),
+                ("notes", "Optional[str]", None),
+                ("products", "Optional[List[Products]]", None),
+                ("related_documents_notes", "Optional[str]", None),
+                ("status", "Optional[str]", None),
+                ("vehicle_id", "Optional[Union[str, int]]", None),
+                ("your_reference", "Optional[str]", None),
+            ),
+        },
+    },
+}
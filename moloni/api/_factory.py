@@ -0,0 +1,199 @@
+"""
+Builds the API clients and their request models at runtime from the endpoint table that
+`code_generator/client_gen.py` writes to `moloni.api._endpoints`.
+
+A client module only binds the names it exports, its classes are built the first time it is imported. The nested
+models (`Products`, `Taxes`, `Payments`, ...) are built once and shared by every client.
+"""
+
+from functools import lru_cache
+from typing import Any, ClassVar, List, Optional, Union
+
+from pydantic import BaseModel, ConfigDict, create_model
+
+from moloni.api._endpoints import CLIENTS, COMPONENTS
+from moloni.base.async_client import AsyncMoloniBaseClient
+from moloni.base.client import MoloniBaseClient
+from moloni.base.helpers import ApiResponse, endpoint
+
+# Names the field types of the table are written with
+_TYPES = {
+    "Any": Any,
+    "List": List,
+    "Optional": Optional,
+    "Union": Union,
+    "bool": bool,
+    "int": int,
+    "str": str,
+}
+
+
+class ApiRequestModel(BaseModel):
+    """
+    Request model of an endpoint, `connect` it to a client and send it with `request`
+    """
+
+    # Validation schemas are built when a model is first used, not when its client module is imported
+    model_config = ConfigDict(defer_build=True)
+
+    _api_client: Any = None
+    client_class: ClassVar[type] = None
+    method_name: ClassVar[str] = None
+
+    def connect(self, *args, **kwargs):
+        self._api_client = self.client_class(*args, **kwargs)
+        return self
+
+    def __enter__(self):
+        return self.connect()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self._api_client is not None:
+            self._api_client.close()
+
+    def request(self) -> ApiResponse:
+        """
+        Sends the model's data with the client initialized by `connect`
+
+        .. code-block:: python
+
+            with request_model.connect(auth_config=auth_config) as api:
+                response = api.request()
+
+        :raises ValueError: when the client is not initialized
+        """
+        if self._api_client is None:
+            raise ValueError("Client not initialized. Use the 'connect' method.")
+        return getattr(self._api_client, self.method_name)(
+            self.model_dump(exclude={"_api_client"}, exclude_unset=True)
+        )
+
+
+@lru_cache(maxsize=None)
+def components() -> dict:
+    """
+    Nested models shared by the clients, every field is optional and takes any value
+    """
+    return {
+        name: create_model(
+            name,
+            __config__=ConfigDict(defer_build=True),
+            __module__=__name__,
+            **{field: (Optional[Any], None) for field in fields},
+        )
+        for name, fields in COMPONENTS.items()
+    }
+
+
+def __getattr__(name):
+    # Lets pickle find the shared nested models
+    try:
+        return components()[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+
+@lru_cache(maxsize=None)
+def field_type(expression: str):
+    """
+    Type of a field as the table writes it, e.g. `Optional[List[Products]]`
+    """
+    # The table is generated with the package, its expressions only name typing constructs and nested models
+    return eval(expression, {"__builtins__": {}}, {**_TYPES, **components()})
+
+
+def request_model(name, fields, base, module):
+    return create_model(
+        name,
+        __base__=base,
+        __module__=module,
+        **{
+            field: (field_type(expression), default)
+            for field, expression, default in fields
+        },
+    )
+
+
+def endpoint_method(module, class_name, name, path, http_method, model, fields=()):
+    if model is None:
+
+        def call(self, **kwargs):
+            path, method = self.routes[name]
+            return self._request(path, data={**kwargs}, method=method)
+
+        signature = f"{name}(self, **kwargs)"
+        args = ""
+    else:
+
+        def call(self, data, **kwargs):
+            data = self.prepare_data(data, model)
+            path, method = self.routes[name]
+            return self._request(path, data={**data, **kwargs}, method=method)
+
+        call.__annotations__ = {"data": Union[model, dict]}
+        signature = f"{name}(self, data: Union[{model.__name__}, dict], **kwargs)"
+        listed = "\n".join(
+            f"        - {field} ({expression}): {field} of the {model.__name__}."
+            for field, expression, _ in fields
+        )
+        args = (
+            f"\n\nArgs:\n    data (Union[{model.__name__}, dict]): A model instance or dictionary containing the "
+            f"following fields:\n\n{listed}"
+        )
+
+    # Tracebacks show the endpoint method rather than the closure
+    call.__code__ = call.__code__.replace(co_name=name)
+    call.__name__ = name
+    call.__qualname__ = f"{class_name}.{name}"
+    call.__module__ = module
+    call.__doc__ = (
+        f"{signature}{args}\n\nReturns:\n    ApiResponse: The response from the API."
+    )
+    return endpoint(f"/<version>{path}", method=http_method, inject=False)(call)
+
+
+@lru_cache(maxsize=None)
+def client_namespace(class_name: str, module: str) -> dict:
+    """
+    Classes a client module exports: the client, its asyncio version, the nested models and the request models
+    """
+    table = CLIENTS[class_name]
+    base = type(ApiRequestModel.__name__, (ApiRequestModel,), {"__module__": module})
+    models = {
+        name: request_model(name, fields, base, module)
+        for name, fields in table["models"].items()
+    }
+
+    methods = {"__module__": module, "__qualname__": class_name}
+    for name, (path, http_method, model_name) in table["endpoints"].items():
+        model = models.get(model_name)
+        methods[name] = endpoint_method(
+            module,
+            class_name,
+            name,
+            path,
+            http_method,
+            model,
+            table["models"].get(model_name, ()),
+        )
+        if model is not None:
+            model.method_name = name
+    client = type(class_name, (MoloniBaseClient,), methods)
+    async_client = type(
+        f"Async{class_name}",
+        (client, AsyncMoloniBaseClient),
+        {
+            "__module__": module,
+            "__doc__": f"Asyncio version of `{class_name}`. Every endpoint method returns an awaitable `ApiResponse`.",
+        },
+    )
+    base.client_class = client
+
+    shared = components()
+    return {
+        class_name: client,
+        async_client.__name__: async_client,
+        ApiRequestModel.__name__: base,
+        **{name: shared[name] for name in table["components"]},
+        **models,
+    }
@@ -1,372 +1,16 @@
-from pydantic import BaseModel, ValidationError
-from typing import Union, Optional, List, Any
-
-from moloni.base.client import MoloniBaseClient
-from moloni.base.helpers import endpoint, fill_query_params, validate_data
-from moloni.base import ApiResponse
-
-
-class ApiRequestModel(BaseModel):
-    _api_client: Any = None
-
-    def connect(self, *args, **kwargs):
-        self._api_client = BankaccountsClient(*args, **kwargs)
-        return self
-
-    def __enter__(self):
-        return self.connect()
-
-    def __exit__(self, exc_type, exc_value, traceback):
-        pass
-
-
-class BankaccountsCountModifiedSinceModel(ApiRequestModel):
-    company_id: Union[str, int]
-    lastmodified: Optional[str] = None
-
-    def request(self) -> ApiResponse:
-        """
-        request(self) -> ApiResponse
-
-        Make an API request using the initialized client.
-
-        This method checks if the `_api_client` attribute is set (i.e., if the client has been initialized via the `connect` method).
-        If the client is initialized, it will make an API request using the provided method name and the model's data,
-        excluding the `_api_client` attribute itself from the request payload. If the client is not initialized, it will raise a `ValueError`.
-
-        Returns:
-            The response from the API.
-
-        Raises:
-            ValueError: If the client is not initialized via the `connect` method.
-
-        Example:
-
-                # Assuming you have a model instance `request_model` and an API client `api_client`
-
-                ..code-block:: python
-
-                    with request_model.connect(auth_config=auth_config) as api:
-                        response = api.request()
-
-                # The above example assumes that the `connect` method has been used to initialize the client.
-                # The request method then sends the model's data to the API and returns the API's response.
-
-        """
-        if hasattr(self, "_api_client"):
-            response = self._api_client.count_modified_since(
-                self.model_dump(exclude={"_api_client"}, exclude_unset=True)
-            )
-            return response
-        else:
-            raise ValueError("Client not initialized. Use the 'connect' method.")
-
-
-class BankaccountsDeleteModel(ApiRequestModel):
-    company_id: Union[str, int]
-    bank_account_id: Optional[Union[str, int]] = None
-
-    def request(self) -> ApiResponse:
-        """
-        request(self) -> ApiResponse
-
-        Make an API request using the initialized client.
-
-        This method checks if the `_api_client` attribute is set (i.e., if the client has been initialized via the `connect` method).
-        If the client is initialized, it will make an API request using the provided method name and the model's data,
-        excluding the `_api_client` attribute itself from the request payload. If the client is not initialized, it will raise a `ValueError`.
-
-        Returns:
-            The response from the API.
-
-        Raises:
-            ValueError: If the client is not initialized via the `connect` method.
-
-        Example:
-
-                # Assuming you have a model instance `request_model` and an API client `api_client`
-
-                ..code-block:: python
-
-                    with request_model.connect(auth_config=auth_config) as api:
-                        response = api.request()
-
-                # The above example assumes that the `connect` method has been used to initialize the client.
-                # The request method then sends the model's data to the API and returns the API's response.
-
-        """
-        if hasattr(self, "_api_client"):
-            response = self._api_client.delete(
-                self.model_dump(exclude={"_api_client"}, exclude_unset=True)
-            )
-            return response
-        else:
-            raise ValueError("Client not initialized. Use the 'connect' method.")
-
-
-class BankaccountsGetAllModel(ApiRequestModel):
-    company_id: Union[str, int]
-
-    def request(self) -> ApiResponse:
-        """
-        request(self) -> ApiResponse
-
-        Make an API request using the initialized client.
-
-        This method checks if the `_api_client` attribute is set (i.e., if the client has been initialized via the `connect` method).
-        If the client is initialized, it will make an API request using the provided method name and the model's data,
-        excluding the `_api_client` attribute itself from the request payload. If the client is not initialized, it will raise a `ValueError`.
-
-        Returns:
-            The response from the API.
-
-        Raises:
-            ValueError: If the client is not initialized via the `connect` method.
-
-        Example:
-
-                # Assuming you have a model instance `request_model` and an API client `api_client`
-
-                ..code-block:: python
-
-                    with request_model.connect(auth_config=auth_config) as api:
-                        response = api.request()
-
-                # The above example assumes that the `connect` method has been used to initialize the client.
-                # The request method then sends the model's data to the API and returns the API's response.
-
-        """
-        if hasattr(self, "_api_client"):
-            response = self._api_client.get_all(
-                self.model_dump(exclude={"_api_client"}, exclude_unset=True)
-            )
-            return response
-        else:
-            raise ValueError("Client not initialized. Use the 'connect' method.")
-
-
-class BankaccountsInsertModel(ApiRequestModel):
-    company_id: Union[str, int]
-    name: Optional[str] = None
-    order: Optional[str] = None
-    value: Optional[str] = None
-
-    def request(self) -> ApiResponse:
-        """
-        request(self) -> ApiResponse
-
-        Make an API request using the initialized client.
-
-        This method checks if the `_api_client` attribute is set (i.e., if the client has been initialized via the `connect` method).
-        If the client is initialized, it will make an API request using the provided method name and the model's data,
-        excluding the `_api_client` attribute itself from the request payload. If the client is not initialized, it will raise a `ValueError`.
-
-        Returns:
-            The response from the API.
-
-        Raises:
-            ValueError: If the client is not initialized via the `connect` method.
-
-        Example:
-
-                # Assuming you have a model instance `request_model` and an API client `api_client`
-
-                ..code-block:: python
-
-                    with request_model.connect(auth_config=auth_config) as api:
-                        response = api.request()
-
-                # The above example assumes that the `connect` method has been used to initialize the client.
-                # The request method then sends the model's data to the API and returns the API's response.
-
-        """
-        if hasattr(self, "_api_client"):
-            response = self._api_client.insert(
-                self.model_dump(exclude={"_api_client"}, exclude_unset=True)
-            )
-            return response
-        else:
-            raise ValueError("Client not initialized. Use the 'connect' method.")
-
-
-class BankaccountsUpdateModel(ApiRequestModel):
-    company_id: Union[str, int]
-    bank_account_id: Optional[Union[str, int]] = None
-    name: Optional[str] = None
-    order: Optional[str] = None
-    value: Optional[str] = None
-
-    def request(self) -> ApiResponse:
-        """
-        request(self) -> ApiResponse
-
-        Make an API request using the initialized client.
-
-        This method checks if the `_api_client` attribute is set (i.e., if the client has been initialized via the `connect` method).
-        If the client is initialized, it will make an API request using the provided method name and the model's data,
-        excluding the `_api_client` attribute itself from the request payload. If the client is not initialized, it will raise a `ValueError`.
-
-        Returns:
-            The response from the API.
-
-        Raises:
-            ValueError: If the client is not initialized via the `connect` method.
-
-        Example:
-
-                # Assuming you have a model instance `request_model` and an API client `api_client`
-
-                ..code-block:: python
-
-                    with request_model.connect(auth_config=auth_config) as api:
-                        response = api.request()
-
-                # The above example assumes that the `connect` method has been used to initialize the client.
-                # The request method then sends the model's data to the API and returns the API's response.
-
-        """
-        if hasattr(self, "_api_client"):
-            response = self._api_client.update(
-                self.model_dump(exclude={"_api_client"}, exclude_unset=True)
-            )
-            return response
-        else:
-            raise ValueError("Client not initialized. Use the 'connect' method.")
-
-
-class BankaccountsClient(MoloniBaseClient):
-
-    @endpoint("/<version>/bankAccounts/countModifiedSince/", method="post")
-    def count_modified_since(
-        self, data: Union[BankaccountsCountModifiedSinceModel, dict], **kwargs
-    ):
-        """
-        count_modified_since(self, data: Union[BankaccountsCountModifiedSinceModel, dict], **kwargs)
-
-        Args:
-
-            data (Union[BankaccountsCountModifiedSinceModel, dict]): A model instance or dictionary containing the following fields:
-
-                - company_id (Union[str, int]): company_id of the BankaccountsCountModifiedSinceModel.
-
-                - lastmodified (str): lastmodified of the BankaccountsCountModifiedSinceModel.
-
-
-
-        Returns:
-            ApiResponse: The response from the API.
-        """
-
-        data = validate_data(data, self.validate, BankaccountsCountModifiedSinceModel)
-
-        return self._request(
-            fill_query_params(kwargs.pop("path"), self.version), data={**data, **kwargs}
-        )
-
-    @endpoint("/<version>/bankAccounts/delete/", method="post")
-    def delete(self, data: Union[BankaccountsDeleteModel, dict], **kwargs):
-        """
-        delete(self, data: Union[BankaccountsDeleteModel, dict], **kwargs)
-
-        Args:
-
-            data (Union[BankaccountsDeleteModel, dict]): A model instance or dictionary containing the following fields:
-
-                - bank_account_id (Union[str, int]): bank_account_id of the BankaccountsDeleteModel.
-
-                - company_id (Union[str, int]): company_id of the BankaccountsDeleteModel.
-
-
-
-        Returns:
-            ApiResponse: The response from the API.
-        """
-
-        data = validate_data(data, self.validate, BankaccountsDeleteModel)
-
-        return self._request(
-            fill_query_params(kwargs.pop("path"), self.version), data={**data, **kwargs}
-        )
-
-    @endpoint("/<version>/bankAccounts/getAll/", method="post")
-    def get_all(self, data: Union[BankaccountsGetAllModel, dict], **kwargs):
-        """
-        get_all(self, data: Union[BankaccountsGetAllModel, dict], **kwargs)
-
-        Args:
-
-            data (Union[BankaccountsGetAllModel, dict]): A model instance or dictionary containing the following fields:
-
-                - company_id (Union[str, int]): company_id of the BankaccountsGetAllModel.
-
-
-
-        Returns:
-            ApiResponse: The response from the API.
-        """
-
-        data = validate_data(data, self.validate, BankaccountsGetAllModel)
-
-        return self._request(
-            fill_query_params(kwargs.pop("path"), self.version), data={**data, **kwargs}
-        )
-
-    @endpoint("/<version>/bankAccounts/insert/", method="post")
-    def insert(self, data: Union[BankaccountsInsertModel, dict], **kwargs):
-        """
-        insert(self, data: Union[BankaccountsInsertModel, dict], **kwargs)
-
-        Args:
-
-            data (Union[BankaccountsInsertModel, dict]): A model instance or dictionary containing the following fields:
-
-                - company_id (Union[str, int]): company_id of the BankaccountsInsertModel.
-
-                - name (str): name of the BankaccountsInsertModel.
-
-                - order (str): order of the BankaccountsInsertModel.
-
-                - value (str): value of the BankaccountsInsertModel.
-
-
-
-        Returns:
-            ApiResponse: The response from the API.
-        """
-
-        data = validate_data(data, self.validate, BankaccountsInsertModel)
-
-        return self._request(
-            fill_query_params(kwargs.pop("path"), self.version), data={**data, **kwargs}
-        )
-
-    @endpoint("/<version>/bankAccounts/update/", method="post")
-    def update(self, data: Union[BankaccountsUpdateModel, dict], **kwargs):
-        """
-        update(self, data: Union[BankaccountsUpdateModel, dict], **kwargs)
-
-        Args:
-
-            data (Union[BankaccountsUpdateModel, dict]): A model instance or dictionary containing the following fields:
-
-                - bank_account_id (Union[str, int]): bank_account_id of the BankaccountsUpdateModel.
-
-                - company_id (Union[str, int]): company_id of the BankaccountsUpdateModel.
-
-                - name (str): name of the BankaccountsUpdateModel.
-
-                - order (str): order of the BankaccountsUpdateModel.
-
-                - value (str): value of the BankaccountsUpdateModel.
-
-
-
-        Returns:
-            ApiResponse: The response from the API.
-        """
-
-        data = validate_data(data, self.validate, BankaccountsUpdateModel)
-
-        return self._request(
-            fill_query_params(kwargs.pop("path"), self.version), data={**data, **kwargs}
-        )
+"""
+BankaccountsClient and its request models, built from the endpoint table in `moloni.api._endpoints`.
+"""
+
+from moloni.api._factory import client_namespace
+
+_namespace = client_namespace("BankaccountsClient", __name__)
+
+BankaccountsClient = _namespace["BankaccountsClient"]
+AsyncBankaccountsClient = _namespace["AsyncBankaccountsClient"]
+ApiRequestModel = _namespace["ApiRequestModel"]
+BankaccountsCountModifiedSinceModel = _namespace["BankaccountsCountModifiedSinceModel"]
+BankaccountsDeleteModel = _namespace["BankaccountsDeleteModel"]
+BankaccountsGetAllModel = _namespace["BankaccountsGetAllModel"]
+BankaccountsInsertModel = _namespace["BankaccountsInsertModel"]
+BankaccountsUpdateModel = _namespace["BankaccountsUpdateModel"]
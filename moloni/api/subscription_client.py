@@ -1,104 +1,15 @@
-from pydantic import BaseModel, ValidationError
-from typing import Union, Optional, List, Any
+"""
+SubscriptionClient and its request models, built from the endpoint table in `moloni.api._endpoints`.
+"""
 
-from moloni.base.client import MoloniBaseClient
-from moloni.base.helpers import endpoint, fill_query_params, validate_data
-from moloni.base import ApiResponse
+from moloni.api._factory import client_namespace
 
+_namespace = client_namespace("SubscriptionClient", __name__)
 
-class ApiRequestModel(BaseModel):
-    _api_client: Any = None
-
-    def connect(self, *args, **kwargs):
-        self._api_client = SubscriptionClient(*args, **kwargs)
-        return self
-
-    def __enter__(self):
-        return self.connect()
-
-    def __exit__(self, exc_type, exc_value, traceback):
-        pass
-
-
-class Suppliers(BaseModel):
-    cost_price: Optional[Any] = None
-    supplier_id: Optional[Any] = None
-
-
-class Taxes(BaseModel):
-    cumulative: Optional[Any] = None
-    order: Optional[Any] = None
-    tax_id: Optional[Any] = None
-    value: Optional[Any] = None
-
-
-class Warehouses(BaseModel):
-    stock: Optional[Any] = None
-    warehouse_id: Optional[Any] = None
-
-
-class SubscriptionGetOneModel(ApiRequestModel):
-    company_id: Union[str, int]
-
-    def request(self) -> ApiResponse:
-        """
-        request(self) -> ApiResponse
-
-        Make an API request using the initialized client.
-
-        This method checks if the `_api_client` attribute is set (i.e., if the client has been initialized via the `connect` method).
-        If the client is initialized, it will make an API request using the provided method name and the model's data,
-        excluding the `_api_client` attribute itself from the request payload. If the client is not initialized, it will raise a `ValueError`.
-
-        Returns:
-            The response from the API.
-
-        Raises:
-            ValueError: If the client is not initialized via the `connect` method.
-
-        Example:
-
-                # Assuming you have a model instance `request_model` and an API client `api_client`
-
-                ..code-block:: python
-
-                    with request_model.connect(auth_config=auth_config) as api:
-                        response = api.request()
-
-                # The above example assumes that the `connect` method has been used to initialize the client.
-                # The request method then sends the model's data to the API and returns the API's response.
-
-        """
-        if hasattr(self, "_api_client"):
-            response = self._api_client.get_one(
-                self.model_dump(exclude={"_api_client"}, exclude_unset=True)
-            )
-            return response
-        else:
-            raise ValueError("Client not initialized. Use the 'connect' method.")
-
-
-class SubscriptionClient(MoloniBaseClient):
-
-    @endpoint("/<version>/subscription/getOne/", method="post")
-    def get_one(self, data: Union[SubscriptionGetOneModel, dict], **kwargs):
-        """
-        get_one(self, data: Union[SubscriptionGetOneModel, dict], **kwargs)
-
-        Args:
-
-            data (Union[SubscriptionGetOneModel, dict]): A model instance or dictionary containing the following fields:
-
-                - company_id (Union[str, int]): company_id of the SubscriptionGetOneModel.
-
-
-
-        Returns:
-            ApiResponse: The response from the API.
-        """
-
-        data = validate_data(data, self.validate, SubscriptionGetOneModel)
-
-        return self._request(
-            fill_query_params(kwargs.pop("path"), self.version), data={**data, **kwargs}
-        )
+SubscriptionClient = _namespace["SubscriptionClient"]
+AsyncSubscriptionClient = _namespace["AsyncSubscriptionClient"]
+ApiRequestModel = _namespace["ApiRequestModel"]
+Suppliers = _namespace["Suppliers"]
+Taxes = _namespace["Taxes"]
+Warehouses = _namespace["Warehouses"]
+SubscriptionGetOneModel = _namespace["SubscriptionGetOneModel"]
@@ -1,24 +1,59 @@
 from .client import MoloniBaseClient, AuthConfig
-from .config import MoloniBaseUrl
+from .bulk import BulkExecutor
+from .circuit_breaker import CircuitBreaker, CircuitBreakerConfig, CircuitOpenError
+from .async_client import AsyncMoloniBaseClient
+from .config import MoloniBaseUrl, PoolConfig
+from .deadline import deadline, DeadlineExceeded
 from .helpers import (
     endpoint,
     fill_query_params,
     validate_data,
+    trusted,
     NoMoreRecords,
     ApiException,
     ApiResponse,
 )
+from .journal import Journal, JournaledExecutor
 from .logger_config import setup_logger
+from .lookup_index import LookupIndex
+from .mirror import Mirror
+from .rate_limit import RateLimiter, RateLimitConfig
+from .response_cache import ResponseCache, ResponseCacheConfig
+from .retry import RetryPolicy
+from .single_flight import SingleFlight
+from .token_store import TokenStore, FileTokenStore, SQLiteTokenStore
 
 __all__ = [
     "MoloniBaseClient",
+    "AsyncMoloniBaseClient",
     "MoloniBaseUrl",
+    "PoolConfig",
     "endpoint",
     "fill_query_params",
     "validate_data",
+    "trusted",
     "setup_logger",
     "NoMoreRecords",
     "ApiException",
     "AuthConfig",
     "ApiResponse",
+    "TokenStore",
+    "FileTokenStore",
+    "SQLiteTokenStore",
+    "RateLimiter",
+    "RateLimitConfig",
+    "RetryPolicy",
+    "Mirror",
+    "LookupIndex",
+    "BulkExecutor",
+    "Journal",
+    "JournaledExecutor",
+    "deadline",
+    "DeadlineExceeded",
+    "CircuitBreaker",
+    "CircuitBreakerConfig",
+    "CircuitOpenError",
+    "SingleFlight",
+    "ResponseCache",
+    "ResponseCacheConfig",
 ]
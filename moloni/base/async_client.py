@@ -0,0 +1,425 @@
+import asyncio
+import time
+
+from moloni.base.client import MoloniBaseClient, MyAuth, logger, raise_if_expired
+from moloni.base.config import PoolConfig
+from moloni.base.deadline import (
+    Deadline,
+    acquire_store,
+    check_wait,
+    deadline_timeout,
+    lock_timeout,
+    use_deadline,
+    within_deadline,
+)
+from moloni.base.form_encoding import encode_form
+from moloni.base.helpers import (
+    AccessTokenResponse,
+    ApiResponse,
+    ApiResponseValidator,
+    GetManyResult,
+    check_status,
+    record_id_field,
+)
+from moloni.base.pagination import (
+    count_method_name,
+    page_size_for,
+    parse_count,
+    resolve_method_name,
+    split_pagination,
+)
+
+
+def build_async_session(pool_config: PoolConfig) -> "httpx.AsyncClient":
+    """
+    Creates an httpx client backed by a connection pool configured from `pool_config`
+    :return:httpx.AsyncClient
+    """
+    # Imported here so the synchronous clients don't pay for it
+    try:
+        import httpx
+    except ImportError:  # pragma: no cover
+        raise ImportError(
+            "The asyncio clients require httpx, install it with `pip install python-moloni[async]`"
+        )
+    limits = httpx.Limits(
+        max_connections=pool_config.pool_connections * pool_config.pool_maxsize,
+        max_keepalive_connections=(
+            pool_config.pool_maxsize if pool_config.keep_alive else 0
+        ),
+    )
+    return httpx.AsyncClient(
+        limits=limits,
+        transport=httpx.AsyncHTTPTransport(
+            limits=limits, retries=pool_config.max_retries
+        ),
+    )
+
+
+def httpx_timeout(timeout) -> "httpx.Timeout":
+    """
+    Converts a requests style timeout, seconds or a (connect, read) tuple, to httpx
+    :return:httpx.Timeout
+    """
+    import httpx
+
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+        return httpx.Timeout(read, connect=connect)
+    return httpx.Timeout(timeout)
+
+
+class AsyncMyAuth(MyAuth):
+    async def get_auth(self) -> AccessTokenResponse:
+        """
+        Get's the access token, refreshing it shortly before it expires
+        :return:AccessTokenResponse
+        """
+        token = self.token_cache.get(self.cache_key)
+        if token is not None:
+            return token
+        return await within_deadline(self.refresh_locked())
+
+    async def refresh_locked(self) -> AccessTokenResponse:
+        """
+        Refreshes the token once for every task and thread waiting for it
+        :return:AccessTokenResponse
+        """
+        async with self.token_cache.async_lock(self.cache_key):
+            token = self.token_cache.get(self.cache_key)
+            if token is not None:
+                return token
+
+            # Also wait for refreshes running in other threads
+            lock = self.token_cache.lock(self.cache_key)
+            acquire = asyncio.get_running_loop().run_in_executor(None, lock.acquire)
+            try:
+                await asyncio.shield(acquire)
+            except asyncio.CancelledError:
+                acquire.add_done_callback(lambda _: lock.release())
+                raise
+            try:
+                token = self.token_cache.get(self.cache_key)
+                if token is None:
+                    token = self.token_cache.set(
+                        self.cache_key, await self.load_or_refresh()
+                    )
+            finally:
+                lock.release()
+        return token
+
+    async def load_or_refresh(self) -> AccessTokenResponse:
+        """
+        Reuses the token stored by another process, or refreshes it and stores the new one
+        :return:AccessTokenResponse
+        """
+        stale = self.token_cache.peek(self.cache_key)
+        if self.token_store is None:
+            return await self.refresh(stale)
+
+        # The store does blocking I/O, keep it off the event loop
+        loop = asyncio.get_running_loop()
+        # The executor doesn't see the deadline, its timeout is passed along
+        acquire = loop.run_in_executor(
+            None, acquire_store, self.token_store, self.cache_key, lock_timeout()
+        )
+        try:
+            handle = await asyncio.shield(acquire)
+        except asyncio.CancelledError:
+            # The lock is still acquired after the caller gave up, release it as soon as it is
+            acquire.add_done_callback(self._release_acquired)
+            raise
+        try:
+            stored = await loop.run_in_executor(
+                None, self.token_store.load, self.cache_key
+            )
+            if stored is not None and self.token_cache.is_fresh(stored):
+                return stored
+            token = self.token_cache.stamp(await self.refresh(stored or stale))
+            await loop.run_in_executor(
+                None, self.token_store.save, self.cache_key, token
+            )
+        finally:
+            self.token_store.release(handle)
+        return token
+
+    def _release_acquired(self, acquire):
+        if not acquire.cancelled() and acquire.exception() is None:
+            self.token_store.release(acquire.result())
+
+    async def refresh(self, stale: AccessTokenResponse = None) -> AccessTokenResponse:
+        """
+        Exchanges the refresh token of an expired token, falling back to the configured credentials
+        :return:AccessTokenResponse
+        """
+        if stale is not None and stale.refresh_token:
+            token = await self.get_token(refresh_token=stale.refresh_token)
+            if token.access_token:
+                return token
+        return await self.get_token()
+
+    async def get_token(self, **kwargs) -> AccessTokenResponse:
+        res = await self.session.request(
+            method="GET",
+            url=self.base_url + "/v1/grant",
+            headers=self.headers,
+            params=self.grant_params(**kwargs),
+            timeout=httpx_timeout(deadline_timeout(self.timeout)),
+        )
+        return AccessTokenResponse(**res.json())
+
+    async def __call__(self):
+        auth = await self.get_auth()
+        return f"{auth.access_token}"
+
+
+class AsyncMoloniBaseClient(MoloniBaseClient):
+    """
+    Asyncio counterpart of `MoloniBaseClient`, backed by an `httpx.AsyncClient`.
+
+    Endpoint methods take the same arguments and request models as the synchronous clients,
+    and return an awaitable resolving to an `ApiResponse`.
+    """
+
+    auth_class = AsyncMyAuth
+
+    @staticmethod
+    def build_session(pool_config: PoolConfig) -> "httpx.AsyncClient":
+        return build_async_session(pool_config)
+
+    async def close(self):
+        """
+        Releases the pooled connections, unless the session was passed in by the caller
+        """
+        if self._owns_session:
+            await self.session.aclose()
+
+    def __enter__(self):
+        raise TypeError("Use 'async with' with asyncio clients")
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def iter_all(
+        self,
+        data,
+        page_size: int = None,
+        method: str = None,
+        deadline: float = None,
+    ):
+        """
+        Asynchronous version of `MoloniBaseClient.iter_all`, use it with `async for`
+        """
+        method = method or resolve_method_name(self, data)
+        params, offset, qty = split_pagination(data)
+        page_size = page_size_for(page_size, qty)
+        limit = Deadline(deadline) if deadline is not None else None
+        with use_deadline(limit):
+            total = await self._count_for(method, params)
+        fetch = getattr(self, method)
+
+        while total is None or offset < total:
+            with use_deadline(limit):
+                response = await fetch({**params, "offset": offset, "qty": page_size})
+            page = response.payload
+            received = len(page)
+            paginated = response.requested_qty is not None
+            for record in page:
+                yield record
+            del page, response
+            if not paginated or not received:
+                return
+            if total is None and received != page_size:
+                return
+            offset += received
+
+    async def fetch_all(
+        self,
+        data,
+        page_size: int = None,
+        method: str = None,
+        max_workers: int = 8,
+        deadline: float = None,
+    ) -> list:
+        """
+        Asynchronous version of `MoloniBaseClient.fetch_all`, at most `max_workers` pages are requested at once
+        """
+        method = method or resolve_method_name(self, data)
+        params, offset, qty = split_pagination(data)
+        page_size = page_size_for(page_size, qty)
+
+        # The tasks created by gather inherit the deadline from this context
+        with use_deadline(Deadline(deadline) if deadline is not None else None):
+            total = await self._count_for(method, params)
+            if total is None:
+                return [
+                    record async for record in self.iter_all(data, page_size, method)
+                ]
+
+            fetch = getattr(self, method)
+            semaphore = asyncio.Semaphore(max_workers)
+
+            async def fetch_page(page_offset):
+                end = min(page_offset + page_size, total)
+                page = []
+                async with semaphore:
+                    while page_offset < end:
+                        response = await fetch(
+                            {**params, "offset": page_offset, "qty": page_size}
+                        )
+                        received = response.payload
+                        if not received:
+                            break
+                        page.extend(received[: end - page_offset])
+                        page_offset += len(received)
+                return page
+
+            pages = await asyncio.gather(
+                *[
+                    fetch_page(page_offset)
+                    for page_offset in range(offset, total, page_size)
+                ]
+            )
+        return [record for page in pages for record in page]
+
+    async def get_many(
+        self,
+        ids,
+        data: dict = None,
+        concurrency: int = 8,
+        method: str = "get_one",
+        id_field: str = None,
+        deadline: float = None,
+    ) -> GetManyResult:
+        """
+        Asynchronous version of `MoloniBaseClient.get_many`, at most `concurrency` records are requested at once
+        """
+        id_field = id_field or record_id_field(self)
+        fetch = getattr(self, method)
+        params = dict(data or {})
+        semaphore = asyncio.Semaphore(concurrency)
+        result = GetManyResult({}, {})
+
+        async def fetch_one(record_id):
+            async with semaphore:
+                request_data = {**params, id_field: record_id}
+                try:
+                    response = check_status(await fetch(request_data), request_data)
+                except Exception as error:
+                    return error
+                return response.payload
+
+        ids = list(dict.fromkeys(ids))
+        # The tasks created by gather inherit the deadline from this context
+        with use_deadline(Deadline(deadline) if deadline is not None else None):
+            outcomes = await asyncio.gather(
+                *[fetch_one(record_id) for record_id in ids]
+            )
+        for record_id, outcome in zip(ids, outcomes):
+            if isinstance(outcome, Exception):
+                result.errors[record_id] = outcome
+            else:
+                result.add(record_id, outcome, id_field)
+        return result
+
+    async def _count_for(self, method, params):
+        count = count_method_name(method)
+        if count is None or not hasattr(self, count):
+            return None
+        return parse_count((await getattr(self, count)(dict(params))).payload)
+
+    async def _request(self, path, data=None, method=None, **kwargs) -> ApiResponse:
+        data = data or {}
+
+        logger.debug(data)
+
+        if method is None:
+            method = data.pop("method")
+        body = encode_form(data)
+        key = self._read_key(path, method, body)
+        cache = self.response_cache
+        if key is not None and cache is not None:
+            response = cache.get(path, key)
+            if response is not None:
+                return response
+
+        if key is not None and self.single_flight is not None:
+            response = await self.single_flight.do_async(
+                key, lambda: self._send(path, method, data, body)
+            )
+        else:
+            response = await self._send(path, method, data, body)
+
+        if cache is not None:
+            self._update_cache(path, key, response)
+        for observer in self.observers:
+            observer(path, data, response)
+        return response
+
+    async def _send(self, path, method, data, body) -> ApiResponse:
+        import httpx
+
+        policy = self.retry_policy.for_path(path) if self.retry_policy else None
+        attempt = 1
+
+        while True:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async(
+                    self.auth.cache_key, data.get("company_id")
+                )
+
+            ticket = started = None
+            try:
+                access_token = await self.auth()
+                ticket = self._admit(path)
+                started = time.monotonic()
+                res = await self.session.request(
+                    method=method,
+                    url=f"{self.base_url}{path}",
+                    headers=self.request_headers(body),
+                    params={"access_token": access_token},
+                    content=body or None,
+                    timeout=httpx_timeout(deadline_timeout(self.timeout)),
+                )
+            except httpx.TransportError as error:
+                self._settle(ticket, started, failed=True)
+                raise_if_expired(error)
+                delay = policy and policy.delay(
+                    path,
+                    attempt,
+                    sent=not isinstance(
+                        error, (httpx.ConnectError, httpx.ConnectTimeout)
+                    ),
+                )
+                if delay is None:
+                    raise
+                logger.warning(
+                    f"{path} failed with {error!r}, retrying in {delay:.2f}s"
+                )
+            except BaseException:
+                # Also frees half-open probes of cancelled tasks
+                self._settle(ticket, started)
+                raise
+            else:
+                self._settle(ticket, started, failed=res.status_code >= 500)
+                delay = policy and policy.delay(
+                    path, attempt, res.status_code, res.headers
+                )
+                if delay is None:
+                    break
+                logger.warning(
+                    f"{path} returned {res.status_code}, retrying in {delay:.2f}s"
+                )
+
+            check_wait(delay)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+        logger.debug(res)
+        logger.debug(res.request.url)
+        logger.debug(res.content)
+
+        return ApiResponseValidator(res, data).validate()
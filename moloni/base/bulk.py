@@ -0,0 +1,169 @@
+"""
+Sends many requests of one client, e.g. a migration inserting thousands of `ProductsInsertModel`, through a bounded
+pool of workers.
+
+The input is read as the workers free up, so a generator over a large file is never loaded whole. Each item ends
+with a `BulkOutcome` holding its `ApiResponse` or the exception it raised, a failed item doesn't stop the others.
+"""
+
+import contextvars
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Iterable, Iterator, NamedTuple, Optional
+
+from moloni.base.helpers import ApiException, ApiResponse, check_status
+from moloni.base.pagination import resolve_method_name
+
+
+class BulkOutcome(NamedTuple):
+    """
+    Result of one item, `index` is its position in the input
+    """
+
+    index: int
+    item: Any
+    response: Optional[ApiResponse]
+    error: Optional[Exception]
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class BulkSummary:
+    """
+    Counts of the items sent so far, updated as their outcomes arrive. The failed outcomes are kept to retry them
+    """
+
+    def __init__(self):
+        self.total = 0
+        self.succeeded = 0
+        self.failed = 0
+        self.failures = []
+        self.started = time.monotonic()
+        self.elapsed = 0.0
+
+    def add(self, outcome: BulkOutcome):
+        self.total += 1
+        if outcome.ok:
+            self.succeeded += 1
+        else:
+            self.failed += 1
+            self.failures.append(outcome)
+        self.elapsed = time.monotonic() - self.started
+
+    @property
+    def rate(self) -> float:
+        """
+        Items per second
+        """
+        return self.total / self.elapsed if self.elapsed else 0.0
+
+    def __repr__(self):
+        return (
+            f"BulkSummary(total={self.total}, succeeded={self.succeeded}, failed={self.failed}, "
+            f"elapsed={self.elapsed:.1f}s)"
+        )
+
+
+class BulkExecutor:
+    """
+    Sends items through a client method with at most `concurrency` requests at once.
+
+    The requests share the client's connection pool, rate limiter, retry policy and circuit breaker, keep
+    `concurrency` within `PoolConfig.pool_maxsize`. Only synchronous clients are supported.
+
+    .. code-block:: python
+
+        executor = BulkExecutor(ProductsClient(), concurrency=8, progress=print_progress)
+        summary = executor.run(ProductsInsertModel(**row) for row in csv.DictReader(file))
+
+    :param client: client the items are sent with
+    :param method: method sending the items, taken from the request model of each item by default, required
+                   for dicts
+    :param concurrency: maximum number of concurrent requests
+    :param progress: called with each outcome and the summary so far, in the thread iterating the outcomes
+    """
+
+    def __init__(
+        self,
+        client,
+        method: str = None,
+        concurrency: int = 8,
+        progress: Callable[[BulkOutcome, BulkSummary], Any] = None,
+    ):
+        self.client = client
+        self.method = method
+        self.concurrency = concurrency
+        self.progress = progress
+        self._methods = {}
+
+    def method_for(self, item) -> str:
+        """
+        Client method an item is sent with, e.g. `ProductsInsertModel` -> `insert`
+        """
+        if self.method is not None:
+            return self.method
+        model = type(item)
+        method = self._methods.get(model)
+        if method is None:
+            method = self._methods[model] = resolve_method_name(self.client, item)
+        return method
+
+    def send(self, index: int, item) -> BulkOutcome:
+        """
+        Sends one item in a worker thread, the outcome holds the exception of a failed request. A response with an
+        error status fails the item with an `ApiException`, the response is kept in the outcome
+        """
+        try:
+            response = getattr(self.client, self.method_for(item))(item)
+        except Exception as error:
+            return BulkOutcome(index, item, None, error)
+        try:
+            check_status(response, item)
+        except ApiException as error:
+            return BulkOutcome(index, item, response, error)
+        return BulkOutcome(index, item, response, None)
+
+    def outcomes(self, items: Iterable) -> Iterator[BulkOutcome]:
+        """
+        Sends the items, yielding their outcomes as they complete. Items are read from `items` as workers free
+        up, at most twice `concurrency` are in flight
+        """
+        return self._outcomes(enumerate(items))
+
+    def _outcomes(self, numbered: Iterable) -> Iterator[BulkOutcome]:
+        window = self.concurrency * 2
+        executor = ThreadPoolExecutor(max_workers=self.concurrency)
+        pending = set()
+        try:
+            for index, item in numbered:
+                # Resolved here, an item no method takes is a mistake to raise rather than an outcome
+                self.method_for(item)
+                if len(pending) >= window:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    yield from (future.result() for future in done)
+                # Each worker runs in a copy of this context, so it sees a deadline or `trusted()` block
+                pending.add(
+                    executor.submit(
+                        contextvars.copy_context().run, self.send, index, item
+                    )
+                )
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                yield from (future.result() for future in done)
+        finally:
+            # Items not sent yet are dropped when the caller stops early
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def run(self, items: Iterable) -> BulkSummary:
+        """
+        Sends every item
+        :return: the counts and failed outcomes
+        """
+        summary = BulkSummary()
+        for outcome in self.outcomes(items):
+            summary.add(outcome)
+            if self.progress is not None:
+                self.progress(outcome, summary)
+        return summary
@@ -0,0 +1,184 @@
+import threading
+import time
+from collections import deque
+from typing import Optional
+
+from pydantic import BaseModel
+
+from moloni.base.helpers import endpoint_family
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    def __init__(self, circuit: str, retry_in: float):
+        super().__init__(
+            f"Circuit {circuit} is open, calls are rejected for {retry_in:.1f}s"
+        )
+        self.circuit = circuit
+        self.retry_in = retry_in
+
+
+class CircuitBreakerConfig(BaseModel):
+    """
+    When a circuit opens and how it recovers.
+
+    - failure_rate_threshold: share of failed calls, within the last `window_size` calls, that opens the circuit.
+      Transport errors, 5xx responses and calls slower than `slow_call_seconds` are failures.
+    - minimum_calls: calls needed in the window before the failure rate is evaluated.
+    - open_seconds: time calls are rejected before probing Moloni again.
+    - half_open_calls: probes let through once `open_seconds` have passed. The circuit closes when all of them
+      succeed and opens again as soon as one fails.
+    """
+
+    failure_rate_threshold: float = 0.5
+    slow_call_seconds: Optional[float] = None
+    window_size: int = 20
+    minimum_calls: int = 10
+    open_seconds: float = 30.0
+    half_open_calls: int = 1
+
+
+class Circuit:
+    def __init__(self, window_size: int):
+        self.state = CLOSED
+        self.outcomes = deque(maxlen=window_size)
+        self.opened_at = None
+        self.probes = 0
+        self.probe_successes = 0
+        self.rejected = 0
+
+
+class CircuitBreaker:
+    """
+    Fails fast when Moloni degrades. Calls are tracked per base URL and endpoint family
+    (`https://api.moloni.pt/documents`), pass the same instance to every client that should share the state,
+    e.g. `InvoicesClient(circuit_breaker=breaker)`.
+    """
+
+    def __init__(self, config: CircuitBreakerConfig = CircuitBreakerConfig()):
+        self.config = config
+        self._circuits = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def circuit_name(base_url: str, path: str) -> str:
+        return f"{base_url}/{endpoint_family(path)}"
+
+    def _circuit(self, name) -> Circuit:
+        circuit = self._circuits.get(name)
+        if circuit is None:
+            circuit = self._circuits[name] = Circuit(self.config.window_size)
+        return circuit
+
+    def _open(self, circuit: Circuit, now: float):
+        circuit.state = OPEN
+        circuit.opened_at = now
+        circuit.outcomes.clear()
+
+    def before(self, name: str) -> tuple:
+        """
+        Admits a call
+        :return: ticket passed to `record` or `release`
+        :raises CircuitOpenError: if the circuit rejects calls
+        """
+        now = time.monotonic()
+        with self._lock:
+            circuit = self._circuit(name)
+            if circuit.state == OPEN:
+                retry_in = circuit.opened_at + self.config.open_seconds - now
+                if retry_in > 0:
+                    circuit.rejected += 1
+                    raise CircuitOpenError(name, retry_in)
+                circuit.state = HALF_OPEN
+                circuit.probes = circuit.probe_successes = 0
+
+            if circuit.state == HALF_OPEN:
+                if circuit.probes >= self.config.half_open_calls:
+                    circuit.rejected += 1
+                    raise CircuitOpenError(name, 0.0)
+                circuit.probes += 1
+                return name, True
+            return name, False
+
+    def record(self, ticket: tuple, failed: bool, elapsed: float):
+        """
+        Records the outcome of an admitted call
+        """
+        name, probe = ticket
+        slow = self.config.slow_call_seconds
+        failed = failed or (slow is not None and elapsed > slow)
+        now = time.monotonic()
+        with self._lock:
+            circuit = self._circuit(name)
+            if probe:
+                if circuit.state != HALF_OPEN:
+                    return
+                if failed:
+                    self._open(circuit, now)
+                    return
+                circuit.probe_successes += 1
+                if circuit.probe_successes >= self.config.half_open_calls:
+                    circuit.state = CLOSED
+                return
+
+            # Calls admitted before the circuit opened don't count any more
+            if circuit.state != CLOSED:
+                return
+            circuit.outcomes.append(failed)
+            calls = len(circuit.outcomes)
+            if (
+                calls >= self.config.minimum_calls
+                and sum(circuit.outcomes) / calls >= self.config.failure_rate_threshold
+            ):
+                self._open(circuit, now)
+
+    def release(self, ticket: tuple):
+        """
+        Frees an admitted call that ended without an outcome (e.g. cancelled)
+        """
+        name, probe = ticket
+        with self._lock:
+            circuit = self._circuit(name)
+            if probe and circuit.state == HALF_OPEN:
+                circuit.probes -= 1
+
+    def reset(self, name: str = None):
+        """
+        Closes a circuit, or all of them
+        """
+        with self._lock:
+            if name is None:
+                self._circuits.clear()
+            else:
+                self._circuits.pop(name, None)
+
+    def snapshot(self) -> dict:
+        """
+        State of every circuit, for dashboards and health checks
+        :return:dict
+        """
+        now = time.monotonic()
+        with self._lock:
+            snapshot = {}
+            for name, circuit in self._circuits.items():
+                calls = len(circuit.outcomes)
+                failures = sum(circuit.outcomes)
+                snapshot[name] = {
+                    "state": circuit.state,
+                    "calls": calls,
+                    "failures": failures,
+                    "failure_rate": failures / calls if calls else 0.0,
+                    "rejected": circuit.rejected,
+                    "retry_in": (
+                        max(
+                            0.0,
+                            circuit.opened_at + self.config.open_seconds - now,
+                        )
+                        if circuit.state == OPEN
+                        else 0.0
+                    ),
+                }
+            return snapshot
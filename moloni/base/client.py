@@ -1,17 +1,108 @@
+import contextvars
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Union
 
-from cachetools import TTLCache
 from pydantic import BaseModel
-from requests import request
+from requests import Session
+from requests.adapters import HTTPAdapter
+from requests.exceptions import ConnectionError, ConnectTimeout, Timeout
+from urllib3.exceptions import NewConnectionError
 
 from moloni import __version__
-from moloni.base.config import MoloniBaseUrl
-from moloni.base.helpers import AccessTokenResponse, ApiResponse, ApiResponseValidator
+from moloni.base.circuit_breaker import CircuitBreaker
+from moloni.base.config import DEFAULT_TIMEOUT, MoloniBaseUrl, PoolConfig
+from moloni.base.deadline import (
+    Deadline,
+    DeadlineExceeded,
+    Timeout as TimeoutConfig,
+    acquire_store,
+    acquire_within,
+    check_wait,
+    current_deadline,
+    deadline_timeout,
+    lock_timeout,
+    use_deadline,
+)
+from moloni.base.form_encoding import FORM_CONTENT_TYPE, encode_form
+from moloni.base.helpers import (
+    AccessTokenResponse,
+    ApiResponse,
+    ApiResponseValidator,
+    GetManyResult,
+    Route,
+    check_status,
+    endpoint_family,
+    fill_query_params,
+    is_trusted,
+    record_id_field,
+    trusted_data,
+    validate_data,
+)
+from moloni.base.pagination import (
+    count_method_name,
+    page_size_for,
+    parse_count,
+    resolve_method_name,
+    split_pagination,
+)
+from moloni.base.rate_limit import RateLimiter
+from moloni.base.response_cache import ResponseCache
+from moloni.base.retry import RetryPolicy, is_idempotent
+from moloni.base.single_flight import SingleFlight
+from moloni.base.token_cache import TokenCache, credential_key, token_cache
+from moloni.base.token_store import TokenStore
 from .logger_config import setup_logger
 
 logger = setup_logger(__name__)
 
-cache = TTLCache(maxsize=10, ttl=3600)
+
+def build_session(pool_config: PoolConfig) -> Session:
+    """
+    Creates a requests session backed by a connection pool configured from `pool_config`
+    :return:Session
+    """
+    session = Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_config.pool_connections,
+        pool_maxsize=pool_config.pool_maxsize,
+        max_retries=pool_config.max_retries,
+        pool_block=pool_config.pool_block,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    if not pool_config.keep_alive:
+        session.headers["Connection"] = "close"
+    return session
+
+
+def resolve_base_url(environment: Union[MoloniBaseUrl, str]) -> str:
+    """
+    Base URL of an environment, or of any server given by its URL (e.g. a local fake API)
+    """
+    if isinstance(environment, MoloniBaseUrl):
+        return environment.value
+    return environment.rstrip("/")
+
+
+def request_was_sent(error) -> bool:
+    """
+    False when a transport error happened before the request reached the server
+    """
+    if isinstance(error, ConnectTimeout):
+        return False
+    reason = getattr(error.args[0], "reason", None) if error.args else None
+    return not isinstance(reason, NewConnectionError)
+
+
+def raise_if_expired(error):
+    """
+    Reports a transport error caused by the deadline capping the timeouts as `DeadlineExceeded`
+    """
+    current = current_deadline()
+    if current is not None and current.remaining() <= 0:
+        raise DeadlineExceeded("Deadline exceeded") from error
 
 
 class MyAuth:
@@ -22,42 +113,107 @@ class MyAuth:
 
     def __init__(
         self,
-        environment: MoloniBaseUrl,
+        environment: Union[MoloniBaseUrl, str],
         client_id: str,
         client_secret: str,
         refresh_token: str = None,
         username: str = None,
         password: str = None,
+        session: Session = None,
+        token_cache: TokenCache = token_cache,
+        token_store: TokenStore = None,
+        timeout: TimeoutConfig = DEFAULT_TIMEOUT,
     ):
-        self.base_url = environment.value
+        self.base_url = resolve_base_url(environment)
+        self.session = session or Session()
+        self.timeout = timeout
         self.refresh_token = refresh_token
         self.client_id = client_id
         self.client_secret = client_secret
         self.username = username
         self.password = password
+        self.token_cache = token_cache
+        self.token_store = token_store
+        self.cache_key = credential_key(
+            self.base_url, client_id, client_secret, username, refresh_token
+        )
 
     def get_auth(self) -> AccessTokenResponse:
         """
-        Get's the access token
+        Get's the access token, refreshing it shortly before it expires
+        :return:AccessTokenResponse
+        """
+        token = self.token_cache.get(self.cache_key)
+        if token is not None:
+            return token
+
+        # Only one thread refreshes, the others wait for it and reuse its token
+        lock = self.token_cache.lock(self.cache_key)
+        acquire_within(lock)
+        try:
+            token = self.token_cache.get(self.cache_key)
+            if token is None:
+                token = self.token_cache.set(self.cache_key, self.load_or_refresh())
+        finally:
+            lock.release()
+        return token
+
+    def load_or_refresh(self) -> AccessTokenResponse:
+        """
+        Reuses the token stored by another process, or refreshes it and stores the new one
         :return:AccessTokenResponse
         """
+        stale = self.token_cache.peek(self.cache_key)
+        if self.token_store is None:
+            return self.refresh(stale)
 
-        cache_key = "token"
+        # Other processes may hold the lock while refreshing, it is waited for until the deadline at most
+        handle = acquire_store(self.token_store, self.cache_key, lock_timeout())
         try:
-            access_token = cache[cache_key]
-        except KeyError:
-            access_token = self.get_token().dict()
-            cache[cache_key] = access_token
-        return AccessTokenResponse(**access_token)
+            stored = self.token_store.load(self.cache_key)
+            if stored is not None and self.token_cache.is_fresh(stored):
+                return stored
+            token = self.token_cache.stamp(self.refresh(stored or stale))
+            self.token_store.save(self.cache_key, token)
+        finally:
+            self.token_store.release(handle)
+        return token
+
+    def refresh(self, stale: AccessTokenResponse = None) -> AccessTokenResponse:
+        """
+        Exchanges the refresh token of an expired token, falling back to the configured credentials
+        :return:AccessTokenResponse
+        """
+        if stale is not None and stale.refresh_token:
+            token = self.get_token(refresh_token=stale.refresh_token)
+            if token.access_token:
+                return token
+        return self.get_token()
 
     def get_token(self, **kwargs) -> AccessTokenResponse:
-        if self.refresh_token:
+        return AccessTokenResponse(
+            **self.session.request(
+                method="GET",
+                url=self.base_url + "/v1/grant",
+                headers=self.headers,
+                params=self.grant_params(**kwargs),
+                timeout=deadline_timeout(self.timeout),
+            ).json()
+        )
+
+    def grant_params(self, **kwargs) -> dict:
+        """
+        Builds the query parameters of the grant request
+        :return:dict
+        """
+        refresh_token = kwargs.pop("refresh_token", None) or self.refresh_token
+        if refresh_token:
             kwargs.update(
                 dict(
                     client_id=self.client_id,
                     client_secret=self.client_secret,
                     grant_type="refresh_token",
-                    refresh_token=self.refresh_token,
+                    refresh_token=refresh_token,
                 )
             )
         else:
@@ -70,14 +226,7 @@ class MyAuth:
                     password=self.password,
                 )
             )
-        return AccessTokenResponse(
-            **request(
-                method="GET",
-                url=self.base_url + "/v1/grant",
-                headers=self.headers,
-                params=kwargs,
-            ).json()
-        )
+        return kwargs
 
     def __call__(self):
         auth = self.get_auth()
@@ -101,29 +250,269 @@ class MoloniBaseClient:
         "Accept": "application/json",
         "User-Agent": f"python-moloni/{__version__}",
     }
+    auth_class = MyAuth
+    # Endpoint methods of the class by name, collected from the `endpoint` decorator
+    endpoints: Dict[str, Route] = {}
+    _route_tables: Dict[str, Dict[str, Route]] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        endpoints = {}
+        for klass in reversed(cls.__mro__):
+            for name, attribute in vars(klass).items():
+                route = getattr(attribute, "endpoint", None)
+                if isinstance(route, Route):
+                    endpoints[name] = route
+        cls.endpoints = endpoints
+        cls._route_tables = {}
+
+    @property
+    def routes(self) -> Dict[str, Route]:
+        """
+        Routes of the endpoint methods with the path filled in for the client's API version. Built once per
+        class and version, an endpoint call only looks its route up
+        """
+        routes = self._route_tables.get(self.version)
+        if routes is None:
+            routes = {
+                name: Route(fill_query_params(path, self.version), method)
+                for name, (path, method) in self.endpoints.items()
+            }
+            self._route_tables[self.version] = routes
+        return routes
 
     def __init__(
         self,
-        environment: MoloniBaseUrl = MoloniBaseUrl.PROD,
+        environment: Union[MoloniBaseUrl, str] = MoloniBaseUrl.PROD,
         *,
         auth_config: AuthConfig = AuthConfig(),
         version: str = "v1",
         validate: bool = True,
         log_level: str = "INFO",
+        pool_config: PoolConfig = PoolConfig(),
+        session: Session = None,
+        token_store: TokenStore = None,
+        rate_limiter: RateLimiter = None,
+        retry_policy: RetryPolicy = None,
+        timeout: TimeoutConfig = DEFAULT_TIMEOUT,
+        circuit_breaker: CircuitBreaker = None,
+        single_flight: SingleFlight = None,
+        response_cache: ResponseCache = None,
+        trusted: bool = False,
     ):
-        self.base_url = environment.value
+        self.base_url = resolve_base_url(environment)
         self.validate = validate
+        self.trusted = trusted
         self.version = version
-        self.auth = MyAuth(
+        self.timeout = timeout
+        self.circuit_breaker = circuit_breaker
+        self.single_flight = single_flight
+        self.response_cache = response_cache
+        # Called with the path, data and response of every request the API answers, e.g. by a `LookupIndex`
+        self.observers = []
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy
+        # A session passed in is shared with other clients and is left open by close()
+        self._owns_session = session is None
+        self.session = session or self.build_session(pool_config)
+        self.auth = self.auth_class(
             environment,
             auth_config.client_id,
             auth_config.client_secret,
             auth_config.refresh_token,
             auth_config.username,
             auth_config.password,
+            session=self.session,
+            token_store=token_store,
+            timeout=timeout,
         )
         logger.setLevel(log_level)
 
+    def prepare_data(self, data, model):
+        """
+        Request data of an endpoint call, validated against `model` unless the client or the call is trusted
+        """
+        if self.trusted or is_trusted():
+            return trusted_data(data)
+        return validate_data(data, self.validate, model)
+
+    @staticmethod
+    def build_session(pool_config: PoolConfig) -> Session:
+        return build_session(pool_config)
+
+    def close(self):
+        """
+        Releases the pooled connections, unless the session was passed in by the caller
+        """
+        if self._owns_session:
+            self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def iter_all(
+        self,
+        data,
+        page_size: int = None,
+        method: str = None,
+        deadline: float = None,
+    ):
+        """
+        Iterates over every record of a paginated endpoint, requesting one page at a time.
+
+        The endpoint is taken from the request model (`CustomersGetAllModel` -> `get_all`), pass `method`
+        when `data` is a dict. If the client has the matching count endpoint, the total is fetched first,
+        so the last page doesn't cost an extra empty request.
+
+        :param data: request model or dict with the endpoint filters, `offset` sets the first record
+        :param page_size: records per request, defaults to the `qty` of `data` or 50
+        :param method: name of the paginated method, e.g. `get_by_search`
+        :param deadline: seconds to fetch every page in, see `moloni.base.deadline`
+        :return: generator of records
+        """
+        method = method or resolve_method_name(self, data)
+        params, offset, qty = split_pagination(data)
+        page_size = page_size_for(page_size, qty)
+        # Applied around each request, a context variable set across a yield would leak into the caller
+        limit = Deadline(deadline) if deadline is not None else None
+        with use_deadline(limit):
+            total = self._count_for(method, params)
+        fetch = getattr(self, method)
+
+        while total is None or offset < total:
+            with use_deadline(limit):
+                response = fetch({**params, "offset": offset, "qty": page_size})
+            page = response.payload
+            received = len(page)
+            paginated = response.requested_qty is not None
+            yield from page
+            # Drop the page before requesting the next one
+            del page, response
+            # Endpoints without offset/qty return everything in one response
+            if not paginated or not received:
+                return
+            # Without a count a short page is the last one, with it the rest of a page the API capped follows
+            if total is None and received != page_size:
+                return
+            offset += received
+
+    def fetch_all(
+        self,
+        data,
+        page_size: int = None,
+        method: str = None,
+        max_workers: int = 8,
+        deadline: float = None,
+    ) -> list:
+        """
+        Fetches every record of a paginated endpoint, requesting the pages concurrently.
+
+        The matching count endpoint is called once to compute the offset of every page, the pages are then
+        retrieved by a pool of `max_workers` threads and reassembled in order. Endpoints without a count
+        endpoint fall back to `iter_all`. Keep `max_workers` within `PoolConfig.pool_maxsize` so every
+        worker gets a pooled connection.
+
+        :param data: request model or dict with the endpoint filters, `offset` sets the first record
+        :param page_size: records per request, defaults to the `qty` of `data` or 50, at most 50
+        :param method: name of the paginated method, e.g. `get_by_search`
+        :param max_workers: maximum number of concurrent requests
+        :param deadline: seconds to fetch every page in, see `moloni.base.deadline`
+        :return: list of records
+        """
+        method = method or resolve_method_name(self, data)
+        params, offset, qty = split_pagination(data)
+        page_size = page_size_for(page_size, qty)
+
+        with use_deadline(Deadline(deadline) if deadline is not None else None):
+            total = self._count_for(method, params)
+            if total is None:
+                return list(self.iter_all(data, page_size, method))
+
+            fetch = getattr(self, method)
+
+            def fetch_page(page_offset):
+                # The rest of a page the API returned short is asked for until the page's range is complete
+                end = min(page_offset + page_size, total)
+                page = []
+                while page_offset < end:
+                    received = fetch(
+                        {**params, "offset": page_offset, "qty": page_size}
+                    ).payload
+                    if not received:
+                        break
+                    page.extend(received[: end - page_offset])
+                    page_offset += len(received)
+                return page
+
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                # Each worker runs in a copy of this context, so it sees the deadline
+                pages = [
+                    executor.submit(
+                        contextvars.copy_context().run, fetch_page, page_offset
+                    )
+                    for page_offset in range(offset, total, page_size)
+                ]
+                return [record for page in pages for record in page.result()]
+
+    def get_many(
+        self,
+        ids,
+        data: dict = None,
+        concurrency: int = 8,
+        method: str = "get_one",
+        id_field: str = None,
+        deadline: float = None,
+    ) -> GetManyResult:
+        """
+        Fetches records by id, e.g. the documents of a `get_all` summary, requesting up to `concurrency` at once.
+
+        Repeated ids are requested once. A failed request, a response with an error status, or an id the API has
+        no record of, is reported in `errors` and the other ids are still fetched. The requests share the client's connection pool, rate
+        limiter and retry policy, keep `concurrency` within `PoolConfig.pool_maxsize`.
+
+        :param ids: ids of the records
+        :param data: fields sent with every id, e.g. `{"company_id": 5}`
+        :param concurrency: maximum number of concurrent requests
+        :param method: name of the method fetching one record
+        :param id_field: field the ids are sent as, see `record_id_field` for the default
+        :param deadline: seconds to fetch every record in, see `moloni.base.deadline`
+        :return: records and errors, keyed by id in the order of `ids`
+        """
+        id_field = id_field or record_id_field(self)
+        fetch = getattr(self, method)
+        params = dict(data or {})
+        result = GetManyResult({}, {})
+
+        def fetch_one(record_id):
+            request_data = {**params, id_field: record_id}
+            return check_status(fetch(request_data), request_data).payload
+
+        with use_deadline(Deadline(deadline) if deadline is not None else None):
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                futures = {
+                    record_id: executor.submit(
+                        contextvars.copy_context().run, fetch_one, record_id
+                    )
+                    for record_id in dict.fromkeys(ids)
+                }
+                for record_id, future in futures.items():
+                    try:
+                        payload = future.result()
+                    except Exception as error:
+                        result.errors[record_id] = error
+                    else:
+                        result.add(record_id, payload, id_field)
+        return result
+
+    def _count_for(self, method, params):
+        count = count_method_name(method)
+        if count is None or not hasattr(self, count):
+            return None
+        return parse_count(getattr(self, count)(dict(params)).payload)
+
     def flatten_dict(self, data, parent_key="", sep="[", end_sep="]"):
         items = []
         if isinstance(data, dict):
@@ -144,18 +533,138 @@ class MoloniBaseClient:
             for k, v in self.flatten_dict(data).items()
         }
 
-    def _request(self, path, data=None, **kwargs) -> ApiResponse:
+    def request_headers(self, body: str) -> dict:
+        """
+        Headers of a request, `encode_form` bodies are sent pre-encoded so their content type is set here
+        """
+        if not body:
+            return self.headers
+        return {**self.headers, "Content-Type": FORM_CONTENT_TYPE}
+
+    def _admit(self, path):
+        """
+        Lets the circuit breaker reject the call before it is sent
+        :return: circuit breaker ticket or None
+        """
+        if self.circuit_breaker is None:
+            return None
+        return self.circuit_breaker.before(
+            self.circuit_breaker.circuit_name(self.base_url, path)
+        )
+
+    def _settle(self, ticket, started: float, failed: bool = None):
+        """
+        Reports the outcome of an admitted call, `failed=None` when it ended without one
+        """
+        if ticket is None:
+            return
+        if failed is None:
+            self.circuit_breaker.release(ticket)
+        else:
+            self.circuit_breaker.record(ticket, failed, time.monotonic() - started)
+
+    def _read_key(self, path, method, body) -> tuple:
+        """
+        Identifies a read call, so identical calls can share their response
+        :return: tuple or None for writes
+        """
+        if not is_idempotent(path):
+            return None
+        return (
+            self.auth.cache_key,
+            self.base_url,
+            method,
+            path,
+            body,
+        )
+
+    def _request(self, path, data=None, method=None, **kwargs) -> ApiResponse:
         data = data or {}
 
         logger.debug(data)
 
-        res = request(
-            method=data.pop("method"),
-            url=f"{self.base_url}{path}",
-            headers=self.headers,
-            params={"access_token": self.auth()},
-            data=self.create_form_data(data),
-        )
+        if method is None:
+            method = data.pop("method")
+        body = encode_form(data)
+        key = self._read_key(path, method, body)
+        cache = self.response_cache
+        if key is not None and cache is not None:
+            response = cache.get(path, key)
+            if response is not None:
+                return response
+
+        if key is not None and self.single_flight is not None:
+            response = self.single_flight.do(
+                key, lambda: self._send(path, method, data, body)
+            )
+        else:
+            response = self._send(path, method, data, body)
+
+        if cache is not None:
+            self._update_cache(path, key, response)
+        for observer in self.observers:
+            observer(path, data, response)
+        return response
+
+    def _update_cache(self, path, key, response):
+        """
+        Stores the successful response of a read, or drops the cached responses of the family a write changed
+        """
+        if key is not None:
+            self.response_cache.set(path, key, response)
+        else:
+            self.response_cache.invalidate(endpoint_family(path))
+
+    def _send(self, path, method, data, body) -> ApiResponse:
+        policy = self.retry_policy.for_path(path) if self.retry_policy else None
+        attempt = 1
+
+        while True:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(self.auth.cache_key, data.get("company_id"))
+
+            ticket = started = None
+            try:
+                access_token = self.auth()
+                ticket = self._admit(path)
+                started = time.monotonic()
+                res = self.session.request(
+                    method=method,
+                    url=f"{self.base_url}{path}",
+                    headers=self.request_headers(body),
+                    params={"access_token": access_token},
+                    data=body or None,
+                    timeout=deadline_timeout(self.timeout),
+                )
+            except (ConnectionError, Timeout) as error:
+                self._settle(ticket, started, failed=True)
+                raise_if_expired(error)
+                delay = policy and policy.delay(
+                    path, attempt, sent=request_was_sent(error)
+                )
+                if delay is None:
+                    raise
+                logger.warning(
+                    f"{path} failed with {error!r}, retrying in {delay:.2f}s"
+                )
+            except BaseException:
+                self._settle(ticket, started)
+                raise
+            else:
+                self._settle(ticket, started, failed=res.status_code >= 500)
+                delay = policy and policy.delay(
+                    path, attempt, res.status_code, res.headers
+                )
+                if delay is None:
+                    break
+                logger.warning(
+                    f"{path} returned {res.status_code}, retrying in {delay:.2f}s"
+                )
+
+            check_wait(delay)
+            time.sleep(delay)
+            attempt += 1
+
         logger.debug(res)
         logger.debug(res.request.url)
         logger.debug(res.content)
@@ -1,6 +1,30 @@
 import enum
 
+from pydantic import BaseModel
+
 
 class MoloniBaseUrl(enum.Enum):
     PROD = "https://api.moloni.pt"
     SANDBOX = "https://api.moloni.pt/sandbox"
+
+
+# Seconds to wait for a connection and for the server to send data
+DEFAULT_TIMEOUT = (10, 60)
+
+
+class PoolConfig(BaseModel):
+    """
+    Connection pool settings for the HTTP session shared by a client and its token refresher.
+
+    - pool_connections: number of host pools to cache.
+    - pool_maxsize: maximum number of connections kept alive per host.
+    - pool_block: block when the pool is exhausted instead of opening throwaway connections.
+    - keep_alive: reuse connections between calls. Set to False to send ``Connection: close``.
+    - max_retries: retries for failed connection attempts (socket level, requests are not re-sent).
+    """
+
+    pool_connections: int = 10
+    pool_maxsize: int = 10
+    pool_block: bool = False
+    keep_alive: bool = True
+    max_retries: int = 0
@@ -0,0 +1,152 @@
+import asyncio
+import contextvars
+import time
+from contextlib import contextmanager
+from typing import Optional, Tuple, Union
+
+Timeout = Union[float, Tuple[float, float], None]
+
+_current = contextvars.ContextVar("moloni_deadline", default=None)
+
+
+class DeadlineExceeded(Exception):
+    pass
+
+
+class Deadline:
+    """
+    Point in time by which an operation, with all its requests, retries and token refreshes, must be done
+    """
+
+    def __init__(self, seconds: float):
+        self.expires_at = time.monotonic() + seconds
+
+    def remaining(self) -> float:
+        return self.expires_at - time.monotonic()
+
+    def check(self) -> float:
+        """
+        :return: the remaining seconds
+        :raises DeadlineExceeded: if the deadline has passed
+        """
+        remaining = self.remaining()
+        if remaining <= 0:
+            raise DeadlineExceeded("Deadline exceeded")
+        return remaining
+
+
+def current_deadline() -> Optional[Deadline]:
+    return _current.get()
+
+
+@contextmanager
+def use_deadline(value: Optional[Deadline]):
+    """
+    Applies an existing deadline to the calls made inside the block. A deadline already in effect
+    is kept if it expires first.
+    """
+    current = _current.get()
+    if value is None or (
+        current is not None and current.expires_at <= value.expires_at
+    ):
+        value = current
+    token = _current.set(value)
+    try:
+        yield value
+    finally:
+        _current.reset(token)
+
+
+def deadline(seconds: float):
+    """
+    Bounds every call made inside the block to `seconds` in total
+
+    .. code-block:: python
+
+        with deadline(30):
+            invoices = list(client.iter_all(InvoicesGetAllModel(company_id=5)))
+    """
+    return use_deadline(Deadline(seconds))
+
+
+def deadline_timeout(timeout: Timeout) -> Timeout:
+    """
+    Caps a (connect, read) timeout to the time left before the current deadline
+    :raises DeadlineExceeded: if the deadline has passed
+    """
+    current = _current.get()
+    if current is None:
+        return timeout
+    remaining = current.check()
+    if timeout is None:
+        return remaining, remaining
+    if isinstance(timeout, tuple):
+        return tuple(
+            remaining if value is None else min(value, remaining) for value in timeout
+        )
+    return min(timeout, remaining)
+
+
+def check_wait(seconds: float):
+    """
+    Makes sure waiting `seconds` (backoff, rate limiting, locks) still fits before the current deadline
+    :raises DeadlineExceeded: if it doesn't
+    """
+    current = _current.get()
+    if current is not None and current.check() <= seconds:
+        raise DeadlineExceeded(f"Waiting {seconds:.2f}s would exceed the deadline")
+
+
+def acquire_within(lock):
+    """
+    Acquires a threading lock, giving up when the current deadline passes
+    :raises DeadlineExceeded: if the lock wasn't acquired in time
+    """
+    current = _current.get()
+    if current is None:
+        lock.acquire()
+    elif not lock.acquire(timeout=current.check()):
+        raise DeadlineExceeded("Deadline exceeded while waiting for a lock")
+
+
+def lock_timeout() -> Optional[float]:
+    """
+    Seconds a lock may be waited for before the current deadline passes, None without a deadline
+    :raises DeadlineExceeded: if the deadline has passed
+    """
+    current = _current.get()
+    return None if current is None else current.check()
+
+
+def acquire_store(token_store, key: str, timeout: Optional[float]):
+    """
+    Acquires the lock of a token store, waiting at most `timeout` seconds
+    :return: handle passed to `token_store.release`
+    :raises DeadlineExceeded: if the lock wasn't acquired in time
+    """
+    try:
+        return token_store.acquire(key, timeout)
+    except TimeoutError:
+        raise DeadlineExceeded(
+            "Deadline exceeded while waiting for the token store lock"
+        ) from None
+
+
+async def within_deadline(awaitable):
+    """
+    Awaits `awaitable`, cancelling it when the current deadline passes
+    :raises DeadlineExceeded: if it didn't finish in time
+    """
+    current = _current.get()
+    if current is None:
+        return await awaitable
+    try:
+        remaining = current.check()
+    except DeadlineExceeded:
+        if asyncio.iscoroutine(awaitable):
+            awaitable.close()
+        raise
+    try:
+        return await asyncio.wait_for(awaitable, remaining)
+    except asyncio.TimeoutError:
+        raise DeadlineExceeded("Deadline exceeded") from None
@@ -0,0 +1,79 @@
+"""
+Encodes request data as an `application/x-www-form-urlencoded` body in one pass.
+
+The body is byte for byte what requests sends for `MoloniBaseClient.create_form_data(data)`: nested keys in
+bracket notation (`products[0][taxes][1][tax_id]`), `None` as an empty value, everything else through `str`,
+quoted with `quote_plus`.
+"""
+
+import re
+from functools import lru_cache
+from urllib.parse import quote_plus
+
+from pydantic import BaseModel
+
+FORM_CONTENT_TYPE = "application/x-www-form-urlencoded"
+
+# Characters quote_plus leaves as they are, most values (ids, amounts, dates without time) only have these
+_unquoted = re.compile(r"[A-Za-z0-9_.~-]*\Z").match
+
+
+@lru_cache(maxsize=4096)
+def quote_key(key) -> str:
+    return quote_plus(str(key))
+
+
+@lru_cache(maxsize=4096)
+def quote_segment(key) -> str:
+    # Field names of the nested models and list indexes repeat on every line, quote them once
+    return f"%5B{quote_plus(str(key))}%5D"
+
+
+def set_fields(model: BaseModel) -> dict:
+    """
+    Top level of `model.model_dump(exclude_unset=True)` without dumping the nested models
+    """
+    fields_set = model.model_fields_set
+    # __dict__ holds the fields in definition order, the order model_dump uses
+    return {name: value for name, value in model.__dict__.items() if name in fields_set}
+
+
+def encode_form(data) -> str:
+    """
+    :return: the urlencoded body, empty when there is nothing to send
+    """
+    fields = {}
+    # (quoted name, value, whether dict keys below get brackets), popped in the order flatten_dict visits them
+    stack = [("", data, False)]
+    while stack:
+        name, value, nested = stack.pop()
+        if isinstance(value, BaseModel):
+            # Trusted request data keeps its nested models, encoded as their dump would be
+            value = set_fields(value)
+        if isinstance(value, dict):
+            if nested:
+                children = [
+                    (name + quote_segment(key), child, True)
+                    for key, child in value.items()
+                ]
+            else:
+                # Top level keys are sent as they are, a falsy one doesn't prefix its children
+                children = [
+                    (quote_key(key), child, bool(key)) for key, child in value.items()
+                ]
+            children.reverse()
+            stack.extend(children)
+        elif isinstance(value, list):
+            children = [
+                (name + quote_segment(index), child, True)
+                for index, child in enumerate(value)
+            ]
+            children.reverse()
+            stack.extend(children)
+        else:
+            if value is None:
+                fields[name] = ""
+            else:
+                value = str(value)
+                fields[name] = value if _unquoted(value) else quote_plus(value)
+    return "&".join([f"{name}={value}" for name, value in fields.items()])
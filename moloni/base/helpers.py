@@ -1,11 +1,25 @@
+import contextvars
 import functools
 import re
+from contextlib import contextmanager
+from typing import NamedTuple, get_args
 from urllib import parse
 
 from pydantic import BaseModel
 from pydantic import ValidationError
 from requests import Response
 
+from moloni.base.form_encoding import set_fields
+from moloni.base.json_backend import decode_response
+
+# Moloni reports errors as a list of strings such as "2 company_id"
+ERROR_PATTERN = re.compile(r"^\d+ \w+")
+
+# Marks a payload that still has to be decoded from the response
+NOT_DECODED = object()
+
+_trusted = contextvars.ContextVar("moloni_trusted", default=False)
+
 
 def fill_query_params(query, version, *args):
     return re.sub(
@@ -13,13 +27,115 @@ def fill_query_params(query, version, *args):
     )
 
 
-def endpoint(path, method="POST"):
+def endpoint_name(path):
+    """
+    Endpoint of a request path without the API version, e.g. `/v1/invoices/getAll/` -> `invoices/getAll`
+    """
+    parts = path.strip("/").split("/")
+    if re.match(r"^v\d+$", parts[0]):
+        parts = parts[1:]
+    return "/".join(parts)
+
+
+def endpoint_family(path):
+    """
+    Group of endpoints a request path belongs to, e.g. `/v1/invoices/getAll/` -> `invoices`
+    """
+    return endpoint_name(path).split("/", 1)[0]
+
+
+def request_model(client, method: str):
+    """
+    Request model a client method takes, None for methods that take a dict
+    """
+    annotation = getattr(getattr(type(client), method, None), "__annotations__", {})
+    for candidate in get_args(annotation.get("data")):
+        if isinstance(candidate, type) and issubclass(candidate, BaseModel):
+            return candidate
+    return None
+
+
+def family_id_field(family) -> str:
+    """
+    Id field named after a group of endpoints, e.g. `countries` -> `country_id`, `productCategories` -> `product_category_id`
+    """
+    name = re.sub(r"(?<!^)(?=[A-Z])", "_", family).lower()
+    name = re.sub("ies$", "y", name) if name.endswith("ies") else re.sub("s$", "", name)
+    return f"{name}_id"
+
+
+def record_id_field(client) -> str:
+    """
+    Field a client identifies its records by: the id field of its `delete` endpoint, e.g. `customer_id`, else the
+    one named after its family that `get_one`/`update` take, e.g. `document_id`. Families with neither endpoint,
+    e.g. `countries`, are assumed to be identified by the field named after them
+    """
+    model = request_model(client, "delete")
+    fields = [
+        field
+        for field in (model.model_fields if model is not None else ())
+        if field != "company_id" and field.endswith("_id")
+    ]
+    if len(fields) == 1:
+        return fields[0]
+
+    route = next(iter(client.routes.values()), None)
+    named = route and family_id_field(endpoint_family(route.path))
+    models = [
+        model
+        for model in (request_model(client, method) for method in ("get_one", "update"))
+        if model is not None
+    ]
+    if named and (not models or any(named in model.model_fields for model in models)):
+        return named
+    raise ValueError(f"Pass the id field of the {type(client).__name__} records")
+
+
+class Route(NamedTuple):
+    path: str
+    method: str
+
+
+class GetManyResult(NamedTuple):
+    """
+    Records fetched by `get_many` and the errors of the ids that failed, both keyed by id
+    """
+
+    records: dict
+    errors: dict
+
+    def add(self, record_id, payload, id_field):
+        if payload:
+            self.records[record_id] = payload
+        else:
+            # Moloni answers with an empty payload for ids it has no record of
+            self.errors[record_id] = LookupError(
+                f"No record with {id_field} {record_id}"
+            )
+
+
+def endpoint(path, method="POST", inject: bool = True):
+    """
+    Marks a client method as the API endpoint at `path`, the client resolves the path for its API version once,
+    see `MoloniBaseClient.routes`.
+
+    Methods written against earlier versions read the raw `path` and `method` from their keyword arguments
+    (`fill_query_params(kwargs.pop("path"), self.version)`), they are still passed to them. The generated clients
+    look their route up instead and pass `inject=False`, the method is then returned as it is.
+    """
+    route = Route(path, method)
+
     def decorator(function):
+        if not inject:
+            function.endpoint = route
+            return function
+
         @functools.wraps(function)
         def wrapper(*args, **kwargs):
             kwargs.update({"path": path, "method": method})
             return function(*args, **kwargs)
 
+        wrapper.endpoint = route
         return wrapper
 
     return decorator
@@ -40,12 +156,40 @@ def validate_data(data, validate, model):
     return data
 
 
+@contextmanager
+def trusted():
+    """
+    Sends the request data of the endpoint calls made inside the block without validating it against the
+    request models, see `trusted_data`.
+    """
+    token = _trusted.set(True)
+    try:
+        yield
+    finally:
+        _trusted.reset(token)
+
+
+def is_trusted() -> bool:
+    return _trusted.get()
+
+
+def trusted_data(data):
+    """
+    Request data that is already valid: a dict is used as it is, a model only has its top level converted and
+    its nested models are encoded straight from their fields
+    """
+    if isinstance(data, BaseModel):
+        return set_fields(data)
+    return data
+
+
 class AccessTokenResponse:
     def __init__(self, **kwargs):
         self.access_token = kwargs.get("access_token")
         self.refresh_token = kwargs.get("refresh_token")
         self.expires_in = kwargs.get("expires_in")
         self.token_type = kwargs.get("token_type")
+        self.expires_at = kwargs.get("expires_at")
 
     def dict(self):
         return {
@@ -53,6 +197,7 @@ class AccessTokenResponse:
             "refresh_token": self.refresh_token,
             "expires_in": self.expires_in,
             "token_type": self.token_type,
+            "expires_at": self.expires_at,
         }
 
 
@@ -61,8 +206,10 @@ class NoMoreRecords(Exception):
 
 
 class ApiException(Exception):
-    def __init__(self, response: Response, request_data: dict, **kwargs):
-        self.error = response.json()
+    def __init__(
+        self, response: Response, request_data: dict, payload=NOT_DECODED, **kwargs
+    ):
+        self.error = response.json() if payload is NOT_DECODED else payload
         self.status_code = response.status_code
         self.headers = response.headers
         self.kwargs = kwargs
@@ -73,33 +220,36 @@ class ApiException(Exception):
 
 
 class ApiResponseValidator:
-    def __init__(self, response: Response, request_data: dict):
+    def __init__(self, response: Response, request_data: dict, payload=NOT_DECODED):
         self.response = response
         self.request_data = request_data
+        # The body is decoded here once and handed over to ApiResponse/ApiException
+        self.payload = decode_response(response) if payload is NOT_DECODED else payload
 
     def is_empty_array(self):
         """
         Checks if the response is an empty array.
         """
         try:
-            return len(self.response.json()) == 0
-        except Exception:
+            return len(self.payload) == 0
+        except TypeError:
             return False
 
     def is_all_strings(self):
         """
         Checks if all the elements in the response are strings.
         """
-        return all(isinstance(line, str) for line in self.response.json())
+        try:
+            return all(isinstance(line, str) for line in self.payload)
+        except TypeError:
+            return False
 
     def matches_error_pattern(self):
         """
         Checks if the response contains any lines that start with a number followed by a space.
         This is indicative of an error message format.
         """
-        lines = self.response.json()
-        pattern = re.compile(r"^\d+ \w+")
-        return all(pattern.match(line) for line in lines)
+        return all(ERROR_PATTERN.match(line) for line in self.payload)
 
     def is_error_response(self):
         """
@@ -122,13 +272,15 @@ class ApiResponseValidator:
         Validates the API response and determines if it's an error.
         """
         if self.is_error_response():
-            raise ApiException(self.response, self.request_data)
-        return ApiResponse(self.response, self.request_data)
+            raise ApiException(self.response, self.request_data, payload=self.payload)
+        return ApiResponse(self.response, self.request_data, payload=self.payload)
 
 
 class ApiResponse:
-    def __init__(self, response: Response, request_data: dict, **kwargs):
-        self.payload = response.json()
+    def __init__(
+        self, response: Response, request_data: dict, payload=NOT_DECODED, **kwargs
+    ):
+        self.payload = response.json() if payload is NOT_DECODED else payload
         self.qty = len(self.payload)
         self.requested_qty = request_data.get("qty", None)
         self.has_more = self.qty == self.requested_qty
@@ -148,3 +300,13 @@ class ApiResponse:
 
     def __str__(self):
         return f"ApiResponse(payload={self.payload}, qty={self.qty}, requested_qty={self.requested_qty}, has_more={self.has_more}, offset={self.offset}, status_code={self.status_code}, headers={self.headers}, kwargs={self.kwargs})"
+
+
+def check_status(response: ApiResponse, request_data: dict) -> ApiResponse:
+    """
+    Raises `ApiException` for a response with an error status, which `ApiResponseValidator` only catches when the
+    payload is a list of error messages (a 502 answered with `{"error": ...}` is validated as a response)
+    """
+    if response.status_code >= 400:
+        raise ApiException(response, request_data, payload=response.payload)
+    return response
@@ -0,0 +1,254 @@
+"""
+Restartable bulk jobs: every item sent by a `JournaledExecutor` is written to an append-only journal before the
+request and again with its outcome, so a job that died halfway can be run again with the same input and only sends
+the items the journal doesn't show as done.
+
+An item whose request started but whose outcome never reached the journal, whose request failed without an
+answer from the API after it was sent, or whose write was answered with a server error, may or may not have been
+applied. These items are "in doubt": a resumed job doesn't send them again unless asked to, and reports them so they
+can be checked first.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Callable, Iterable, Iterator
+
+from pydantic import BaseModel, ValidationError
+from requests.exceptions import ConnectionError, Timeout
+
+from moloni.base.bulk import BulkExecutor, BulkOutcome, BulkSummary
+from moloni.base.circuit_breaker import CircuitOpenError
+from moloni.base.client import request_was_sent
+from moloni.base.deadline import DeadlineExceeded
+from moloni.base.helpers import ApiException, ApiResponseValidator
+from moloni.base.retry import is_idempotent
+
+# States of an item in the journal
+SENDING = "sending"
+DONE = "done"
+FAILED = "failed"
+UNKNOWN = "unknown"
+
+
+def item_key(method: str, item) -> str:
+    """
+    Identity of an item, a hash of the method and data it is sent with. Identical items share it
+    """
+    if isinstance(item, BaseModel):
+        item = item.model_dump(mode="json", exclude_unset=True)
+    data = json.dumps(item, sort_keys=True, default=str)
+    return hashlib.sha256(f"{method}\n{data}".encode()).hexdigest()
+
+
+def may_have_been_sent(error) -> bool:
+    """
+    Whether the request that failed with `error` may have reached the API. A deadline that passed without a
+    transport error expired before a request went out: before the first attempt, or while waiting to retry one
+    """
+    if isinstance(error, DeadlineExceeded):
+        if error.__cause__ is None:
+            return False
+        error = error.__cause__
+    if isinstance(error, (CircuitOpenError, ValidationError)):
+        return False
+    if isinstance(error, (ConnectionError, Timeout)):
+        return request_was_sent(error)
+    return True
+
+
+def was_rejected(error: ApiException) -> bool:
+    """
+    Whether the API rejected the request of `error`, with its error messages or a client error status, so nothing
+    was applied. A server error status without them may come after a write was applied
+    """
+    if error.status_code < 500:
+        return True
+    return ApiResponseValidator(
+        None, error.request_data, payload=error.error
+    ).is_error_response()
+
+
+class Journal:
+    """
+    Append-only log of the items of a bulk job, one JSON object per line.
+
+    :param path: file of the journal, created if needed and appended to
+    :param fsync: flush every entry to disk before going on, so an entry written before a request survives a
+                  crash of the machine and not only of the process
+    """
+
+    def __init__(self, path: str, fsync: bool = True):
+        self.path = path
+        self.fsync = fsync
+        self._lock = threading.Lock()
+        cut_short = False
+        if os.path.exists(path) and os.path.getsize(path):
+            with open(path, "rb") as file:
+                file.seek(-1, os.SEEK_END)
+                cut_short = file.read(1) != b"\n"
+        self._file = open(path, "a", encoding="utf-8")
+        if cut_short:
+            # Ends the line a crash cut short, it is skipped when read
+            self._file.write("\n")
+
+    def states(self) -> dict:
+        """
+        Last state of every item in the journal, by key
+        """
+        states = {}
+        with open(self.path, encoding="utf-8") as file:
+            for line in file:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # The last line is cut short when the process died while writing it
+                    continue
+                states[entry["key"]] = entry["state"]
+        return states
+
+    def append(self, key: str, index: int, state: str, **details):
+        line = json.dumps(
+            {"key": key, "index": index, "state": state, "at": time.time(), **details},
+            default=str,
+        )
+        with self._lock:
+            self._file.write(line + "\n")
+            self._file.flush()
+            if self.fsync:
+                os.fsync(self._file.fileno())
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class JobSummary(BulkSummary):
+    """
+    Summary of a journaled run, with the items skipped as done or repeated and the `(index, item)` in doubt
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.skipped = 0
+        self.in_doubt = []
+
+    def __repr__(self):
+        return (
+            f"JobSummary(total={self.total}, succeeded={self.succeeded}, failed={self.failed}, "
+            f"skipped={self.skipped}, in_doubt={len(self.in_doubt)}, elapsed={self.elapsed:.1f}s)"
+        )
+
+
+class JournaledExecutor(BulkExecutor):
+    """
+    `BulkExecutor` that records each item to a `Journal` and skips the items a previous run completed.
+
+    Items are identified by `key`, by default a hash of their method and data, so the same input yields the
+    same keys on every run. Repeated items are sent once. Items the API rejected are sent again on the next
+    run.
+
+    .. code-block:: python
+
+        with Journal("products.journal") as journal:
+            executor = JournaledExecutor(ProductsClient(), journal, key=lambda model: model.reference)
+            summary = executor.run(ProductsInsertModel(**row) for row in csv.DictReader(file))
+
+    :param journal: journal of the job, reused by every run of it
+    :param key: identity of an item, e.g. its reference in the source data
+    :param resend_in_doubt: send again the items that may have been applied, default is to skip and report them
+    """
+
+    def __init__(
+        self,
+        client,
+        journal: Journal,
+        key: Callable[[object], str] = None,
+        resend_in_doubt: bool = False,
+        method: str = None,
+        concurrency: int = 8,
+        progress: Callable[[BulkOutcome, BulkSummary], object] = None,
+    ):
+        super().__init__(client, method, concurrency, progress)
+        self.journal = journal
+        self.key = key
+        self.resend_in_doubt = resend_in_doubt
+        self.skipped = 0
+        self.in_doubt = []
+        self._keys = {}
+
+    def key_for(self, item) -> str:
+        if self.key is not None:
+            return str(self.key(item))
+        return item_key(self.method_for(item), item)
+
+    def is_read(self, item) -> bool:
+        """
+        Whether an item is sent with a read endpoint, which applies nothing whatever its outcome
+        """
+        route = self.client.routes.get(self.method_for(item))
+        return route is not None and is_idempotent(route.path)
+
+    def outcomes(self, items: Iterable) -> Iterator[BulkOutcome]:
+        """
+        Sends the items the journal doesn't show as done, yielding their outcomes as they complete. The items
+        skipped are counted in `skipped`, the ones in doubt listed in `in_doubt` as `(index, item)`
+        """
+        self.skipped = 0
+        self.in_doubt = []
+        return self._outcomes(self._pending(items, self.journal.states()))
+
+    def _pending(self, items, states):
+        seen = set()
+        for index, item in enumerate(items):
+            key = self.key_for(item)
+            state = states.get(key)
+            if key in seen or state == DONE:
+                self.skipped += 1
+                continue
+            if state in (SENDING, UNKNOWN) and not self.resend_in_doubt:
+                self.skipped += 1
+                self.in_doubt.append((index, item))
+                continue
+            seen.add(key)
+            self._keys[index] = key
+            yield index, item
+
+    def send(self, index: int, item) -> BulkOutcome:
+        key = self._keys.pop(index)
+        # Written before the request: a crash from here on leaves the item in doubt
+        self.journal.append(key, index, SENDING)
+        outcome = super().send(index, item)
+        if outcome.ok:
+            self.journal.append(key, index, DONE, payload=outcome.response.payload)
+        elif isinstance(outcome.error, ApiException) and (
+            was_rejected(outcome.error) or self.is_read(item)
+        ):
+            # The API answered with an error, nothing was applied
+            self.journal.append(key, index, FAILED, error=outcome.error.error)
+        elif not may_have_been_sent(outcome.error):
+            self.journal.append(key, index, FAILED, error=repr(outcome.error))
+        else:
+            self.journal.append(key, index, UNKNOWN, error=repr(outcome.error))
+        return outcome
+
+    def run(self, items: Iterable) -> JobSummary:
+        """
+        Sends the items the journal doesn't show as done
+        :return: the counts, failed outcomes, skipped count and items in doubt
+        """
+        summary = JobSummary()
+        for outcome in self.outcomes(items):
+            summary.add(outcome)
+            if self.progress is not None:
+                self.progress(outcome, summary)
+        summary.skipped = self.skipped
+        summary.in_doubt = self.in_doubt
+        return summary
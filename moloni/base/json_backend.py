@@ -0,0 +1,38 @@
+"""
+JSON decoding of API responses, using the fastest backend installed: orjson, msgspec or the standard library.
+"""
+
+try:
+    import orjson
+
+    backend = "orjson"
+    loads = orjson.loads
+    DecodeError = orjson.JSONDecodeError
+except ImportError:
+    try:
+        import msgspec
+
+        backend = "msgspec"
+        loads = msgspec.json.Decoder().decode
+        DecodeError = msgspec.DecodeError
+    except ImportError:
+        import json
+
+        backend = "json"
+        loads = json.loads
+        DecodeError = ValueError
+
+
+def decode_response(response):
+    """
+    Decodes the body of a requests or httpx response once
+    :return: the decoded payload
+    """
+    content = getattr(response, "content", None)
+    if isinstance(content, (bytes, bytearray)) and content:
+        try:
+            return loads(content)
+        except DecodeError:
+            # Not UTF-8 JSON, let the response guess the encoding (or raise its usual error)
+            pass
+    return response.json()
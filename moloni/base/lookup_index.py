@@ -0,0 +1,263 @@
+"""
+In-memory index of the records of a company by the fields they are looked up by, e.g. customers by `vat` and
+`number` or products by `ean` and `reference`.
+
+The index is filled and kept current through `get_modified_since`, a full load asking for the records modified
+since the epoch (`getAll` of products needs a `category_id`), and with the inserts, updates and deletes its client
+sends. A lookup the index can't answer asks the live `get_by_<field>` endpoint and keeps what it returns. With a
+`Mirror`, the records are also kept on disk and a restart only asks for the changes since.
+"""
+
+import threading
+import time
+from datetime import datetime, timezone
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+from moloni.base.form_encoding import set_fields
+from moloni.base.helpers import endpoint_family, endpoint_name, record_id_field
+from moloni.base.mirror import (
+    DEFAULT_OVERLAP,
+    MODIFIED_FORMAT,
+    list_all,
+    list_records,
+)
+
+# Records a lookup asks the live endpoint for per request
+LOOKUP_PAGE_SIZE = 50
+
+
+def plain(value):
+    """
+    Request data as JSON-compatible values, the models of trusted calls turned into dicts of their set fields
+    """
+    if isinstance(value, BaseModel):
+        value = set_fields(value)
+    if isinstance(value, dict):
+        return {key: plain(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [plain(item) for item in value]
+    return value
+
+
+class LookupIndex:
+    """
+    Records of a client's family for one company, by the fields it has `get_by_<field>` endpoints for.
+
+    Values are compared as text, records without a value for a field aren't indexed by it. Only synchronous clients
+    are supported, though the writes of an asyncio client sharing the index are applied too.
+
+    .. code-block:: python
+
+        customers = LookupIndex(CustomersClient(), company_id=5, fields=("vat", "number"))
+        customers.load()
+        customer = customers.get("vat", "500000000")
+
+    :param client: client of the family, writes sent through it update the index
+    :param company_id: company whose records are indexed
+    :param fields: fields to look records up by, e.g. `("ean", "reference")`
+    :param id_field: field identifying a record, see `record_id_field` for the default
+    :param mirror: keeps the records on disk, `load` and `refresh` sync it and index its records
+    :param overlap: seconds before the start of a refresh the next one asks for changes from
+    :param clock: time source, seconds since the epoch
+    """
+
+    def __init__(
+        self,
+        client,
+        company_id,
+        fields,
+        id_field: str = None,
+        mirror=None,
+        overlap: float = DEFAULT_OVERLAP,
+        clock=time.time,
+    ):
+        for field in fields:
+            if not hasattr(client, f"get_by_{field}"):
+                raise ValueError(
+                    f"{type(client).__name__} has no get_by_{field} endpoint"
+                )
+        self.client = client
+        self.company_id = company_id
+        self.fields = tuple(fields)
+        self.family = endpoint_family(client.routes["get_modified_since"].path).lower()
+        self.id_field = id_field or record_id_field(client)
+        self.mirror = mirror
+        self.overlap = overlap
+        self.clock = clock
+        self.records = {}
+        self.hits = 0
+        self.misses = 0
+        self._values = {field: {} for field in self.fields}
+        self._lastmodified = None
+        self._lock = threading.Lock()
+        if mirror is not None and self.family not in mirror.families:
+            mirror.add(client, self.id_field)
+        client.observers.append(self.observe)
+
+    def load(self) -> int:
+        """
+        Indexes every record of the company, the ones of the mirror after syncing it
+        :return: number of records indexed
+        """
+        started = self.clock()
+        if self.mirror is not None:
+            self.mirror.sync(self.family)
+            records = self.mirror.find(self.family)
+        else:
+            records = list_all(self.client, {"company_id": self.company_id})
+        # Built before taking the lock, lookups keep using the current records while the pages arrive
+        indexed, values = {}, {field: {} for field in self.fields}
+        for record in records:
+            self._put(record, indexed, values)
+        with self._lock:
+            self.records, self._values = indexed, values
+            self._lastmodified = self._watermark(started)
+        return len(indexed)
+
+    def refresh(self) -> int:
+        """
+        Indexes the records changed since the last `load` or `refresh`. Without a mirror, records deleted by other
+        programs stay indexed until the next `load`
+        :return: number of records indexed or updated
+        """
+        if self.mirror is not None or self._lastmodified is None:
+            return self.load()
+        started = self.clock()
+        records = list(
+            list_records(
+                self.client,
+                "get_modified_since",
+                {"company_id": self.company_id, "lastmodified": self._lastmodified},
+            )
+        )
+        with self._lock:
+            for record in records:
+                self._put(record, self.records, self._values)
+            self._lastmodified = self._watermark(started)
+        return len(records)
+
+    def _watermark(self, started) -> str:
+        return datetime.fromtimestamp(started - self.overlap, timezone.utc).strftime(
+            MODIFIED_FORMAT
+        )
+
+    def find(self, field: str, value) -> List[dict]:
+        """
+        Records whose field equals the value, from the live `get_by_<field>` endpoint when none is indexed
+        """
+        if field not in self._values:
+            raise ValueError(f"{self.family} aren't indexed by {field}")
+        with self._lock:
+            ids = self._values[field].get(str(value))
+            if ids:
+                self.hits += 1
+                return [self.records[record_id] for record_id in ids]
+            self.misses += 1
+
+        records = self._live(field, value)
+        if records:
+            self._write(records)
+        return records
+
+    def _live(self, field, value) -> list:
+        method = f"get_by_{field}"
+        params = {"company_id": self.company_id, field: value}
+        # A value is usually unique, one request without counting the records first
+        page = getattr(self.client, method)(
+            {**params, "offset": 0, "qty": LOOKUP_PAGE_SIZE}
+        ).payload
+        if len(page) < LOOKUP_PAGE_SIZE:
+            return page
+        return page + list(
+            self.client.iter_all(
+                {**params, "offset": len(page)},
+                page_size=LOOKUP_PAGE_SIZE,
+                method=method,
+            )
+        )
+
+    def get(self, field: str, value) -> Optional[dict]:
+        """
+        First record whose field equals the value, None if the API has none either
+        """
+        records = self.find(field, value)
+        return records[0] if records else None
+
+    def observe(self, path, data, response):
+        """
+        Applies a successful insert, update or delete of the company's records, other requests are ignored
+        """
+        action = endpoint_name(path).split("/")[-1]
+        if (
+            action not in ("insert", "update", "delete")
+            or endpoint_family(path).lower() != self.family
+            or str(data.get("company_id")) != str(self.company_id)
+        ):
+            return
+        payload = response.payload if isinstance(response.payload, dict) else {}
+        record_id = payload.get(self.id_field, data.get(self.id_field))
+        if record_id is None:
+            return
+
+        if action == "delete":
+            with self._lock:
+                self._drop(str(record_id), self.records, self._values)
+            if self.mirror is not None:
+                self.mirror.remove(self.family, record_id)
+            return
+
+        with self._lock:
+            if action == "update":
+                # Records never indexed are left for a lookup or refresh to fetch whole
+                if str(record_id) not in self.records:
+                    return
+                record = {**self.records[str(record_id)], **plain(data)}
+            else:
+                # Fields the API fills in are missing until a refresh fetches the record
+                record = plain(data)
+            record[self.id_field] = record_id
+        self._write([record])
+
+    def _write(self, records):
+        with self._lock:
+            for record in records:
+                self._put(record, self.records, self._values)
+        if self.mirror is not None:
+            self.mirror.put(self.family, records)
+
+    def _put(self, record, records, values):
+        record_id = str(record[self.id_field])
+        self._drop(record_id, records, values)
+        records[record_id] = record
+        for field, field_values in values.items():
+            value = record.get(field)
+            if value not in (None, ""):
+                field_values.setdefault(str(value), []).append(record_id)
+
+    @staticmethod
+    def _drop(record_id, records, values):
+        record = records.pop(record_id, None)
+        if record is None:
+            return
+        for field, field_values in values.items():
+            key = str(record.get(field))
+            ids = field_values.get(key)
+            if ids and record_id in ids:
+                ids.remove(record_id)
+                if not ids:
+                    del field_values[key]
+
+    def close(self):
+        """
+        Stops following the client's writes
+        """
+        if self.observe in self.client.observers:
+            self.client.observers.remove(self.observe)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
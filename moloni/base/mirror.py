@@ -0,0 +1,299 @@
+"""
+Local SQLite replica of the records of a company, kept up to date through the `getModifiedSince` endpoints.
+
+The first sync of a family lists all of its records, as the ones modified since the epoch: `getModifiedSince` needs
+no filter besides the company, unlike `getAll` of e.g. products (`category_id`). Later syncs only ask for the records
+changed since the last one. Deleted records never show up as modified, so every `reconcile_every` seconds a sync lists all the records
+again and drops the local ones the API no longer returns.
+"""
+
+import json
+import re
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Optional
+
+from moloni.base.helpers import endpoint_family, record_id_field, request_model
+
+# A record changed while a sync runs may be missed by it, the next sync asks for the changes since a bit before
+DEFAULT_OVERLAP = 300
+DEFAULT_RECONCILE_EVERY = 24 * 3600
+# Format of `lastmodified`, in UTC. Should Moloni read it as local time, syncs ask for a bit more than needed
+MODIFIED_FORMAT = "%Y-%m-%d %H:%M:%S"
+# Records written per transaction
+BATCH_SIZE = 500
+# `lastmodified` of a full listing, every record has been modified since
+LISTED_SINCE = "1970-01-01 00:00:00"
+
+FIELD_PATTERN = re.compile(r"^\w+$")
+
+
+def list_records(client, method: str, params: dict):
+    """
+    Records a listing endpoint returns, every page of it
+    """
+    if request_model(client, method) is None:
+        # Endpoints without a request model take no pagination, e.g. `CountriesClient.get_all`
+        return getattr(client, method)(**params).payload
+    return client.iter_all(params, method=method)
+
+
+def list_all(client, params: dict):
+    """
+    Every record of a family, through `get_modified_since` from the epoch
+    """
+    return list_records(
+        client, "get_modified_since", {**params, "lastmodified": LISTED_SINCE}
+    )
+
+
+class Mirror:
+    """
+    Replica of the records of the clients added to it, for one company.
+
+    Families without a company (countries, currencies, ...) are shared by the mirrors of every company in the
+    same database. Only synchronous clients are supported.
+
+    :param path: SQLite database, created if needed
+    :param company_id: company whose records are mirrored
+    :param clients: clients of the families to mirror, see `add`
+    :param overlap: seconds before the start of a sync the next one asks for changes from
+    :param reconcile_every: seconds between the full listings that drop deleted records
+    :param clock: time source, seconds since the epoch
+    """
+
+    def __init__(
+        self,
+        path: str,
+        company_id,
+        clients=(),
+        overlap: float = DEFAULT_OVERLAP,
+        reconcile_every: float = DEFAULT_RECONCILE_EVERY,
+        clock=time.time,
+    ):
+        self.path = path
+        self.company_id = company_id
+        self.overlap = overlap
+        self.reconcile_every = reconcile_every
+        self.clock = clock
+        self.families = {}
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS moloni_records (family TEXT NOT NULL, company_id TEXT NOT NULL, "
+                "record_id TEXT NOT NULL, data TEXT NOT NULL, PRIMARY KEY (family, company_id, record_id))"
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS moloni_sync_state (family TEXT NOT NULL, company_id TEXT NOT NULL, "
+                "lastmodified TEXT NOT NULL, synced_at REAL NOT NULL, reconciled_at REAL NOT NULL, "
+                "PRIMARY KEY (family, company_id))"
+            )
+        for client in clients:
+            self.add(client)
+
+    def add(self, client, id_field: str = None) -> str:
+        """
+        Mirrors the records of a client with a `get_modified_since` endpoint
+        :param id_field: field identifying a record, see `record_id_field` for the default
+        :return: name of the family, e.g. `customers`
+        """
+        family = endpoint_family(client.routes["get_modified_since"].path).lower()
+        model = request_model(client, "get_modified_since")
+        # Families listed without a company are stored under company "0"
+        scoped = model is not None and "company_id" in model.model_fields
+        self.families[family] = (client, id_field or record_id_field(client), scoped)
+        return family
+
+    def sync(self, *families: str, full: bool = False) -> dict:
+        """
+        Brings the local records up to date, of every family added by default
+        :param full: list all the records and drop the deleted ones, even if not due
+        :return: per family, the records stored and deleted and whether all were listed
+        """
+        return {
+            family: self._sync(family, full) for family in families or self.families
+        }
+
+    def _sync(self, family, full):
+        client, id_field, scoped = self.families[family]
+        company_id = self._company(family)
+        state = self._state(family)
+        started = self.clock()
+        params = {"company_id": self.company_id} if scoped else {}
+
+        reconcile = full or state is None or started - state[2] >= self.reconcile_every
+        if reconcile:
+            records = list_all(client, params)
+        else:
+            records = list_records(
+                client, "get_modified_since", {**params, "lastmodified": state[0]}
+            )
+
+        seen = set()
+        batch = []
+        for record in records:
+            record_id = str(record[id_field])
+            seen.add(record_id)
+            batch.append((family, company_id, record_id, json.dumps(record)))
+            if len(batch) >= BATCH_SIZE:
+                self._store(batch)
+                batch = []
+        self._store(batch)
+
+        deleted = self._drop_missing(family, company_id, seen) if reconcile else 0
+        watermark = datetime.fromtimestamp(
+            started - self.overlap, timezone.utc
+        ).strftime(MODIFIED_FORMAT)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO moloni_sync_state VALUES (?, ?, ?, ?, ?)",
+                (
+                    family,
+                    company_id,
+                    watermark,
+                    started,
+                    started if reconcile else state[2],
+                ),
+            )
+        return {"stored": len(seen), "deleted": deleted, "full": reconcile}
+
+    def _store(self, batch):
+        if batch:
+            with self._lock, self._connection:
+                self._connection.executemany(
+                    "INSERT OR REPLACE INTO moloni_records VALUES (?, ?, ?, ?)", batch
+                )
+
+    def _drop_missing(self, family, company_id, seen) -> int:
+        with self._lock, self._connection:
+            stored = self._connection.execute(
+                "SELECT record_id FROM moloni_records WHERE family = ? AND company_id = ?",
+                (family, company_id),
+            ).fetchall()
+            missing = [
+                (family, company_id, row[0]) for row in stored if row[0] not in seen
+            ]
+            self._connection.executemany(
+                "DELETE FROM moloni_records WHERE family = ? AND company_id = ? AND record_id = ?",
+                missing,
+            )
+        return len(missing)
+
+    def put(self, family: str, records):
+        """
+        Stores records the API is known to hold, e.g. the ones a write just changed, until the next sync
+        """
+        id_field = self.families[family][1]
+        company_id = self._company(family)
+        self._store(
+            [
+                (family, company_id, str(record[id_field]), json.dumps(record))
+                for record in records
+            ]
+        )
+
+    def remove(self, family: str, *record_ids):
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "DELETE FROM moloni_records WHERE family = ? AND company_id = ? AND record_id = ?",
+                [
+                    (family, self._company(family), str(record_id))
+                    for record_id in record_ids
+                ],
+            )
+
+    def _company(self, family) -> str:
+        return str(self.company_id) if self.families[family][2] else "0"
+
+    def _state(self, family):
+        with self._lock:
+            return self._connection.execute(
+                "SELECT lastmodified, synced_at, reconciled_at FROM moloni_sync_state "
+                "WHERE family = ? AND company_id = ?",
+                (family, self._company(family)),
+            ).fetchone()
+
+    def get(self, family: str, record_id) -> Optional[dict]:
+        """
+        Local record by its id, None if it isn't mirrored
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT data FROM moloni_records WHERE family = ? AND company_id = ? AND record_id = ?",
+                (family, self._company(family), str(record_id)),
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def find(self, family: str, **filters) -> list:
+        """
+        Local records whose fields equal the filters, compared as text, e.g. `find("customers", vat="123456789")`
+        """
+        where, params = self._where(family, filters)
+        with self._lock:
+            rows = self._connection.execute(
+                f"SELECT data FROM moloni_records WHERE {where}", params
+            ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def count(self, family: str, **filters) -> int:
+        where, params = self._where(family, filters)
+        with self._lock:
+            return self._connection.execute(
+                f"SELECT COUNT(*) FROM moloni_records WHERE {where}", params
+            ).fetchone()[0]
+
+    def index(self, family: str, *fields: str):
+        """
+        Indexes fields `find` filters on, an index covers the field in every family
+        """
+        with self._lock, self._connection:
+            for field in fields:
+                self._connection.execute(
+                    f"CREATE INDEX IF NOT EXISTS moloni_records_{self._field(field)} ON moloni_records "
+                    f"(family, company_id, {self._expression(field)})"
+                )
+
+    def _where(self, family, filters):
+        where = ["family = ?", "company_id = ?"]
+        params = [family, self._company(family)]
+        for field, value in filters.items():
+            where.append(f"{self._expression(field)} = ?")
+            params.append(str(value))
+        return " AND ".join(where), params
+
+    @staticmethod
+    def _field(field) -> str:
+        if not FIELD_PATTERN.match(field):
+            raise ValueError(f"Invalid field name {field!r}")
+        return field
+
+    def _expression(self, field) -> str:
+        return f"CAST(json_extract(data, '$.{self._field(field)}') AS TEXT)"
+
+    def status(self) -> dict:
+        """
+        Per family: the local records, the `lastmodified` the next sync asks from and when it last synced and
+        listed all the records
+        """
+        status = {}
+        for family in self.families:
+            state = self._state(family)
+            status[family] = {
+                "records": self.count(family),
+                "lastmodified": state[0] if state else None,
+                "synced_at": state[1] if state else None,
+                "reconciled_at": state[2] if state else None,
+            }
+        return status
+
+    def close(self):
+        self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,72 @@
+import re
+
+from pydantic import BaseModel
+
+# Moloni caps the page size of list endpoints at 50 records
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 50
+
+
+def resolve_method_name(client, data) -> str:
+    """
+    Finds the client method a request model belongs to, e.g. `CustomersGetByVatModel` -> `get_by_vat`
+    :return:str
+    """
+    if not isinstance(data, BaseModel):
+        raise ValueError("Pass `method` when paginating with a dict")
+
+    prefix = re.sub("^Async", "", re.sub("Client$", "", type(client).__name__))
+    model_name = type(data).__name__
+    if not model_name.startswith(prefix) or not model_name.endswith("Model"):
+        raise ValueError(
+            f"{model_name} is not a request model of {type(client).__name__}"
+        )
+
+    action = model_name[len(prefix) : -len("Model")]
+    return re.sub(r"(?<!^)(?=[A-Z])", "_", action).lower()
+
+
+def count_method_name(method_name: str):
+    """
+    Name of the count endpoint matching a list endpoint, e.g. `get_by_vat` -> `count_by_vat`
+    :return:str or None
+    """
+    if method_name == "get_all":
+        return "count"
+    if method_name.startswith("get_"):
+        return f"count_{method_name[len('get_'):]}"
+    return None
+
+
+def split_pagination(data):
+    """
+    Splits request data into the filter params and the requested offset and page size
+    :return:tuple
+    """
+    if isinstance(data, BaseModel):
+        data = data.model_dump(exclude_unset=True, exclude={"_api_client"})
+    params = dict(data)
+    offset = int(params.pop("offset", None) or 0)
+    qty = params.pop("qty", None)
+    return params, offset, int(qty) if qty else None
+
+
+def page_size_for(page_size, qty) -> int:
+    """
+    Records to ask per request: `page_size`, else the requested `qty`, else 50, at most the 50 Moloni returns
+    :return:int
+    """
+    return min(page_size or qty or DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE)
+
+
+def parse_count(payload):
+    """
+    Reads the total from a count response, `{"count": 10}`
+    :return:int or None
+    """
+    if isinstance(payload, dict):
+        payload = payload.get("count")
+    try:
+        return int(payload)
+    except (TypeError, ValueError):
+        return None
@@ -0,0 +1,164 @@
+import asyncio
+import threading
+import time
+from typing import Optional
+
+from pydantic import BaseModel
+
+from moloni.base.deadline import DeadlineExceeded, check_wait
+
+
+class RateLimitConfig(BaseModel):
+    """
+    Request budget shared by every client using the same `RateLimiter`.
+
+    - requests_per_second / burst: budget of each set of credentials.
+    - company_requests_per_second / company_burst: optional budget of each company_id, within the credential budget.
+    """
+
+    requests_per_second: float = 10
+    burst: int = 10
+    company_requests_per_second: Optional[float] = None
+    company_burst: Optional[int] = None
+
+
+class TokenBucket:
+    """
+    Token bucket refilled at `rate` tokens per second, holding at most `capacity` tokens.
+
+    Tokens are reserved ahead: when the bucket is empty the caller gets the time to wait for its
+    token, so concurrent callers are served in the order they asked.
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Takes a token
+        :return: seconds to wait before using it
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(
+                self.capacity, self.tokens + (now - self.updated) * self.rate
+            )
+            self.updated = now
+            self.tokens -= 1
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+    def release(self):
+        """
+        Gives back a reserved token that won't be used
+        """
+        with self._lock:
+            self.tokens = min(self.capacity, self.tokens + 1)
+
+
+class RateLimiter:
+    """
+    Paces requests per credentials and per company_id. Pass the same instance to every client that
+    should share the budget, e.g. `InvoicesClient(rate_limiter=limiter)`.
+    """
+
+    def __init__(self, config: RateLimitConfig = RateLimitConfig()):
+        self.config = config
+        self._buckets = {}
+        self._guard = threading.Lock()
+        self.requests = 0
+        self.delayed = 0
+        self.wait_seconds = 0.0
+
+    def _bucket(self, key, rate, capacity) -> TokenBucket:
+        with self._guard:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = TokenBucket(rate, capacity)
+            return bucket
+
+    def _buckets_for(self, credential, company_id) -> list:
+        buckets = [
+            self._bucket(credential, self.config.requests_per_second, self.config.burst)
+        ]
+        if company_id is not None and self.config.company_requests_per_second:
+            buckets.append(
+                self._bucket(
+                    (credential, str(company_id)),
+                    self.config.company_requests_per_second,
+                    self.config.company_burst or self.config.burst,
+                )
+            )
+        return buckets
+
+    def reserve(self, credential: str, company_id=None) -> float:
+        """
+        Takes a token from the credential bucket and, if configured, from the company bucket
+        :return: seconds to wait before sending the request
+        """
+        wait = max(
+            bucket.reserve() for bucket in self._buckets_for(credential, company_id)
+        )
+
+        with self._guard:
+            self.requests += 1
+            if wait > 0:
+                self.delayed += 1
+                self.wait_seconds += wait
+        return wait
+
+    def release(self, credential: str, company_id=None, wait: float = 0.0):
+        """
+        Gives back the tokens of a reservation that won't be sent, `wait` being what `reserve` returned
+        """
+        for bucket in self._buckets_for(credential, company_id):
+            bucket.release()
+
+        with self._guard:
+            self.requests -= 1
+            if wait > 0:
+                self.delayed -= 1
+                self.wait_seconds -= wait
+
+    def _check_wait(self, credential, company_id, wait):
+        try:
+            check_wait(wait)
+        except DeadlineExceeded:
+            # The request is abandoned, its tokens go to the next ones
+            self.release(credential, company_id, wait)
+            raise
+
+    def acquire(self, credential: str, company_id=None):
+        """
+        Blocks until the request fits in the budget
+        :raises DeadlineExceeded: if the wait would outlast the current deadline, the budget is left untouched
+        """
+        wait = self.reserve(credential, company_id)
+        if wait > 0:
+            self._check_wait(credential, company_id, wait)
+            time.sleep(wait)
+
+    async def acquire_async(self, credential: str, company_id=None):
+        """
+        Waits, without blocking the event loop, until the request fits in the budget
+        :raises DeadlineExceeded: if the wait would outlast the current deadline, the budget is left untouched
+        """
+        wait = self.reserve(credential, company_id)
+        if wait > 0:
+            self._check_wait(credential, company_id, wait)
+            await asyncio.sleep(wait)
+
+    def metrics(self) -> dict:
+        """
+        Number of paced requests, how many had to wait and the total time spent waiting
+        :return:dict
+        """
+        with self._guard:
+            return {
+                "requests": self.requests,
+                "delayed": self.delayed,
+                "wait_seconds": self.wait_seconds,
+            }
@@ -0,0 +1,106 @@
+import threading
+import time
+from typing import Dict
+
+from cachetools import TTLCache
+from pydantic import BaseModel
+
+from moloni.base.helpers import endpoint_family
+
+# Seconds the responses of rarely changing reference data are kept
+DEFAULT_TTLS = {
+    "countries": 24 * 3600,
+    "currencies": 24 * 3600,
+    "languages": 24 * 3600,
+    "fiscalzones": 24 * 3600,
+    "taxexemptions": 3600,
+    "measurementunits": 3600,
+    "paymentmethods": 3600,
+    "maturitydates": 3600,
+    "deliverymethods": 3600,
+    "documentsets": 600,
+}
+
+
+class ResponseCacheConfig(BaseModel):
+    """
+    Which responses are cached and for how long.
+
+    - ttls: seconds each endpoint family (`countries`, `taxexemptions`, ...) is cached, names are case insensitive.
+      Families missing here aren't cached.
+    - maxsize: responses kept per family, the least recently used ones are dropped first.
+    """
+
+    ttls: Dict[str, float] = DEFAULT_TTLS
+    maxsize: int = 256
+
+
+class ResponseCache:
+    """
+    Caches the responses of read endpoints (`get*`, `count*`) of reference data, keyed by credentials, path and data.
+    A successful write (`insert`, `update`, `delete`, ...) to a family drops its cached responses.
+    Pass the same instance to every client that should share it, e.g. `CountriesClient(response_cache=cache)`.
+
+    Cached responses are shared, not copied, treat them as read-only.
+    """
+
+    def __init__(
+        self, config: ResponseCacheConfig = ResponseCacheConfig(), timer=time.monotonic
+    ):
+        self.config = config
+        self._caches = {
+            family.lower(): TTLCache(maxsize=config.maxsize, ttl=ttl, timer=timer)
+            for family, ttl in config.ttls.items()
+        }
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, path, key):
+        """
+        :return: the cached ApiResponse or None
+        """
+        cache = self._caches.get(endpoint_family(path).lower())
+        if cache is None:
+            return None
+        with self._lock:
+            response = cache.get(key)
+            if response is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return response
+
+    def set(self, path, key, response):
+        """
+        Caches the response of a read, unless the API answered with an error status
+        """
+        if response.status_code >= 400:
+            return
+        cache = self._caches.get(endpoint_family(path).lower())
+        if cache is not None:
+            with self._lock:
+                cache[key] = response
+
+    def invalidate(self, family: str = None):
+        """
+        Drops the cached responses of an endpoint family (e.g. `taxexemptions`), or all of them
+        """
+        with self._lock:
+            for name, cache in self._caches.items():
+                if family is None or name == family.lower():
+                    cache.clear()
+
+    def metrics(self) -> dict:
+        """
+        Cache hits, misses and the number of cached responses per family
+        :return:dict
+        """
+        with self._lock:
+            for cache in self._caches.values():
+                cache.expire()
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": {family: len(cache) for family, cache in self._caches.items()},
+            }
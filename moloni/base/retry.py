@@ -0,0 +1,103 @@
+import email.utils
+import random
+import time
+from fnmatch import fnmatch
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel
+
+from moloni.base.helpers import endpoint_name
+
+# Throttled requests were rejected before being processed, they are safe to re-send
+THROTTLED = 429
+
+
+def is_idempotent(path) -> bool:
+    """
+    Read endpoints (`get*`, `count*`) can be re-sent, writes (`insert`, `update`, `delete`, ...) can't
+    """
+    action = endpoint_name(path).rsplit("/", 1)[-1]
+    return action.startswith(("get", "count"))
+
+
+def parse_retry_after(headers) -> Optional[float]:
+    """
+    Reads the Retry-After header, given in seconds or as an HTTP date
+    :return: seconds to wait or None
+    """
+    value = (headers or {}).get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(
+            0.0, email.utils.parsedate_to_datetime(value).timestamp() - time.time()
+        )
+    except (TypeError, ValueError):
+        return None
+
+
+class RetryPolicy(BaseModel):
+    """
+    When and how long to wait before re-sending a failed request.
+
+    - max_attempts: attempts per call, including the first one.
+    - backoff_factor / backoff_max: exponential backoff, `backoff_factor * 2 ** (attempt - 1)` capped at `backoff_max`.
+    - jitter: wait a random time between 0 and the backoff ("full jitter").
+    - retry_statuses: HTTP statuses worth retrying.
+    - retry_writes: also re-send writes that may have reached Moloni. Writes are otherwise only retried
+      when they were not sent (connection failures) or throttled.
+    - overrides: policies for specific endpoints, keyed by patterns such as `invoices/insert` or `*/getAll`.
+
+    A `Retry-After` header is honored when it asks for a longer wait than the backoff.
+    """
+
+    max_attempts: int = 3
+    backoff_factor: float = 0.5
+    backoff_max: float = 30.0
+    jitter: bool = True
+    retry_statuses: List[int] = [429, 500, 502, 503, 504]
+    retry_writes: bool = False
+    overrides: Dict[str, "RetryPolicy"] = {}
+
+    def for_path(self, path) -> "RetryPolicy":
+        """
+        :return: the override matching the endpoint, or this policy
+        """
+        name = endpoint_name(path)
+        for pattern, policy in self.overrides.items():
+            if fnmatch(name, pattern):
+                return policy
+        return self
+
+    def backoff(self, attempt: int) -> float:
+        delay = min(self.backoff_max, self.backoff_factor * 2 ** (attempt - 1))
+        return random.uniform(0, delay) if self.jitter else delay
+
+    def delay(
+        self, path, attempt: int, status: int = None, headers=None, sent: bool = True
+    ) -> Optional[float]:
+        """
+        Decides whether a failed attempt is retried
+
+        :param path: request path
+        :param attempt: number of the attempt that failed, starting at 1
+        :param status: HTTP status of the response, None for transport errors
+        :param headers: response headers
+        :param sent: False when the request never reached the server
+        :return: seconds to wait before the next attempt, or None to give up
+        """
+        if attempt >= self.max_attempts:
+            return None
+        if status is not None and status not in self.retry_statuses:
+            return None
+        if (
+            sent
+            and status != THROTTLED
+            and not (self.retry_writes or is_idempotent(path))
+        ):
+            return None
+        return max(self.backoff(attempt), parse_retry_after(headers) or 0.0)
@@ -0,0 +1,93 @@
+import asyncio
+import threading
+
+from moloni.base.deadline import DeadlineExceeded, current_deadline, within_deadline
+
+
+class Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Coalesces identical read calls that are in flight at the same time: the first caller sends the request and
+    the others wait for it and share its `ApiResponse` (or its exception). Pass the same instance to every client
+    that should share in-flight calls, e.g. `CompaniesClient(single_flight=flights)`.
+
+    Only read endpoints (`get*`, `count*`) are coalesced, keyed by credentials, path and form data.
+    """
+
+    def __init__(self):
+        self._calls = {}
+        self._tasks = {}
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.coalesced = 0
+
+    def do(self, key, function):
+        """
+        Calls `function`, unless a call with the same key is in flight, and returns its result
+        """
+        with self._lock:
+            self.calls += 1
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = Call()
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            deadline = current_deadline()
+            if not call.done.wait(deadline.check() if deadline else None):
+                raise DeadlineExceeded(
+                    "Deadline exceeded while waiting for a shared call"
+                )
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = function()
+            return call.result
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    async def do_async(self, key, function):
+        """
+        Asynchronous version of `do`, `function` returns an awaitable.
+
+        The shared call runs in its own task, so cancelling one of the callers doesn't cancel it for the others.
+        """
+        loop = asyncio.get_running_loop()
+        key = (loop, key)
+        with self._lock:
+            self.calls += 1
+            task = self._tasks.get(key)
+            if task is None:
+                task = self._tasks[key] = loop.create_task(function())
+                task.add_done_callback(lambda done: self._forget(key, done))
+            else:
+                self.coalesced += 1
+        return await within_deadline(asyncio.shield(task))
+
+    def _forget(self, key, task):
+        with self._lock:
+            if self._tasks.get(key) is task:
+                del self._tasks[key]
+
+    def metrics(self) -> dict:
+        """
+        Number of read calls and how many of them shared an in-flight call
+        :return:dict
+        """
+        with self._lock:
+            return {"calls": self.calls, "coalesced": self.coalesced}
@@ -0,0 +1,92 @@
+import asyncio
+import hashlib
+import threading
+import time
+import weakref
+
+from moloni.base.helpers import AccessTokenResponse
+
+# Lifetime assumed when the grant response has no expires_in
+DEFAULT_EXPIRES_IN = 3600
+
+
+def credential_key(*parts) -> str:
+    """
+    Identity of a set of credentials, hashed so secrets are not kept as cache keys
+    :return:str
+    """
+    return hashlib.sha256("\0".join(str(part) for part in parts).encode()).hexdigest()
+
+
+class TokenCache:
+    """
+    Access tokens keyed by credential identity.
+
+    Tokens are considered stale `refresh_margin` seconds before they expire, so they get refreshed
+    before requests start failing. `lock` and `async_lock` give one refresh lock per credential.
+    """
+
+    def __init__(self, refresh_margin: float = 60):
+        self.refresh_margin = refresh_margin
+        self._tokens = {}
+        self._locks = {}
+        self._async_locks = weakref.WeakKeyDictionary()
+        self._guard = threading.Lock()
+
+    def get(self, key):
+        """
+        Returns the cached token if it is still fresh
+        :return:AccessTokenResponse or None
+        """
+        token = self._tokens.get(key)
+        if token is not None and self.is_fresh(token):
+            return token
+        return None
+
+    def peek(self, key):
+        """
+        Returns the cached token, fresh or not, to reuse its refresh token
+        :return:AccessTokenResponse or None
+        """
+        return self._tokens.get(key)
+
+    def set(self, key, token: AccessTokenResponse) -> AccessTokenResponse:
+        self._tokens[key] = self.stamp(token)
+        return token
+
+    @staticmethod
+    def stamp(token: AccessTokenResponse) -> AccessTokenResponse:
+        """
+        Records when the token expires, as wall-clock time so it can be shared between processes
+        :return:AccessTokenResponse
+        """
+        if token.expires_at is None:
+            token.expires_at = time.time() + int(token.expires_in or DEFAULT_EXPIRES_IN)
+        return token
+
+    def is_fresh(self, token: AccessTokenResponse) -> bool:
+        return (
+            token.access_token is not None
+            and token.expires_at is not None
+            and token.expires_at - self.refresh_margin > time.time()
+        )
+
+    def invalidate(self, key):
+        self._tokens.pop(key, None)
+
+    def clear(self):
+        self._tokens.clear()
+
+    def lock(self, key) -> threading.Lock:
+        with self._guard:
+            return self._locks.setdefault(key, threading.Lock())
+
+    def async_lock(self, key) -> asyncio.Lock:
+        # asyncio locks belong to one event loop
+        loop = asyncio.get_running_loop()
+        with self._guard:
+            locks = self._async_locks.setdefault(loop, {})
+            return locks.setdefault(key, asyncio.Lock())
+
+
+token_cache = TokenCache()
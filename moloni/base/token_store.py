@@ -0,0 +1,204 @@
+import json
+import os
+import sqlite3
+import tempfile
+import time
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+    import msvcrt
+
+from moloni.base.helpers import AccessTokenResponse
+
+
+class FileLock:
+    """
+    Exclusive lock on a file, shared by every process (and thread) that opens the same path
+    """
+
+    # Seconds between attempts when waiting with a timeout
+    poll_interval = 0.01
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def acquire(self, timeout: float = None):
+        """
+        :param timeout: seconds to wait for the lock, forever by default
+        :raises TimeoutError: if the lock wasn't acquired in time
+        """
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            if timeout is None:
+                self._lock(fd, blocking=True)
+                return fd
+            expires_at = time.monotonic() + timeout
+            while not self._lock(fd, blocking=False):
+                if time.monotonic() >= expires_at:
+                    raise TimeoutError(f"Timed out waiting for {self.path}")
+                time.sleep(self.poll_interval)
+        except BaseException:
+            os.close(fd)
+            raise
+        return fd
+
+    @staticmethod
+    def _lock(fd, blocking: bool) -> bool:
+        """
+        :return: whether the lock was taken, always True when blocking
+        """
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_EX | (0 if blocking else fcntl.LOCK_NB))
+            else:  # pragma: no cover
+                msvcrt.locking(fd, msvcrt.LK_LOCK if blocking else msvcrt.LK_NBLCK, 1)
+        except OSError:
+            # Held by another process or thread
+            if blocking:
+                raise
+            return False
+        return True
+
+    def release(self, fd):
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            else:  # pragma: no cover
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+        finally:
+            os.close(fd)
+
+
+class TokenStore:
+    """
+    Interface of persistent token stores shared between processes.
+
+    `MyAuth` acquires the store lock before refreshing, loads the token another process may have stored,
+    and only calls `/v1/grant` if there is no fresh one, saving the new token before releasing the lock.
+    `load` and `save` are always called while the lock is held.
+    """
+
+    def load(self, key: str):
+        """
+        :return:AccessTokenResponse or None
+        """
+        raise NotImplementedError
+
+    def save(self, key: str, token: AccessTokenResponse):
+        raise NotImplementedError
+
+    def acquire(self, key: str, timeout: float = None):
+        """
+        Blocks until this process may refresh the token of `key`
+        :param timeout: seconds to wait, forever by default
+        :return: handle passed to `release`
+        :raises TimeoutError: if the lock wasn't acquired in time
+        """
+        return None
+
+    def release(self, handle):
+        pass
+
+    @contextmanager
+    def lock(self, key: str, timeout: float = None):
+        handle = self.acquire(key, timeout)
+        try:
+            yield
+        finally:
+            self.release(handle)
+
+
+class FileTokenStore(TokenStore):
+    """
+    Stores tokens in a JSON file, guarded by a lock file next to it
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = FileLock(f"{path}.lock")
+
+    def load(self, key: str):
+        try:
+            with open(self.path) as f:
+                tokens = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return None
+        token = tokens.get(key)
+        return AccessTokenResponse(**token) if token else None
+
+    def save(self, key: str, token: AccessTokenResponse):
+        try:
+            with open(self.path) as f:
+                tokens = json.load(f)
+        except (FileNotFoundError, ValueError):
+            tokens = {}
+        tokens[key] = token.dict()
+
+        # Replace the file atomically so readers never see a partial write
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(self.path)))
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(tokens, f)
+            os.chmod(tmp_path, 0o600)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def acquire(self, key: str, timeout: float = None):
+        return self._lock.acquire(timeout)
+
+    def release(self, handle):
+        self._lock.release(handle)
+
+
+class SQLiteTokenStore(TokenStore):
+    """
+    Stores tokens in a SQLite database, guarded by a lock file next to it
+    """
+
+    def __init__(self, path: str, table: str = "moloni_tokens"):
+        self.path = path
+        self.table = table
+        self._lock = FileLock(f"{path}.lock")
+        connection = self._connect()
+        try:
+            with connection:
+                connection.execute(
+                    f"CREATE TABLE IF NOT EXISTS {self.table} (key TEXT PRIMARY KEY, token TEXT NOT NULL)"
+                )
+        finally:
+            connection.close()
+
+    def _connect(self):
+        return sqlite3.connect(self.path, timeout=30)
+
+    def load(self, key: str):
+        connection = self._connect()
+        try:
+            row = connection.execute(
+                f"SELECT token FROM {self.table} WHERE key = ?", (key,)
+            ).fetchone()
+        finally:
+            connection.close()
+        return AccessTokenResponse(**json.loads(row[0])) if row else None
+
+    def save(self, key: str, token: AccessTokenResponse):
+        connection = self._connect()
+        try:
+            with connection:
+                connection.execute(
+                    f"INSERT OR REPLACE INTO {self.table} (key, token) VALUES (?, ?)",
+                    (key, json.dumps(token.dict())),
+                )
+        finally:
+            connection.close()
+
+    def acquire(self, key: str, timeout: float = None):
+        return self._lock.acquire(timeout)
+
+    def release(self, handle):
+        self._lock.release(handle)
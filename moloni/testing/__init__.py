@@ -0,0 +1,3 @@
+from .fake_server import FakeMoloniServer
+
+__all__ = ["FakeMoloniServer"]
@@ -0,0 +1,416 @@
+"""
+Local stand-in for the Moloni API, to exercise the clients end-to-end without network access.
+
+The endpoints are read from the OpenAPI specs the clients are generated from (`moloni/testing/specs/*.yaml`, requires pyyaml),
+and backed by an in-memory store:
+
+- `/v1/grant`: issues access tokens, other calls must send one of them.
+- `getAll`, `getBy*`, `getModifiedSince`: records of the company matching the filters sent, paginated with `offset`/`qty`.
+  `getModifiedSince` only returns the records inserted or updated since `lastmodified` (UTC, `YYYY-MM-DD HH:MM:SS`).
+- `count*`: `{"count": N}` for the same filters.
+- `getOne`, `insert`, `update`, `delete`: by the id field of the endpoint family (`customer_id`, `document_id`, ...).
+
+Point any client at it with its URL:
+
+.. code-block:: python
+
+    from moloni.api import CustomersClient
+    from moloni.testing import FakeMoloniServer
+
+    with FakeMoloniServer(latency=0.01) as server:
+        server.seed("customers", [{"name": "Ana", "vat": "123456789"}], company_id=5)
+        client = CustomersClient(server.url)
+        client.get_all({"company_id": 5})
+
+Run `python -m moloni.testing.fake_server --port 8080` to keep one running.
+"""
+
+import argparse
+import glob
+import itertools
+import json
+import os
+import random
+import re
+import secrets
+import threading
+import time
+from collections import deque
+from fnmatch import fnmatch
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+
+from moloni.base.helpers import endpoint_name, family_id_field
+
+# Shipped with the package, the clients are generated from the same files
+SPEC_PATHS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "specs", "*.yaml")
+
+# Filters that select records by something other than equality
+IGNORED_FILTERS = {"company_id", "offset", "qty", "lastmodified", "search"}
+
+KEY_PATTERN = re.compile(r"\[([^\]]*)\]")
+
+# Format of `lastmodified`, in UTC
+MODIFIED_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+def load_routes(spec_paths: str = SPEC_PATHS) -> dict:
+    """
+    Reads the endpoints of the OpenAPI specs
+    :return: dict of endpoint name (`customers/getAll`) to the names of its fields
+    """
+    try:
+        import yaml
+    except ImportError:  # pragma: no cover
+        raise ImportError(
+            "The fake server reads the OpenAPI specs with pyyaml, install it with `pip install python-moloni[testing]`"
+        )
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+    files = sorted(glob.glob(spec_paths))
+    if not files:
+        raise FileNotFoundError(f"No OpenAPI specs found at {spec_paths}")
+
+    routes = {}
+    for file in files:
+        with open(file) as f:
+            spec = yaml.load(f, Loader=loader)
+        for path, operations in spec["paths"].items():
+            operation = operations.get("post") or operations.get("get") or {}
+            schema = (
+                operation.get("requestBody", {})
+                .get("content", {})
+                .get("application/json", {})
+                .get("schema", {})
+            )
+            routes[endpoint_name(path)] = {
+                "properties": set(schema.get("properties", {})),
+                "required": set(schema.get("required", [])),
+            }
+    return routes
+
+
+def unflatten(pairs) -> dict:
+    """
+    Rebuilds the nested data of a form, `products[0][taxes][0][tax_id]=1` -> `{"products": [{"taxes": [{"tax_id": "1"}]}]}`
+    """
+    data = {}
+    for key, value in pairs:
+        head = key.split("[", 1)[0]
+        parts = [head] + KEY_PATTERN.findall(key[len(head) :])
+        node = data
+        for part in parts[:-1]:
+            node = node.setdefault(part, {})
+        node[parts[-1]] = value
+    return _lists(data)
+
+
+def _lists(node):
+    if not isinstance(node, dict):
+        return node
+    node = {key: _lists(value) for key, value in node.items()}
+    if node and all(key.isdigit() for key in node):
+        return [node[key] for key in sorted(node, key=int)]
+    return node
+
+
+class FakeMoloniServer:
+    """
+    Fake Moloni API running in a background thread.
+
+    :param spec_paths: glob of the OpenAPI specs
+    :param host: interface to listen on
+    :param port: port to listen on, 0 picks a free one
+    :param latency: seconds every response is delayed by
+    :param page_size: records returned when a paginated call doesn't send `qty`
+    :param max_page_size: records returned at most per call, whatever `qty` asks for
+    :param error_rate: share of calls answered with a random 5xx error
+    :param seed: seed of the random generator used for `error_rate`
+    :param request_log: number of recent calls kept in `requests` as `(endpoint, form)`, None keeps every call
+    """
+
+    def __init__(
+        self,
+        spec_paths: str = SPEC_PATHS,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        page_size: int = 50,
+        max_page_size: int = None,
+        error_rate: float = 0.0,
+        seed: int = None,
+        request_log: int = 10000,
+    ):
+        self.routes = load_routes(spec_paths)
+        self.id_fields = {
+            family: self._id_field(family)
+            for family in {name.split("/", 1)[0] for name in self.routes}
+        }
+        self.latency = latency
+        self.page_size = page_size
+        self.max_page_size = max_page_size
+        self.error_rate = error_rate
+        self.random = random.Random(seed)
+        self.store = {}
+        # When each record was last inserted or updated, by (family, id)
+        self.modified = {}
+        self.tokens = set()
+        self.requests = deque(maxlen=request_log)
+        self._faults = []
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._handler())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    def _id_field(self, family) -> str:
+        # The id field is the one, besides company_id, every delete/update/getOne call requires
+        for action in ("delete", "update", "getOne"):
+            route = self.routes.get(f"{family}/{action}")
+            if route is None:
+                continue
+            ids = sorted(
+                field
+                for field in route["required"]
+                if field.endswith("_id") and field != "company_id"
+            )
+            if len(ids) == 1:
+                return ids[0]
+            if "document_id" in ids:
+                return "document_id"
+        return family_id_field(family)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeMoloniServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    @staticmethod
+    def now() -> str:
+        return time.strftime(MODIFIED_FORMAT, time.gmtime())
+
+    def seed(self, family: str, records, company_id=None) -> list:
+        """
+        Adds records to the store, assigning them an id when they don't have one. A record's `lastmodified`
+        sets when it was last modified, now by default
+        :return: the stored records
+        """
+        id_field = self.id_fields.get(family, family_id_field(family))
+        stored = []
+        with self._lock:
+            table = self.store.setdefault(family, {})
+            for record in records:
+                record = dict(record)
+                if company_id is not None:
+                    record.setdefault("company_id", company_id)
+                record.setdefault(id_field, next(self._ids))
+                table[int(record[id_field])] = record
+                self.modified[family, int(record[id_field])] = (
+                    record.get("lastmodified") or self.now()
+                )
+                stored.append(record)
+        return stored
+
+    def fail(self, pattern: str = "*", status: int = 503, times: int = 1, payload=None):
+        """
+        Answers the next `times` calls to the endpoints matching `pattern` (e.g. `invoices/*`) with an error
+        """
+        with self._lock:
+            self._faults.append([pattern, status, times, payload])
+
+    def _fault(self, name):
+        with self._lock:
+            for fault in self._faults:
+                pattern, status, times, payload = fault
+                if fnmatch(name, pattern):
+                    fault[2] -= 1
+                    if fault[2] <= 0:
+                        self._faults.remove(fault)
+                    return status, payload
+        if self.error_rate and self.random.random() < self.error_rate:
+            return self.random.choice((500, 502, 503)), None
+        return None
+
+    def handle(self, http_method: str, url: str, body: bytes):
+        """
+        Answers a call
+        :return: (status, payload)
+        """
+        parts = urlsplit(url)
+        query = dict(parse_qsl(parts.query, keep_blank_values=True))
+        path = parts.path
+        # Accept any prefix before the version, e.g. /sandbox/v1/...
+        match = re.search(r"/v\d+/.*", path)
+        name = endpoint_name(match.group(0)) if match else ""
+
+        if self.latency:
+            time.sleep(self.latency)
+
+        form = parse_qsl(body.decode(), keep_blank_values=True) if body else []
+        with self._lock:
+            self.requests.append((name, dict(form)))
+
+        if name == "grant":
+            token = secrets.token_hex(16)
+            with self._lock:
+                self.tokens.add(token)
+            return 200, {
+                "access_token": token,
+                "expires_in": 3600,
+                "token_type": "bearer",
+                "scope": None,
+                "refresh_token": secrets.token_hex(16),
+            }
+
+        if name not in self.routes:
+            return 404, {"error": "not_found"}
+        if query.get("access_token") not in self.tokens:
+            return 401, {
+                "error": "invalid_token",
+                "error_description": "The access token provided is invalid",
+            }
+
+        fault = self._fault(name)
+        if fault is not None:
+            status, payload = fault
+            return status, payload if payload is not None else {"error": "fault"}
+
+        return 200, self.dispatch(name, unflatten(form))
+
+    def dispatch(self, name: str, data: dict):
+        family, action = name.split("/", 1)
+        id_field = self.id_fields[family]
+
+        with self._lock:
+            table = self.store.setdefault(family, {})
+
+            if action == "insert":
+                record_id = next(self._ids)
+                table[record_id] = {**data, id_field: record_id}
+                self.modified[family, record_id] = self.now()
+                return {"valid": 1, id_field: record_id}
+
+            record_id = data.get(id_field)
+            if action in ("update", "delete", "getOne") and record_id is not None:
+                record = table.get(int(record_id))
+                if action == "getOne":
+                    return record or {}
+                if record is None:
+                    return [f"2 {id_field} 0"]
+                if action == "delete":
+                    del table[int(record_id)]
+                    self.modified.pop((family, int(record_id)), None)
+                else:
+                    record.update(data)
+                    record[id_field] = int(record_id)
+                    self.modified[family, int(record_id)] = self.now()
+                return {"valid": 1, id_field: int(record_id)}
+
+            if action.startswith(("get", "count")):
+                since = action.endswith("ModifiedSince") and data.get("lastmodified")
+                records = [
+                    record
+                    for record_id, record in table.items()
+                    if self._matches(record, data)
+                    and (not since or self.modified[family, record_id] >= since)
+                ]
+                if action.startswith("count"):
+                    return {"count": len(records)}
+                if not {"offset", "qty"} & self.routes[name]["properties"]:
+                    return records
+                offset = int(data.get("offset") or 0)
+                qty = int(data.get("qty") or self.page_size)
+                if self.max_page_size:
+                    qty = min(qty, self.max_page_size)
+                return records[offset : offset + qty]
+
+        return {}
+
+    @staticmethod
+    def _matches(record, data) -> bool:
+        for field, value in data.items():
+            if field == "company_id":
+                if "company_id" in record and str(record["company_id"]) != value:
+                    return False
+            elif field not in IGNORED_FILTERS and not isinstance(value, (dict, list)):
+                if str(record.get(field)) != value:
+                    return False
+        return True
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            # Keep connections open, like the real API
+            protocol_version = "HTTP/1.1"
+            # Headers and body are written separately, don't let Nagle hold the body back
+            disable_nagle_algorithm = True
+
+            def _respond(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length) if length else b""
+                status, payload = server.handle(self.command, self.path, body)
+                content = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            do_GET = do_POST = _respond
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Runs a fake Moloni API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--page-size", type=int, default=50)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument(
+        "--request-log",
+        type=int,
+        default=0,
+        help="number of recent calls to keep in memory, none by default",
+    )
+    args = parser.parse_args()
+
+    server = FakeMoloniServer(
+        host=args.host,
+        port=args.port,
+        latency=args.latency,
+        page_size=args.page_size,
+        error_rate=args.error_rate,
+        request_log=args.request_log,
+    )
+    print(f"Fake Moloni API listening on {server.url}")
+    try:
+        server._server.serve_forever()
+    except KeyboardInterrupt:
+        server._server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -9,8 +9,12 @@ setup(
     extras_require={
         "aws-caching": ["aws-secretsmanager-caching", "boto3"],
         "aws": ["boto3"],
+        "async": ["httpx"],
+        "fast-json": ["orjson"],
+        "testing": ["pyyaml"],
     },
-    packages=["moloni.api", "moloni.base", "moloni"],
+    packages=["moloni.api", "moloni.base", "moloni.testing", "moloni"],
+    package_data={"moloni.testing": ["specs/*.yaml"]},
     url="https://github.com/saleweaver/python-moloni",
     license="MIT",
     author="Michael",
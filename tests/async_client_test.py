@@ -0,0 +1,98 @@
+import inspect
+import unittest
+from urllib.parse import parse_qs
+
+import httpx
+
+import moloni.api
+from moloni.api.customers_client import (
+    AsyncCustomersClient,
+    CustomersClient,
+    CustomersGetAllModel,
+)
+from moloni.base import ApiException, ApiResponse, AsyncMoloniBaseClient
+from moloni.base.token_cache import token_cache
+
+
+class TestAsyncMoloniBaseClient(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        token_cache.clear()
+        self.requests = []
+
+    def tearDown(self):
+        token_cache.clear()
+
+    def handler(self, request: httpx.Request):
+        self.requests.append(request)
+        if request.url.path == "/v1/grant":
+            return httpx.Response(
+                200, json={"access_token": "token", "expires_in": 3600}
+            )
+        body = parse_qs(request.content.decode())
+        if body.get("company_id") == ["0"]:
+            return httpx.Response(200, json=["2 company_id"])
+        return httpx.Response(200, json=[{"customer_id": 1}, {"customer_id": 2}])
+
+    def make_client(self):
+        return AsyncCustomersClient(
+            session=httpx.AsyncClient(transport=httpx.MockTransport(self.handler))
+        )
+
+    def test_all_clients_have_async_twins(self):
+        for name in moloni.api.__all__:
+            if name.endswith("Client") and not name.startswith("Async"):
+                twin = getattr(moloni.api, f"Async{name}")
+                self.assertTrue(issubclass(twin, getattr(moloni.api, name)))
+                self.assertTrue(issubclass(twin, AsyncMoloniBaseClient))
+                self.assertTrue(inspect.iscoroutinefunction(twin._request))
+
+    async def test_get_all(self):
+        async with self.make_client() as client:
+            response = await client.get_all(
+                CustomersGetAllModel(company_id=5, qty=2, offset=0)
+            )
+
+        self.assertIsInstance(response, ApiResponse)
+        self.assertEqual(response.payload, [{"customer_id": 1}, {"customer_id": 2}])
+        self.assertTrue(response.has_more)
+        self.assertEqual(response.next(), {"offset": 2, "qty": 2})
+
+        grant, call = self.requests
+        self.assertEqual(grant.url.path, "/v1/grant")
+        self.assertEqual(call.url.path, "/v1/customers/getAll/")
+        self.assertEqual(call.url.params["access_token"], "token")
+        self.assertEqual(
+            parse_qs(call.content.decode()),
+            {"company_id": ["5"], "qty": ["2"], "offset": ["0"]},
+        )
+
+    async def test_error_response(self):
+        async with self.make_client() as client:
+            with self.assertRaises(ApiException):
+                await client.get_all({"company_id": 0})
+
+    async def test_token_is_cached(self):
+        async with self.make_client() as client:
+            await client.get_all({"company_id": 5})
+            await client.get_all({"company_id": 5})
+
+        self.assertEqual([r.url.path for r in self.requests].count("/v1/grant"), 1)
+
+    async def test_shared_session_is_not_closed(self):
+        session = httpx.AsyncClient(transport=httpx.MockTransport(self.handler))
+        async with AsyncCustomersClient(session=session):
+            pass
+        self.assertFalse(session.is_closed)
+        await session.aclose()
+
+    def test_sync_context_manager_is_rejected(self):
+        with self.assertRaises(TypeError):
+            with AsyncCustomersClient(session=object()):
+                pass
+
+    def test_sync_client_is_unchanged(self):
+        self.assertFalse(inspect.iscoroutinefunction(CustomersClient._request))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,151 @@
+import unittest
+from unittest.mock import patch, Mock
+
+from requests import Response, Session
+
+from moloni.api.companies_client import CompaniesClient
+from moloni.api.customers_client import (
+    AsyncCustomersClient,
+    CustomersClient,
+    CustomersGetAllModel,
+)
+from moloni.base import ApiResponse, PoolConfig
+from moloni.base.client import MoloniBaseClient, build_session
+from moloni.base.helpers import Route, endpoint, fill_query_params
+from tests.helpers import make_response
+
+
+class TestMoloniBaseClientSession(unittest.TestCase):
+    def test_build_session_configures_pool(self):
+        session = build_session(
+            PoolConfig(pool_connections=3, pool_maxsize=20, max_retries=2)
+        )
+        adapter = session.get_adapter("https://api.moloni.pt")
+
+        self.assertEqual(adapter._pool_connections, 3)
+        self.assertEqual(adapter._pool_maxsize, 20)
+        self.assertEqual(adapter.max_retries.total, 2)
+        self.assertEqual(session.headers["Connection"], "keep-alive")
+
+    def test_build_session_without_keep_alive(self):
+        session = build_session(PoolConfig(keep_alive=False))
+        self.assertEqual(session.headers["Connection"], "close")
+
+    def test_auth_shares_client_session(self):
+        client = CustomersClient()
+        self.assertIs(client.auth.session, client.session)
+
+    def test_close_owned_session(self):
+        client = CustomersClient()
+        with patch.object(client.session, "close") as mock_close:
+            with client:
+                pass
+        mock_close.assert_called_once()
+
+    def test_shared_session_is_not_closed(self):
+        session = Session()
+        companies = CompaniesClient(session=session)
+        customers = CustomersClient(session=session)
+
+        with patch.object(session, "close") as mock_close:
+            companies.close()
+            customers.close()
+        mock_close.assert_not_called()
+        self.assertIs(companies.session, customers.session)
+
+    @patch.object(CustomersClient, "_request")
+    def test_model_connect_closes_client(self, mock_request):
+        mock_response = Mock(spec=Response)
+        mock_response.json.return_value = []
+        mock_response.status_code = 200
+        mock_response.headers = {}
+        mock_request.return_value = ApiResponse(mock_response, {})
+
+        with patch.object(CustomersClient, "close") as mock_close:
+            with CustomersGetAllModel(company_id=5).connect() as api:
+                api.request()
+        mock_close.assert_called_once()
+
+    def test_request_uses_session(self):
+        client = CustomersClient()
+        client.auth = Mock(return_value="token")
+        mock_response = Mock(spec=Response)
+        mock_response.json.return_value = [{"customer_id": 1}]
+        mock_response.status_code = 200
+        mock_response.headers = {}
+        mock_response.request = Mock(url="https://api.moloni.pt/v1/customers/getAll/")
+
+        with patch.object(
+            client.session, "request", return_value=mock_response
+        ) as mock_request:
+            response = client.get_all({"company_id": 5})
+
+        self.assertEqual(response.payload, [{"customer_id": 1}])
+        self.assertEqual(
+            mock_request.call_args.kwargs["url"],
+            "https://api.moloni.pt/v1/customers/getAll/",
+        )
+        self.assertEqual(
+            mock_request.call_args.kwargs["params"], {"access_token": "token"}
+        )
+
+
+class TestEndpointRoutes(unittest.TestCase):
+    def test_endpoint_methods_are_not_wrapped(self):
+        function = CustomersClient.__dict__["get_all"]
+        self.assertEqual(
+            function.endpoint, Route("/<version>/customers/getAll/", "post")
+        )
+        self.assertEqual(function.__code__.co_name, "get_all")
+
+    def test_baseline_style_methods_get_path_and_method(self):
+        class LegacyClient(MoloniBaseClient):
+            @endpoint("/<version>/countries/getAll/", method="post")
+            def get_all(self, **kwargs):
+                return self._request(
+                    fill_query_params(kwargs.pop("path"), self.version),
+                    data={**kwargs},
+                )
+
+        client = LegacyClient()
+        client.auth = Mock(return_value="token", cache_key="credential")
+        client.session.request = Mock(return_value=make_response())
+        client.get_all()
+
+        kwargs = client.session.request.call_args.kwargs
+        self.assertEqual(
+            (kwargs["method"], kwargs["url"]),
+            ("post", "https://api.moloni.pt/v1/countries/getAll/"),
+        )
+        self.assertEqual(
+            LegacyClient().routes["get_all"], Route("/v1/countries/getAll/", "post")
+        )
+
+    def test_routes_resolved_per_version(self):
+        routes = CustomersClient().routes
+        self.assertEqual(routes["get_all"], Route("/v1/customers/getAll/", "post"))
+        self.assertIs(CustomersClient().routes, routes)
+        self.assertEqual(
+            CustomersClient(version="v2").routes["get_all"].path,
+            "/v2/customers/getAll/",
+        )
+
+    def test_async_client_inherits_endpoints(self):
+        self.assertEqual(AsyncCustomersClient.endpoints, CustomersClient.endpoints)
+        self.assertIsNot(
+            AsyncCustomersClient._route_tables, CustomersClient._route_tables
+        )
+
+    def test_request_method_from_route(self):
+        client = CustomersClient(version="v2")
+        with patch.object(CustomersClient, "_request") as mock_request:
+            client.get_all({"company_id": 5}, qty=10)
+        mock_request.assert_called_once_with(
+            "/v2/customers/getAll/",
+            data={"company_id": 5, "qty": 10},
+            method="post",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
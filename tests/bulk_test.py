@@ -0,0 +1,107 @@
+import unittest
+
+from moloni.api.products_client import ProductsClient, ProductsInsertModel
+from moloni.base import ApiException, BulkExecutor, trusted
+from moloni.testing import FakeMoloniServer
+
+
+class TestBulkExecutor(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = FakeMoloniServer().start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def setUp(self):
+        self.server.store.clear()
+        self.server.requests.clear()
+        self.products = ProductsClient(self.server.url)
+        self.addCleanup(self.products.close)
+
+    def models(self, count):
+        for i in range(count):
+            yield ProductsInsertModel(
+                company_id=5, name=f"product {i}", reference=f"P{i}"
+            )
+
+    def test_run(self):
+        progress = []
+        executor = BulkExecutor(
+            self.products,
+            concurrency=4,
+            progress=lambda outcome, summary: progress.append(summary.total),
+        )
+        summary = executor.run(self.models(20))
+
+        self.assertEqual(
+            (summary.total, summary.succeeded, summary.failed), (20, 20, 0)
+        )
+        self.assertEqual(progress, list(range(1, 21)))
+        self.assertEqual(
+            sorted(
+                record["reference"] for record in self.server.store["products"].values()
+            ),
+            sorted(f"P{i}" for i in range(20)),
+        )
+
+    def test_failures_do_not_stop_the_run(self):
+        self.server.fail("products/insert", payload=["2 name 0"], times=2)
+        summary = BulkExecutor(self.products, concurrency=1).run(self.models(5))
+
+        self.assertEqual((summary.succeeded, summary.failed), (3, 2))
+        self.assertEqual([outcome.index for outcome in summary.failures], [0, 1])
+        failure = summary.failures[0]
+        self.assertFalse(failure.ok)
+        self.assertIsInstance(failure.error, ApiException)
+        self.assertEqual(failure.item.reference, "P0")
+
+    def test_error_status_is_a_failure(self):
+        self.server.fail("products/insert", status=503, payload={"error": "fault"})
+        summary = BulkExecutor(self.products, concurrency=1).run(self.models(3))
+
+        self.assertEqual((summary.succeeded, summary.failed), (2, 1))
+        failure = summary.failures[0]
+        self.assertEqual(failure.index, 0)
+        self.assertIsInstance(failure.error, ApiException)
+        self.assertEqual(failure.error.status_code, 503)
+        self.assertEqual(failure.response.payload, {"error": "fault"})
+
+    def test_input_is_read_as_workers_free_up(self):
+        read = []
+
+        def items():
+            for i, model in enumerate(self.models(100)):
+                read.append(i)
+                yield model
+
+        outcomes = BulkExecutor(self.products, concurrency=2).outcomes(items())
+        first = next(outcomes)
+        self.assertTrue(first.ok)
+        self.assertLessEqual(len(read), 5)
+        outcomes.close()
+        self.assertLess(len(self.server.store.get("products", {})), 10)
+
+    def test_dicts_need_a_method(self):
+        with self.assertRaises(ValueError):
+            BulkExecutor(self.products).run([{"company_id": 5, "name": "pen"}])
+
+        summary = BulkExecutor(self.products, method="insert").run(
+            [{"company_id": 5, "name": "pen"}]
+        )
+        self.assertEqual(summary.succeeded, 1)
+        self.assertIsInstance(summary.rate, float)
+
+    def test_workers_see_the_callers_context(self):
+        with trusted():
+            summary = BulkExecutor(self.products, method="insert").run(
+                [{"company_id": 5, "name": "pen", "unknown_field": 1}]
+            )
+        self.assertEqual(summary.succeeded, 1)
+        record = next(iter(self.server.store["products"].values()))
+        self.assertEqual(record["unknown_field"], "1")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,176 @@
+import asyncio
+import unittest
+from unittest.mock import patch, Mock
+
+import httpx
+from requests.exceptions import ConnectionError
+
+from moloni.api.customers_client import AsyncCustomersClient, CustomersClient
+from moloni.api.invoices_client import InvoicesClient
+from moloni.base import CircuitBreaker, CircuitBreakerConfig, CircuitOpenError
+from tests.helpers import make_response
+
+
+@patch("moloni.base.circuit_breaker.time.monotonic")
+class TestCircuitBreaker(unittest.TestCase):
+    name = "https://api.moloni.pt/documents"
+
+    def setUp(self):
+        self.breaker = CircuitBreaker(
+            CircuitBreakerConfig(
+                window_size=4,
+                minimum_calls=4,
+                failure_rate_threshold=0.5,
+                slow_call_seconds=2,
+                open_seconds=10,
+                half_open_calls=2,
+            )
+        )
+
+    def call(self, failed=False, elapsed=0.1):
+        self.breaker.record(self.breaker.before(self.name), failed, elapsed)
+
+    def trip(self):
+        for failed in (False, False, True, True):
+            self.call(failed)
+
+    def test_circuit_name(self, mock_time):
+        self.assertEqual(
+            CircuitBreaker.circuit_name(
+                "https://api.moloni.pt", "/v1/documents/getPDFLink/"
+            ),
+            self.name,
+        )
+
+    def test_opens_on_failure_rate(self, mock_time):
+        mock_time.return_value = 0
+        for failed in (True, True, False):
+            self.call(failed)
+        self.assertEqual(self.breaker.snapshot()[self.name]["state"], "closed")
+        self.call()
+        with self.assertRaises(CircuitOpenError) as context:
+            self.breaker.before(self.name)
+        self.assertEqual(context.exception.retry_in, 10)
+
+        snapshot = self.breaker.snapshot()[self.name]
+        self.assertEqual(snapshot["state"], "open")
+        self.assertEqual(snapshot["rejected"], 1)
+        self.assertEqual(snapshot["retry_in"], 10)
+
+    def test_slow_calls_are_failures(self, mock_time):
+        mock_time.return_value = 0
+        for elapsed in (1, 1, 3, 3):
+            self.call(elapsed=elapsed)
+        self.assertEqual(self.breaker.snapshot()[self.name]["state"], "open")
+
+    def test_half_open_probes_close_the_circuit(self, mock_time):
+        mock_time.return_value = 0
+        self.trip()
+        mock_time.return_value = 10
+        probes = [self.breaker.before(self.name), self.breaker.before(self.name)]
+        with self.assertRaises(CircuitOpenError):
+            self.breaker.before(self.name)
+        for probe in probes:
+            self.breaker.record(probe, False, 0.1)
+        self.assertEqual(self.breaker.snapshot()[self.name]["state"], "closed")
+
+    def test_failed_probe_reopens(self, mock_time):
+        mock_time.return_value = 0
+        self.trip()
+        mock_time.return_value = 10
+        self.breaker.record(self.breaker.before(self.name), True, 0.1)
+        mock_time.return_value = 15
+        self.assertEqual(self.breaker.snapshot()[self.name]["state"], "open")
+        self.assertEqual(self.breaker.snapshot()[self.name]["retry_in"], 5)
+
+    def test_released_probe_frees_its_slot(self, mock_time):
+        mock_time.return_value = 0
+        self.trip()
+        mock_time.return_value = 10
+        probes = [self.breaker.before(self.name), self.breaker.before(self.name)]
+        self.breaker.release(probes[0])
+        self.breaker.before(self.name)
+
+    def test_reset(self, mock_time):
+        mock_time.return_value = 0
+        self.trip()
+        self.breaker.reset(self.name)
+        self.breaker.before(self.name)
+
+
+class TestClientCircuitBreaker(unittest.TestCase):
+    def make_client(self, client_class, breaker, *responses):
+        client = client_class(circuit_breaker=breaker)
+        client.auth = Mock(return_value="token", cache_key="credential")
+        client.session.request = Mock(side_effect=responses)
+        return client
+
+    def test_fails_fast_per_family(self):
+        breaker = CircuitBreaker(CircuitBreakerConfig(minimum_calls=2))
+        customers = self.make_client(
+            CustomersClient,
+            breaker,
+            make_response({}, status_code=503),
+            ConnectionError("reset"),
+            make_response(),
+        )
+        customers.get_all({"company_id": 5})
+        with self.assertRaises(ConnectionError):
+            customers.get_all({"company_id": 5})
+        with self.assertRaises(CircuitOpenError):
+            customers.get_all({"company_id": 5})
+        self.assertEqual(customers.session.request.call_count, 2)
+
+        # Other endpoint families are not affected
+        invoices = self.make_client(InvoicesClient, breaker, make_response())
+        invoices.get_all({"company_id": 5})
+        self.assertEqual(
+            breaker.snapshot()["https://api.moloni.pt/customers"]["state"], "open"
+        )
+
+    def test_api_errors_are_not_failures(self):
+        breaker = CircuitBreaker(CircuitBreakerConfig(minimum_calls=1))
+        client = self.make_client(
+            CustomersClient,
+            breaker,
+            make_response([{"code": "1", "description": "error"}]),
+        )
+        client.get_all({"company_id": 5})
+        self.assertEqual(
+            breaker.snapshot()["https://api.moloni.pt/customers"]["failures"], 0
+        )
+
+
+class TestAsyncClientCircuitBreaker(unittest.IsolatedAsyncioTestCase):
+    async def test_cancelled_probe_is_released(self):
+        breaker = CircuitBreaker(CircuitBreakerConfig(half_open_calls=1))
+        name = "https://api.moloni.pt/customers"
+        breaker._circuit(name).state = "half_open"
+        started = asyncio.Event()
+
+        async def handler(request):
+            started.set()
+            await asyncio.sleep(10)
+
+        client = AsyncCustomersClient(
+            session=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+            circuit_breaker=breaker,
+        )
+
+        async def auth():
+            return "token"
+
+        client.auth = Mock(side_effect=auth, cache_key="credential")
+        task = asyncio.ensure_future(client.get_all({"company_id": 5}))
+        await started.wait()
+        with self.assertRaises(CircuitOpenError):
+            breaker.before(name)
+        task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+        breaker.before(name)
+        await client.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+import pickle
+import unittest
+from unittest.mock import patch
+
+from moloni.api import creditnotes_client, invoices_client
+from moloni.api._endpoints import CLIENTS
+from moloni.api._factory import client_namespace
+from moloni.api.invoices_client import (
+    AsyncInvoicesClient,
+    InvoicesClient,
+    InvoicesGetAllModel,
+    InvoicesInsertModel,
+    Products,
+)
+from moloni.base import AsyncMoloniBaseClient
+
+
+class TestClientFactory(unittest.TestCase):
+    def test_nested_models_are_shared(self):
+        self.assertIs(invoices_client.Products, creditnotes_client.Products)
+        self.assertIs(invoices_client.Payments, creditnotes_client.Payments)
+
+    def test_modules_are_built_once(self):
+        namespace = client_namespace("InvoicesClient", invoices_client.__name__)
+        self.assertIs(namespace["InvoicesClient"], InvoicesClient)
+
+    def test_client_endpoints_match_the_table(self):
+        table = CLIENTS["InvoicesClient"]["endpoints"]
+        self.assertEqual(set(InvoicesClient.endpoints), set(table))
+        path, method, _ = table["get_all"]
+        self.assertEqual(
+            InvoicesClient.endpoints["get_all"], (f"/<version>{path}", method)
+        )
+        self.assertTrue(issubclass(AsyncInvoicesClient, AsyncMoloniBaseClient))
+
+    def test_endpoint_method(self):
+        method = InvoicesClient.get_all
+        self.assertEqual(method.__qualname__, "InvoicesClient.get_all")
+        self.assertEqual(method.__module__, "moloni.api.invoices_client")
+        self.assertEqual(method.__code__.co_name, "get_all")
+        self.assertIn("data (Union[InvoicesGetAllModel, dict])", method.__doc__)
+        self.assertIn("- company_id (Union[str, int])", method.__doc__)
+
+    def test_request_model_fields(self):
+        fields = InvoicesInsertModel.model_fields
+        self.assertEqual(list(fields)[0], "company_id")
+        self.assertTrue(fields["company_id"].is_required())
+        self.assertEqual(InvoicesGetAllModel.model_fields["qty"].default, 25)
+
+        model = InvoicesInsertModel(company_id=5, products=[{"product_id": 1}])
+        self.assertIsInstance(model.products[0], Products)
+
+    def test_request_model_connect(self):
+        model = InvoicesGetAllModel(company_id=5)
+        with self.assertRaises(ValueError):
+            model.request()
+
+        with patch.object(InvoicesClient, "_request") as mock_request:
+            with model.connect() as api:
+                api.request()
+        mock_request.assert_called_once_with(
+            "/v1/invoices/getAll/", data={"company_id": 5}, method="post"
+        )
+
+    def test_models_pickle(self):
+        model = InvoicesInsertModel(company_id=5, products=[Products(product_id=1)])
+        self.assertEqual(pickle.loads(pickle.dumps(model)), model)
+
+
+if __name__ == "__main__":
+    unittest.main()
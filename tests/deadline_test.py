@@ -0,0 +1,224 @@
+import asyncio
+import time
+import unittest
+from unittest.mock import patch, Mock
+
+import httpx
+from requests.exceptions import ReadTimeout
+
+from moloni.api.customers_client import AsyncCustomersClient, CustomersClient
+from moloni.base import (
+    DeadlineExceeded,
+    RateLimiter,
+    RateLimitConfig,
+    RetryPolicy,
+    deadline,
+)
+from moloni.base.client import MyAuth
+from moloni.base.config import DEFAULT_TIMEOUT, MoloniBaseUrl
+from moloni.base.deadline import current_deadline, deadline_timeout
+from moloni.base.token_cache import TokenCache
+from tests.helpers import make_response
+
+
+class TestDeadline(unittest.TestCase):
+    def test_timeout_is_capped(self):
+        self.assertEqual(deadline_timeout((10, 60)), (10, 60))
+        with deadline(5):
+            connect, read = deadline_timeout((10, 60))
+            self.assertTrue(4 < connect <= 5 and 4 < read <= 5)
+            self.assertEqual(deadline_timeout((1, 2)), (1, 2))
+            self.assertTrue(deadline_timeout(None)[0] <= 5)
+        self.assertIsNone(current_deadline())
+
+    def test_nested_deadline_cannot_extend(self):
+        with deadline(1) as outer:
+            with deadline(10) as inner:
+                self.assertIs(inner, outer)
+            with deadline(0.5) as inner:
+                self.assertIsNot(inner, outer)
+            self.assertIs(current_deadline(), outer)
+
+    def test_expired(self):
+        with deadline(0):
+            with self.assertRaises(DeadlineExceeded):
+                deadline_timeout(DEFAULT_TIMEOUT)
+
+
+class TestClientDeadline(unittest.TestCase):
+    def make_client(self, *responses, **kwargs):
+        client = CustomersClient(**kwargs)
+        client.auth = Mock(return_value="token", cache_key="credential")
+        client.session.request = Mock(side_effect=responses)
+        return client
+
+    def test_client_timeout_is_sent(self):
+        client = self.make_client(make_response(), timeout=(3, 7))
+        client.get_all({"company_id": 5})
+        self.assertEqual(client.session.request.call_args.kwargs["timeout"], (3, 7))
+
+    def test_request_timeout_follows_deadline(self):
+        client = self.make_client(make_response())
+        with deadline(2):
+            client.get_all({"company_id": 5})
+        connect, read = client.session.request.call_args.kwargs["timeout"]
+        self.assertTrue(connect <= 2 and read <= 2)
+
+    def test_expired_deadline_sends_nothing(self):
+        client = self.make_client(make_response())
+        with deadline(0), self.assertRaises(DeadlineExceeded):
+            client.get_all({"company_id": 5})
+        client.session.request.assert_not_called()
+
+    @patch("moloni.base.client.time.sleep")
+    def test_retry_backoff_bounded_by_deadline(self, mock_sleep):
+        client = self.make_client(
+            ReadTimeout(),
+            make_response(),
+            retry_policy=RetryPolicy(jitter=False, backoff_factor=10),
+        )
+        with deadline(1), self.assertRaises(DeadlineExceeded):
+            client.get_all({"company_id": 5})
+        self.assertEqual(client.session.request.call_count, 1)
+        mock_sleep.assert_not_called()
+
+    def test_timeout_at_deadline_is_reported(self):
+        def timeout(**kwargs):
+            time.sleep(0.02)
+            raise ReadTimeout()
+
+        client = self.make_client()
+        client.session.request = Mock(side_effect=timeout)
+        with deadline(0.01), self.assertRaises(DeadlineExceeded):
+            client.get_all({"company_id": 5})
+
+    @patch("moloni.base.rate_limit.time.sleep")
+    def test_rate_limit_wait_bounded_by_deadline(self, mock_sleep):
+        client = self.make_client(
+            make_response(),
+            rate_limiter=RateLimiter(RateLimitConfig(requests_per_second=0.1, burst=1)),
+        )
+        client.get_all({"company_id": 5})
+        with deadline(1), self.assertRaises(DeadlineExceeded):
+            client.get_all({"company_id": 5})
+        mock_sleep.assert_not_called()
+
+    def test_iter_all_deadline(self):
+        client = self.make_client(
+            make_response({"count": 4}),
+            make_response([{"customer_id": 1}, {"customer_id": 2}]),
+        )
+        records = client.iter_all({"company_id": 5}, 2, "get_all", deadline=60)
+        self.assertEqual(next(records), {"customer_id": 1})
+        # The deadline only applies while a page is requested
+        self.assertIsNone(current_deadline())
+        self.assertTrue(client.session.request.call_args.kwargs["timeout"][1] <= 60)
+
+    def test_fetch_all_propagates_deadline_to_workers(self):
+        seen = []
+
+        def request(**kwargs):
+            seen.append(current_deadline())
+            if "count" in kwargs["url"]:
+                return make_response({"count": 4})
+            return make_response([{"customer_id": 1}, {"customer_id": 2}])
+
+        client = self.make_client()
+        client.session.request = Mock(side_effect=request)
+        records = client.fetch_all({"company_id": 5}, 2, "get_all", deadline=60)
+
+        self.assertEqual(len(records), 4)
+        self.assertEqual(len(seen), 3)
+        self.assertIsNotNone(seen[0])
+        self.assertTrue(all(d is seen[0] for d in seen))
+
+
+class TestAuthDeadline(unittest.TestCase):
+    def make_auth(self):
+        auth = MyAuth(
+            MoloniBaseUrl.SANDBOX,
+            "id",
+            "secret",
+            "refresh",
+            token_cache=TokenCache(),
+            timeout=(2, 4),
+        )
+        auth.session.request = Mock(
+            return_value=make_response(
+                {
+                    "access_token": "token",
+                    "refresh_token": "refresh",
+                    "expires_in": 3600,
+                }
+            )
+        )
+        return auth
+
+    def test_grant_uses_timeout(self):
+        auth = self.make_auth()
+        self.assertEqual(auth(), "token")
+        self.assertEqual(auth.session.request.call_args.kwargs["timeout"], (2, 4))
+
+    def test_waiting_for_refresh_is_bounded(self):
+        auth = self.make_auth()
+        lock = auth.token_cache.lock(auth.cache_key)
+        lock.acquire()
+        try:
+            with deadline(0.05), self.assertRaises(DeadlineExceeded):
+                auth()
+        finally:
+            lock.release()
+        auth.session.request.assert_not_called()
+
+
+class TestAsyncDeadline(unittest.IsolatedAsyncioTestCase):
+    async def test_request_timeout_follows_deadline(self):
+        timeouts = []
+
+        def handler(request):
+            timeouts.append(request.extensions["timeout"])
+            return httpx.Response(200, json=[])
+
+        client = AsyncCustomersClient(
+            session=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+            timeout=(3, 7),
+        )
+
+        async def auth():
+            return "token"
+
+        client.auth = Mock(side_effect=auth, cache_key="credential")
+        await client.get_all({"company_id": 5})
+        with deadline(1):
+            await client.get_all({"company_id": 5})
+        with deadline(0), self.assertRaises(DeadlineExceeded):
+            await client.get_all({"company_id": 5})
+        await client.close()
+
+        self.assertEqual(timeouts[0]["connect"], 3)
+        self.assertEqual(timeouts[0]["read"], 7)
+        self.assertTrue(timeouts[1]["connect"] <= 1 and timeouts[1]["read"] <= 1)
+        self.assertEqual(len(timeouts), 2)
+
+    async def test_token_refresh_bounded_by_deadline(self):
+        async def slow(*args, **kwargs):
+            await asyncio.sleep(1)
+
+        client = AsyncCustomersClient(
+            session=httpx.AsyncClient(
+                transport=httpx.MockTransport(lambda request: httpx.Response(200))
+            )
+        )
+        client.auth.token_cache = TokenCache()
+        client.auth.load_or_refresh = slow
+        with deadline(0.05), self.assertRaises(DeadlineExceeded):
+            await client.auth()
+        # The thread lock was released when the refresh was cancelled
+        lock = client.auth.token_cache.lock(client.auth.cache_key)
+        self.assertTrue(lock.acquire(timeout=1))
+        lock.release()
+        await client.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,145 @@
+import unittest
+
+from moloni.api.customers_client import AsyncCustomersClient, CustomersClient
+from moloni.api.invoices_client import InvoicesClient
+from moloni.base import ApiException, RetryPolicy
+from moloni.base.client import resolve_base_url
+from moloni.base.config import MoloniBaseUrl
+from moloni.testing import FakeMoloniServer
+from moloni.testing.fake_server import unflatten
+
+
+class TestFakeServer(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = FakeMoloniServer(page_size=4).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def setUp(self):
+        self.server.store.clear()
+        self.server.seed(
+            "customers",
+            [{"name": f"customer {i}", "vat": str(i)} for i in range(10)],
+            company_id=5,
+        )
+        self.client = CustomersClient(self.server.url)
+
+    def tearDown(self):
+        self.client.close()
+
+    def test_base_url(self):
+        self.assertEqual(
+            resolve_base_url(MoloniBaseUrl.SANDBOX), MoloniBaseUrl.SANDBOX.value
+        )
+        self.assertEqual(
+            resolve_base_url("http://localhost:8080/"), "http://localhost:8080"
+        )
+        self.assertEqual(self.client.base_url, self.server.url)
+
+    def test_pagination(self):
+        self.assertEqual(len(self.client.get_all({"company_id": 5}).payload), 4)
+        self.assertEqual(self.client.count({"company_id": 5}).payload, {"count": 10})
+        records = list(self.client.iter_all({"company_id": 5}, 3, "get_all"))
+        self.assertEqual([r["vat"] for r in records], [str(i) for i in range(10)])
+        self.assertEqual(
+            len(self.client.fetch_all({"company_id": 5}, 3, "get_all")), 10
+        )
+        self.assertEqual(self.client.get_all({"company_id": 6}).payload, [])
+
+    def test_filters(self):
+        response = self.client.get_by_vat(
+            {"company_id": 5, "vat": "7", "offset": 0, "qty": 10}
+        )
+        self.assertEqual([r["name"] for r in response.payload], ["customer 7"])
+
+    def test_crud(self):
+        inserted = self.client.insert(
+            {"company_id": 5, "name": "new", "vat": "999"}
+        ).payload
+        customer_id = inserted["customer_id"]
+        self.client.update(
+            {"company_id": 5, "customer_id": customer_id, "name": "renamed"}
+        )
+        customer = self.client.get_one(
+            {"company_id": 5, "customer_id": customer_id}
+        ).payload
+        self.assertEqual(customer["name"], "renamed")
+        self.client.delete({"company_id": 5, "customer_id": customer_id})
+        with self.assertRaises(ApiException):
+            self.client.delete({"company_id": 5, "customer_id": customer_id})
+
+    def test_nested_insert(self):
+        invoices = InvoicesClient(self.server.url)
+        invoices.insert(
+            {
+                "company_id": 5,
+                "products": [
+                    {"product_id": 1, "taxes": [{"tax_id": 1}, {"tax_id": 2}]}
+                ],
+            }
+        )
+        (invoice,) = self.server.store["invoices"].values()
+        self.assertEqual(
+            invoice["products"][0]["taxes"], [{"tax_id": "1"}, {"tax_id": "2"}]
+        )
+
+    def test_fault_injection(self):
+        client = CustomersClient(
+            self.server.url, retry_policy=RetryPolicy(backoff_factor=0)
+        )
+        self.server.fail("customers/getAll", status=503, times=2)
+        response = client.get_all({"company_id": 5})
+        self.assertEqual(response.status_code, 200)
+
+        self.server.fail("customers/*", status=500)
+        self.assertEqual(self.client.get_all({"company_id": 5}).status_code, 500)
+        self.assertEqual(self.client.get_all({"company_id": 5}).status_code, 200)
+
+    def test_request_log_is_bounded(self):
+        with FakeMoloniServer(request_log=2) as server:
+            with CustomersClient(server.url) as client:
+                for company_id in range(3):
+                    client.get_all({"company_id": company_id})
+            self.assertEqual(
+                [(name, form["company_id"]) for name, form in server.requests],
+                [("customers/getAll", "1"), ("customers/getAll", "2")],
+            )
+
+    def test_rejects_unknown_tokens(self):
+        status, payload = self.server.handle(
+            "POST", "/v1/customers/getAll/?access_token=nope", b"company_id=5"
+        )
+        self.assertEqual(status, 401)
+        self.assertEqual(self.server.handle("POST", "/v1/nothing/here/", b"")[0], 404)
+
+    def test_unflatten(self):
+        self.assertEqual(
+            unflatten(
+                [
+                    ("company_id", "5"),
+                    ("products[1][name]", "b"),
+                    ("products[0][name]", "a"),
+                    ("products[0][taxes][0][tax_id]", "1"),
+                ]
+            ),
+            {
+                "company_id": "5",
+                "products": [{"name": "a", "taxes": [{"tax_id": "1"}]}, {"name": "b"}],
+            },
+        )
+
+
+class TestAsyncFakeServer(unittest.IsolatedAsyncioTestCase):
+    async def test_round_trip(self):
+        with FakeMoloniServer(latency=0.01) as server:
+            server.seed("customers", [{"name": "a"}, {"name": "b"}], company_id=5)
+            async with AsyncCustomersClient(server.url) as client:
+                records = await client.fetch_all({"company_id": 5}, 1, "get_all")
+            self.assertEqual([r["name"] for r in records], ["a", "b"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,126 @@
+import unittest
+from unittest.mock import Mock
+
+import httpx
+from pydantic import ValidationError
+from requests import Request
+
+from moloni.api.invoices_client import InvoicesClient, InvoicesInsertModel
+from moloni.base import MoloniBaseClient, trusted, validate_data
+from moloni.base.form_encoding import encode_form
+from moloni.base.helpers import trusted_data
+from tests.helpers import make_response
+
+
+def requests_body(data):
+    """
+    Body requests sends for the form data of the recursive encoder
+    """
+    form_data = MoloniBaseClient().create_form_data(data)
+    return Request("POST", "http://localhost", data=form_data).prepare().body
+
+
+def invoice(lines):
+    return {
+        "company_id": 5,
+        "date": "2024-01-31",
+        "our_reference": "Encomenda nº 1 & 2 / ação",
+        "notes": None,
+        "status": "1",
+        "products": [
+            {
+                "product_id": line,
+                "name": f"Produto {line} +50%",
+                "qty": 2.5,
+                "summary": "",
+                "taxes": [{"tax_id": 1, "value": 23}, {"tax_id": 2, "value": None}],
+            }
+            for line in range(lines)
+        ],
+        "associated_documents": [],
+        "payments": [{"payment_method_id": 1, "date": "2024-01-31 10:00:00"}],
+    }
+
+
+class TestEncodeForm(unittest.TestCase):
+    def assertSameBody(self, data):
+        self.assertEqual(encode_form(data), requests_body(data) or "")
+
+    def test_matches_requests(self):
+        for data in (
+            {},
+            {"company_id": 5},
+            {"a": {}, "b": [], "c": [[1, 2], {"d": [None]}]},
+            {"": {"a": 1}, 0: {"b": 2}, "x": {0: {"": 3}}},
+            {0: [1], "": ["y"], "z z": "ü ß ~*'()"},
+            {"a[0]": 1, "a": [2]},
+            invoice(3),
+            invoice(500),
+        ):
+            with self.subTest(data=str(data)[:60]):
+                self.assertSameBody(data)
+
+    def test_matches_validated_models(self):
+        data = validate_data(invoice(20), True, InvoicesInsertModel)
+        self.assertSameBody(data)
+
+    def test_matches_httpx(self):
+        data = invoice(3)
+        form_data = MoloniBaseClient().create_form_data(data)
+        request = httpx.Request("POST", "http://localhost", data=form_data)
+        self.assertEqual(encode_form(data).encode(), request.read())
+
+    def test_trusted_model_matches_dump(self):
+        model = InvoicesInsertModel(**invoice(20))
+        self.assertEqual(
+            encode_form(trusted_data(model)),
+            encode_form(validate_data(model, True, InvoicesInsertModel)),
+        )
+        # Only the top level is converted
+        self.assertIs(trusted_data(model)["products"], model.products)
+
+
+class TestClientBody(unittest.TestCase):
+    def setUp(self):
+        response = make_response({"valid": 1})
+        self.client = InvoicesClient()
+        self.client.auth = Mock(return_value="token", cache_key="credential")
+        self.client.session.request = Mock(return_value=response)
+
+    def test_sends_encoded_body(self):
+        data = invoice(2)
+        self.client.insert(data)
+        kwargs = self.client.session.request.call_args.kwargs
+        self.assertEqual(
+            kwargs["data"],
+            requests_body(validate_data(invoice(2), True, InvoicesInsertModel)),
+        )
+        self.assertEqual(
+            kwargs["headers"]["Content-Type"], "application/x-www-form-urlencoded"
+        )
+        self.assertNotIn("Content-Type", self.client.headers)
+
+    def test_empty_body(self):
+        self.client._request("/v1/companies/getAll/", {"method": "POST"})
+        kwargs = self.client.session.request.call_args.kwargs
+        self.assertIsNone(kwargs["data"])
+        self.assertNotIn("Content-Type", kwargs["headers"])
+
+    def test_trusted_client_skips_validation(self):
+        self.client.trusted = True
+        self.client.insert({"company_id": 5, "products": "not a list"})
+        kwargs = self.client.session.request.call_args.kwargs
+        self.assertEqual(kwargs["data"], "company_id=5&products=not+a+list")
+
+    def test_trusted_calls(self):
+        data = {"company_id": 5, "unknown": 1}
+        with self.assertRaises(ValidationError):
+            self.client.insert({"company_id": 5, "products": "not a list"})
+        with trusted():
+            self.client.insert(data)
+        kwargs = self.client.session.request.call_args.kwargs
+        self.assertEqual(kwargs["data"], "company_id=5&unknown=1")
+
+
+if __name__ == "__main__":
+    unittest.main()
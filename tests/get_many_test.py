@@ -0,0 +1,130 @@
+import time
+import unittest
+
+from moloni.api.customeralternateaddresses_client import (
+    CustomeralternateaddressesClient,
+)
+from moloni.api.documents_client import DocumentsClient
+from moloni.api.invoices_client import AsyncInvoicesClient, InvoicesClient
+from moloni.base import ApiException
+from moloni.testing import FakeMoloniServer
+
+
+class TestGetMany(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = FakeMoloniServer(latency=0.05).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def setUp(self):
+        self.server.store.clear()
+        self.server.requests.clear()
+        self.ids = [
+            record["document_id"]
+            for record in self.server.seed(
+                "invoices", [{"number": i} for i in range(8)], company_id=5
+            )
+        ]
+        self.client = InvoicesClient(self.server.url)
+        self.addCleanup(self.client.close)
+
+    def sent(self):
+        return [name for name, _ in self.server.requests if name != "grant"]
+
+    def test_records_by_id(self):
+        started = time.monotonic()
+        result = self.client.get_many(self.ids, {"company_id": 5}, concurrency=8)
+        elapsed = time.monotonic() - started
+
+        self.assertEqual(list(result.records), self.ids)
+        self.assertEqual(
+            [record["number"] for record in result.records.values()],
+            list(range(8)),
+        )
+        self.assertEqual(result.errors, {})
+        # Serially, the eight requests would take 0.4 seconds
+        self.assertLess(elapsed, 0.3)
+
+    def test_repeated_ids_are_requested_once(self):
+        result = self.client.get_many(self.ids[:2] * 3, {"company_id": 5})
+        self.assertEqual(list(result.records), self.ids[:2])
+        self.assertEqual(self.sent(), ["invoices/getOne"] * 2)
+
+    def test_errors_do_not_stop_the_batch(self):
+        self.server.fail("invoices/getOne", payload=["2 document_id 0"])
+        result = self.client.get_many(
+            self.ids + [999999], {"company_id": 5}, concurrency=1
+        )
+
+        self.assertEqual(list(result.records), self.ids[1:])
+        self.assertIsInstance(result.errors[self.ids[0]], ApiException)
+        self.assertIsInstance(result.errors[999999], LookupError)
+
+    def test_error_status_is_an_error(self):
+        self.server.fail("invoices/getOne", status=502, payload={"error": "fault"})
+        result = self.client.get_many(self.ids[:2], {"company_id": 5}, concurrency=1)
+
+        self.assertEqual(list(result.records), self.ids[1:2])
+        error = result.errors[self.ids[0]]
+        self.assertIsInstance(error, ApiException)
+        self.assertEqual(error.status_code, 502)
+        self.assertEqual(error.error, {"error": "fault"})
+
+    def test_id_field_of_get_one_without_delete_endpoint(self):
+        ids = [
+            record["document_id"]
+            for record in self.server.seed(
+                "documents", [{"number": i} for i in range(3)], company_id=5
+            )
+        ]
+        with DocumentsClient(self.server.url) as documents:
+            result = documents.get_many(ids, {"company_id": 5})
+        self.assertEqual(list(result.records), ids)
+        self.assertEqual(result.errors, {})
+
+    def test_id_field_is_required_when_ambiguous(self):
+        with CustomeralternateaddressesClient(self.server.url) as addresses:
+            with self.assertRaises(ValueError):
+                addresses.get_many([1])
+
+
+class TestAsyncGetMany(unittest.IsolatedAsyncioTestCase):
+    async def test_records_by_id(self):
+        with FakeMoloniServer() as server:
+            ids = [
+                record["document_id"]
+                for record in server.seed(
+                    "invoices", [{"number": i} for i in range(5)], company_id=5
+                )
+            ]
+            server.fail("invoices/getOne", payload=["2 document_id 0"])
+            async with AsyncInvoicesClient(server.url) as client:
+                result = await client.get_many(
+                    ids + ids, {"company_id": 5}, concurrency=1
+                )
+
+        self.assertEqual(list(result.records), ids[1:])
+        self.assertEqual(list(result.errors), ids[:1])
+        self.assertIsInstance(result.errors[ids[0]], ApiException)
+
+    async def test_error_status_is_an_error(self):
+        with FakeMoloniServer() as server:
+            ids = [
+                record["document_id"]
+                for record in server.seed(
+                    "invoices", [{"number": i} for i in range(2)], company_id=5
+                )
+            ]
+            server.fail("invoices/getOne", status=502, payload={"error": "fault"})
+            async with AsyncInvoicesClient(server.url) as client:
+                result = await client.get_many(ids, {"company_id": 5}, concurrency=1)
+
+        self.assertEqual(list(result.records), ids[1:])
+        self.assertEqual(result.errors[ids[0]].status_code, 502)
+
+
+if __name__ == "__main__":
+    unittest.main()
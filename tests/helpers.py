@@ -0,0 +1,18 @@
+import json
+from unittest.mock import Mock
+
+from requests import Response
+
+
+def make_response(payload=None, status_code=200, headers=None):
+    """
+    requests response of the API, as a client's session returns it
+    """
+    payload = payload if payload is not None else []
+    response = Mock(spec=Response)
+    response.json.return_value = payload
+    response.content = json.dumps(payload).encode()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.request = Mock(url="")
+    return response
@@ -0,0 +1,175 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from pydantic import ValidationError
+from requests.exceptions import ConnectionError, ConnectTimeout, ReadTimeout
+from urllib3.exceptions import MaxRetryError, NewConnectionError
+
+from moloni.api.products_client import ProductsClient, ProductsInsertModel
+from moloni.base import CircuitOpenError, DeadlineExceeded, Journal, JournaledExecutor
+from moloni.base.journal import DONE, FAILED, SENDING, UNKNOWN, item_key
+from moloni.testing import FakeMoloniServer
+
+
+class TestJournaledExecutor(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = FakeMoloniServer().start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def setUp(self):
+        self.server.store.clear()
+        self.server.requests.clear()
+        self.products = ProductsClient(self.server.url)
+        self.addCleanup(self.products.close)
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "products.journal")
+
+    def models(self, count):
+        return [
+            ProductsInsertModel(company_id=5, name=f"product {i}", reference=f"P{i}")
+            for i in range(count)
+        ]
+
+    def inserted(self):
+        return sorted(
+            record["reference"]
+            for record in self.server.store.get("products", {}).values()
+        )
+
+    def run_job(self, items, **kwargs):
+        with Journal(self.path, fsync=False) as journal:
+            return JournaledExecutor(
+                self.products, journal, concurrency=2, **kwargs
+            ).run(items)
+
+    def entries(self):
+        with open(self.path) as file:
+            return [json.loads(line) for line in file if line.strip()]
+
+    def test_entries_before_and_after_each_request(self):
+        summary = self.run_job(self.models(3))
+        self.assertEqual((summary.succeeded, summary.skipped), (3, 0))
+
+        entries = self.entries()
+        self.assertEqual(len(entries), 6)
+        for index in range(3):
+            states = [entry["state"] for entry in entries if entry["index"] == index]
+            self.assertEqual(states, [SENDING, DONE])
+        done = [entry for entry in entries if entry["state"] == DONE]
+        self.assertTrue(all("product_id" in entry["payload"] for entry in done))
+
+    def test_resume_skips_completed_items(self):
+        models = self.models(10)
+        self.run_job(iter(models[:6]))
+        self.server.requests.clear()
+
+        summary = self.run_job(models)
+
+        self.assertEqual((summary.succeeded, summary.skipped), (4, 6))
+        self.assertEqual(self.inserted(), sorted(f"P{i}" for i in range(10)))
+        sent = [name for name, _ in self.server.requests if name != "grant"]
+        self.assertEqual(sent, ["products/insert"] * 4)
+
+    def test_rejected_items_are_sent_again(self):
+        self.server.fail("products/insert", payload=["2 name 0"])
+        first = self.run_job(self.models(1))
+        self.assertEqual(first.failed, 1)
+        self.assertEqual(self.entries()[-1]["state"], FAILED)
+
+        second = self.run_job(self.models(1))
+        self.assertEqual((second.succeeded, second.skipped), (1, 0))
+
+    def test_errors_before_sending_are_failed(self):
+        refused = ConnectionError(
+            MaxRetryError(None, "/", NewConnectionError(None, "refused"))
+        )
+        read_timeout = ReadTimeout()
+        expired = DeadlineExceeded("Deadline exceeded")
+        expired.__cause__ = read_timeout
+        cases = [
+            (CircuitOpenError("products", 5), FAILED),
+            (ValidationError.from_exception_data("ProductsInsertModel", []), FAILED),
+            (DeadlineExceeded("Deadline exceeded"), FAILED),
+            (refused, FAILED),
+            (ConnectTimeout(), FAILED),
+            (read_timeout, UNKNOWN),
+            (expired, UNKNOWN),
+            (ConnectionError("Connection aborted"), UNKNOWN),
+        ]
+        directory = os.path.dirname(self.path)
+        for number, (error, state) in enumerate(cases):
+            with self.subTest(error=repr(error)):
+                self.path = os.path.join(directory, f"{number}.journal")
+                with patch.object(self.products, "insert", side_effect=error):
+                    summary = self.run_job(self.models(1))
+                self.assertEqual(summary.failed, 1)
+                self.assertEqual(self.entries()[-1]["state"], state)
+
+                # Only the items in doubt are held back on the next run
+                summary = self.run_job(self.models(1))
+                self.assertEqual(summary.succeeded, int(state == FAILED))
+                self.assertEqual(len(summary.in_doubt), int(state == UNKNOWN))
+
+    def test_error_statuses(self):
+        cases = [(503, UNKNOWN), (502, UNKNOWN), (400, FAILED)]
+        directory = os.path.dirname(self.path)
+        for status, state in cases:
+            with self.subTest(status=status):
+                self.path = os.path.join(directory, f"{status}.journal")
+                self.server.fail(
+                    "products/insert", status=status, payload={"error": "fault"}
+                )
+                summary = self.run_job(self.models(1))
+                self.assertEqual(summary.failed, 1)
+                self.assertEqual(self.entries()[-1]["state"], state)
+
+                # A write answered with a server error may have been applied, it is held back
+                summary = self.run_job(self.models(1))
+                self.assertEqual(summary.succeeded, int(state == FAILED))
+                self.assertEqual(len(summary.in_doubt), int(state == UNKNOWN))
+
+    def test_items_in_doubt(self):
+        model = self.models(1)[0]
+        key = item_key("insert", model)
+        with open(self.path, "w") as file:
+            # A crash after the request started, while writing its outcome
+            file.write(json.dumps({"key": key, "index": 0, "state": SENDING}) + "\n")
+            file.write('{"key": "' + key + '", "ind')
+
+        summary = self.run_job([model])
+        self.assertEqual((summary.total, summary.skipped), (0, 1))
+        self.assertEqual(summary.in_doubt, [(0, model)])
+
+        summary = self.run_job([model], resend_in_doubt=True)
+        self.assertEqual(summary.succeeded, 1)
+        # The line cut short is ended, the entries after it are readable
+        with Journal(self.path, fsync=False) as journal:
+            self.assertEqual(journal.states(), {key: DONE})
+        with open(self.path) as file:
+            self.assertEqual(len(file.readlines()), 4)
+
+    def test_repeated_items_are_sent_once(self):
+        summary = self.run_job(self.models(2) * 2)
+        self.assertEqual((summary.succeeded, summary.skipped), (2, 2))
+        self.assertEqual(self.inserted(), ["P0", "P1"])
+
+    def test_custom_key(self):
+        self.run_job(self.models(2), key=lambda model: model.reference)
+        renamed = [
+            ProductsInsertModel(company_id=5, name="renamed", reference=f"P{i}")
+            for i in range(3)
+        ]
+        summary = self.run_job(renamed, key=lambda model: model.reference)
+        self.assertEqual((summary.succeeded, summary.skipped), (1, 2))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+import subprocess
+import sys
+import unittest
+
+import moloni.api
+
+
+class TestLazyImports(unittest.TestCase):
+    def run_python(self, code):
+        return subprocess.run(
+            [sys.executable, "-c", code], check=True, capture_output=True, text=True
+        ).stdout.strip()
+
+    def test_package_import_loads_no_client_module(self):
+        loaded = self.run_python(
+            "import sys, moloni.api; "
+            "print(sorted(m for m in sys.modules if m.startswith('moloni.api.')))"
+        )
+        self.assertEqual(loaded, "[]")
+
+    def test_name_loads_only_its_module(self):
+        loaded = self.run_python(
+            "import sys; from moloni.api import CustomersClient; "
+            "print(sorted(m for m in sys.modules if m.startswith('moloni.api.')))"
+        )
+        # The endpoint table and the factory are shared by all the client modules
+        self.assertEqual(
+            loaded,
+            "['moloni.api._endpoints', 'moloni.api._factory', 'moloni.api.customers_client']",
+        )
+
+    def test_names_resolve_to_module_attributes(self):
+        from moloni.api import customers_client, invoices_client
+
+        self.assertIs(moloni.api.CustomersClient, customers_client.CustomersClient)
+        self.assertIs(moloni.api.InvoicesClientProductsModel, invoices_client.Products)
+
+    def test_unknown_name(self):
+        with self.assertRaises(AttributeError):
+            moloni.api.NotAClient
+
+        with self.assertRaises(ImportError):
+            from moloni.api import NotAClient  # noqa: F401
+
+    def test_dir_lists_public_names(self):
+        self.assertTrue(set(moloni.api.__all__) <= set(dir(moloni.api)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,246 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+
+from moloni.api.customers_client import CustomersClient
+from moloni.api.products_client import ProductsClient
+from moloni.base import LookupIndex, Mirror
+from moloni.testing import FakeMoloniServer
+
+OLD = "2020-01-01 00:00:00"
+
+
+class TestLookupIndex(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = FakeMoloniServer(page_size=4).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def setUp(self):
+        self.server.store.clear()
+        self.server.requests.clear()
+        self.seeded = self.server.seed(
+            "customers",
+            [
+                {
+                    "name": f"customer {i}",
+                    "vat": f"50000000{i}",
+                    "number": f"C{i}",
+                    "lastmodified": OLD,
+                }
+                for i in range(6)
+            ]
+            + [{"name": "consumer", "vat": "999999990", "lastmodified": OLD}],
+            company_id=5,
+        )
+        self.server.seed(
+            "customers", [{"name": "other", "vat": "500000001", "number": "C1"}], 6
+        )
+        self.customers = CustomersClient(self.server.url)
+        self.now = time.time()
+        self.index = LookupIndex(
+            self.customers,
+            company_id=5,
+            fields=("vat", "number"),
+            overlap=0,
+            clock=lambda: self.now,
+        )
+        self.addCleanup(self.index.close)
+
+    def sent(self):
+        # Listings count the records before paging through them
+        sent = [
+            name
+            for name, _ in self.server.requests
+            if name != "grant" and "/count" not in name
+        ]
+        self.server.requests.clear()
+        return sent
+
+    def test_load_and_lookup_without_requests(self):
+        self.assertEqual(self.index.load(), 7)
+        self.sent()
+
+        self.assertEqual(self.index.get("vat", "500000003")["name"], "customer 3")
+        self.assertEqual(self.index.get("number", "C1")["name"], "customer 1")
+        self.assertEqual(self.sent(), [])
+        self.assertEqual((self.index.hits, self.index.misses), (2, 0))
+
+    def test_shared_values(self):
+        self.index.load()
+        self.server.seed(
+            "customers", [{"name": "consumer 2", "vat": "999999990"}], company_id=5
+        )
+        self.index.refresh()
+        names = {record["name"] for record in self.index.find("vat", 999999990)}
+        self.assertEqual(names, {"consumer", "consumer 2"})
+
+    def test_miss_asks_the_live_endpoint(self):
+        record = self.index.get("vat", "500000002")
+        self.assertEqual(record["name"], "customer 2")
+        self.assertEqual(self.sent(), ["customers/getByVat"])
+
+        self.assertEqual(self.index.get("vat", "500000002"), record)
+        self.assertIsNone(self.index.get("vat", "123"))
+        self.assertEqual(self.sent(), ["customers/getByVat"])
+        self.assertEqual((self.index.hits, self.index.misses), (1, 2))
+
+    def test_writes_update_the_index(self):
+        self.index.load()
+        inserted = self.customers.insert(
+            {"company_id": 5, "name": "new", "vat": "511111111", "number": "N1"}
+        ).payload
+        first = self.seeded[0]["customer_id"]
+        self.customers.update(
+            {"company_id": 5, "customer_id": first, "vat": "522222222"}
+        )
+        self.customers.delete(
+            {"company_id": 5, "customer_id": self.seeded[1]["customer_id"]}
+        )
+        self.sent()
+
+        self.assertEqual(
+            self.index.get("number", "N1")["customer_id"], inserted["customer_id"]
+        )
+        updated = self.index.get("vat", "522222222")
+        self.assertEqual(
+            (updated["customer_id"], updated["name"]), (first, "customer 0")
+        )
+        self.assertEqual(self.sent(), [])
+
+        self.assertIsNone(self.index.get("vat", "500000000"))
+        self.assertIsNone(self.index.get("vat", "500000001"))
+        self.assertEqual(self.sent(), ["customers/getByVat", "customers/getByVat"])
+
+    def test_writes_of_other_companies_are_ignored(self):
+        self.index.load()
+        self.customers.insert({"company_id": 6, "name": "new", "vat": "533333333"})
+        self.assertNotIn("533333333", str(self.index.records))
+
+    def test_refresh_asks_for_changes(self):
+        self.index.load()
+        first = self.seeded[0]["customer_id"]
+        self.server.dispatch("customers/update", {"customer_id": first, "number": "X0"})
+        self.sent()
+
+        self.assertEqual(self.index.refresh(), 1)
+        self.assertEqual(self.sent(), ["customers/getModifiedSince"])
+        self.assertEqual(self.index.get("number", "X0")["customer_id"], first)
+        self.assertEqual(self.index.find("number", "C0"), [])
+
+    def test_lookups_are_served_while_listing(self):
+        self.index.load()
+        pages, found = [], []
+
+        def look_up(path, data, response):
+            # Runs on the listing thread, after each page arrives
+            if "/count" not in path:
+                pages.append(path)
+                thread = threading.Thread(
+                    target=lambda: found.append(self.index.get("vat", "500000003"))
+                )
+                thread.start()
+                thread.join(1)
+
+        self.customers.observers.append(look_up)
+        self.index.load()
+        self.server.dispatch(
+            "customers/update", {"customer_id": self.seeded[0]["customer_id"]}
+        )
+        self.index.refresh()
+
+        self.assertTrue(pages)
+        self.assertEqual(len(found), len(pages))
+        self.assertTrue(all(record["name"] == "customer 3" for record in found))
+
+    def test_close_stops_following_writes(self):
+        self.index.close()
+        self.assertEqual(self.customers.observers, [])
+
+    def test_field_without_endpoint(self):
+        with self.assertRaises(ValueError):
+            LookupIndex(self.customers, 5, fields=("ean",))
+        with self.assertRaises(ValueError):
+            self.index.find("name", "customer 1")
+
+    def test_products(self):
+        self.server.seed(
+            "products", [{"name": "pen", "ean": "560", "reference": "PEN"}], 5
+        )
+        with LookupIndex(
+            ProductsClient(self.server.url), 5, ("ean", "reference")
+        ) as products:
+            products.load()
+            self.assertEqual(products.get("reference", "PEN")["ean"], "560")
+            self.assertEqual(products.get("ean", 560)["name"], "pen")
+        # getAll of products needs a category_id, they are listed as modified since the epoch
+        self.assertNotIn("products/getAll", self.sent())
+
+
+class TestMirroredLookupIndex(TestLookupIndex):
+    def setUp(self):
+        super().setUp()
+        self.index.close()
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.mirror = Mirror(
+            os.path.join(directory.name, "mirror.sqlite"),
+            company_id=5,
+            overlap=0,
+            clock=lambda: self.now,
+        )
+        self.addCleanup(self.mirror.close)
+        self.index = LookupIndex(
+            self.customers,
+            company_id=5,
+            fields=("vat", "number"),
+            mirror=self.mirror,
+        )
+        self.addCleanup(self.index.close)
+
+    def test_refresh_asks_for_changes(self):
+        self.index.load()
+        first = self.seeded[0]["customer_id"]
+        self.server.dispatch("customers/update", {"customer_id": first, "number": "X0"})
+        self.sent()
+
+        self.index.refresh()
+        self.assertEqual(self.sent(), ["customers/getModifiedSince"])
+        self.assertEqual(self.index.get("number", "X0")["customer_id"], first)
+
+    def test_writes_are_kept_on_disk(self):
+        self.index.load()
+        inserted = self.customers.insert(
+            {"company_id": 5, "name": "new", "vat": "511111111"}
+        ).payload
+        deleted = self.seeded[1]["customer_id"]
+        self.customers.delete({"company_id": 5, "customer_id": deleted})
+
+        self.assertEqual(
+            self.mirror.get("customers", inserted["customer_id"])["name"], "new"
+        )
+        self.assertIsNone(self.mirror.get("customers", deleted))
+
+    def test_restart_loads_from_disk(self):
+        self.index.load()
+        self.index.close()
+        self.sent()
+
+        restarted = LookupIndex(
+            self.customers, 5, ("vat", "number"), mirror=self.mirror
+        )
+        self.addCleanup(restarted.close)
+        self.assertEqual(restarted.load(), 7)
+        self.assertEqual(
+            [name for name, _ in self.server.requests if name != "grant"],
+            ["customers/countModifiedSince"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
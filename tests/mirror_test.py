@@ -0,0 +1,170 @@
+import os
+import tempfile
+import time
+import unittest
+
+from moloni.api.countries_client import CountriesClient
+from moloni.api.currencies_client import CurrenciesClient
+from moloni.api.customeralternateaddresses_client import (
+    CustomeralternateaddressesClient,
+)
+from moloni.api.customers_client import CustomersClient
+from moloni.api.products_client import ProductsClient
+from moloni.base import Mirror
+from moloni.testing import FakeMoloniServer
+
+OLD = "2020-01-01 00:00:00"
+
+
+class TestMirror(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = FakeMoloniServer(page_size=4).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def setUp(self):
+        self.server.store.clear()
+        self.server.requests.clear()
+        self.seeded = self.server.seed(
+            "customers",
+            [
+                {"name": f"customer {i}", "vat": f"50000000{i}", "lastmodified": OLD}
+                for i in range(10)
+            ],
+            company_id=5,
+        )
+        self.server.seed(
+            "customers", [{"name": "other", "vat": "1", "lastmodified": OLD}], 6
+        )
+        self.server.seed(
+            "products", [{"name": "pen", "ean": "560", "lastmodified": OLD}], 5
+        )
+        self.customers = CustomersClient(self.server.url)
+        self.products = ProductsClient(self.server.url)
+        self.now = time.time()
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.mirror = Mirror(
+            os.path.join(directory.name, "mirror.sqlite"),
+            company_id=5,
+            clients=[self.customers, self.products],
+            overlap=0,
+            clock=lambda: self.now,
+        )
+        self.addCleanup(self.mirror.close)
+
+    def sent(self):
+        sent = [name for name, _ in self.server.requests if name != "grant"]
+        self.server.requests.clear()
+        return sent
+
+    def test_first_sync_lists_everything(self):
+        result = self.mirror.sync()
+        self.assertEqual(
+            result,
+            {
+                "customers": {"stored": 10, "deleted": 0, "full": True},
+                "products": {"stored": 1, "deleted": 0, "full": True},
+            },
+        )
+        self.assertEqual(self.mirror.count("customers"), 10)
+        self.assertEqual(self.mirror.find("products", ean=560)[0]["name"], "pen")
+        # getAll of products needs a category_id, every family is listed as modified since the epoch
+        sent = self.server.requests
+        self.assertFalse([name for name, _ in sent if name.endswith("/getAll")])
+        self.assertIn(
+            ("products/getModifiedSince", "1970-01-01 00:00:00"),
+            [(name, form.get("lastmodified")) for name, form in sent],
+        )
+
+    def test_incremental_sync(self):
+        self.mirror.sync("customers")
+        inserted = self.customers.insert({"company_id": 5, "name": "new"}).payload
+        first = self.seeded[0]["customer_id"]
+        self.customers.update(
+            {"company_id": 5, "customer_id": first, "name": "renamed"}
+        )
+        self.sent()
+
+        result = self.mirror.sync("customers")
+
+        self.assertEqual(
+            result["customers"], {"stored": 2, "deleted": 0, "full": False}
+        )
+        self.assertIn("customers/getModifiedSince", self.sent())
+        self.assertEqual(self.mirror.get("customers", first)["name"], "renamed")
+        self.assertEqual(
+            self.mirror.get("customers", inserted["customer_id"])["name"], "new"
+        )
+        self.assertEqual(self.mirror.count("customers"), 11)
+
+    def test_reconciliation_drops_deleted_records(self):
+        self.mirror.sync("customers")
+        deleted = self.seeded[1]["customer_id"]
+        self.customers.delete({"company_id": 5, "customer_id": deleted})
+
+        self.assertEqual(self.mirror.sync("customers")["customers"]["deleted"], 0)
+        self.assertIsNotNone(self.mirror.get("customers", deleted))
+
+        self.now += self.mirror.reconcile_every
+        result = self.mirror.sync("customers")["customers"]
+        self.assertEqual((result["full"], result["deleted"]), (True, 1))
+        self.assertIsNone(self.mirror.get("customers", deleted))
+        self.assertEqual(self.mirror.status()["customers"]["reconciled_at"], self.now)
+
+    def test_companies_are_separate(self):
+        self.mirror.sync("customers")
+        other = Mirror(self.mirror.path, company_id=6, clients=[self.customers])
+        self.addCleanup(other.close)
+        self.assertEqual(other.count("customers"), 0)
+        other.sync()
+        self.assertEqual(other.find("customers", vat="1")[0]["name"], "other")
+        self.assertEqual(self.mirror.count("customers"), 10)
+
+    def test_families_without_company(self):
+        country = {"country_id": 1, "name": "Portugal"}
+        self.server.seed("countries", [country])
+        countries = CountriesClient(self.server.url)
+        self.mirror.add(countries, id_field="country_id")
+        self.mirror.sync("countries")
+        self.assertEqual(
+            self.mirror.get("countries", country["country_id"])["name"], "Portugal"
+        )
+
+    def test_indexed_lookup(self):
+        self.mirror.sync()
+        self.mirror.index("customers", "vat")
+        plan = self.mirror._connection.execute(
+            "EXPLAIN QUERY PLAN SELECT data FROM moloni_records WHERE "
+            + self.mirror._where("customers", {"vat": "500000003"})[0],
+            self.mirror._where("customers", {"vat": "500000003"})[1],
+        ).fetchall()
+        self.assertIn("moloni_records_vat", str(plan))
+        self.assertEqual(
+            self.mirror.find("customers", vat="500000003")[0]["name"], "customer 3"
+        )
+
+    def test_invalid_field(self):
+        with self.assertRaises(ValueError):
+            self.mirror.find("customers", **{"vat') OR 1=1 --": 1})
+
+    def test_id_field_named_after_family_without_delete_endpoint(self):
+        self.server.seed("currencies", [{"currency_id": 2, "symbol": "€"}])
+        self.mirror.add(CountriesClient(self.server.url))
+        self.assertEqual(
+            self.mirror.add(CurrenciesClient(self.server.url)), "currencies"
+        )
+        self.mirror.sync("currencies")
+        self.assertEqual(self.mirror.get("currencies", 2)["symbol"], "€")
+        self.assertEqual(self.mirror.families["countries"][1], "country_id")
+
+    def test_id_field_is_required_when_ambiguous(self):
+        with self.assertRaises(ValueError):
+            self.mirror.add(CustomeralternateaddressesClient(self.server.url))
+
+
+if __name__ == "__main__":
+    unittest.main()
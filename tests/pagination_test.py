@@ -0,0 +1,273 @@
+import asyncio
+import time
+import unittest
+from unittest.mock import patch
+
+import moloni.api
+from moloni.api.customers_client import (
+    AsyncCustomersClient,
+    CustomersClient,
+    CustomersGetAllModel,
+    CustomersGetBySearchModel,
+)
+from moloni.api.taxes_client import TaxesClient
+from moloni.base import ApiResponse
+from moloni.base.pagination import (
+    count_method_name,
+    page_size_for,
+    resolve_method_name,
+)
+from moloni.testing import FakeMoloniServer
+from tests.helpers import make_response
+
+RECORDS = [{"customer_id": i} for i in range(7)]
+
+
+def api_response(payload, data):
+    return ApiResponse(make_response(payload), data)
+
+
+class FakeCustomers:
+    def __init__(self, records):
+        self.records = records
+        self.calls = []
+
+    def __call__(self, path, data=None, **kwargs):
+        self.calls.append(path.rsplit("/", 2)[-2])
+        if "count" in path:
+            return api_response({"count": len(self.records)}, data)
+        if "qty" not in data:
+            return api_response(self.records, data)
+        offset, qty = int(data["offset"]), int(data["qty"])
+        return api_response(self.records[offset : offset + qty], data)
+
+
+class TestIterAll(unittest.TestCase):
+    def test_request_models_resolve_to_their_method(self):
+        for name in moloni.api.__all__:
+            if name.endswith("Client") and not name.startswith("Async"):
+                client_class = getattr(moloni.api, name)
+                module = __import__(client_class.__module__, fromlist=["*"])
+                for model in vars(module).values():
+                    if (
+                        isinstance(model, type)
+                        and issubclass(model, module.ApiRequestModel)
+                        and model is not module.ApiRequestModel
+                    ):
+                        method = resolve_method_name(
+                            client_class.__new__(client_class),
+                            model.model_construct(),
+                        )
+                        self.assertTrue(
+                            hasattr(client_class, method),
+                            f"{model.__name__} -> {method}",
+                        )
+
+    def test_count_method_name(self):
+        self.assertEqual(count_method_name("get_all"), "count")
+        self.assertEqual(count_method_name("get_by_vat"), "count_by_vat")
+        self.assertIsNone(count_method_name("insert"))
+
+    def test_iter_all_with_count_skips_trailing_request(self):
+        fake = FakeCustomers(RECORDS[:6])
+        client = CustomersClient()
+        with patch.object(CustomersClient, "_request", side_effect=fake):
+            records = list(client.iter_all(CustomersGetAllModel(company_id=5), 3))
+
+        self.assertEqual(records, RECORDS[:6])
+        self.assertEqual(fake.calls, ["count", "getAll", "getAll"])
+
+    def test_iter_all_stops_on_short_page(self):
+        fake = FakeCustomers(RECORDS)
+        client = CustomersClient()
+        with patch.object(CustomersClient, "_request", side_effect=fake):
+            records = list(
+                client.iter_all(
+                    CustomersGetBySearchModel(company_id=5, search="a", qty=3)
+                )
+            )
+
+        self.assertEqual(records, RECORDS)
+        self.assertEqual(
+            fake.calls, ["countBySearch", "getBySearch"] + ["getBySearch"] * 2
+        )
+
+    def test_iter_all_without_count_endpoint(self):
+        fake = FakeCustomers(RECORDS)
+        client = TaxesClient()
+        with patch.object(TaxesClient, "_request", side_effect=fake):
+            records = list(
+                client.iter_all({"company_id": 5}, page_size=3, method="get_all")
+            )
+
+        # TaxesGetAllModel has no offset/qty, everything comes in one response
+        self.assertEqual(records, RECORDS)
+        self.assertEqual(fake.calls, ["getAll"])
+
+    def test_iter_all_is_lazy(self):
+        fake = FakeCustomers(RECORDS)
+        client = CustomersClient()
+        with patch.object(CustomersClient, "_request", side_effect=fake):
+            records = client.iter_all({"company_id": 5, "offset": 2}, 2, "get_all")
+            self.assertEqual(fake.calls, [])
+            self.assertEqual(next(records), RECORDS[2])
+            self.assertEqual(fake.calls, ["count", "getAll"])
+
+    def test_page_size_is_capped(self):
+        self.assertEqual(page_size_for(None, None), 50)
+        self.assertEqual(page_size_for(None, 10), 10)
+        self.assertEqual(page_size_for(100, 10), 50)
+
+    def test_iter_all_dict_requires_method(self):
+        with self.assertRaises(ValueError):
+            list(CustomersClient().iter_all({"company_id": 5}))
+
+
+class TestCappedPages(unittest.TestCase):
+    """
+    The API returns fewer records than `qty` asks for
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = FakeMoloniServer(max_page_size=50).start()
+        cls.server.seed(
+            "customers", [{"name": str(i)} for i in range(230)], company_id=5
+        )
+        cls.client = CustomersClient(cls.server.url)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.client.close()
+        cls.server.stop()
+
+    def names(self, records):
+        return [record["name"] for record in records]
+
+    def test_iter_all(self):
+        records = self.client.iter_all({"company_id": 5}, 100, "get_all")
+        self.assertEqual(self.names(records), [str(i) for i in range(230)])
+
+    def test_iter_all_below_the_requested_page_size(self):
+        self.server.max_page_size = 7
+        self.addCleanup(setattr, self.server, "max_page_size", 50)
+        records = self.client.iter_all({"company_id": 5, "offset": 5}, 10, "get_all")
+        self.assertEqual(self.names(records), [str(i) for i in range(5, 230)])
+
+    def test_fetch_all(self):
+        records = self.client.fetch_all({"company_id": 5}, 100, "get_all")
+        self.assertEqual(self.names(records), [str(i) for i in range(230)])
+
+    def test_fetch_all_below_the_requested_page_size(self):
+        self.server.max_page_size = 7
+        self.addCleanup(setattr, self.server, "max_page_size", 50)
+        records = self.client.fetch_all(
+            {"company_id": 5, "offset": 5}, 10, "get_all", max_workers=4
+        )
+        self.assertEqual(self.names(records), [str(i) for i in range(5, 230)])
+
+
+class TestFetchAll(unittest.TestCase):
+    def test_fetch_all_keeps_page_order(self):
+        records = [{"customer_id": i} for i in range(95)]
+        fake = FakeCustomers(records)
+
+        def slow_request(path, data=None, **kwargs):
+            # later pages answer first
+            if "offset" in data:
+                time.sleep((100 - int(data["offset"])) / 5000)
+            return fake(path, data)
+
+        client = CustomersClient()
+        with patch.object(CustomersClient, "_request", side_effect=slow_request):
+            result = client.fetch_all(
+                CustomersGetAllModel(company_id=5), page_size=10, max_workers=4
+            )
+
+        self.assertEqual(result, records)
+        self.assertEqual(fake.calls.count("count"), 1)
+        self.assertEqual(fake.calls.count("getAll"), 10)
+
+    def test_fetch_all_starts_at_offset(self):
+        fake = FakeCustomers(RECORDS)
+        client = CustomersClient()
+        with patch.object(CustomersClient, "_request", side_effect=fake):
+            result = client.fetch_all(
+                {"company_id": 5, "offset": 3}, page_size=2, method="get_all"
+            )
+
+        self.assertEqual(result, RECORDS[3:])
+        self.assertEqual(fake.calls, ["count"] + ["getAll"] * 2)
+
+    def test_fetch_all_without_count_endpoint(self):
+        fake = FakeCustomers(RECORDS)
+        client = TaxesClient()
+        with patch.object(TaxesClient, "_request", side_effect=fake):
+            result = client.fetch_all({"company_id": 5}, method="get_all")
+
+        self.assertEqual(result, RECORDS)
+        self.assertEqual(fake.calls, ["getAll"])
+
+
+class TestAsyncIterAll(unittest.IsolatedAsyncioTestCase):
+    async def test_iter_all(self):
+        fake = FakeCustomers(RECORDS)
+
+        async def request(path, data=None, **kwargs):
+            return fake(path, data)
+
+        client = AsyncCustomersClient(session=object())
+        with patch.object(AsyncCustomersClient, "_request", side_effect=request):
+            records = [
+                record
+                async for record in client.iter_all(
+                    CustomersGetAllModel(company_id=5), page_size=4
+                )
+            ]
+
+        self.assertEqual(records, RECORDS)
+        self.assertEqual(fake.calls, ["count", "getAll", "getAll"])
+
+    async def test_iter_all_capped_pages(self):
+        with FakeMoloniServer(max_page_size=50) as server:
+            server.seed("customers", [{"name": str(i)} for i in range(120)], 5)
+            async with AsyncCustomersClient(server.url) as client:
+                records = [
+                    record
+                    async for record in client.iter_all(
+                        {"company_id": 5}, 100, "get_all"
+                    )
+                ]
+        self.assertEqual(len(records), 120)
+
+    async def test_fetch_all_capped_pages(self):
+        with FakeMoloniServer(max_page_size=7) as server:
+            server.seed("customers", [{"name": str(i)} for i in range(120)], 5)
+            async with AsyncCustomersClient(server.url) as client:
+                records = await client.fetch_all({"company_id": 5}, 10, "get_all")
+        self.assertEqual([r["name"] for r in records], [str(i) for i in range(120)])
+
+    async def test_fetch_all(self):
+        records = [{"customer_id": i} for i in range(42)]
+        fake = FakeCustomers(records)
+        running = []
+
+        async def request(path, data=None, **kwargs):
+            running.append(path)
+            self.assertLessEqual(len(running), 3)
+            await asyncio.sleep(0.001)
+            running.remove(path)
+            return fake(path, data)
+
+        client = AsyncCustomersClient(session=object())
+        with patch.object(AsyncCustomersClient, "_request", side_effect=request):
+            result = await client.fetch_all(
+                CustomersGetAllModel(company_id=5), page_size=5, max_workers=3
+            )
+
+        self.assertEqual(result, records)
+        self.assertEqual(fake.calls.count("getAll"), 9)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,137 @@
+import asyncio
+import unittest
+from unittest.mock import patch, Mock
+
+from moloni.api.customers_client import AsyncCustomersClient, CustomersClient
+from moloni.api.products_client import ProductsClient
+from moloni.base import (
+    ApiResponse,
+    DeadlineExceeded,
+    RateLimitConfig,
+    RateLimiter,
+    deadline,
+)
+from moloni.base.rate_limit import TokenBucket
+from tests.helpers import make_response
+
+
+class TestTokenBucket(unittest.TestCase):
+    def test_burst_then_paced(self):
+        with patch("moloni.base.rate_limit.time.monotonic", return_value=100.0):
+            bucket = TokenBucket(rate=2, capacity=3)
+            waits = [bucket.reserve() for _ in range(5)]
+        self.assertEqual(waits, [0, 0, 0, 0.5, 1.0])
+
+    def test_refills_over_time(self):
+        with patch("moloni.base.rate_limit.time.monotonic") as monotonic:
+            monotonic.return_value = 100.0
+            bucket = TokenBucket(rate=2, capacity=1)
+            self.assertEqual(bucket.reserve(), 0)
+            monotonic.return_value = 100.5
+            self.assertEqual(bucket.reserve(), 0)
+            monotonic.return_value = 110.0
+            # refill is capped at the capacity
+            self.assertEqual([bucket.reserve(), bucket.reserve()], [0, 0.5])
+
+
+class TestRateLimiter(unittest.TestCase):
+    def test_budgets_per_credential_and_company(self):
+        limiter = RateLimiter(
+            RateLimitConfig(
+                requests_per_second=10,
+                burst=3,
+                company_requests_per_second=1,
+                company_burst=1,
+            )
+        )
+        self.assertEqual(limiter.reserve("a", 5), 0)
+        self.assertGreater(limiter.reserve("a", 5), 0)  # company 5 is exhausted
+        self.assertEqual(limiter.reserve("a", 6), 0)
+        self.assertGreater(limiter.reserve("a", 7), 0)  # credential "a" is exhausted
+        self.assertEqual(limiter.reserve("b", 5), 0)
+
+        metrics = limiter.metrics()
+        self.assertEqual(metrics["requests"], 5)
+        self.assertEqual(metrics["delayed"], 2)
+        self.assertGreater(metrics["wait_seconds"], 0)
+
+    @patch("moloni.base.rate_limit.time.sleep")
+    def test_acquire_sleeps(self, mock_sleep):
+        limiter = RateLimiter(RateLimitConfig(requests_per_second=1, burst=1))
+        limiter.acquire("a")
+        mock_sleep.assert_not_called()
+        limiter.acquire("a")
+        mock_sleep.assert_called_once()
+
+    @patch("moloni.base.rate_limit.time.sleep")
+    def test_wait_past_deadline_gives_tokens_back(self, mock_sleep):
+        limiter = RateLimiter(
+            RateLimitConfig(
+                requests_per_second=0.1,
+                burst=1,
+                company_requests_per_second=0.1,
+                company_burst=1,
+            )
+        )
+        with patch("moloni.base.rate_limit.time.monotonic", return_value=100.0):
+            limiter.acquire("a", 5)
+            with deadline(1), self.assertRaises(DeadlineExceeded):
+                limiter.acquire("a", 5)
+            mock_sleep.assert_not_called()
+            # Only the request that was sent used up budget
+            self.assertEqual(limiter.reserve("a", 5), 10.0)
+        self.assertEqual(
+            limiter.metrics(), {"requests": 2, "delayed": 1, "wait_seconds": 10.0}
+        )
+
+    def test_clients_share_budget(self):
+        limiter = RateLimiter(RateLimitConfig(requests_per_second=1, burst=2))
+        customers = CustomersClient(rate_limiter=limiter)
+        products = ProductsClient(rate_limiter=limiter)
+        response = make_response()
+
+        for client in (customers, products):
+            client.auth = Mock(return_value="token", cache_key="credential")
+            client.session.request = Mock(return_value=response)
+
+        with patch("moloni.base.rate_limit.time.sleep") as mock_sleep:
+            customers.get_all({"company_id": 5})
+            products.get_all({"company_id": 5})
+            mock_sleep.assert_not_called()
+            products.get_all({"company_id": 5})
+            mock_sleep.assert_called_once()
+
+        self.assertEqual(limiter.metrics()["requests"], 3)
+
+
+class TestAsyncRateLimiter(unittest.IsolatedAsyncioTestCase):
+    async def test_acquire_async(self):
+        limiter = RateLimiter(RateLimitConfig(requests_per_second=1, burst=1))
+        with patch("moloni.base.rate_limit.asyncio.sleep") as mock_sleep:
+            await limiter.acquire_async("a")
+            mock_sleep.assert_not_called()
+            await limiter.acquire_async("a")
+            mock_sleep.assert_awaited_once()
+
+    async def test_async_client_is_paced(self):
+        limiter = RateLimiter(RateLimitConfig(requests_per_second=1000, burst=1))
+        client = AsyncCustomersClient(session=Mock(), rate_limiter=limiter)
+        client.auth = Mock(cache_key="credential")
+        client.auth.side_effect = lambda: asyncio.sleep(0, "token")
+
+        response = make_response()
+
+        async def request(**kwargs):
+            return response
+
+        client.session.request = request
+        responses = await asyncio.gather(
+            *[client.get_all({"company_id": 5}) for _ in range(3)]
+        )
+
+        self.assertTrue(all(isinstance(r, ApiResponse) for r in responses))
+        self.assertEqual(limiter.metrics()["delayed"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,147 @@
+import unittest
+from unittest.mock import Mock
+
+import httpx
+
+from moloni.api.countries_client import AsyncCountriesClient, CountriesClient
+from moloni.api.paymentmethods_client import PaymentmethodsClient
+from moloni.api.taxes_client import TaxesClient
+from moloni.base import ApiException, ResponseCache, ResponseCacheConfig
+from tests.helpers import make_response
+
+
+class TestResponseCache(unittest.TestCase):
+    def make_client(self, client_class, cache, *responses):
+        client = client_class(response_cache=cache)
+        client.auth = Mock(return_value="token", cache_key="credential")
+        client.session.request = Mock(side_effect=responses)
+        return client
+
+    def test_reference_data_is_cached(self):
+        cache = ResponseCache()
+        client = self.make_client(
+            CountriesClient, cache, make_response([{"country_id": 1}])
+        )
+        first = client.get_all()
+        self.assertIs(client.get_all(), first)
+        self.assertEqual(client.session.request.call_count, 1)
+        self.assertEqual(cache.metrics()["hits"], 1)
+        self.assertEqual(cache.metrics()["size"]["countries"], 1)
+
+    def test_other_families_are_not_cached(self):
+        client = self.make_client(
+            TaxesClient, ResponseCache(), make_response(), make_response()
+        )
+        client.get_all({"company_id": 5})
+        client.get_all({"company_id": 5})
+        self.assertEqual(client.session.request.call_count, 2)
+
+    def test_key_includes_data(self):
+        client = self.make_client(
+            PaymentmethodsClient, ResponseCache(), make_response(), make_response()
+        )
+        client.get_all({"company_id": 5})
+        client.get_all({"company_id": 6})
+        client.get_all({"company_id": 5})
+        self.assertEqual(client.session.request.call_count, 2)
+
+    def test_ttl(self):
+        now = Mock(return_value=0)
+        cache = ResponseCache(ResponseCacheConfig(ttls={"countries": 60}), timer=now)
+        client = self.make_client(
+            CountriesClient, cache, *[make_response() for _ in range(3)]
+        )
+        client.get_all()
+        now.return_value = 59
+        client.get_all()
+        now.return_value = 61
+        client.get_all()
+        self.assertEqual(client.session.request.call_count, 2)
+
+    def test_lru_size_limit(self):
+        cache = ResponseCache(ResponseCacheConfig(maxsize=1))
+        client = self.make_client(
+            PaymentmethodsClient, cache, *[make_response() for _ in range(3)]
+        )
+        client.get_all({"company_id": 5})
+        client.get_all({"company_id": 6})
+        client.get_all({"company_id": 5})
+        self.assertEqual(client.session.request.call_count, 3)
+
+    def test_successful_write_invalidates_family(self):
+        cache = ResponseCache()
+        client = self.make_client(
+            PaymentmethodsClient,
+            cache,
+            make_response(),
+            make_response({"valid": 1, "payment_method_id": 2}),
+            make_response(),
+        )
+        client.get_all({"company_id": 5})
+        client.insert({"company_id": 5, "name": "MB Way"})
+        client.get_all({"company_id": 5})
+        self.assertEqual(client.session.request.call_count, 3)
+
+    def test_failed_write_keeps_cache(self):
+        cache = ResponseCache()
+        client = self.make_client(
+            PaymentmethodsClient,
+            cache,
+            make_response(),
+            make_response(["2 name 0"]),
+        )
+        client.get_all({"company_id": 5})
+        with self.assertRaises(ApiException):
+            client.insert({"company_id": 5, "name": ""})
+        client.get_all({"company_id": 5})
+        self.assertEqual(client.session.request.call_count, 2)
+
+    def test_failed_read_is_not_cached(self):
+        cache = ResponseCache()
+        client = self.make_client(
+            CountriesClient,
+            cache,
+            make_response({"error": "fault"}, status_code=503),
+            make_response([{"country_id": 1}]),
+        )
+        self.assertEqual(client.get_all().status_code, 503)
+        self.assertEqual(client.get_all().payload, [{"country_id": 1}])
+        self.assertEqual(client.session.request.call_count, 2)
+        self.assertEqual(cache.metrics()["size"]["countries"], 1)
+
+    def test_explicit_invalidation(self):
+        cache = ResponseCache()
+        client = self.make_client(
+            CountriesClient, cache, make_response(), make_response()
+        )
+        client.get_all()
+        cache.invalidate("countries")
+        client.get_all()
+        self.assertEqual(client.session.request.call_count, 2)
+
+
+class TestAsyncResponseCache(unittest.IsolatedAsyncioTestCase):
+    async def test_reference_data_is_cached(self):
+        sent = []
+
+        def handler(request):
+            sent.append(request)
+            return httpx.Response(200, json=[{"country_id": 1}])
+
+        client = AsyncCountriesClient(
+            session=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+            response_cache=ResponseCache(),
+        )
+
+        async def auth():
+            return "token"
+
+        client.auth = Mock(side_effect=auth, cache_key="credential")
+        first = await client.get_all()
+        self.assertIs(await client.get_all(), first)
+        self.assertEqual(len(sent), 1)
+        await client.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
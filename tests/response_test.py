@@ -0,0 +1,70 @@
+import json
+import unittest
+from unittest.mock import patch
+
+from requests import Response
+
+from moloni.base import ApiException, ApiResponse
+from moloni.base import json_backend
+from moloni.base.helpers import ApiResponseValidator
+
+
+def make_response(payload, raw=None):
+    response = Response()
+    response.status_code = 200
+    response._content = raw if raw is not None else json.dumps(payload).encode()
+    return response
+
+
+class TestApiResponseValidator(unittest.TestCase):
+    def test_body_is_decoded_once(self):
+        response = make_response([{"customer_id": 1}])
+        with patch.object(
+            json_backend, "loads", wraps=json_backend.loads
+        ) as mock_loads, patch.object(Response, "json") as mock_json:
+            result = ApiResponseValidator(response, {"qty": 1}).validate()
+
+        mock_loads.assert_called_once()
+        mock_json.assert_not_called()
+        self.assertEqual(result.payload, [{"customer_id": 1}])
+        self.assertTrue(result.has_more)
+
+    def test_error_response(self):
+        response = make_response(["2 company_id", "1 name"])
+        with self.assertRaises(ApiException) as context:
+            ApiResponseValidator(response, {"company_id": 0}).validate()
+        self.assertEqual(context.exception.error, ["2 company_id", "1 name"])
+
+    def test_strings_without_error_pattern(self):
+        response = make_response(["Portugal", "Spain"])
+        result = ApiResponseValidator(response, {}).validate()
+        self.assertEqual(result.payload, ["Portugal", "Spain"])
+
+    def test_empty_and_non_list_payloads(self):
+        self.assertEqual(
+            ApiResponseValidator(make_response([]), {}).validate().payload, []
+        )
+        self.assertFalse(ApiResponseValidator(make_response(5), {}).is_error_response())
+        self.assertEqual(
+            ApiResponseValidator(make_response({"count": 3}), {}).validate().payload,
+            {"count": 3},
+        )
+
+    def test_non_utf8_body_falls_back_to_response_json(self):
+        response = make_response(None, raw='["caf\xe9"]'.encode("latin-1"))
+        response.encoding = "latin-1"
+        self.assertEqual(
+            ApiResponseValidator(response, {}).validate().payload, ["café"]
+        )
+
+    def test_invalid_body_raises(self):
+        with self.assertRaises(ValueError):
+            ApiResponseValidator(make_response(None, raw=b"<html>"), {})
+
+    def test_api_response_still_decodes_without_payload(self):
+        response = make_response([1, 2])
+        self.assertEqual(ApiResponse(response, {}).payload, [1, 2])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,155 @@
+import unittest
+from unittest.mock import patch, Mock
+
+import httpx
+from requests.exceptions import ConnectionError, ConnectTimeout, ReadTimeout
+from urllib3.exceptions import MaxRetryError, NewConnectionError
+
+from moloni.api.customers_client import AsyncCustomersClient, CustomersClient
+from moloni.base import RetryPolicy
+from moloni.base.client import request_was_sent
+from moloni.base.retry import is_idempotent, parse_retry_after
+from tests.helpers import make_response
+
+
+class TestRetryPolicy(unittest.TestCase):
+    def setUp(self):
+        self.policy = RetryPolicy(jitter=False, backoff_factor=1, backoff_max=3)
+
+    def test_idempotency_classification(self):
+        self.assertTrue(is_idempotent("/v1/invoices/getAll/"))
+        self.assertTrue(is_idempotent("/v1/customers/countModifiedSince/"))
+        self.assertFalse(is_idempotent("/v1/invoices/insert/"))
+        self.assertFalse(is_idempotent("/v1/waybills/setTransportCode/"))
+
+    def test_backoff(self):
+        self.assertEqual([self.policy.backoff(n) for n in (1, 2, 3, 4)], [1, 2, 3, 3])
+        jittered = RetryPolicy(backoff_factor=1).backoff(3)
+        self.assertTrue(0 <= jittered <= 4)
+
+    def test_reads_are_retried(self):
+        self.assertEqual(self.policy.delay("/v1/invoices/getAll/", 1, 503), 1)
+        self.assertEqual(self.policy.delay("/v1/invoices/getAll/", 2), 2)
+        self.assertIsNone(self.policy.delay("/v1/invoices/getAll/", 3, 503))
+        self.assertIsNone(self.policy.delay("/v1/invoices/getAll/", 1, 200))
+        self.assertIsNone(self.policy.delay("/v1/invoices/getAll/", 1, 400))
+
+    def test_writes_are_only_retried_when_safe(self):
+        path = "/v1/invoices/insert/"
+        self.assertIsNone(self.policy.delay(path, 1, 503))
+        self.assertIsNone(self.policy.delay(path, 1))
+        self.assertEqual(self.policy.delay(path, 1, sent=False), 1)
+        self.assertEqual(self.policy.delay(path, 1, 429), 1)
+        self.assertEqual(
+            RetryPolicy(jitter=False, retry_writes=True).delay(path, 1, 503), 0.5
+        )
+
+    def test_retry_after(self):
+        self.assertEqual(parse_retry_after({"Retry-After": "7"}), 7)
+        self.assertIsNone(parse_retry_after({}))
+        self.assertEqual(
+            parse_retry_after({"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}), 0
+        )
+        self.assertEqual(
+            self.policy.delay("/v1/taxes/getAll/", 1, 429, {"Retry-After": "10"}), 10
+        )
+
+    def test_overrides(self):
+        policy = RetryPolicy(
+            overrides={
+                "invoices/insert": RetryPolicy(retry_writes=True),
+                "*/getAll": RetryPolicy(max_attempts=1),
+            }
+        )
+        self.assertTrue(policy.for_path("/v1/invoices/insert/").retry_writes)
+        self.assertEqual(policy.for_path("/v1/products/getAll/").max_attempts, 1)
+        self.assertIs(policy.for_path("/v1/products/getOne/"), policy)
+
+    def test_request_was_sent(self):
+        refused = ConnectionError(
+            MaxRetryError(None, "/", NewConnectionError(None, "refused"))
+        )
+        self.assertFalse(request_was_sent(refused))
+        self.assertFalse(request_was_sent(ConnectTimeout()))
+        self.assertTrue(request_was_sent(ConnectionError("reset")))
+        self.assertTrue(request_was_sent(ReadTimeout()))
+
+
+@patch("moloni.base.client.time.sleep")
+class TestClientRetries(unittest.TestCase):
+    def make_client(self, *responses, **policy):
+        client = CustomersClient(retry_policy=RetryPolicy(jitter=False, **policy))
+        client.auth = Mock(return_value="token", cache_key="credential")
+        client.session.request = Mock(side_effect=responses)
+        return client
+
+    def test_retries_read_until_success(self, mock_sleep):
+        client = self.make_client(
+            make_response(status_code=503),
+            ReadTimeout(),
+            make_response([{"customer_id": 1}]),
+        )
+        response = client.get_all({"company_id": 5})
+
+        self.assertEqual(response.payload, [{"customer_id": 1}])
+        self.assertEqual(client.session.request.call_count, 3)
+        self.assertEqual([c.args[0] for c in mock_sleep.call_args_list], [0.5, 1.0])
+
+    def test_gives_up_after_max_attempts(self, mock_sleep):
+        client = self.make_client(ReadTimeout(), ReadTimeout(), max_attempts=2)
+        with self.assertRaises(ReadTimeout):
+            client.get_all({"company_id": 5})
+        self.assertEqual(client.session.request.call_count, 2)
+
+    def test_write_is_not_resent(self, mock_sleep):
+        client = self.make_client(ConnectionError("reset"), make_response())
+        with self.assertRaises(ConnectionError):
+            client.insert({"company_id": 5, "name": "name"})
+        mock_sleep.assert_not_called()
+
+    def test_throttled_write_is_resent(self, mock_sleep):
+        client = self.make_client(
+            make_response(status_code=429, headers={"Retry-After": "2"}),
+            make_response(),
+        )
+        client.insert({"company_id": 5, "name": "name"})
+        mock_sleep.assert_called_once_with(2.0)
+
+    def test_without_policy(self, mock_sleep):
+        client = CustomersClient()
+        client.auth = Mock(return_value="token", cache_key="credential")
+        client.session.request = Mock(side_effect=[ReadTimeout(), make_response()])
+        with self.assertRaises(ReadTimeout):
+            client.get_all({"company_id": 5})
+
+
+class TestAsyncClientRetries(unittest.IsolatedAsyncioTestCase):
+    async def test_retries(self):
+        attempts = []
+
+        def handler(request):
+            attempts.append(request)
+            if len(attempts) == 1:
+                raise httpx.ConnectError("refused")
+            if len(attempts) == 2:
+                return httpx.Response(502, json=[])
+            return httpx.Response(200, json=[{"customer_id": 1}])
+
+        client = AsyncCustomersClient(
+            session=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+            retry_policy=RetryPolicy(backoff_factor=0),
+        )
+
+        async def auth():
+            return "token"
+
+        client.auth = Mock(side_effect=auth, cache_key="credential")
+        response = await client.insert({"company_id": 5, "name": "name"})
+        # the connection error is retried, the 502 on a write is not
+        self.assertEqual(len(attempts), 2)
+        self.assertEqual(response.status_code, 502)
+        await client.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
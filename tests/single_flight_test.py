@@ -0,0 +1,119 @@
+import asyncio
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+
+import httpx
+from requests.exceptions import ConnectionError
+
+from moloni.api.taxes_client import AsyncTaxesClient, TaxesClient
+from moloni.base import DeadlineExceeded, SingleFlight, deadline
+from tests.helpers import make_response
+
+
+class TestSingleFlight(unittest.TestCase):
+    def setUp(self):
+        self.flights = SingleFlight()
+        self.release = threading.Event()
+        self.sent = []
+        self.client = TaxesClient(single_flight=self.flights)
+        self.client.auth = Mock(return_value="token", cache_key="credential")
+        self.client.session.request = Mock(side_effect=self.request)
+
+    def request(self, **kwargs):
+        self.sent.append(kwargs["data"])
+        self.release.wait(5)
+        if kwargs["data"] == "company_id=0":
+            raise ConnectionError("reset")
+        return make_response([{"tax_id": 1}])
+
+    def run_concurrently(self, *calls):
+        with ThreadPoolExecutor(len(calls)) as executor:
+            futures = [executor.submit(call) for call in calls]
+            # Let every call reach single flight before the leader completes
+            while self.flights.metrics()["calls"] < len(calls):
+                pass
+            self.release.set()
+            return [future.exception() or future.result() for future in futures]
+
+    def test_identical_reads_are_coalesced(self):
+        responses = self.run_concurrently(
+            *[lambda: self.client.get_all({"company_id": 5})] * 4
+        )
+        self.assertEqual(len(self.sent), 1)
+        self.assertTrue(all(response is responses[0] for response in responses))
+        self.assertEqual(self.flights.metrics(), {"calls": 4, "coalesced": 3})
+
+    def test_different_reads_are_sent(self):
+        self.run_concurrently(
+            lambda: self.client.get_all({"company_id": 5}),
+            lambda: self.client.get_all({"company_id": 6}),
+        )
+        self.assertEqual(len(self.sent), 2)
+
+    def test_writes_are_never_coalesced(self):
+        self.release.set()
+        self.client.delete({"company_id": 5, "tax_id": 1})
+        self.assertEqual(self.flights.metrics()["calls"], 0)
+
+    def test_followers_share_the_error(self):
+        errors = self.run_concurrently(
+            *[lambda: self.client.get_all({"company_id": 0})] * 3
+        )
+        self.assertEqual(len(self.sent), 1)
+        self.assertTrue(all(isinstance(error, ConnectionError) for error in errors))
+
+    def test_follower_wait_bounded_by_deadline(self):
+        def follower():
+            with deadline(0.05):
+                return self.client.get_all({"company_id": 5})
+
+        with ThreadPoolExecutor(2) as executor:
+            leader = executor.submit(self.client.get_all, {"company_id": 5})
+            while not self.sent:
+                pass
+            with self.assertRaises(DeadlineExceeded):
+                executor.submit(follower).result()
+            self.release.set()
+            leader.result()
+
+
+class TestAsyncSingleFlight(unittest.IsolatedAsyncioTestCase):
+    async def test_identical_reads_are_coalesced(self):
+        sent = []
+        release = asyncio.Event()
+
+        async def handler(request):
+            sent.append(request)
+            await release.wait()
+            return httpx.Response(200, json=[{"tax_id": 1}])
+
+        flights = SingleFlight()
+        client = AsyncTaxesClient(
+            session=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+            single_flight=flights,
+        )
+
+        async def auth():
+            return "token"
+
+        client.auth = Mock(side_effect=auth, cache_key="credential")
+        calls = [
+            asyncio.ensure_future(client.get_all({"company_id": 5})) for _ in range(3)
+        ]
+        await asyncio.sleep(0.01)
+        # Cancelling the first caller doesn't cancel the shared call
+        calls[0].cancel()
+        release.set()
+        responses = await asyncio.gather(*calls[1:])
+
+        self.assertEqual(len(sent), 1)
+        self.assertIs(responses[0], responses[1])
+        self.assertEqual(responses[0].payload, [{"tax_id": 1}])
+        self.assertEqual(flights.metrics(), {"calls": 3, "coalesced": 2})
+        await client.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
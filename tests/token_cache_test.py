@@ -0,0 +1,141 @@
+import asyncio
+import threading
+import time
+import unittest
+from unittest.mock import patch, Mock
+
+import httpx
+
+from moloni.base import MoloniBaseUrl
+from moloni.base.async_client import AsyncMyAuth
+from moloni.base.client import MyAuth
+from moloni.base.helpers import AccessTokenResponse
+from moloni.base.token_cache import TokenCache
+from tests.helpers import make_response
+
+
+def grant_response(access_token, refresh_token="refresh", expires_in=3600):
+    return make_response(
+        {
+            "access_token": access_token,
+            "refresh_token": refresh_token,
+            "expires_in": expires_in,
+        }
+    )
+
+
+class TestTokenCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = TokenCache(refresh_margin=60)
+
+    def make_auth(self, client_id="id", username="user"):
+        auth = MyAuth(
+            MoloniBaseUrl.SANDBOX,
+            client_id,
+            "secret",
+            username=username,
+            password="password",
+            token_cache=self.cache,
+        )
+        auth.session = Mock()
+        return auth
+
+    def test_tokens_are_scoped_by_credentials(self):
+        first, second = self.make_auth(username="a"), self.make_auth(username="b")
+        first.session.request.return_value = grant_response("token-a")
+        second.session.request.return_value = grant_response("token-b")
+
+        self.assertEqual(first(), "token-a")
+        self.assertEqual(second(), "token-b")
+        self.assertEqual(first(), "token-a")
+        self.assertNotEqual(first.cache_key, second.cache_key)
+        self.assertEqual(first.session.request.call_count, 1)
+
+    def test_same_credentials_share_token(self):
+        first, second = self.make_auth(), self.make_auth()
+        first.session.request.return_value = grant_response("token")
+
+        self.assertEqual(first(), "token")
+        self.assertEqual(second(), "token")
+        second.session.request.assert_not_called()
+
+    def test_refreshes_before_expiry_with_refresh_token(self):
+        auth = self.make_auth()
+        auth.session.request.side_effect = [
+            grant_response("first", refresh_token="rotated", expires_in=90),
+            grant_response("second"),
+        ]
+
+        self.assertEqual(auth(), "first")
+        with patch("moloni.base.token_cache.time.time", return_value=time.time() + 31):
+            self.assertEqual(auth(), "second")
+
+        params = auth.session.request.call_args.kwargs["params"]
+        self.assertEqual(params["grant_type"], "refresh_token")
+        self.assertEqual(params["refresh_token"], "rotated")
+
+    def test_falls_back_to_credentials_when_refresh_fails(self):
+        auth = self.make_auth()
+        self.cache.set(
+            auth.cache_key,
+            AccessTokenResponse(access_token="old", refresh_token="old", expires_at=0),
+        )
+        auth.session.request.side_effect = [
+            grant_response(None),
+            grant_response("new"),
+        ]
+
+        self.assertEqual(auth(), "new")
+        params = auth.session.request.call_args.kwargs["params"]
+        self.assertEqual(params["grant_type"], "password")
+
+    def test_single_flight_across_threads(self):
+        auth = self.make_auth()
+
+        def slow_grant(**kwargs):
+            time.sleep(0.05)
+            return grant_response("token")
+
+        auth.session.request.side_effect = slow_grant
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(auth())) for _ in range(10)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(results, ["token"] * 10)
+        self.assertEqual(auth.session.request.call_count, 1)
+
+
+class TestAsyncTokenCache(unittest.IsolatedAsyncioTestCase):
+    async def test_single_flight_across_coroutines(self):
+        grants = []
+
+        async def handler(request):
+            grants.append(request)
+            await asyncio.sleep(0.01)
+            return httpx.Response(
+                200, json={"access_token": "token", "expires_in": 3600}
+            )
+
+        auth = AsyncMyAuth(
+            MoloniBaseUrl.SANDBOX,
+            "id",
+            "secret",
+            username="user",
+            password="password",
+            session=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+            token_cache=TokenCache(),
+        )
+        results = await asyncio.gather(*[auth() for _ in range(20)])
+
+        self.assertEqual(results, ["token"] * 20)
+        self.assertEqual(len(grants), 1)
+        await auth.session.aclose()
+
+
+if __name__ == "__main__":
+    unittest.main()
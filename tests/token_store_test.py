@@ -0,0 +1,224 @@
+import asyncio
+import multiprocessing
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import Mock
+
+from moloni.base import (
+    DeadlineExceeded,
+    FileTokenStore,
+    MoloniBaseUrl,
+    SQLiteTokenStore,
+    deadline,
+)
+from moloni.base.async_client import AsyncMyAuth
+from moloni.base.client import MyAuth
+from moloni.base.helpers import AccessTokenResponse
+from moloni.base.token_cache import TokenCache
+from tests.helpers import make_response
+
+
+class CountingSession:
+    """Grant endpoint that records every call in a file, visible across processes"""
+
+    def __init__(self, calls_path):
+        self.calls_path = calls_path
+
+    def request(self, **kwargs):
+        with open(self.calls_path, "a") as f:
+            f.write("grant\n")
+        time.sleep(0.05)
+        return make_response(
+            {"access_token": "token", "refresh_token": "refresh", "expires_in": 3600}
+        )
+
+
+def make_auth(store, calls_path):
+    # A fresh TokenCache per auth stands in for a separate process
+    return MyAuth(
+        MoloniBaseUrl.SANDBOX,
+        "id",
+        "secret",
+        username="user",
+        password="password",
+        session=CountingSession(calls_path),
+        token_cache=TokenCache(),
+        token_store=store,
+    )
+
+
+def worker(store, calls_path):
+    make_auth(store, calls_path)()
+
+
+class TokenStoreTestMixin:
+    def make_store(self, path):
+        raise NotImplementedError
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.store = self.make_store(os.path.join(self.directory.name, "tokens"))
+        self.calls_path = os.path.join(self.directory.name, "calls")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def grant_calls(self):
+        try:
+            with open(self.calls_path) as f:
+                return len(f.readlines())
+        except FileNotFoundError:
+            return 0
+
+    def test_round_trip(self):
+        token = AccessTokenResponse(
+            access_token="token", refresh_token="refresh", expires_at=123.0
+        )
+        self.assertIsNone(self.store.load("key"))
+        with self.store.lock("key"):
+            self.store.save("key", token)
+
+        loaded = self.store.load("key")
+        self.assertEqual(loaded.dict(), token.dict())
+        self.assertIsNone(self.store.load("other"))
+
+    def test_token_is_reused_by_other_caches(self):
+        self.assertEqual(make_auth(self.store, self.calls_path)(), "token")
+        self.assertEqual(make_auth(self.store, self.calls_path)(), "token")
+        self.assertEqual(self.grant_calls(), 1)
+
+    def test_expired_token_is_refreshed_with_stored_refresh_token(self):
+        first = make_auth(self.store, self.calls_path)
+        with self.store.lock(first.cache_key):
+            self.store.save(
+                first.cache_key,
+                AccessTokenResponse(
+                    access_token="old", refresh_token="stored", expires_at=0
+                ),
+            )
+        first.session = Mock()
+        first.session.request.return_value.json.return_value = {
+            "access_token": "new",
+            "expires_in": 3600,
+        }
+
+        self.assertEqual(first(), "new")
+        params = first.session.request.call_args.kwargs["params"]
+        self.assertEqual(params["refresh_token"], "stored")
+        self.assertEqual(self.store.load(first.cache_key).access_token, "new")
+
+    @unittest.skipUnless(
+        "fork" in multiprocessing.get_all_start_methods(), "requires fork"
+    )
+    def test_single_grant_across_processes(self):
+        context = multiprocessing.get_context("fork")
+        processes = [
+            context.Process(target=worker, args=(self.store, self.calls_path))
+            for _ in range(6)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+
+        self.assertTrue(all(process.exitcode == 0 for process in processes))
+        self.assertEqual(self.grant_calls(), 1)
+
+
+class TestStoreLockDeadline(unittest.TestCase):
+    def test_refresh_gives_up_at_the_deadline(self):
+        with tempfile.TemporaryDirectory() as directory:
+            store = FileTokenStore(os.path.join(directory, "tokens.json"))
+            held = store.acquire("other")
+            self.addCleanup(store.release, held)
+            auth = make_auth(store, os.path.join(directory, "calls"))
+            started = time.monotonic()
+            with self.assertRaises(DeadlineExceeded):
+                with deadline(0.2):
+                    auth()
+            self.assertLess(time.monotonic() - started, 1)
+
+    def test_lock_timeout(self):
+        with tempfile.TemporaryDirectory() as directory:
+            store = SQLiteTokenStore(os.path.join(directory, "tokens.sqlite3"))
+            held = store.acquire("key")
+            with self.assertRaises(TimeoutError):
+                store.acquire("key", timeout=0.05)
+            store.release(held)
+            store.release(store.acquire("key", timeout=0.05))
+
+
+class TestFileTokenStore(TokenStoreTestMixin, unittest.TestCase):
+    def make_store(self, path):
+        return FileTokenStore(path + ".json")
+
+
+class TestSQLiteTokenStore(TokenStoreTestMixin, unittest.TestCase):
+    def make_store(self, path):
+        return SQLiteTokenStore(path + ".sqlite3")
+
+
+class TestAsyncTokenStore(unittest.IsolatedAsyncioTestCase):
+    def make_async_auth(self, store):
+        return AsyncMyAuth(
+            MoloniBaseUrl.SANDBOX,
+            "id",
+            "secret",
+            username="user",
+            password="password",
+            session=Mock(),
+            token_cache=TokenCache(),
+            token_store=store,
+        )
+
+    async def test_cancelled_refresh_releases_the_store_lock(self):
+        with tempfile.TemporaryDirectory() as directory:
+            store = FileTokenStore(os.path.join(directory, "tokens.json"))
+            # Another process refreshing
+            held = store.acquire("other")
+            task = asyncio.create_task(self.make_async_auth(store).get_auth())
+            await asyncio.sleep(0.05)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+            store.release(held)
+
+            # The lock the cancelled refresh acquires afterwards is released
+            await asyncio.sleep(0.1)
+            store.release(store.acquire("other", timeout=1))
+
+    async def test_store_lock_waits_until_the_deadline(self):
+        with tempfile.TemporaryDirectory() as directory:
+            store = FileTokenStore(os.path.join(directory, "tokens.json"))
+            held = store.acquire("other")
+            self.addCleanup(store.release, held)
+            started = time.monotonic()
+            with self.assertRaises(DeadlineExceeded):
+                with deadline(0.2):
+                    await self.make_async_auth(store).get_auth()
+            self.assertLess(time.monotonic() - started, 1)
+
+    async def test_token_is_reused_by_async_auth(self):
+        with tempfile.TemporaryDirectory() as directory:
+            store = FileTokenStore(os.path.join(directory, "tokens.json"))
+            sync_auth = make_auth(store, os.path.join(directory, "calls"))
+            self.assertEqual(sync_auth(), "token")
+
+            async_auth = AsyncMyAuth(
+                MoloniBaseUrl.SANDBOX,
+                "id",
+                "secret",
+                username="user",
+                password="password",
+                session=Mock(),
+                token_cache=TokenCache(),
+                token_store=store,
+            )
+            self.assertEqual(await async_auth(), "token")
+            async_auth.session.request.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()